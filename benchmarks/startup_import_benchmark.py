@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Server Startup Import Benchmark
+Measures what ``import vibe_check.server`` costs with ``python -X importtime``:
+the total, the share spent in the MCP framework itself, and the heaviest
+third-party packages pulled in by vibe_check modules. Implementation
+dependencies (scikit-learn, numpy, PyGithub, the legacy FastMCP backup tools)
+are expected to load on first tool call, not at startup.
+
+Usage:
+    python benchmarks/startup_import_benchmark.py [--runs N] [--budget-ms MS]
+
+Exits non-zero if a deferred package is imported at startup or the median
+vibe_check share (total minus the MCP framework) exceeds the budget.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+TARGET = "vibe_check.server"
+FRAMEWORK_MODULE = "mcp.server.fastmcp"
+DEFERRED_PACKAGES = ("sklearn", "scipy", "numpy", "github", "fastmcp")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+# (cumulative microseconds, indent, module) in the order importtime prints them
+ImportRow = Tuple[int, int, str]
+
+
+def measure_imports(target: str = TARGET) -> List[ImportRow]:
+    """Import a module in a fresh interpreter and parse its import timings"""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), VIBE_CHECK_TEST_MODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            rows.append(
+                (int(match.group(2)), len(match.group(3)), match.group(4).strip())
+            )
+    return rows
+
+
+def heaviest_dependencies(rows: List[ImportRow], limit: int = 10) -> List[str]:
+    """Third-party packages imported directly by vibe_check modules, by cost"""
+    costs: Dict[str, int] = {}
+    for i, (cumulative, indent, name) in enumerate(rows):
+        if name.startswith("vibe_check"):
+            continue
+        # importtime prints children before their parent
+        parent = next((row[2] for row in rows[i + 1 :] if row[1] < indent), "")
+        if parent.startswith("vibe_check"):
+            package = name.split(".")[0]
+            costs[package] = max(costs.get(package, 0), cumulative)
+    ordered = sorted(costs.items(), key=lambda item: item[1], reverse=True)
+    return [f"{package:<24} {us / 1000:8.1f} ms" for package, us in ordered[:limit]]
+
+
+def summarize(rows: List[ImportRow]) -> Dict[str, float]:
+    cumulative = {name: us for us, _, name in rows}
+    total = cumulative.get(TARGET, 0) / 1000
+    framework = cumulative.get(FRAMEWORK_MODULE, 0) / 1000
+    return {"total_ms": total, "framework_ms": framework, "own_ms": total - framework}
+
+
+def run_benchmark(runs: int, budget_ms: float) -> int:
+    samples = []
+    rows: List[ImportRow] = []
+    for _ in range(runs):
+        rows = measure_imports()
+        samples.append(summarize(rows))
+
+    print(f"Startup import benchmark: import {TARGET} ({runs} runs, median)")
+    print("-" * 60)
+    for key, label in (
+        ("total_ms", "total"),
+        ("framework_ms", FRAMEWORK_MODULE),
+        ("own_ms", "vibe_check share"),
+    ):
+        print(f"{label:<24} {statistics.median(s[key] for s in samples):8.1f} ms")
+    print("-" * 60)
+    print("Heaviest dependencies imported by vibe_check modules:")
+    for line in heaviest_dependencies(rows):
+        print(f"  {line}")
+    print("-" * 60)
+
+    imported = {name.split(".")[0] for _, _, name in rows}
+    eager = [package for package in DEFERRED_PACKAGES if package in imported]
+    own_ms = statistics.median(s["own_ms"] for s in samples)
+    if eager:
+        print(f"FAIL: deferred packages imported at startup: {', '.join(eager)}")
+    if own_ms > budget_ms:
+        print(f"FAIL: vibe_check share {own_ms:.1f} ms exceeds {budget_ms:.0f} ms")
+    if eager or own_ms > budget_ms:
+        return 1
+    print(f"OK: within {budget_ms:.0f} ms budget, no deferred packages loaded")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=750.0)
+    args = parser.parse_args()
+    sys.exit(run_benchmark(args.runs, args.budget_ms))
@@ -4,6 +4,7 @@ Vibe Check MCP Core Engine
 Core detection and educational content generation modules.
 """
 
+from .compiled_patterns import CompiledPatternSet, get_compiled_pattern_set
 from .pattern_detector import PatternDetector, DetectionResult
 from .educational_content import (
     EducationalContentGenerator,
@@ -12,6 +13,8 @@ from .educational_content import (
 )
 
 __all__ = [
+    "CompiledPatternSet",
+    "get_compiled_pattern_set",
     "PatternDetector",
     "DetectionResult",
     "EducationalContentGenerator",
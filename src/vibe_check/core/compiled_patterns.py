@@ -0,0 +1,193 @@
+"""
+Compiled Pattern Set
+
+Loads the anti-pattern definitions and case studies once per process and keeps
+them in an immutable, precompiled form. Every detector instance shares the same
+``CompiledPatternSet``, so constructing a ``PatternDetector`` or
+``EducationalContentGenerator`` no longer touches the disk and detection is
+reduced to pure regex matching.
+
+The cache is keyed by the resolved data file paths plus their mtime and size,
+so edits to ``anti_patterns.json`` are picked up on the next lookup.
+"""
+
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Pattern, Tuple
+
+from .multi_pattern_matcher import MultiPatternMatcher, required_literals
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
+DEFAULT_PATTERNS_FILE = DATA_DIR / "anti_patterns.json"
+DEFAULT_CASE_STUDIES_FILE = DATA_DIR / "cognee_case_study.json"
+
+VERSION_KEYS = ("schema_version", "data_version")
+
+
+@dataclass(frozen=True)
+class CompiledIndicator:
+    """A single precompiled indicator regex with its weight"""
+
+    regex: Pattern[str]
+    weight: float
+    description: str
+    literals: Optional[FrozenSet[str]] = None
+
+    def may_match(self, present_literals: Optional[FrozenSet[str]]) -> bool:
+        """Whether the regex can match given the literals found by the prefilter"""
+        if present_literals is None or self.literals is None:
+            return True
+        return not self.literals.isdisjoint(present_literals)
+
+
+@dataclass(frozen=True)
+class CompiledPattern:
+    """Precompiled detection data for one anti-pattern"""
+
+    pattern_id: str
+    threshold: float
+    version: str
+    indicators: Tuple[CompiledIndicator, ...]
+    negative_indicators: Tuple[CompiledIndicator, ...]
+    config: Mapping[str, Any]
+
+
+@dataclass(frozen=True)
+class CompiledPatternSet:
+    """Immutable, process-wide view of the pattern database"""
+
+    schema_version: str
+    data_version: str
+    patterns: Mapping[str, CompiledPattern]
+    raw_data: Mapping[str, Any]
+    case_study_data: Mapping[str, Any]
+    fingerprint: str
+    matcher: MultiPatternMatcher
+
+
+def _compile_indicators(
+    indicators: Any,
+) -> Tuple[CompiledIndicator, ...]:
+    return tuple(
+        CompiledIndicator(
+            regex=re.compile(indicator["regex"], re.IGNORECASE),
+            weight=indicator["weight"],
+            description=indicator.get("description", ""),
+            literals=required_literals(indicator["regex"]),
+        )
+        for indicator in indicators or []
+    )
+
+
+def compile_pattern(pattern_config: Dict[str, Any]) -> CompiledPattern:
+    """Compile a single raw pattern definition"""
+    return CompiledPattern(
+        pattern_id=pattern_config["id"],
+        threshold=pattern_config["detection_threshold"],
+        version=pattern_config.get("version", "1.0.0"),
+        indicators=_compile_indicators(pattern_config["indicators"]),
+        negative_indicators=_compile_indicators(
+            pattern_config.get("negative_indicators", [])
+        ),
+        config=pattern_config,
+    )
+
+
+def _file_signature(path: Path) -> Tuple[str, int, int]:
+    resolved = path.resolve()
+    stat = resolved.stat()
+    return (str(resolved), stat.st_mtime_ns, stat.st_size)
+
+
+_cache: Dict[Tuple[Any, ...], CompiledPatternSet] = {}
+_cache_lock = threading.Lock()
+
+
+def get_compiled_pattern_set(
+    patterns_file: Optional[str] = None,
+    case_studies_file: Optional[str] = None,
+) -> CompiledPatternSet:
+    """
+    Get the shared compiled pattern set for the given data files.
+
+    The files are parsed and compiled only the first time a given
+    (path, mtime, size) combination is seen; afterwards the same immutable
+    instance is returned to every caller.
+
+    Args:
+        patterns_file: Path to anti-pattern definitions (default: data/anti_patterns.json)
+        case_studies_file: Path to case studies (default: data/cognee_case_study.json)
+
+    Returns:
+        Shared CompiledPatternSet instance
+    """
+    patterns_path = (
+        Path(patterns_file) if patterns_file is not None else DEFAULT_PATTERNS_FILE
+    )
+    case_studies_path = (
+        Path(case_studies_file)
+        if case_studies_file is not None
+        else DEFAULT_CASE_STUDIES_FILE
+    )
+
+    key = _file_signature(patterns_path) + _file_signature(case_studies_path)
+
+    compiled = _cache.get(key)
+    if compiled is not None:
+        return compiled
+
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            return compiled
+
+        with open(patterns_path) as f:
+            pattern_data = json.load(f)
+        with open(case_studies_path) as f:
+            case_study_data = json.load(f)
+
+        patterns = {
+            pattern_id: compile_pattern(config)
+            for pattern_id, config in pattern_data.items()
+            if pattern_id not in VERSION_KEYS
+        }
+
+        compiled = CompiledPatternSet(
+            schema_version=pattern_data.get("schema_version", "1.0.0"),
+            data_version=pattern_data.get("data_version", "1.0.0"),
+            patterns=MappingProxyType(patterns),
+            raw_data=MappingProxyType(pattern_data),
+            case_study_data=MappingProxyType(case_study_data),
+            fingerprint="{}:{}:{}".format(*key[:3]),
+            matcher=MultiPatternMatcher(
+                indicator.literals
+                for compiled_pattern in patterns.values()
+                for indicator in (
+                    compiled_pattern.indicators + compiled_pattern.negative_indicators
+                )
+            ),
+        )
+
+        # Drop stale entries for the same files so edits don't accumulate
+        for stale_key in [k for k in _cache if k[0] == key[0] and k[3] == key[3]]:
+            del _cache[stale_key]
+        _cache[key] = compiled
+
+        logger.debug(
+            f"Compiled {len(patterns)} patterns from {patterns_path} "
+            f"(data_version {compiled.data_version})"
+        )
+        return compiled
+
+
+def clear_compiled_pattern_cache() -> None:
+    """Forget all compiled pattern sets (mainly for tests)"""
+    with _cache_lock:
+        _cache.clear()
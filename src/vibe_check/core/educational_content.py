@@ -7,12 +7,12 @@ explaining WHY patterns are problematic and HOW to fix them using real-world cas
 Phase 1.2 enhancement: Dedicated educational content system with multiple detail levels.
 """
 
-import json
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Mapping
 from dataclasses import dataclass
 from enum import Enum
 
+from .compiled_patterns import get_compiled_pattern_set
+
 
 class DetailLevel(Enum):
     """Educational content detail levels"""
@@ -86,32 +86,10 @@ class EducationalContentGenerator:
 
         self.default_detail_level = default_detail_level
 
-        # Load pattern definitions
-        if patterns_file is None:
-            patterns_path = (
-                Path(__file__).parent.parent.parent.parent
-                / "data"
-                / "anti_patterns.json"
-            )
-        else:
-            patterns_path = Path(patterns_file)
-
-        with open(patterns_path) as f:
-            self.patterns = json.load(f)
-
-        # Load case studies
-        if case_studies_file is None:
-            case_studies_path = (
-                Path(__file__).parent.parent.parent.parent
-                / "data"
-                / "cognee_case_study.json"
-            )
-        else:
-            case_studies_path = Path(case_studies_file)
-
-        with open(case_studies_path) as f:
-            case_study_data = json.load(f)
-            self.case_studies = self._parse_case_studies(case_study_data)
+        # Pattern definitions and case studies come from the shared compiled set
+        pattern_set = get_compiled_pattern_set(patterns_file, case_studies_file)
+        self.patterns = pattern_set.raw_data
+        self.case_studies = self._parse_case_studies(pattern_set.case_study_data)
 
         # Load additional educational content
         self._load_educational_extensions()
@@ -646,7 +624,7 @@ class EducationalContentGenerator:
         return best_practices.get(pattern_type, [])
 
     def _parse_case_studies(
-        self, case_study_data: Dict[str, Any]
+        self, case_study_data: Mapping[str, Any]
     ) -> Dict[str, CaseStudy]:
         """Parse case study data into structured format"""
         case_studies = {}
@@ -17,7 +17,6 @@ import re
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
-from pathlib import Path
 
 from ..models.severity import SeverityLevel, normalize_severity
 from .pattern_detector import PatternDetector, DetectionResult
@@ -290,7 +289,7 @@ class IntegrationPatternDetector:
                 # Add specific red flags for detected technologies
                 for tech in detected_technologies:
                     if tech.red_flags:
-                        for evidence_item in result.evidence:
+                        for evidence_item in list(result.evidence):
                             for red_flag in tech.red_flags:
                                 if red_flag.lower() in evidence_item.lower():
                                     result.evidence.append(
@@ -525,30 +524,15 @@ class IntegrationPatternDetector:
         return questions
 
     def _load_integration_patterns(self) -> Dict[str, Any]:
-        """Load integration-specific patterns from the enhanced anti-patterns file"""
-        try:
-            # Load from the same file as base patterns
-            patterns_path = (
-                Path(__file__).parent.parent.parent.parent
-                / "data"
-                / "anti_patterns.json"
-            )
-
-            import json
-
-            with open(patterns_path) as f:
-                all_patterns = json.load(f)
-
-            # Extract integration pattern data
-            if "integration_over_engineering" in all_patterns:
-                return all_patterns["integration_over_engineering"]
-            else:
-                logger.warning("Integration patterns not found in anti-patterns file")
-                return {}
-
-        except Exception as e:
-            logger.error(f"Failed to load integration patterns: {e}")
+        """Load integration-specific patterns from the shared compiled pattern set"""
+        # Extract integration pattern data
+        integration_config = self.base_detector.patterns.get(
+            "integration_over_engineering"
+        )
+        if integration_config is None:
+            logger.warning("Integration patterns not found in anti-patterns file")
             return {}
+        return integration_config
 
     def get_technology_coverage(self) -> List[str]:
         """Get list of technologies covered by the detector"""
@@ -0,0 +1,140 @@
+"""
+Multi-Pattern Literal Prefilter
+
+Finds every indicator that could possibly match a text in a single pass, so
+the per-indicator regexes only run as confirmation for real candidates.
+
+Each indicator regex is reduced to a set of required literals (at least one of
+them must appear in any text the regex matches). All literals across all
+patterns are merged into one trie-shaped lookahead regex that reports, at
+every position, the longest literal starting there. Shorter literals starting
+at the same position are prefixes of it and are added from a precomputed
+closure, which makes the literal scan exact without overlapping-match tricks.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+try:  # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants  # type: ignore[no-redef]
+    import sre_parse  # type: ignore[no-redef]
+
+_REPEAT_OPS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, "POSSESSIVE_REPEAT"):
+    _REPEAT_OPS.add(sre_constants.POSSESSIVE_REPEAT)
+
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter
+# but that str.lower() leaves alone. Folding them keeps the prefilter exact.
+_IGNORECASE_FOLDS = str.maketrans({"ı": "i", "ſ": "s"})
+
+
+def _required_from_parsed(parsed) -> Optional[FrozenSet[str]]:
+    candidates: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    def flush() -> None:
+        if run:
+            candidates.append(frozenset(["".join(run)]))
+            run.clear()
+
+    for op, av in parsed:
+        if op is sre_constants.LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+
+        flush()
+        required = None
+        if op is sre_constants.SUBPATTERN:
+            required = _required_from_parsed(av[-1])
+        elif op in _REPEAT_OPS and av[0] >= 1:
+            required = _required_from_parsed(av[2])
+        elif op is sre_constants.BRANCH:
+            alternatives = [_required_from_parsed(branch) for branch in av[1]]
+            if all(alternatives):
+                required = frozenset().union(*alternatives)
+        if required:
+            candidates.append(required)
+
+    flush()
+    if not candidates:
+        return None
+
+    # Prefer the most selective requirement: longest shortest-literal, then fewest options
+    return max(candidates, key=lambda c: (min(map(len, c)), -len(c)))
+
+
+def required_literals(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    Derive literals of which at least one must occur in any match of pattern.
+
+    Literals are lowercased, so the result applies to lowercased text matched
+    with re.IGNORECASE. Returns None when no requirement can be derived, in
+    which case the regex must always be evaluated.
+    """
+    try:
+        return _required_from_parsed(sre_parse.parse(pattern))
+    except (re.error, TypeError, ValueError):
+        return None
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class MultiPatternMatcher:
+    """Single-pass literal scanner shared by all indicators of a pattern set"""
+
+    def __init__(self, literal_sets: Iterable[Optional[FrozenSet[str]]]):
+        vocabulary = set()
+        for literals in literal_sets:
+            if literals:
+                vocabulary.update(literals)
+
+        self.vocabulary: FrozenSet[str] = frozenset(vocabulary)
+        self._prefix_closure: Dict[str, FrozenSet[str]] = {
+            literal: frozenset(
+                other for other in self.vocabulary if literal.startswith(other)
+            )
+            for literal in self.vocabulary
+        }
+        self._scanner = (
+            re.compile(f"(?=({_trie_regex(self.vocabulary)}))")
+            if self.vocabulary
+            else None
+        )
+
+    def scan(self, text_lower: str) -> FrozenSet[str]:
+        """Return every vocabulary literal occurring in already-lowercased text"""
+        if self._scanner is None:
+            return frozenset()
+        if not text_lower.isascii():
+            text_lower = text_lower.translate(_IGNORECASE_FOLDS)
+
+        longest = {match.group(1) for match in self._scanner.finditer(text_lower)}
+        found = set()
+        for literal in longest:
+            found.update(self._prefix_closure[literal])
+        return frozenset(found)
@@ -8,12 +8,15 @@ with confidence scoring and educational content generation.
 The algorithms in this module achieved 87.5% accuracy in Phase 0 validation.
 """
 
-import json
-import re
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, FrozenSet, Iterable, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from .compiled_patterns import (
+    CompiledPattern,
+    compile_pattern,
+    get_compiled_pattern_set,
+)
+from .multi_pattern_matcher import MultiPatternMatcher
 from .educational_content import (
     EducationalContentGenerator,
     DetailLevel,
@@ -34,6 +37,108 @@ class DetectionResult:
     educational_content: Optional[Dict[str, Any]] = None
 
 
+# Characters carried over from the end of one stream chunk into the next so
+# indicator matches that straddle a chunk boundary are still found
+DEFAULT_STREAM_OVERLAP_CHARS = 2048
+
+
+class StreamingPatternScan:
+    """
+    Incremental detection state for a stream of text chunks.
+
+    Only the current chunk plus an overlap window from the previous one is
+    held in memory. Indicator hits accumulate across chunks, and indicators
+    that already matched are not searched again.
+    """
+
+    def __init__(
+        self,
+        patterns: Dict[str, Tuple[CompiledPattern, bool]],
+        matcher: MultiPatternMatcher,
+        overlap_chars: int = DEFAULT_STREAM_OVERLAP_CHARS,
+    ):
+        self._patterns = patterns
+        self._matcher = matcher
+        self._overlap_chars = max(0, overlap_chars)
+        self._tail = ""
+        self._hits: Dict[str, Set[int]] = {pattern_id: set() for pattern_id in patterns}
+        self._negative_hits: Dict[str, Set[int]] = {
+            pattern_id: set() for pattern_id in patterns
+        }
+        self.chunks_processed = 0
+        self.chars_processed = 0
+
+    def feed(self, chunk: str) -> None:
+        """Scan one chunk of text, updating the running indicator hits"""
+        if not isinstance(chunk, str):
+            raise TypeError(f"Chunk must be string, got {type(chunk)}")
+
+        window = self._tail + chunk.lower()
+        present_literals = self._matcher.scan(window)
+
+        for pattern_id, (compiled, is_shared) in self._patterns.items():
+            literals = present_literals if is_shared else None
+            self._scan_indicators(
+                window, compiled.indicators, self._hits[pattern_id], literals
+            )
+            self._scan_indicators(
+                window,
+                compiled.negative_indicators,
+                self._negative_hits[pattern_id],
+                literals,
+            )
+
+        self._tail = window[-self._overlap_chars :] if self._overlap_chars else ""
+        self.chunks_processed += 1
+        self.chars_processed += len(chunk)
+
+    @staticmethod
+    def _scan_indicators(window, indicators, hits, present_literals) -> None:
+        for index, indicator in enumerate(indicators):
+            if index in hits or not indicator.may_match(present_literals):
+                continue
+            if indicator.regex.search(window):
+                hits.add(index)
+
+    def confidence(self, pattern_id: str) -> float:
+        """Running confidence for a pattern over everything fed so far"""
+        return self.result(pattern_id).confidence
+
+    def result(self, pattern_id: str) -> DetectionResult:
+        """Build the DetectionResult for a pattern from the accumulated hits"""
+        compiled, _ = self._patterns[pattern_id]
+        hits = self._hits[pattern_id]
+        negative_hits = self._negative_hits[pattern_id]
+
+        evidence = []
+        confidence = 0.0
+
+        # Sum in indicator order so scores match whole-text detection exactly
+        for index, indicator in enumerate(compiled.indicators):
+            if index in hits:
+                evidence.append(indicator.description)
+                confidence += indicator.weight
+
+        for index, neg_indicator in enumerate(compiled.negative_indicators):
+            if index in negative_hits:
+                confidence += neg_indicator.weight  # weight is negative
+
+        confidence = max(0.0, min(1.0, confidence))
+
+        return DetectionResult(
+            pattern_type=compiled.pattern_id,
+            detected=confidence >= compiled.threshold,
+            confidence=confidence,
+            evidence=evidence,
+            threshold=compiled.threshold,
+            pattern_version=compiled.version,
+        )
+
+    def results(self) -> List[DetectionResult]:
+        """DetectionResults for every scanned pattern"""
+        return [self.result(pattern_id) for pattern_id in self._patterns]
+
+
 class PatternDetector:
     """
     Core anti-pattern detection engine using validated algorithms from Phase 0.
@@ -49,42 +154,22 @@ class PatternDetector:
     ):
         """Initialize pattern detector with pattern definitions and case studies"""
 
-        # Load pattern definitions
-        if patterns_file is None:
-            patterns_path = (
-                Path(__file__).parent.parent.parent.parent
-                / "data"
-                / "anti_patterns.json"
-            )
-        else:
-            patterns_path = Path(patterns_file)
-
-        with open(patterns_path) as f:
-            pattern_data = json.load(f)
+        # Shared, precompiled pattern data (loaded from disk once per process)
+        self.compiled_patterns = get_compiled_pattern_set(
+            patterns_file, case_studies_file
+        )
 
         # Extract version information if present
-        self.schema_version = pattern_data.get("schema_version", "1.0.0")
-        self.data_version = pattern_data.get("data_version", "1.0.0")
+        self.schema_version = self.compiled_patterns.schema_version
+        self.data_version = self.compiled_patterns.data_version
 
         # Extract pattern definitions (exclude version fields)
         self.patterns = {
-            key: value
-            for key, value in pattern_data.items()
-            if key not in ["schema_version", "data_version"]
+            pattern_id: compiled.config
+            for pattern_id, compiled in self.compiled_patterns.patterns.items()
         }
 
-        # Load case studies
-        if case_studies_file is None:
-            case_studies_path = (
-                Path(__file__).parent.parent.parent.parent
-                / "data"
-                / "cognee_case_study.json"
-            )
-        else:
-            case_studies_path = Path(case_studies_file)
-
-        with open(case_studies_path) as f:
-            self.case_studies = json.load(f)
+        self.case_studies = self.compiled_patterns.case_study_data
 
         # Initialize educational content generator with comprehensive capabilities
         self.educational_generator = EducationalContentGenerator(
@@ -125,15 +210,25 @@ class PatternDetector:
 
         detected_patterns = []
 
-        # Combine content and context
-        full_text = f"{content} {context or ''}"
+        # Combine content and context (lowercased once for all patterns)
+        full_text_lower = f"{content} {context or ''}".lower()
+
+        # One literal scan finds every indicator that could match; only those
+        # indicators run their regex below
+        present_literals = self.compiled_patterns.matcher.scan(full_text_lower)
 
         # Check each pattern type
         for pattern_id, pattern_config in self.patterns.items():
             if focus_patterns and pattern_id not in focus_patterns:
                 continue
 
-            result = self._detect_single_pattern(full_text, pattern_config)
+            compiled = self._get_compiled_pattern(pattern_config)
+            is_shared = compiled is self.compiled_patterns.patterns.get(pattern_id)
+            result = self._score_pattern(
+                full_text_lower,
+                compiled,
+                present_literals if is_shared else None,
+            )
 
             if result.detected:
                 # Add enhanced educational content for detected patterns
@@ -175,6 +270,71 @@ class PatternDetector:
 
         return result
 
+    def start_stream(
+        self,
+        focus_patterns: Optional[List[str]] = None,
+        overlap_chars: int = DEFAULT_STREAM_OVERLAP_CHARS,
+    ) -> StreamingPatternScan:
+        """
+        Start an incremental scan that can be fed text chunks one at a time.
+
+        Args:
+            focus_patterns: Specific patterns to check (default: all patterns)
+            overlap_chars: Characters carried across chunk boundaries
+
+        Returns:
+            StreamingPatternScan accumulating indicator hits across chunks
+        """
+        patterns = {}
+        for pattern_id, pattern_config in self.patterns.items():
+            if focus_patterns and pattern_id not in focus_patterns:
+                continue
+            compiled = self._get_compiled_pattern(pattern_config)
+            is_shared = compiled is self.compiled_patterns.patterns.get(pattern_id)
+            patterns[pattern_id] = (compiled, is_shared)
+
+        return StreamingPatternScan(
+            patterns, self.compiled_patterns.matcher, overlap_chars=overlap_chars
+        )
+
+    def analyze_stream_for_patterns(
+        self,
+        chunks: Iterable[str],
+        focus_patterns: Optional[List[str]] = None,
+        detail_level: DetailLevel = DetailLevel.STANDARD,
+        overlap_chars: int = DEFAULT_STREAM_OVERLAP_CHARS,
+    ) -> List[DetectionResult]:
+        """
+        Analyze a stream of text chunks (e.g. diff hunks) for anti-patterns.
+
+        Memory use is bounded by the largest chunk plus the overlap window, so
+        arbitrarily large inputs can be analyzed without concatenating them.
+        Matches that cross a chunk boundary are found as long as they fit in
+        overlap_chars.
+
+        Args:
+            chunks: Iterable of text chunks, in order
+            focus_patterns: Specific patterns to check (default: all patterns)
+            detail_level: Level of detail for educational content
+            overlap_chars: Characters carried across chunk boundaries
+
+        Returns:
+            List of DetectionResult objects for detected patterns
+        """
+        scan = self.start_stream(focus_patterns, overlap_chars=overlap_chars)
+        for chunk in chunks:
+            scan.feed(chunk)
+
+        detected_patterns = []
+        for result in scan.results():
+            if result.detected:
+                result.educational_content = self._generate_educational_content(
+                    result.pattern_type, result, detail_level
+                )
+                detected_patterns.append(result)
+
+        return detected_patterns
+
     def _detect_single_pattern(
         self, text: str, pattern_config: Dict[str, Any]
     ) -> DetectionResult:
@@ -184,36 +344,62 @@ class PatternDetector:
         This method implements the exact detection logic that achieved 87.5% accuracy
         in comprehensive validation testing.
         """
-        pattern_id = pattern_config["id"]
-        text_lower = text.lower()
+        return self._score_pattern(
+            text.lower(), self._get_compiled_pattern(pattern_config)
+        )
+
+    def _get_compiled_pattern(self, pattern_config: Dict[str, Any]) -> CompiledPattern:
+        """Get the shared compiled form of a pattern, compiling ad-hoc configs"""
+        compiled = self.compiled_patterns.patterns.get(pattern_config.get("id"))
+        if compiled is not None and compiled.config is pattern_config:
+            return compiled
+        return compile_pattern(pattern_config)
+
+    def _score_pattern(
+        self,
+        text_lower: str,
+        compiled: CompiledPattern,
+        present_literals: Optional[FrozenSet[str]] = None,
+    ) -> DetectionResult:
+        """
+        Score already-lowercased text against a compiled pattern.
+
+        When present_literals (from the shared literal prefilter) is given,
+        indicators whose required literals are absent are skipped without
+        running their regex; the resulting scores are identical.
+        """
         evidence = []
         confidence = 0.0
 
         # Check positive indicators
-        for indicator in pattern_config["indicators"]:
-            if re.search(indicator["regex"], text_lower, re.IGNORECASE):
-                evidence.append(indicator["description"])
-                confidence += indicator["weight"]
+        for indicator in compiled.indicators:
+            if indicator.may_match(present_literals) and indicator.regex.search(
+                text_lower
+            ):
+                evidence.append(indicator.description)
+                confidence += indicator.weight
 
         # Check negative indicators (reduce confidence if found)
-        for neg_indicator in pattern_config.get("negative_indicators", []):
-            if re.search(neg_indicator["regex"], text_lower, re.IGNORECASE):
-                confidence += neg_indicator["weight"]  # weight is negative
+        for neg_indicator in compiled.negative_indicators:
+            if neg_indicator.may_match(present_literals) and neg_indicator.regex.search(
+                text_lower
+            ):
+                confidence += neg_indicator.weight  # weight is negative
 
         # Ensure confidence is between 0 and 1
         confidence = max(0.0, min(1.0, confidence))
 
         # Determine if pattern is detected
-        threshold = pattern_config["detection_threshold"]
+        threshold = compiled.threshold
         detected = confidence >= threshold
 
         return DetectionResult(
-            pattern_type=pattern_id,
+            pattern_type=compiled.pattern_id,
             detected=detected,
             confidence=confidence,
             evidence=evidence,
             threshold=threshold,
-            pattern_version=pattern_config.get("version", "1.0.0"),
+            pattern_version=compiled.version,
         )
 
     def _generate_educational_content(
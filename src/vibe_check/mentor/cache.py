@@ -10,17 +10,40 @@ import hashlib
 import json
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 
 from .context_models import FileContext, SessionContext
-from .constants import MAX_FILES, MAX_TOTAL_SIZE, PROJECT_REGISTRY_PATH
+from .constants import (
+    INGEST_MAX_WORKERS,
+    MAX_FILES,
+    MAX_TOTAL_SIZE,
+    PROJECT_REGISTRY_PATH,
+)
 from .file_reader import FileReader
 from .code_parser import CodeParser
+from .parsed_file_cache import FileStamp, get_parsed_file_cache
+from .project_index import get_project_file_index
+from .validators import SecurityValidator
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _IngestItem:
+    """A requested file as it moves through bulk ingestion"""
+
+    file_path: str
+    file_hash: str
+    resolved_path: str = ""
+    stamp: Optional[FileStamp] = None
+    shared: Optional[FileContext] = None
+    error: Optional[str] = None
+
+
 class ContextCache:
     """Manages session-based context caching"""
 
@@ -28,6 +51,8 @@ class ContextCache:
         self._cache: Dict[str, SessionContext] = {}
         self._file_reader = FileReader()
         self._code_parser = CodeParser()
+        self._parsed_files = get_parsed_file_cache()
+        self._lock = threading.Lock()
 
     def get_or_create_session(
         self, session_id: str, working_directory: str | None = None
@@ -63,6 +88,12 @@ class ContextCache:
         """
         Add files to a session context.
 
+        Files missing from the shared parsed file cache are read and parsed
+        concurrently in a bounded thread pool, largest first so the longest
+        reads start earliest. Results are then committed in request order
+        under the cache lock, so the MAX_TOTAL_SIZE budget is enforced
+        atomically and admits the same files as a serial read would.
+
         Returns:
             Tuple of (successful_contexts, error_messages)
         """
@@ -77,96 +108,184 @@ class ContextCache:
             )
             file_paths = file_paths[:MAX_FILES]
 
-        for file_path in file_paths:
-            # Check if already cached in this session
-            file_hash = hashlib.md5(file_path.encode()).hexdigest()
-            if file_hash in session.files:
-                successful.append(session.files[file_hash])
-                continue
-
-            # Read file
-            content, error = self._file_reader.read_file(
-                file_path, session.working_directory, include_error=True
-            )
-            if error:
-                errors.append(f"{file_path}: {error}")
-                continue
-
-            # Check total size limit
-            file_size = len(content.encode("utf-8"))
-            if session.total_size + file_size > MAX_TOTAL_SIZE:
-                errors.append(f"{file_path}: Would exceed total size limit")
-                continue
-
-            # Determine language
-            path = Path(file_path)
-            language = self._detect_language(path.suffix)
-
-            # Create file context
-            file_context = FileContext(
-                path=str(path),
-                content=content,
-                language=language,
-                size=file_size,
-                last_modified=path.stat().st_mtime,
-                hash=file_hash,
-            )
-
-            # Parse structure based on language
-            if language == "python":
-                parsed = self._code_parser.parse_python_file(content)
-                file_context.classes = parsed["classes"]
-                file_context.functions = parsed["functions"]
-                file_context.imports = parsed["imports"]
-            elif language in ["javascript", "typescript"]:
-                parsed = self._code_parser.parse_javascript_file(content)
-                file_context.classes = parsed["classes"]
-                file_context.functions = parsed["functions"]
-                file_context.imports = parsed["imports"]
-            elif language == "go":
-                parsed = self._code_parser.parse_go_file(content)
-                file_context.functions = parsed["functions"]
-                file_context.classes = parsed[
-                    "types"
-                ]  # Go types are similar to classes
-                file_context.imports = [
-                    imp
-                    for group in parsed["imports"]
-                    for imp in (group[0].split("\n") if group[0] else [group[1]])
-                    if imp
-                ]
-            elif language == "rust":
-                parsed = self._code_parser.parse_rust_file(content)
-                file_context.functions = parsed["functions"]
-                file_context.classes = parsed[
-                    "structs"
-                ]  # Rust structs are similar to classes
-                file_context.imports = parsed["uses"]
-            elif language == "java":
-                parsed = self._code_parser.parse_java_file(content)
-                file_context.classes = parsed["classes"]
-                file_context.functions = parsed["methods"]
-                file_context.imports = parsed["imports"]
-            else:
-                # Use generic parser for other languages
-                parsed = self._code_parser.parse_generic_file(content)
-                file_context.classes = parsed["classes"]
-                file_context.functions = parsed["functions"]
-                # No imports in generic parser
-
-            # Extract relevant context if query provided
-            if query:
-                file_context.relevant_lines = (
-                    self._code_parser.extract_relevant_context(content, query, language)
+        items = [self._plan_ingest(file_path, session) for file_path in file_paths]
+
+        to_load = [item for item in items if item.error is None and item.shared is None]
+        to_load.sort(key=lambda item: item.stamp[1], reverse=True)
+        self._load_files(to_load, session.working_directory)
+
+        with self._lock:
+            for item in items:
+                if item.error:
+                    errors.append(item.error)
+                    continue
+
+                # Reuse this session's entry while it still matches the file
+                cached = session.files.get(item.file_hash)
+                if cached is not None and (cached.last_modified, cached.size) == (
+                    item.shared.last_modified,
+                    item.shared.size,
+                ):
+                    successful.append(cached)
+                    continue
+
+                # Check total size limit, replacing any stale entry for this file
+                previous_size = cached.size if cached is not None else 0
+                if (
+                    session.total_size - previous_size + item.shared.size
+                    > MAX_TOTAL_SIZE
+                ):
+                    errors.append(f"{item.file_path}: Would exceed total size limit")
+                    continue
+
+                file_context = self._session_view(
+                    item.shared, item.file_path, item.file_hash, query
                 )
 
-            # Add to session
-            session.files[file_hash] = file_context
-            session.total_size += file_size
-            successful.append(file_context)
+                # Add to session
+                session.files[item.file_hash] = file_context
+                session.total_size += file_context.size - previous_size
+                successful.append(file_context)
 
         return successful, errors
 
+    def _plan_ingest(self, file_path: str, session: SessionContext) -> "_IngestItem":
+        """Validate a requested file and look it up in the shared cache"""
+        item = _IngestItem(
+            file_path=file_path,
+            file_hash=hashlib.md5(file_path.encode()).hexdigest(),
+        )
+
+        is_valid, resolved_path, error = SecurityValidator.validate_path(
+            file_path, session.working_directory
+        )
+        if not is_valid:
+            logger.warning(f"Path validation failed: {error}")
+            item.error = f"{file_path}: {error}"
+            return item
+
+        # One stat revalidates the shared parse against the file on disk
+        item.resolved_path = resolved_path
+        item.shared, item.stamp = self._parsed_files.lookup(resolved_path)
+        if item.stamp is None:
+            item.error = f"{file_path}: File does not exist"
+        return item
+
+    def _load_files(
+        self, items: List["_IngestItem"], working_directory: str | None
+    ) -> None:
+        """Read and parse files, concurrently when there is more than one"""
+        if len(items) <= 1:
+            for item in items:
+                self._load_file(item, working_directory)
+            return
+
+        workers = min(INGEST_MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="vibe-ingest"
+        ) as pool:
+            list(pool.map(lambda item: self._load_file(item, working_directory), items))
+
+    def _load_file(self, item: "_IngestItem", working_directory: str | None) -> None:
+        """Read and parse one file into the shared cache"""
+        content, error = self._file_reader.read_file(
+            item.resolved_path, working_directory, include_error=True
+        )
+        if error:
+            item.error = f"{item.file_path}: {error}"
+            return
+
+        try:
+            item.shared = self._parse_file(item.resolved_path, content, item.stamp)
+        except Exception as e:
+            logger.warning(f"Error parsing file {item.resolved_path}: {e}")
+            item.error = f"{item.file_path}: Error parsing file: {e}"
+            return
+        self._parsed_files.put(item.resolved_path, item.stamp, item.shared)
+
+    def _parse_file(
+        self, resolved_path: str, content: str, stamp: FileStamp
+    ) -> FileContext:
+        """Parse a file's structure into a FileContext for the shared cache"""
+        language = self._detect_language(Path(resolved_path).suffix)
+
+        file_context = FileContext(
+            path=resolved_path,
+            content=content,
+            language=language,
+            size=len(content.encode("utf-8")),
+            last_modified=stamp[0] / 1e9,
+            hash=hashlib.md5(resolved_path.encode()).hexdigest(),
+        )
+
+        # Parse structure based on language
+        if language == "python":
+            parsed = self._code_parser.parse_python_file(content)
+            file_context.classes = parsed["classes"]
+            file_context.functions = parsed["functions"]
+            file_context.imports = parsed["imports"]
+            file_context.docstrings = parsed["docstrings"]
+        elif language in ["javascript", "typescript"]:
+            parsed = self._code_parser.parse_javascript_file(content)
+            file_context.classes = parsed["classes"]
+            file_context.functions = parsed["functions"]
+            file_context.imports = parsed["imports"]
+        elif language == "go":
+            parsed = self._code_parser.parse_go_file(content)
+            file_context.functions = parsed["functions"]
+            file_context.classes = parsed["types"]  # Go types are similar to classes
+            file_context.imports = [
+                imp
+                for group in parsed["imports"]
+                for imp in (group[0].split("\n") if group[0] else [group[1]])
+                if imp
+            ]
+        elif language == "rust":
+            parsed = self._code_parser.parse_rust_file(content)
+            file_context.functions = parsed["functions"]
+            file_context.classes = parsed[
+                "structs"
+            ]  # Rust structs are similar to classes
+            file_context.imports = parsed["uses"]
+        elif language == "java":
+            parsed = self._code_parser.parse_java_file(content)
+            file_context.classes = parsed["classes"]
+            file_context.functions = parsed["methods"]
+            file_context.imports = parsed["imports"]
+        else:
+            # Use generic parser for other languages
+            parsed = self._code_parser.parse_generic_file(content)
+            file_context.classes = parsed["classes"]
+            file_context.functions = parsed["functions"]
+            # No imports in generic parser
+
+        return file_context
+
+    def _session_view(
+        self,
+        shared: FileContext,
+        file_path: str,
+        file_hash: str,
+        query: str | None,
+    ) -> FileContext:
+        """
+        Reference a shared parse from a session.
+
+        The shared entry is used as-is when the session names the file the same
+        way and needs no query-specific lines; otherwise a lightweight view
+        shares its content and structure lists.
+        """
+        path = str(Path(file_path))
+        if path == shared.path and file_hash == shared.hash and not query:
+            return shared
+
+        relevant_lines = {}
+        if query:
+            relevant_lines = self._code_parser.extract_relevant_context(
+                shared.content, query, shared.language
+            )
+        return replace(shared, path=path, hash=file_hash, relevant_lines=relevant_lines)
+
     def get_session_context(self, session_id: str) -> Optional[SessionContext]:
         """Get session context if it exists and isn't expired"""
         if session_id in self._cache:
@@ -238,6 +357,7 @@ class ContextCache:
             "newest_session": max(
                 (s.created_at for s in self._cache.values()), default=None
             ),
+            "shared_file_cache": self._parsed_files.get_stats(),
         }
 
     def extract_files_from_query(self, query: str) -> List[str]:
@@ -260,56 +380,15 @@ class ContextCache:
     def find_project_containing_files(
         self, file_names: List[str], search_dirs: List[str] | None = None
     ) -> Optional[str]:
-        """Find a project directory containing the specified files"""
-        if not file_names:
-            return None
-
-        # Default search directories
-        if not search_dirs:
-            search_dirs = [
-                os.getcwd(),  # Current directory
-                os.path.expanduser("~/Projects"),  # Common project directory
-                os.path.expanduser("~/Documents"),
-                os.path.expanduser("~/GDrive/Projects"),  # User's specific path
-                "/tmp",  # Temporary projects
-            ]
-
-        # Search for the files in each directory
-        for base_dir in search_dirs:
-            if not os.path.exists(base_dir):
-                continue
-
-            try:
-                # Use a simple find approach (limit depth for performance)
-                for root, dirs, files in os.walk(base_dir):
-                    # Limit search depth
-                    depth = root[len(base_dir) :].count(os.sep)
-                    if depth > 3:  # Don't go too deep
-                        dirs[:] = []  # Don't recurse further
-                        continue
-
-                    # Skip hidden and system directories
-                    dirs[:] = [
-                        d
-                        for d in dirs
-                        if not d.startswith(".")
-                        and d not in ["node_modules", "venv", "__pycache__"]
-                    ]
-
-                    # Check if any target files exist here
-                    for target_file in file_names:
-                        if os.path.basename(target_file) in files:
-                            # Found a match, verify it's the right project
-                            full_path = os.path.join(
-                                root, os.path.basename(target_file)
-                            )
-                            if os.path.exists(full_path):
-                                # Return the project root (might be current dir or parent)
-                                return root
-            except (PermissionError, OSError):
-                continue
+        """
+        Find a project directory containing the specified files.
 
-        return None
+        Answered from the process-wide project file index rather than walking
+        the search directories on every call; see ``project_index``.
+        """
+        return get_project_file_index().find_project_containing_files(
+            file_names, search_dirs
+        )
 
     def load_project_registry(self) -> Dict[str, str]:
         """Load the project registry from disk"""
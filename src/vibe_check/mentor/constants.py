@@ -10,10 +10,12 @@ from pathlib import Path
 MAX_FILE_SIZE = 1024 * 1024  # 1MB max per file
 MAX_TOTAL_SIZE = 5 * 1024 * 1024  # 5MB total for all files
 MAX_FILES = 10  # Maximum number of files to read
+INGEST_MAX_WORKERS = 4  # Threads reading and parsing a session's files
 MAX_LINE_LENGTH = 1000  # Maximum line length to prevent memory issues
 
 # Cache configuration
 CACHE_TTL_SECONDS = 3600  # 1 hour cache TTL
+PARSED_FILE_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32MB shared by all sessions
 
 # File type support
 ALLOWED_EXTENSIONS = {
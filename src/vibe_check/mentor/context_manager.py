@@ -22,6 +22,8 @@ The actual implementation is split into focused submodules:
 - file_reader: FileReader for secure file access
 - code_parser: CodeParser for language-specific parsing
 - cache: ContextCache and session management
+- parsed_file_cache: ParsedFileCache shared by all sessions
+- project_index: ProjectFileIndex for project auto-discovery
 """
 
 # Re-export constants
@@ -56,6 +58,8 @@ from .cache import (
     get_context_cache,
     reset_context_cache,
 )
+from .parsed_file_cache import ParsedFileCache, get_parsed_file_cache
+from .project_index import ProjectFileIndex, get_project_file_index
 
 __all__ = [
     # Models
@@ -79,4 +83,8 @@ __all__ = [
     "ContextCache",
     "get_context_cache",
     "reset_context_cache",
+    "ParsedFileCache",
+    "get_parsed_file_cache",
+    "ProjectFileIndex",
+    "get_project_file_index",
 ]
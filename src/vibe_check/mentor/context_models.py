@@ -34,6 +34,7 @@ class FileContext:
     classes: List[str] = field(default_factory=list)
     functions: List[str] = field(default_factory=list)
     imports: List[str] = field(default_factory=list)
+    docstrings: Dict[str, str] = field(default_factory=dict)
 
     # Relevant sections
     relevant_lines: Dict[str, List[Tuple[int, str]]] = field(default_factory=dict)
@@ -2,18 +2,85 @@
 Secure file reading with validation and encoding detection.
 
 Provides safe file reading with support for multiple encodings
-and line length limits.
+and line length limits. Files are read once as bytes and decoded once:
+a byte order mark or a PEP 263 coding declaration picks the codec,
+otherwise UTF-8 is tried with a latin-1 fallback (which cannot fail).
 """
 
+import codecs
 import logging
+import re
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Optional
 
 from .validators import SecurityValidator
 from .constants import MAX_LINE_LENGTH
 
 logger = logging.getLogger(__name__)
 
+# Longest BOMs first so UTF-32 LE is not mistaken for UTF-16 LE
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_CODING_COOKIE = re.compile(rb"^[ \t\f]*#.*?coding[:=][ \t]*([-\w.]+)", re.MULTILINE)
+
+
+def detect_encoding(raw: bytes) -> Optional[str]:
+    """Sniff a file's declared encoding from its BOM or coding declaration"""
+    for bom, encoding in _BOMS:
+        if raw.startswith(bom):
+            return encoding
+
+    # PEP 263: the declaration must be on one of the first two lines
+    head = b"\n".join(raw.split(b"\n", 2)[:2])
+    match = _CODING_COOKIE.search(head)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except (LookupError, UnicodeDecodeError):
+            return None
+    return None
+
+
+def decode_content(raw: bytes) -> str:
+    """Decode file bytes once, normalizing newlines like text-mode reads"""
+    encoding = detect_encoding(raw)
+    content = None
+    if encoding:
+        try:
+            content = raw.decode(encoding)
+        except UnicodeDecodeError:
+            content = None
+    if content is None:
+        try:
+            content = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            content = raw.decode("latin-1")
+
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def truncate_long_lines(content: str, path: str) -> str:
+    """Truncate lines longer than MAX_LINE_LENGTH, splitting at most once"""
+    if len(content) <= MAX_LINE_LENGTH:
+        return content
+
+    lines = content.split("\n")
+    if all(len(line) <= MAX_LINE_LENGTH for line in lines):
+        return content
+
+    logger.warning(f"File contains very long lines: {path}")
+    return "\n".join(
+        line[:MAX_LINE_LENGTH] + "..." if len(line) > MAX_LINE_LENGTH else line
+        for line in lines
+    )
+
 
 class FileReader:
     """Secure file reader with validation"""
@@ -43,47 +110,12 @@ class FileReader:
             return None
 
         try:
-            # Read file with encoding detection
-            path = Path(resolved_path)
+            raw = Path(resolved_path).read_bytes()
+            content = truncate_long_lines(decode_content(raw), resolved_path)
 
-            # Try UTF-8 first, then fallback to latin-1
-            encodings = ["utf-8", "latin-1", "ascii"]
-            content = None
-
-            for encoding in encodings:
-                try:
-                    content = path.read_text(encoding=encoding)
-
-                    # Validate content
-                    lines = content.split("\n")
-                    if any(len(line) > MAX_LINE_LENGTH for line in lines):
-                        logger.warning(
-                            f"File contains very long lines: {resolved_path}"
-                        )
-                        # Truncate long lines
-                        lines = [
-                            (
-                                line[:MAX_LINE_LENGTH] + "..."
-                                if len(line) > MAX_LINE_LENGTH
-                                else line
-                            )
-                            for line in lines
-                        ]
-                        content = "\n".join(lines)
-
-                    if include_error:
-                        return content, None
-                    return content
-
-                except UnicodeDecodeError:
-                    continue
-
-            error_msg = (
-                f"Could not decode file with any supported encoding: {resolved_path}"
-            )
             if include_error:
-                return None, error_msg
-            return None
+                return content, None
+            return content
 
         except Exception as e:
             logger.error(f"Error reading file {resolved_path}: {str(e)}")
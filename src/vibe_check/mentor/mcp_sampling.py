@@ -8,9 +8,11 @@ without requiring API keys.
 
 import logging
 import json
+import hashlib
 import html
 import re
 import string
+import threading
 import time
 import asyncio
 from collections import OrderedDict
@@ -21,6 +23,7 @@ from enum import Enum
 # Import telemetry components
 from .telemetry import get_telemetry_collector, track_latency, TelemetryContext
 from .metrics import RouteType
+from .response_store import PersistentResponseStore
 
 # Import MCP types for sampling
 try:
@@ -34,29 +37,35 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Potential prompt injection patterns, compiled once into one alternation
+_INJECTION_PATTERNS = [
+    r"#\s*ignore\s+all\s+previous",
+    r"#\s*system\s*:",
+    r"#\s*assistant\s*:",
+    r"#\s*user\s*:",
+    r"/\*\s*SYSTEM\s*\*/",
+    r'""".*?ignore.*?instructions.*?"""',
+    r"'''.*?ignore.*?instructions.*?'''",
+]
+_INJECTION_REGEX = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in _INJECTION_PATTERNS),
+    re.IGNORECASE | re.DOTALL,
+)
+# Every injection pattern contains one of these words
+_INJECTION_PREFILTER = re.compile(r"ignore|system|assistant|user", re.IGNORECASE)
+
+
 def sanitize_code_for_llm(code: str, max_length: int = 2000) -> str:
     """Sanitize code before sending to LLM to prevent injection attacks"""
     if not code:
         return ""
 
-    # Remove potential prompt injection patterns
-    injection_patterns = [
-        r"#\s*ignore\s+all\s+previous",
-        r"#\s*system\s*:",
-        r"#\s*assistant\s*:",
-        r"#\s*user\s*:",
-        r"/\*\s*SYSTEM\s*\*/",
-        r'""".*?ignore.*?instructions.*?"""',
-        r"'''.*?ignore.*?instructions.*?'''",
-    ]
-
+    # Remove potential prompt injection patterns in a single pass; clean
+    # text without any marker keyword skips the regex entirely
     sanitized = code
-    for pattern in injection_patterns:
-        sanitized = re.sub(
-            pattern,
-            "# [REDACTED - POTENTIAL INJECTION]",
-            sanitized,
-            flags=re.IGNORECASE | re.DOTALL,
+    if _INJECTION_PREFILTER.search(sanitized):
+        sanitized = _INJECTION_REGEX.sub(
+            "# [REDACTED - POTENTIAL INJECTION]", sanitized
         )
 
     # Escape HTML entities to prevent rendering issues
@@ -89,41 +98,74 @@ class SecretsScanner:
         (r"ghp_[a-zA-Z0-9]{36}", "GITHUB_TOKEN"),
     ]
 
+    # Literal fragments, one of which every secret pattern requires; text
+    # containing none of them skips the secret regex entirely
+    PREFILTER_KEYWORDS = [
+        "api",
+        "key",
+        "token",
+        "bearer",
+        "password",
+        "sk-",
+        "ghp_",
+        "begin",
+    ]
+
+    _prefilter = re.compile(
+        "|".join(re.escape(keyword) for keyword in PREFILTER_KEYWORDS),
+        re.IGNORECASE,
+    )
+    # All patterns as one alternation of named groups, matched in one pass
+    _combined = re.compile(
+        "|".join(
+            f"(?P<{secret_type}>{pattern})" for pattern, secret_type in SECRET_PATTERNS
+        ),
+        re.IGNORECASE,
+    )
+
+    @classmethod
+    def _find_secrets(cls, text: str) -> List["re.Match[str]"]:
+        """Non-overlapping secret matches in text order"""
+        if not text or not cls._prefilter.search(text):
+            return []
+        return list(cls._combined.finditer(text))
+
     @classmethod
     def scan_and_redact(cls, text: str) -> Tuple[str, List[Dict[str, str]]]:
         """Scan text for secrets and redact them"""
-        redacted_text = text
-        found_secrets = []
-
-        for pattern, secret_type in cls.SECRET_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                secret_value = match.group(0)
-                redacted_value = f"[REDACTED_{secret_type}]"
-                redacted_text = redacted_text.replace(secret_value, redacted_value)
-
-                found_secrets.append(
-                    {
-                        "type": secret_type,
-                        "location": match.start(),
-                        "length": len(secret_value),
-                    }
-                )
+        matches = cls._find_secrets(text)
+        if not matches:
+            return text, []
 
-        if found_secrets:
-            logger.warning(
-                f"Detected and redacted {len(found_secrets)} potential secrets"
+        # Rebuild the text once from the spans between matches
+        parts = []
+        found_secrets = []
+        position = 0
+        for match in matches:
+            secret_type = match.lastgroup
+            parts.append(text[position : match.start()])
+            parts.append(f"[REDACTED_{secret_type}]")
+            position = match.end()
+
+            found_secrets.append(
+                {
+                    "type": secret_type,
+                    "location": match.start(),
+                    "length": match.end() - match.start(),
+                }
             )
+        parts.append(text[position:])
 
-        return redacted_text, found_secrets
+        logger.warning(f"Detected and redacted {len(found_secrets)} potential secrets")
+
+        return "".join(parts), found_secrets
 
     @classmethod
     def validate_safe(cls, text: str) -> bool:
         """Check if text is safe (no secrets detected)"""
-        for pattern, _ in cls.SECRET_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return False
-        return True
+        if not text or not cls._prefilter.search(text):
+            return True
+        return cls._combined.search(text) is None
 
 
 class ResponseQuality(Enum):
@@ -699,77 +741,247 @@ class MCPSamplingClient:
 
 
 class ResponseCache:
-    """LRU cache for frequently generated responses with TTL support"""
+    """
+    LRU cache for frequently generated responses with TTL support.
+
+    Exact lookups key on the intent, the full normalised query and the
+    technologies/patterns context. On an exact miss a second tier looks the
+    query up by its content words, in order, within the same intent and
+    context, so near-duplicates that differ only in case, punctuation,
+    spacing or filler words share a response. Any other word change, such
+    as a negation or a swapped technology, is a miss: embedding similarity
+    barely moves when one word of a long query changes, so it cannot tell
+    "store passwords in plaintext" from "store passwords hashed with bcrypt".
+
+    With a persistent ``store`` every response is also written to disk, exact
+    misses fall through to it, and the most recent stored entries are loaded
+    on first use, so responses survive restarts and are shared between
+    server processes. Only stored entries younger than this cache's TTL are
+    loaded. Store I/O can wait on other processes' writes, so async callers
+    should run get/put in a worker thread; the cache is thread-safe.
+    """
+
+    STORE_NAMESPACE = "dynamic_response"
+    # Words a near-duplicate may differ by; negations and prepositions are
+    # deliberately absent because they change the answer
+    IGNORED_WORDS = frozenset(
+        {"a", "an", "the", "please", "just", "really", "actually", "basically"}
+    )
 
-    def __init__(self, max_size: int = 100, ttl_seconds: int = 3600):
+    def __init__(
+        self,
+        max_size: int = 100,
+        ttl_seconds: int = 3600,
+        match_near_duplicates: bool = True,
+        store: Optional[PersistentResponseStore] = None,
+    ):
+        """
+        Args:
+            max_size: Maximum number of cached responses
+            ttl_seconds: Time-to-live of each cached response
+            match_near_duplicates: Serve queries with the same content words
+                from the second tier
+            store: Optional on-disk store shared across server processes
+        """
         self.cache: OrderedDict[str, Tuple[Dict[str, Any], float]] = OrderedDict()
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
+        self.match_near_duplicates = match_near_duplicates
         self.hits = 0
         self.misses = 0
+        self.near_duplicate_hits = 0
+        self.store = store
+        self.store_hits = 0
+        self._warmed = False
+        self._lock = threading.RLock()
+
+        # Near-duplicate tier, mirroring self.cache: (scope, words) -> key
+        self._near_keys: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        self._near_index: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    @classmethod
+    def _content_words(cls, query: str) -> Tuple[str, ...]:
+        """Query words in order, without punctuation or ignorable filler"""
+        return tuple(
+            word
+            for word in re.findall(r"[a-z0-9]+(?:'[a-z]+)?", query.lower())
+            if word not in cls.IGNORED_WORDS
+        )
+
+    @staticmethod
+    def _get_scope(intent: str, context: Dict[str, Any]) -> str:
+        """Intent and context part of the key; near-duplicates never cross it"""
+        return "|".join(
+            [
+                intent,
+                ",".join(sorted(context.get("technologies", []))),
+                ",".join(sorted(context.get("patterns", []))),
+            ]
+        )
 
     def get_cache_key(self, intent: str, query: str, context: Dict[str, Any]) -> str:
         """Generate a cache key from request parameters"""
-        # Create a simple hash of the key components
-        key_parts = [
-            intent,
-            query[:100],  # First 100 chars of query
-            ",".join(sorted(context.get("technologies", []))),
-            ",".join(sorted(context.get("patterns", []))),
-        ]
-        return "|".join(key_parts)
+        # Hash the whole query so long queries sharing a prefix do not collide
+        query_hash = hashlib.sha256(
+            self._normalize_query(query).encode("utf-8")
+        ).hexdigest()[:16]
+        return f"{self._get_scope(intent, context)}|{query_hash}"
 
     def get(
         self, intent: str, query: str, context: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Get a cached response if available and not expired"""
-        key = self.get_cache_key(intent, query, context)
-        if key in self.cache:
+        with self._lock:
+            self._warm_from_store()
+            key = self.get_cache_key(intent, query, context)
+            near_duplicate = False
+            if key not in self.cache and not self._load_from_store(key):
+                key = self._find_near_duplicate(intent, query, context)
+                if key is None:
+                    self.misses += 1
+                    return None
+                near_duplicate = True
+
             response, timestamp = self.cache[key]
 
             # Check if expired
             if time.time() - timestamp > self.ttl_seconds:
                 # Remove expired entry
-                del self.cache[key]
+                self._remove(key)
                 self.misses += 1
                 return None
 
             # Move to end (most recently used)
             self.cache.move_to_end(key)
             self.hits += 1
-            logger.debug(f"Cache hit for key: {key[:50]}...")
-            return response
-        else:
-            self.misses += 1
-            return None
+            if near_duplicate:
+                self.near_duplicate_hits += 1
+        logger.debug(f"Cache hit for key: {key[:50]}...")
+        return response
 
     def put(
         self, intent: str, query: str, context: Dict[str, Any], response: Dict[str, Any]
     ):
         """Store a response in the cache with timestamp"""
         key = self.get_cache_key(intent, query, context)
+        scope = self._get_scope(intent, context)
+        with self._lock:
+            self._insert(key, scope, query, response, time.time())
+
+        if self.store is not None:
+            self.store.put(
+                self.STORE_NAMESPACE,
+                key,
+                json.dumps(
+                    {"scope": scope, "query": query, "response": response},
+                    default=str,
+                ),
+            )
+
+        logger.debug(f"Cached response for key: {key[:50]}...")
 
+    def _insert(
+        self,
+        key: str,
+        scope: str,
+        query: str,
+        response: Dict[str, Any],
+        timestamp: float,
+    ):
+        """Add an entry to the in-memory tiers"""
         # If key exists, move to end
         if key in self.cache:
             self.cache.move_to_end(key)
 
         # Add new entry
-        self.cache[key] = (response, time.time())
+        self.cache[key] = (response, timestamp)
+        if self.match_near_duplicates and key not in self._near_index:
+            near_key = (scope, self._content_words(query))
+            # The newest entry answers for its word sequence
+            self._drop_near_key(self._near_keys.get(near_key))
+            self._near_keys[near_key] = key
+            self._near_index[key] = near_key
 
         # Remove least recently used if over limit
         while len(self.cache) > self.max_size:
             # Remove least recently used (first item)
-            self.cache.popitem(last=False)
+            self._remove(next(iter(self.cache)))
 
-        logger.debug(f"Cached response for key: {key[:50]}...")
+    def _remove(self, key: str):
+        """Drop an entry from both in-memory tiers"""
+        self.cache.pop(key, None)
+        self._drop_near_key(key)
+
+    def _drop_near_key(self, key: Optional[str]):
+        near_key = self._near_index.pop(key, None) if key is not None else None
+        if near_key is not None and self._near_keys.get(near_key) == key:
+            del self._near_keys[near_key]
+
+    def _load_from_store(self, key: str) -> bool:
+        """Pull an entry written by an earlier or parallel server process"""
+        if self.store is None:
+            return False
+        stored = self.store.get(self.STORE_NAMESPACE, key, max_age=self.ttl_seconds)
+        if stored is None:
+            return False
+        value, stored_at = stored
+        try:
+            entry = json.loads(value)
+            self._insert(
+                key, entry["scope"], entry["query"], entry["response"], stored_at
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Skipping unreadable stored response {key[:50]}: {e}")
+            return False
+        self.store_hits += 1
+        return True
+
+    def _warm_from_store(self):
+        """Load the most recently used stored entries once, for the second tier"""
+        if self.store is None or self._warmed:
+            return
+        self._warmed = True
+        # Oldest first, so the most recently used entries end up most recent here
+        recent = self.store.recent(
+            self.STORE_NAMESPACE, self.max_size, max_age=self.ttl_seconds
+        )
+        for key, value, stored_at in reversed(recent):
+            try:
+                entry = json.loads(value)
+                self._insert(
+                    key, entry["scope"], entry["query"], entry["response"], stored_at
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                logger.debug(f"Skipping unreadable stored response {key[:50]}: {e}")
+
+    def _find_near_duplicate(
+        self, intent: str, query: str, context: Dict[str, Any]
+    ) -> Optional[str]:
+        """Key of a cached query with the same content words in the same scope"""
+        if not self.match_near_duplicates:
+            return None
+        near_key = (self._get_scope(intent, context), self._content_words(query))
+        key = self._near_keys.get(near_key)
+        if key is not None:
+            logger.debug("Near-duplicate cache hit")
+        return key
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
         total = self.hits + self.misses
         hit_rate = (self.hits / total * 100) if total > 0 else 0
+        with self._lock:
+            size = len(self.cache)
         return {
-            "size": len(self.cache),
+            "size": size,
             "hits": self.hits,
             "misses": self.misses,
             "hit_rate": f"{hit_rate:.1f}%",
+            "near_duplicate_hits": self.near_duplicate_hits,
+            "store_hits": self.store_hits,
+            "persistent": self.store is not None,
         }
@@ -0,0 +1,125 @@
+"""
+Process-wide cache of parsed workspace files.
+
+Mentor sessions used to re-read and re-parse every file they were given, even
+when another session had parsed the same file moments earlier. This cache
+keeps one parsed FileContext per resolved path, stamped with the file's
+mtime_ns and size. A lookup costs a single ``os.stat``; an entry whose stamp
+no longer matches the file on disk is dropped and the file is parsed again.
+Entries are evicted least-recently-used once their content exceeds a byte
+budget.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .constants import PARSED_FILE_CACHE_MAX_BYTES
+from .context_models import FileContext
+
+FileStamp = Tuple[int, int]
+
+
+class ParsedFileCache:
+    """Byte-bounded LRU of parsed files keyed by (resolved path, mtime_ns, size)"""
+
+    def __init__(self, max_bytes: int = PARSED_FILE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[FileStamp, FileContext]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+
+    @staticmethod
+    def stamp(resolved_path: str) -> Optional[FileStamp]:
+        """Return (mtime_ns, size) for a file, or None if it cannot be stat'ed"""
+        try:
+            stat = os.stat(resolved_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def lookup(
+        self, resolved_path: str
+    ) -> Tuple[Optional[FileContext], Optional[FileStamp]]:
+        """
+        Look up a parsed file, revalidating it against the file on disk.
+
+        Returns:
+            Tuple of (cached context or None, current stamp or None if the
+            file cannot be stat'ed)
+        """
+        current = self.stamp(resolved_path)
+        with self._lock:
+            entry = self._entries.get(resolved_path)
+            if entry is not None and current is not None and entry[0] == current:
+                self._entries.move_to_end(resolved_path)
+                self.hits += 1
+                return entry[1], current
+
+            if entry is not None:
+                self._remove(resolved_path)
+                self.stale += 1
+            self.misses += 1
+        return None, current
+
+    def put(
+        self, resolved_path: str, stamp: FileStamp, file_context: FileContext
+    ) -> None:
+        """Cache a parsed file under the stamp it was read with"""
+        if file_context.size > self.max_bytes:
+            return
+
+        with self._lock:
+            if resolved_path in self._entries:
+                self._remove(resolved_path)
+            self._entries[resolved_path] = (stamp, file_context)
+            self._bytes += file_context.size
+
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, resolved_path: str) -> None:
+        _, file_context = self._entries.pop(resolved_path)
+        self._bytes -= file_context.size
+
+    def clear(self) -> None:
+        """Drop all parsed files and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.stale = self.evictions = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get shared cache statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+            return {
+                "files": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": f"{hit_rate:.1f}%",
+                "stale": self.stale,
+                "evictions": self.evictions,
+            }
+
+
+# Global parsed file cache instance
+_parsed_file_cache: Optional[ParsedFileCache] = None
+
+
+def get_parsed_file_cache() -> ParsedFileCache:
+    """Get or create the process-wide parsed file cache"""
+    global _parsed_file_cache
+    if _parsed_file_cache is None:
+        _parsed_file_cache = ParsedFileCache()
+    return _parsed_file_cache
@@ -0,0 +1,384 @@
+"""
+Indexed project discovery for workspace auto-discovery.
+
+When a mentor query mentions a file name but no working directory is set,
+the mentor looks for a project directory containing that file under a few
+search roots. Walking those roots on every call visits tens of thousands of
+directory entries on large hosts, so this module keeps a basename -> directories
+index per root instead:
+
+- Built lazily the first time a root is searched, with the same depth limit
+  and skipped directories as the original walk
+- Persisted as a JSON snapshot (``~/.vibe-check/project_index.json`` by
+  default) so new server processes start warm
+- Refreshed incrementally: only directories whose mtime changed (entries
+  added, removed or renamed) are listed again. A stale root is refreshed in
+  a background thread after a hit, and before answering on a miss so files
+  created since the snapshot are still found
+
+Lookups are dictionary reads; the candidate file is checked on disk before a
+directory is returned, so a stale entry is never reported.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+MEMORY_INDEX = ":memory:"
+PROJECT_INDEX_ENV_VAR = "VIBE_CHECK_PROJECT_INDEX"
+SEARCH_DIRS_ENV_VAR = "VIBE_CHECK_PROJECT_SEARCH_DIRS"
+DEFAULT_PROJECT_INDEX_PATH = Path.home() / ".vibe-check" / "project_index.json"
+MAX_SEARCH_DEPTH = 3
+REFRESH_INTERVAL_SECONDS = 60.0
+SKIPPED_DIRECTORIES = {"node_modules", "venv", "__pycache__"}
+
+
+def default_search_dirs() -> List[str]:
+    """
+    Roots searched for projects.
+
+    VIBE_CHECK_PROJECT_SEARCH_DIRS (os.pathsep-separated) replaces the
+    defaults: the current directory, ~/Projects, ~/Documents,
+    ~/GDrive/Projects and /tmp.
+    """
+    configured = os.environ.get(SEARCH_DIRS_ENV_VAR)
+    if configured:
+        return [
+            os.path.expanduser(d) for d in configured.split(os.pathsep) if d.strip()
+        ]
+    return [
+        os.getcwd(),  # Current directory
+        os.path.expanduser("~/Projects"),  # Common project directory
+        os.path.expanduser("~/Documents"),
+        os.path.expanduser("~/GDrive/Projects"),  # User's specific path
+        "/tmp",  # Temporary projects
+    ]
+
+
+def resolve_project_index_path(configured: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve where the index snapshot is stored; None keeps it in memory.
+
+    Order: explicit configuration, the VIBE_CHECK_PROJECT_INDEX environment
+    variable, then ~/.vibe-check/project_index.json. Set the variable to
+    ":memory:" to keep the index in process memory only.
+    """
+    path = (
+        configured
+        or os.environ.get(PROJECT_INDEX_ENV_VAR)
+        or str(DEFAULT_PROJECT_INDEX_PATH)
+    )
+    return None if path == MEMORY_INDEX else path
+
+
+@dataclass
+class RootIndex:
+    """Directories and file basenames indexed under one search root"""
+
+    root: str
+    # directory -> (mtime_ns, depth below root)
+    dirs: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    # directory -> file basenames directly inside it
+    dir_files: Dict[str, List[str]] = field(default_factory=dict)
+    # basename -> directories containing a file with that name
+    files: Dict[str, Set[str]] = field(default_factory=dict)
+    refreshed_at: float = 0.0
+
+    def copy(self) -> "RootIndex":
+        return RootIndex(
+            root=self.root,
+            dirs=dict(self.dirs),
+            dir_files=dict(self.dir_files),
+            files={name: set(dirs) for name, dirs in self.files.items()},
+            refreshed_at=self.refreshed_at,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dirs": {d: list(stamp) for d, stamp in self.dirs.items()},
+            "dir_files": self.dir_files,
+            "refreshed_at": self.refreshed_at,
+        }
+
+    @classmethod
+    def from_dict(cls, root: str, data: Dict[str, Any]) -> "RootIndex":
+        index = cls(root=root, refreshed_at=data.get("refreshed_at", 0.0))
+        index.dirs = {d: (stamp[0], stamp[1]) for d, stamp in data["dirs"].items()}
+        for directory, names in data["dir_files"].items():
+            index._set_files(directory, names)
+        return index
+
+    def _set_files(self, directory: str, names: List[str]) -> None:
+        for name in self.dir_files.get(directory, []):
+            holders = self.files.get(name)
+            if holders is not None:
+                holders.discard(directory)
+                if not holders:
+                    del self.files[name]
+        self.dir_files[directory] = names
+        for name in names:
+            self.files.setdefault(name, set()).add(directory)
+
+    def _drop_tree(self, directory: str) -> None:
+        prefix = directory.rstrip(os.sep) + os.sep
+        for d in [d for d in self.dirs if d == directory or d.startswith(prefix)]:
+            self._set_files(d, [])
+            del self.dir_files[d]
+            del self.dirs[d]
+
+    def scan(self, directory: str, depth: int) -> None:
+        """List a directory, index its files and scan new subdirectories"""
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                listing = list(entries)
+        except OSError:
+            self._drop_tree(directory)
+            return
+
+        names = []
+        subdirs = []
+        for entry in listing:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                names.append(entry.name)
+            elif (
+                not entry.name.startswith(".")
+                and entry.name not in SKIPPED_DIRECTORIES
+                and not entry.is_symlink()
+                and depth < MAX_SEARCH_DEPTH
+            ):
+                subdirs.append(entry.path)
+
+        rescan = directory in self.dirs
+        self.dirs[directory] = (mtime_ns, depth)
+        self._set_files(directory, names)
+
+        # On a rescan, forget subdirectories that disappeared
+        if rescan:
+            prefix = directory.rstrip(os.sep) + os.sep
+            current = set(subdirs)
+            for d, (_, d_depth) in list(self.dirs.items()):
+                if d_depth == depth + 1 and d.startswith(prefix) and d not in current:
+                    self._drop_tree(d)
+        for subdir in subdirs:
+            if subdir not in self.dirs:
+                self.scan(subdir, depth + 1)
+
+    def build(self) -> None:
+        """Index the whole root"""
+        self.dirs.clear()
+        self.dir_files.clear()
+        self.files.clear()
+        if os.path.isdir(self.root):
+            self.scan(self.root, 0)
+        self.refreshed_at = time.time()
+
+    def refresh(self) -> int:
+        """Re-list directories whose mtime changed; returns how many changed"""
+        changed = []
+        for directory, (mtime_ns, depth) in list(self.dirs.items()):
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime_ns:
+                changed.append((depth, directory))
+
+        # Parents first, so dropped subtrees are not listed needlessly
+        for depth, directory in sorted(changed):
+            if directory in self.dirs or directory == self.root:
+                self.scan(directory, depth)
+        if not self.dirs and os.path.isdir(self.root):
+            self.scan(self.root, 0)
+        self.refreshed_at = time.time()
+        return len(changed)
+
+    def find(self, file_names: List[str]) -> Optional[str]:
+        """Shallowest directory containing any of the given files"""
+        candidates = set()
+        for file_name in file_names:
+            basename = os.path.basename(file_name)
+            for directory in self.files.get(basename, ()):
+                if os.path.exists(os.path.join(directory, basename)):
+                    candidates.add(directory)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda d: (self.dirs[d][1], d))
+
+
+class ProjectFileIndex:
+    """Process-wide basename index over the project search roots"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        refresh_interval: float = REFRESH_INTERVAL_SECONDS,
+    ):
+        self.path = resolve_project_index_path(path)
+        self.refresh_interval = refresh_interval
+        self._roots: Dict[str, RootIndex] = {}
+        self._lock = threading.Lock()
+        self._refreshing: Set[str] = set()
+        self._loaded = False
+        self.lookups = 0
+        self.hits = 0
+        self.builds = 0
+        self.refreshes = 0
+
+    def find_project_containing_files(
+        self, file_names: List[str], search_dirs: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """Return the first directory, by root order, containing any file"""
+        if not file_names:
+            return None
+        with self._lock:
+            self.lookups += 1
+
+        for base_dir in search_dirs or default_search_dirs():
+            root = os.path.abspath(base_dir)
+            index = self._get_root(root)
+            if index is None:
+                continue
+
+            found = index.find(file_names)
+            stale = time.time() - index.refreshed_at > self.refresh_interval
+            if not found and stale:
+                # The files may have been created since the last refresh;
+                # catching up is incremental, so do it before answering
+                index = self.refresh(root) or index
+                found = index.find(file_names)
+            elif stale:
+                self.refresh_in_background(root)
+
+            if found:
+                with self._lock:
+                    self.hits += 1
+                return found
+        return None
+
+    def _get_root(self, root: str) -> Optional[RootIndex]:
+        self._load_snapshot()
+        with self._lock:
+            index = self._roots.get(root)
+        if index is not None:
+            return index
+        if not os.path.isdir(root):
+            return None
+
+        # First search of this root: build it now, the caller needs an answer
+        index = RootIndex(root=root)
+        index.build()
+        with self._lock:
+            self._roots[root] = index
+            self.builds += 1
+        self._save_snapshot()
+        return index
+
+    def refresh(self, root: str) -> Optional[RootIndex]:
+        """Incrementally refresh one root, swapping in the result atomically"""
+        with self._lock:
+            current = self._roots.get(root)
+        if current is None:
+            return None
+        updated = current.copy()
+        updated.refresh()
+        with self._lock:
+            self._roots[root] = updated
+            self.refreshes += 1
+        self._save_snapshot()
+        return updated
+
+    def refresh_in_background(self, root: str) -> None:
+        """Refresh a root on a daemon thread unless one is already running"""
+        with self._lock:
+            if root in self._refreshing:
+                return
+            self._refreshing.add(root)
+
+        def run():
+            try:
+                self.refresh(root)
+            except Exception as e:
+                logger.warning(f"Project index refresh failed for {root}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(root)
+
+        threading.Thread(target=run, name="vibe-project-index", daemon=True).start()
+
+    def _load_snapshot(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            roots = {
+                root: RootIndex.from_dict(root, entry) for root, entry in data.items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as e:
+            logger.warning(f"Ignoring unreadable project index {self.path}: {e}")
+            return
+        with self._lock:
+            for root, index in roots.items():
+                self._roots.setdefault(root, index)
+
+    def _save_snapshot(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            data = {root: index.to_dict() for root, index in self._roots.items()}
+        try:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save project index to {self.path}: {e}")
+
+    def clear(self) -> None:
+        """Forget all indexed roots and reset statistics"""
+        with self._lock:
+            self._roots.clear()
+            self._loaded = False
+            self.lookups = self.hits = self.builds = self.refreshes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics"""
+        with self._lock:
+            return {
+                "path": self.path or "memory",
+                "roots": len(self._roots),
+                "directories": sum(len(i.dirs) for i in self._roots.values()),
+                "basenames": sum(len(i.files) for i in self._roots.values()),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "builds": self.builds,
+                "refreshes": self.refreshes,
+            }
+
+
+# Global project file index instance
+_project_file_index: Optional[ProjectFileIndex] = None
+
+
+def get_project_file_index() -> ProjectFileIndex:
+    """Get or create the process-wide project file index"""
+    global _project_file_index
+    if _project_file_index is None:
+        _project_file_index = ProjectFileIndex()
+    return _project_file_index
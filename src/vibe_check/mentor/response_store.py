@@ -0,0 +1,223 @@
+"""
+Persistent Mentor Response Store
+
+On-disk backend for the mentor's dynamic response cache. Every stdio client
+session spawns its own server process, so an in-memory cache starts cold on
+each restart; this store keeps expensive ``ctx.sample`` results across
+restarts and shares them between server processes running on the same host.
+
+Entries live in a SQLite database (``~/.vibe-check/mentor_cache.db`` by
+default) in WAL mode. Each write is a single transaction, so concurrent
+processes see either the old or the new entry, and a busy timeout serialises
+writers instead of failing. Entries expire after a TTL and are evicted
+least-recently-used beyond ``max_entries`` per namespace. Readers with a
+shorter TTL of their own pass it as ``max_age`` so they never load entries
+they would immediately discard.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MEMORY_STORE = ":memory:"
+MENTOR_CACHE_ENV_VAR = "VIBE_CHECK_MENTOR_CACHE"
+DEFAULT_MENTOR_CACHE_PATH = Path.home() / ".vibe-check" / "mentor_cache.db"
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TTL_SECONDS = 24 * 3600
+BUSY_TIMEOUT_SECONDS = 10.0
+
+
+def resolve_mentor_cache_path(configured: Optional[str] = None) -> str:
+    """
+    Resolve where mentor responses are stored.
+
+    Order: explicit configuration, the VIBE_CHECK_MENTOR_CACHE environment
+    variable, then ~/.vibe-check/mentor_cache.db.
+    Set the variable to ":memory:" to keep responses in process memory only.
+    """
+    if configured:
+        return configured
+    from_env = os.environ.get(MENTOR_CACHE_ENV_VAR)
+    if from_env:
+        return from_env
+    return str(DEFAULT_MENTOR_CACHE_PATH)
+
+
+class PersistentResponseStore:
+    """SQLite-backed key/value store of JSON-encoded mentor responses"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS mentor_responses (
+            namespace TEXT NOT NULL,
+            cache_key TEXT NOT NULL,
+            value TEXT NOT NULL,
+            stored_at REAL NOT NULL,
+            last_used REAL NOT NULL,
+            PRIMARY KEY (namespace, cache_key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_mentor_responses_last_used
+            ON mentor_responses (namespace, last_used);
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = resolve_mentor_cache_path(path)
+        self._lock = threading.Lock()
+        self._conn = self._connect(self.path)
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        if path != MEMORY_STORE:
+            Path(path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            path = str(Path(path).expanduser())
+        conn = sqlite3.connect(
+            path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False
+        )
+        if path != MEMORY_STORE:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(PersistentResponseStore.SCHEMA)
+        return conn
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        try:
+            return self._open(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                f"Could not open mentor response store at {path} ({e}); "
+                "responses will not survive a restart"
+            )
+            self.path = MEMORY_STORE
+            return self._open(MEMORY_STORE)
+
+    def _max_age(self, max_age: Optional[float]) -> float:
+        return self.ttl_seconds if max_age is None else min(max_age, self.ttl_seconds)
+
+    def get(
+        self, namespace: str, key: str, max_age: Optional[float] = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Return (value, stored_at) for key, or None on miss or expiry.
+
+        max_age: Treat entries older than this as misses (capped at the TTL)
+        """
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT value, stored_at FROM mentor_responses "
+                    "WHERE namespace = ? AND cache_key = ?",
+                    (namespace, key),
+                ).fetchone()
+                if row is None or now - row[1] > self._max_age(max_age):
+                    # Only entries past the store TTL are dead for every reader
+                    if row is not None and now - row[1] > self.ttl_seconds:
+                        self._conn.execute(
+                            "DELETE FROM mentor_responses "
+                            "WHERE namespace = ? AND cache_key = ?",
+                            (namespace, key),
+                        )
+                    self.misses += 1
+                    return None
+
+                self._conn.execute(
+                    "UPDATE mentor_responses SET last_used = ? "
+                    "WHERE namespace = ? AND cache_key = ?",
+                    (now, namespace, key),
+                )
+                self.hits += 1
+            return row[0], row[1]
+        except sqlite3.Error as e:
+            logger.warning(f"Mentor response store read failed: {e}")
+            self.misses += 1
+            return None
+
+    def put(self, namespace: str, key: str, value: str) -> None:
+        """Store a value, evicting least recently used entries beyond max_entries"""
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO mentor_responses "
+                    "(namespace, cache_key, value, stored_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (namespace, key, value, now, now),
+                )
+                self._conn.execute(
+                    "DELETE FROM mentor_responses WHERE namespace = ? AND cache_key IN ("
+                    "SELECT cache_key FROM mentor_responses WHERE namespace = ? "
+                    "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (namespace, namespace, self.max_entries),
+                )
+        except sqlite3.Error as e:
+            # A failed write only costs a future cache miss
+            logger.warning(f"Mentor response store write failed: {e}")
+            self.write_errors += 1
+
+    def recent(
+        self, namespace: str, limit: int, max_age: Optional[float] = None
+    ) -> List[Tuple[str, str, float]]:
+        """Most recently used (key, value, stored_at) entries younger than max_age"""
+        try:
+            with self._lock:
+                return self._conn.execute(
+                    "SELECT cache_key, value, stored_at FROM mentor_responses "
+                    "WHERE namespace = ? AND stored_at >= ? "
+                    "ORDER BY last_used DESC LIMIT ?",
+                    (namespace, time.time() - self._max_age(max_age), limit),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Mentor response store read failed: {e}")
+            return []
+
+    def clear(self) -> None:
+        """Drop all stored responses and reset statistics"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM mentor_responses")
+            self.hits = self.misses = self.write_errors = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        with self._lock:
+            size = self._conn.execute(
+                "SELECT COUNT(*) FROM mentor_responses"
+            ).fetchone()[0]
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+            return {
+                "path": self.path,
+                "size": size,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": f"{hit_rate:.1f}%",
+                "write_errors": self.write_errors,
+            }
+
+
+# Global mentor response store instance
+_response_store: Optional[PersistentResponseStore] = None
+
+
+def get_mentor_response_store() -> PersistentResponseStore:
+    """Get or create the process-wide mentor response store"""
+    global _response_store
+    if _response_store is None:
+        _response_store = PersistentResponseStore()
+    return _response_store
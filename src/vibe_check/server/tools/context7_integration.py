@@ -16,6 +16,8 @@ from typing import Dict, Any, Optional, List, Union
 from mcp.server.fastmcp import FastMCP
 from enum import Enum
 
+from vibe_check.tools.shared.single_flight import get_single_flight
+
 logger = logging.getLogger(__name__)
 
 
@@ -385,6 +387,16 @@ class Context7Manager:
 
         self._cache_misses += 1
 
+        # Concurrent requests for the same docs share one Context7 call
+        return await get_single_flight().do(
+            ("context7_docs", id(self), cache_key),
+            lambda: self._fetch_library_docs(library_id, topic, cache_key),
+        )
+
+    async def _fetch_library_docs(
+        self, library_id: str, topic: Optional[str], cache_key: str
+    ) -> Optional[str]:
+        """Fetch docs from Context7 behind the circuit breaker and cache them"""
         # Check circuit breaker before making external call
         if not self._circuit_breaker.call_allowed():
             logger.warning(
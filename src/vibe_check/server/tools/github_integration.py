@@ -1,13 +1,6 @@
 import logging
 from typing import Any, Dict
 from vibe_check.server.core import mcp
-from vibe_check.tools.analyze_issue_nollm import (
-    analyze_issue as analyze_github_issue_tool,
-)
-from vibe_check.tools.analyze_pr_nollm import (
-    analyze_pr_nollm as analyze_pr_nollm_function,
-)
-from vibe_check.tools.pr_review import review_pull_request
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +65,11 @@ def analyze_issue_nollm(
     if post_comment is None:
         post_comment = analysis_mode == "comprehensive"
 
+    # Imported on first use: pulls in PyGithub and the legacy framework
+    from vibe_check.tools.analyze_issue_nollm import (
+        analyze_issue as analyze_github_issue_tool,
+    )
+
     logger.info(
         f"GitHub issue analysis ({analysis_mode}): #{issue_number} in {repository}"
     )
@@ -116,6 +114,10 @@ def analyze_pr_nollm(
     Returns:
         Fast PR analysis with basic recommendations
     """
+    from vibe_check.tools.analyze_pr_nollm import (
+        analyze_pr_nollm as analyze_pr_nollm_function,
+    )
+
     logger.info(
         f"Fast PR analysis requested: #{pr_number} in {repository} (mode: {analysis_mode})"
     )
@@ -159,6 +161,10 @@ async def review_pr_comprehensive(
     Returns:
         Comprehensive PR analysis with file type breakdown and recommendations
     """
+    # From main: the package attribute is shadowed once the deprecated
+    # pr_review.review_pull_request module has been imported
+    from vibe_check.tools.pr_review.main import review_pull_request
+
     logger.info(
         f"🔍 Starting enhanced PR review for PR #{pr_number} with model: {model}"
     )
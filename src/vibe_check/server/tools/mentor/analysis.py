@@ -1,9 +1,10 @@
+import asyncio
 import logging
 import re
 import os
 import random
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from vibe_check.tools.analyze_text_nollm import analyze_text_demo
 from vibe_check.core.business_context_extractor import (
     BusinessContextExtractor,
@@ -11,9 +12,13 @@ from vibe_check.core.business_context_extractor import (
 )
 from vibe_check.tools.shared.github_abstraction import get_default_github_operations
 from vibe_check.tools.contextual_documentation import get_context_manager
+from .pipeline import StageTimer
 
 logger = logging.getLogger(__name__)
+# The whole diff is still fetched and held in memory before it is streamed
+# through detection, so keep the cap modest
 DEFAULT_MAX_DIFF_SIZE = 50000
+DIFF_SECTION_MAX_CHARS = 64_000
 
 
 async def analyze_query_and_context(
@@ -22,11 +27,21 @@ async def analyze_query_and_context(
     phase: str,
     mode: str,
     confidence_threshold: float,
+    timer: Optional[StageTimer] = None,
 ) -> Dict[str, Any]:
-    """Analyzes the query and context for patterns and business context."""
-
-    context_extractor = BusinessContextExtractor()
-    business_context = context_extractor.extract_context(query, context, phase=phase)
+    """Analyzes the query and context for patterns and business context.
+
+    The PR diff fetch and project context load are independent, so they run
+    concurrently in worker threads; pattern detection also runs off the event
+    loop. Stage durations are recorded on ``timer`` when one is given.
+    """
+    timer = timer or StageTimer()
+
+    with timer.stage("business_context"):
+        context_extractor = BusinessContextExtractor()
+        business_context = context_extractor.extract_context(
+            query, context, phase=phase
+        )
 
     logger.info(
         f"Business context: type={business_context.primary_type.value}, confidence={business_context.confidence:.2f}"
@@ -60,26 +75,23 @@ async def analyze_query_and_context(
             + f"\n\n*Context indicators detected: {', '.join(business_context.indicators[:3]) if business_context.indicators else 'none'}*",
         }
 
-    pr_diff_content = await fetch_pr_diff(query, context)
-
-    project_context = None
-    try:
-        context_manager = get_context_manager(".")
-        project_context = context_manager.get_project_context()
-        logger.info(
-            f"Loaded project context with {len(project_context.library_docs)} libraries for mentor analysis"
-        )
-    except Exception as e:
-        logger.warning(f"Failed to load project context for mentor: {e}")
+    pr_diff_content, project_context = await asyncio.gather(
+        timer.timed("pr_diff", fetch_pr_diff(query, context)),
+        timer.run("project_context", _load_project_context),
+    )
 
     enhanced_text = f"{query}\n\n{context}" if context else query
-    enhanced_text += pr_diff_content
 
-    vibe_analysis = analyze_text_demo(
+    # The PR diff is streamed through detection section by section instead of
+    # being appended to (and lowercased with) the query text
+    vibe_analysis = await timer.run(
+        "pattern_detection",
+        analyze_text_demo,
         enhanced_text,
         detail_level="standard",
         context=project_context,
         use_project_context=True,
+        stream_chunks=iter_diff_sections(pr_diff_content) if pr_diff_content else None,
     )
 
     patterns_raw = vibe_analysis.get("patterns", [])
@@ -126,6 +138,33 @@ async def analyze_query_and_context(
     }
 
 
+def _load_project_context():
+    """Loads the project context for the current directory, or None on failure."""
+    try:
+        context_manager = get_context_manager(".")
+        project_context = context_manager.get_project_context()
+        logger.info(
+            f"Loaded project context with {len(project_context.library_docs)} libraries for mentor analysis"
+        )
+        return project_context
+    except Exception as e:
+        logger.warning(f"Failed to load project context for mentor: {e}")
+        return None
+
+
+def iter_diff_sections(
+    diff: str, max_chars: int = DIFF_SECTION_MAX_CHARS
+) -> Iterator[str]:
+    """Yields a diff in per-file sections, splitting oversized files by size."""
+    start = 0
+    while start < len(diff):
+        next_file = diff.find("\ndiff --git ", start + 1)
+        end = len(diff) if next_file == -1 else next_file
+        end = min(end, start + max_chars)
+        yield diff[start:end]
+        start = end
+
+
 async def fetch_pr_diff(query: str, context: Optional[str]) -> str:
     """Fetches PR diff content if a PR is mentioned in the query."""
     pr_patterns = [
@@ -155,7 +194,10 @@ async def fetch_pr_diff(query: str, context: Optional[str]) -> str:
 
     try:
         github_ops = get_default_github_operations()
-        diff_result = github_ops.get_pull_request_diff(repository, pr_number)
+        # The GitHub client blocks, so keep it off the event loop
+        diff_result = await asyncio.to_thread(
+            github_ops.get_pull_request_diff, repository, pr_number
+        )
 
         if diff_result.success:
             max_diff_size = int(
@@ -4,6 +4,7 @@ from mcp.server.fastmcp import Context
 from vibe_check.server.core import mcp
 from .context import load_workspace_context
 from .analysis import analyze_query_and_context
+from .pipeline import StageTimer
 from .reasoning import get_reasoning_engine, generate_response
 
 logger = logging.getLogger(__name__)
@@ -57,33 +58,41 @@ async def vibe_check_mentor(
             "No FastMCP context provided to vibe_check_mentor; proceeding with synchronous fallback"
         )
 
+    timer = StageTimer()
+
     # 1. Load context
-    full_context, session_id, workspace_warning = await load_workspace_context(
-        query, context, session_id, file_paths, working_directory
+    full_context, session_id, workspace_warning = await timer.timed(
+        "workspace_context",
+        load_workspace_context(
+            query, context, session_id, file_paths, working_directory
+        ),
     )
 
     # 2. Analyze query and context
     analysis_result = await analyze_query_and_context(
-        query, full_context, phase, mode, confidence_threshold
+        query, full_context, phase, mode, confidence_threshold, timer=timer
     )
 
     if "clarifying_questions" in analysis_result:
+        analysis_result["stage_timings"] = timer.summary()
         return analysis_result
 
     # 3. Get reasoning engine and generate response
     engine = get_reasoning_engine()
-    response = await generate_response(
-        engine=engine,
-        query=query,
-        context=full_context,
-        session_id=session_id,
-        reasoning_depth=reasoning_depth,
-        continue_session=continue_session,
-        mode=mode,
-        phase=phase,
-        analysis_result=analysis_result,
-        workspace_warning=workspace_warning,
-        ctx=ctx,  # Thread FastMCP context for dynamic generation
-    )
+    with timer.stage("response_generation"):
+        response = await generate_response(
+            engine=engine,
+            query=query,
+            context=full_context,
+            session_id=session_id,
+            reasoning_depth=reasoning_depth,
+            continue_session=continue_session,
+            mode=mode,
+            phase=phase,
+            analysis_result=analysis_result,
+            workspace_warning=workspace_warning,
+            ctx=ctx,  # Thread FastMCP context for dynamic generation
+        )
 
+    response["stage_timings"] = timer.summary()
     return response
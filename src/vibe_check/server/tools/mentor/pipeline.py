@@ -0,0 +1,52 @@
+"""
+Mentor request stage timing.
+
+The mentor request path is a small graph of stages: workspace context, then
+business context, then the PR diff and project context concurrently, then
+pattern detection and response generation. ``StageTimer`` runs blocking
+stages in a worker thread and records each stage's wall-clock duration, so
+responses can report where a request spent its time.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+class StageTimer:
+    """Records the duration of named mentor pipeline stages in milliseconds"""
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of code as a stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    async def timed(self, name: str, awaitable: Awaitable[T]) -> T:
+        """Await a coroutine as a stage"""
+        with self.stage(name):
+            return await awaitable
+
+    async def run(
+        self, name: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a blocking function in a worker thread as a stage"""
+        with self.stage(name):
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    def summary(self) -> Dict[str, float]:
+        """Stage timings plus the total elapsed time since the timer started"""
+        return {
+            **self.timings,
+            "total": round((time.perf_counter() - self._started) * 1000, 2),
+        }
@@ -2,7 +2,16 @@ import os
 import logging
 from typing import Any, Dict, List
 from vibe_check.server.core import mcp
+from vibe_check.mentor.parsed_file_cache import get_parsed_file_cache
+from vibe_check.mentor.project_index import get_project_file_index
+from vibe_check.mentor.response_store import get_mentor_response_store
 from vibe_check.mentor.telemetry import get_telemetry_collector
+from vibe_check.tools.pr_review.chunk_cache import get_chunk_result_cache
+from vibe_check.tools.shared.adaptive_concurrency import get_claude_concurrency_limiter
+from vibe_check.tools.shared.executor_pool import get_claude_executor_pool
+from vibe_check.tools.shared.github_client_manager import get_github_client_manager
+from vibe_check.tools.shared.result_cache import get_result_cache
+from vibe_check.tools.shared.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +133,7 @@ def get_telemetry_summary() -> Dict[str, Any]:
     - Response latencies (P95, mean) for static vs dynamic routing
     - Success/failure rates by route type
     - Cache hit rates and effectiveness
+    - Analysis result cache hits, misses and evictions
     - Circuit breaker status
     - Overall system health
 
@@ -148,6 +158,15 @@ def get_telemetry_summary() -> Dict[str, Any]:
         return {
             "status": "success",
             "telemetry": telemetry_data,
+            "result_cache": get_result_cache().get_stats(),
+            "chunk_cache": get_chunk_result_cache().get_stats(),
+            "claude_concurrency": get_claude_concurrency_limiter().get_stats(),
+            "claude_executor_pool": get_claude_executor_pool().get_stats(),
+            "github_client": get_github_client_manager().get_stats(),
+            "mentor_response_store": get_mentor_response_store().get_stats(),
+            "single_flight": get_single_flight().get_stats(),
+            "parsed_file_cache": get_parsed_file_cache().get_stats(),
+            "project_file_index": get_project_file_index().get_stats(),
             "collection_info": {
                 "collector_type": "BasicTelemetryCollector",
                 "max_history": 1000,
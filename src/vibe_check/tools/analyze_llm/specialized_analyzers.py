@@ -8,6 +8,7 @@ pull requests, code, issues, and GitHub issue vibe checks.
 import logging
 from typing import Dict, Any, Optional, List
 
+from vibe_check.tools.shared.async_github import get_default_async_github_operations
 from vibe_check.tools.shared.claude_integration import analyze_content_async
 from vibe_check.tools.shared.github_abstraction import get_default_github_operations
 from .llm_models import ExternalClaudeResponse
@@ -583,11 +584,11 @@ async def analyze_github_pr_llm(
     """
     logger.info(f"Starting external GitHub PR vibe check for {repository}#{pr_number}")
 
-    # Use the GitHub abstraction layer
-    github_ops = get_default_github_operations()
+    # Use the async GitHub abstraction layer so requests don't block the event loop
+    github_ops = get_default_async_github_operations()
 
     # Check authentication first
-    auth_result = github_ops.check_authentication()
+    auth_result = await github_ops.check_authentication()
     if not auth_result.success:
         return {
             "status": "error",
@@ -596,8 +597,8 @@ async def analyze_github_pr_llm(
         }
 
     try:
-        # Fetch PR data using abstraction layer
-        pr_result = github_ops.get_pull_request(repository, pr_number)
+        # Fetch PR metadata only; the diff is fetched once a route needs it
+        pr_result = await github_ops.get_pull_request(repository, pr_number)
         if not pr_result.success:
             return {
                 "status": "error",
@@ -652,8 +653,8 @@ async def analyze_github_pr_llm(
 
         async def llm_analysis():
             """Perform LLM analysis for smaller PRs."""
-            # Get PR diff for analysis using the fixed abstraction layer
-            diff_result = github_ops.get_pull_request_diff(repository, pr_number)
+            # Only the LLM route reads the diff, so massive PRs never download it
+            diff_result = await github_ops.get_pull_request_diff(repository, pr_number)
             if not diff_result.success:
                 raise Exception(f"Failed to fetch PR diff: {diff_result.error}")
 
@@ -23,6 +23,7 @@ except ImportError:
     GITHUB_AVAILABLE = False
 
 from vibe_check.core.pattern_detector import PatternDetector
+from vibe_check.tools.shared.pr_file_stream import PRFileStream
 
 logger = logging.getLogger(__name__)
 
@@ -186,13 +187,18 @@ def _calculate_pr_size(pr_data: Dict[str, Any]) -> Dict[str, Any]:
 def _analyze_file_changes(pr) -> Dict[str, Any]:
     """Analyze the files changed in the PR."""
     try:
-        files = pr.get_files()
+        # Each page of pr.get_files() is fetched once; the count comes from
+        # the same pass instead of a second walk over the PaginatedList
+        files = PRFileStream.from_pull_request(pr)
 
         file_types = {}
         risk_files = []
         large_files = []
+        total_files = 0
 
         for file in files:
+            total_files += 1
+
             # Categorize by file extension
             if "." in file.filename:
                 ext = file.filename.split(".")[-1].lower()
@@ -220,7 +226,7 @@ def _analyze_file_changes(pr) -> Dict[str, Any]:
             "file_types": file_types,
             "risk_files": risk_files,
             "large_files": large_files,
-            "total_files": len(list(files)),
+            "total_files": total_files,
         }
 
     except Exception as e:
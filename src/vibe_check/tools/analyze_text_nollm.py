@@ -5,12 +5,14 @@ Provides text analysis for vibe check framework testing and demonstration.
 Follows action_what naming convention: analyze_text.
 """
 
+import itertools
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 
 from vibe_check.core.pattern_detector import PatternDetector
 from vibe_check.core.educational_content import EducationalContentGenerator
 from .contextual_documentation import AnalysisContext, get_context_manager
+from .shared.result_cache import get_result_cache
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +49,7 @@ def analyze_text_demo(
     context: Optional[AnalysisContext] = None,
     use_project_context: bool = True,
     project_root: str = ".",
+    stream_chunks: Optional[Iterable[str]] = None,
 ) -> Dict[str, Any]:
     """
     Analyze text for anti-patterns using the validated core engine with contextual awareness.
@@ -57,6 +60,11 @@ def analyze_text_demo(
         context: Analysis context with library and project information (optional)
         use_project_context: Whether to automatically load project context (default: true)
         project_root: Root directory for project context loading (default: current directory)
+        stream_chunks: Additional text chunks (e.g. PR diff sections) analyzed after
+            text in streaming mode, without concatenating them into one string
+
+    Results for identical text, detail level, pattern data and project context
+    are served from the shared analysis result cache (streamed input is not cached).
 
     Returns:
         Dictionary containing pattern detection results and educational content with contextual recommendations
@@ -94,12 +102,31 @@ def analyze_text_demo(
                 logger.warning(f"Failed to load project context: {exc}")
                 context = None
 
+        cache = get_result_cache()
+        cache_key = None
+        if stream_chunks is None:
+            cache_key = cache.make_key(
+                "analyze_text",
+                text,
+                detail_enum.value,
+                cache.pattern_version(),
+                context.fingerprint() if context is not None else None,
+            )
+            cached_response = cache.get(cache_key)
+            if cached_response is not None:
+                logger.debug("Serving text analysis from result cache")
+                return cached_response
+
         # Initialize validated core components
         detector = PatternDetector()
         educator = EducationalContentGenerator()
 
         # Analyze text using proven detection algorithms
-        if hasattr(detector, "detect_patterns"):
+        if stream_chunks is not None:
+            patterns = detector.analyze_stream_for_patterns(
+                itertools.chain([text], stream_chunks)
+            )
+        elif hasattr(detector, "detect_patterns"):
             raw_patterns = detector.detect_patterns(text)
             if isinstance(raw_patterns, list):
                 patterns = raw_patterns
@@ -188,6 +215,9 @@ def analyze_text_demo(
             "analysis_method": "Phase 1 validated core engine",
         }
 
+        if cache_key is not None:
+            cache.put(cache_key, response)
+
         return response
 
     except (ValueError, TypeError) as exc:
@@ -9,7 +9,6 @@ import os
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
-
 # Use very short timeout in test mode to prevent tests from hanging
 _WORKER_IDLE_TIMEOUT: int = int(0.1 if os.environ.get("VIBE_CHECK_TEST_MODE") else 30)
 
@@ -21,7 +20,11 @@ class AsyncAnalysisConfig:
     # Queue Configuration
     max_queue_size: int = 50  # Maximum jobs in queue
     max_concurrent_workers: int = 2  # Max parallel analysis workers
+    github_io_threads: int = 4  # Threads shared by workers for blocking GitHub I/O
     worker_idle_timeout: int = _WORKER_IDLE_TIMEOUT  # Seconds to wait for new jobs
+    priority_aging_seconds: int = (
+        120  # Queued jobs gain one priority level per interval
+    )
 
     # Analysis Timeouts (longer for background processing)
     chunk_timeout_seconds: int = 300  # 5 minutes per chunk for background
@@ -36,6 +39,12 @@ class AsyncAnalysisConfig:
     result_retention_hours: int = 24  # Keep results for 24 hours
     status_retention_hours: int = 48  # Keep status longer for debugging
     cleanup_interval_minutes: int = 60  # How often to clean old results
+    # Job store location (None: $VIBE_CHECK_JOB_STORE or ~/.vibe-check/async_jobs.db,
+    # ":memory:" disables persistence)
+    job_store_path: Optional[str] = None
+    # Unfinished jobs of a queue that stops renewing its lease this long may be
+    # resumed by another server process sharing the job store
+    job_lease_seconds: int = 120
 
     # Thresholds for Async Processing
     async_threshold_lines: int = 1500  # Lines to trigger async processing
@@ -110,6 +119,7 @@ class AsyncAnalysisMetrics:
         self.jobs_queued = 0
         self.jobs_completed = 0
         self.jobs_failed = 0
+        self.jobs_deduplicated = 0
         self.total_analysis_time = 0.0
         self.average_chunk_time = 0.0
         self.queue_length_history = []
@@ -118,6 +128,10 @@ class AsyncAnalysisMetrics:
         """Record a new job being queued."""
         self.jobs_queued += 1
 
+    def record_job_deduplicated(self):
+        """Record a request answered by an already queued job."""
+        self.jobs_deduplicated += 1
+
     def record_job_completed(self, duration: float):
         """Record a job completion."""
         self.jobs_completed += 1
@@ -146,6 +160,7 @@ class AsyncAnalysisMetrics:
             "jobs_queued": self.jobs_queued,
             "jobs_completed": self.jobs_completed,
             "jobs_failed": self.jobs_failed,
+            "jobs_deduplicated": self.jobs_deduplicated,
             "success_rate_percent": self.get_success_rate(),
             "average_duration_seconds": self.get_average_duration(),
             "total_analysis_time": self.total_analysis_time,
@@ -0,0 +1,611 @@
+"""
+Job Store for Async Analysis
+
+Pluggable storage for async analysis jobs, their results and their history.
+``AsyncAnalysisQueue`` keeps only queued and running jobs in memory; finished
+jobs and results live in the store, so memory use stays flat no matter how
+much history is retained.
+
+Backends:
+- InMemoryJobStore: process-local dictionaries (tests, or when no path is set)
+- SQLiteJobStore: SQLite database in WAL mode. Every state change is appended
+  to ``job_transitions``; ``jobs`` holds the latest state of each job. Queued
+  and in-flight jobs survive a server restart and are resumed on startup.
+
+Several server processes can share one database, so every unfinished job
+records its owner (``host:pid:token``) and a heartbeat that the owning queue
+renews. A queue starting up only claims jobs whose owner has released them,
+has exited, or has let its lease lapse; the claim is a conditional UPDATE in
+one write transaction, so two processes never resume the same job.
+
+Both backends also keep per-chunk checkpoints of chunked PR analysis, keyed by
+PR and chunk content hash, so a retried or resumed job only re-runs the chunks
+that have not completed yet.
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MEMORY_STORE = ":memory:"
+JOB_STORE_ENV_VAR = "VIBE_CHECK_JOB_STORE"
+DEFAULT_JOB_STORE_PATH = Path.home() / ".vibe-check" / "async_jobs.db"
+BUSY_TIMEOUT_SECONDS = 10.0
+
+# Columns persisted for every job (mirrors AnalysisJob fields except results)
+JOB_FIELDS = (
+    "job_id",
+    "pr_number",
+    "repository",
+    "pr_data",
+    "status",
+    "progress",
+    "worker_id",
+    "queued_at",
+    "started_at",
+    "completed_at",
+    "estimated_completion",
+    "error_message",
+    "created_by",
+    "priority",
+    "owner",
+    "heartbeat_at",
+)
+
+UNFINISHED_STATUSES = ("queued", "processing")
+
+
+def make_owner_id() -> str:
+    """Identity of one queue instance: host, process id and a unique token"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def owner_is_alive(owner: str) -> bool:
+    """
+    False only if the owner is known to be gone: a process on this host that
+    no longer exists. Owners on other hosts are judged by their lease alone.
+    """
+    try:
+        host, pid, _ = owner.rsplit(":", 2)
+        pid = int(pid)
+    except ValueError:
+        return False
+    if host != socket.gethostname():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # Exists but belongs to another user
+    return True
+
+
+def is_claimable(record: Dict[str, Any], now: float, lease_seconds: float) -> bool:
+    """True if an unfinished job has no live owner holding a current lease"""
+    owner = record.get("owner")
+    if not owner:
+        return True
+    heartbeat_at = record.get("heartbeat_at") or 0
+    if now - heartbeat_at > lease_seconds:
+        return True
+    return not owner_is_alive(owner)
+
+
+def job_to_record(job: Any) -> Dict[str, Any]:
+    """Flatten an AnalysisJob into a JSON-serializable record"""
+    record = {name: getattr(job, name) for name in JOB_FIELDS}
+    record["status"] = getattr(job.status, "value", job.status)
+    return record
+
+
+class JobStore(ABC):
+    """Storage backend for async analysis jobs and results"""
+
+    @abstractmethod
+    def record_job(self, job: Any) -> None:
+        """Append a state transition for job and update its latest state"""
+
+    @abstractmethod
+    def save_result(self, job: Any, result: Dict[str, Any]) -> None:
+        """Record a completed job together with its result"""
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Latest state of a job as a record, or None if unknown"""
+
+    @abstractmethod
+    def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Result of a completed job, or None"""
+
+    @abstractmethod
+    def load_unfinished(self) -> List[Dict[str, Any]]:
+        """Records of queued and in-flight jobs, oldest first"""
+
+    @abstractmethod
+    def claim_unfinished(
+        self, owner: str, lease_seconds: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Take ownership of unfinished jobs that no live owner holds, oldest
+        first, and return their records with the new owner and heartbeat.
+        """
+
+    @abstractmethod
+    def heartbeat(self, owner: str) -> int:
+        """Renew the lease on owner's unfinished jobs; returns how many"""
+
+    @abstractmethod
+    def release(self, owner: str) -> int:
+        """Give up owner's unfinished jobs so another process may resume them"""
+
+    @abstractmethod
+    def cleanup(self, result_cutoff: float, status_cutoff: float) -> int:
+        """
+        Drop results of jobs finished before result_cutoff and all data of
+        jobs finished before status_cutoff. Returns the number of results removed.
+        """
+
+    @abstractmethod
+    def save_chunk_checkpoint(
+        self, scope: str, content_hash: str, result: Dict[str, Any]
+    ) -> None:
+        """Checkpoint the result of one analyzed chunk of a PR"""
+
+    @abstractmethod
+    def load_chunk_checkpoints(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        """Checkpointed chunk results of a PR, keyed by chunk content hash"""
+
+    @abstractmethod
+    def clear_chunk_checkpoints(self, scope: str) -> None:
+        """Drop all chunk checkpoints of a PR"""
+
+    @property
+    @abstractmethod
+    def results(self) -> Mapping[str, Dict[str, Any]]:
+        """Read-only mapping of job_id to result"""
+
+    def close(self) -> None:
+        """Release backend resources"""
+
+
+class InMemoryJobStore(JobStore):
+    """Process-local job store (no persistence)"""
+
+    def __init__(self):
+        # The queue calls the store from worker threads
+        self._lock = threading.RLock()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        # scope -> content_hash -> (result, saved_at)
+        self._checkpoints: Dict[str, Dict[str, Tuple[Dict[str, Any], float]]] = {}
+
+    def record_job(self, job: Any) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = job_to_record(job)
+
+    def save_result(self, job: Any, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self.record_job(job)
+            self._results[job.job_id] = result
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._jobs.get(job_id)
+            return dict(record) if record is not None else None
+
+    def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._results.get(job_id)
+
+    def load_unfinished(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            unfinished = [
+                dict(record)
+                for record in self._jobs.values()
+                if record["status"] in UNFINISHED_STATUSES
+            ]
+            return sorted(unfinished, key=lambda record: record["queued_at"])
+
+    def claim_unfinished(
+        self, owner: str, lease_seconds: float
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            now = time.time()
+            claimed = []
+            for record in self.load_unfinished():
+                if is_claimable(record, now, lease_seconds):
+                    self._jobs[record["job_id"]].update(owner=owner, heartbeat_at=now)
+                    claimed.append(dict(record, owner=owner, heartbeat_at=now))
+            return claimed
+
+    def heartbeat(self, owner: str) -> int:
+        with self._lock:
+            return self._set_lease(owner, owner, time.time())
+
+    def release(self, owner: str) -> int:
+        with self._lock:
+            return self._set_lease(owner, None, None)
+
+    def _set_lease(
+        self, owner: str, new_owner: Optional[str], heartbeat_at: Optional[float]
+    ) -> int:
+        updated = 0
+        for record in self._jobs.values():
+            if record["owner"] == owner and record["status"] in UNFINISHED_STATUSES:
+                record.update(owner=new_owner, heartbeat_at=heartbeat_at)
+                updated += 1
+        return updated
+
+    def cleanup(self, result_cutoff: float, status_cutoff: float) -> int:
+        with self._lock:
+            expired_results = [
+                job_id
+                for job_id in self._results
+                if (self._jobs.get(job_id) or {}).get("completed_at") is not None
+                and self._jobs[job_id]["completed_at"] < result_cutoff
+            ]
+            for job_id in expired_results:
+                del self._results[job_id]
+
+            for job_id, record in list(self._jobs.items()):
+                completed_at = record.get("completed_at")
+                if completed_at is not None and completed_at < status_cutoff:
+                    del self._jobs[job_id]
+                    self._results.pop(job_id, None)
+
+            for scope, checkpoints in list(self._checkpoints.items()):
+                for content_hash, (_, saved_at) in list(checkpoints.items()):
+                    if saved_at < status_cutoff:
+                        del checkpoints[content_hash]
+                if not checkpoints:
+                    del self._checkpoints[scope]
+
+            return len(expired_results)
+
+    def save_chunk_checkpoint(
+        self, scope: str, content_hash: str, result: Dict[str, Any]
+    ) -> None:
+        with self._lock:
+            self._checkpoints.setdefault(scope, {})[content_hash] = (
+                result,
+                time.time(),
+            )
+
+    def load_chunk_checkpoints(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                content_hash: result
+                for content_hash, (result, _) in self._checkpoints.get(
+                    scope, {}
+                ).items()
+            }
+
+    def clear_chunk_checkpoints(self, scope: str) -> None:
+        with self._lock:
+            self._checkpoints.pop(scope, None)
+
+    @property
+    def results(self) -> Mapping[str, Dict[str, Any]]:
+        return self._results
+
+
+class _SQLiteResultsView(Mapping):
+    """Lazy job_id -> result mapping backed by the results table"""
+
+    def __init__(self, store: "SQLiteJobStore"):
+        self._store = store
+
+    def __getitem__(self, job_id: str) -> Dict[str, Any]:
+        result = self._store.get_result(job_id)
+        if result is None:
+            raise KeyError(job_id)
+        return result
+
+    def __iter__(self) -> Iterator[str]:
+        rows = self._store._query("SELECT job_id FROM job_results")
+        return iter([row["job_id"] for row in rows])
+
+    def __len__(self) -> int:
+        return self._store._query("SELECT COUNT(*) AS n FROM job_results")[0]["n"]
+
+
+class SQLiteJobStore(JobStore):
+    """Durable job store backed by SQLite in WAL mode"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            pr_number INTEGER NOT NULL,
+            repository TEXT NOT NULL,
+            pr_data TEXT NOT NULL,
+            status TEXT NOT NULL,
+            progress INTEGER NOT NULL,
+            worker_id TEXT,
+            queued_at REAL NOT NULL,
+            started_at REAL,
+            completed_at REAL,
+            estimated_completion REAL,
+            error_message TEXT,
+            created_by TEXT,
+            priority INTEGER NOT NULL,
+            owner TEXT,
+            heartbeat_at REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+        CREATE INDEX IF NOT EXISTS idx_jobs_completed_at ON jobs (completed_at);
+
+        CREATE TABLE IF NOT EXISTS job_transitions (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            progress INTEGER NOT NULL,
+            worker_id TEXT,
+            error_message TEXT,
+            recorded_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_transitions_job ON job_transitions (job_id);
+
+        CREATE TABLE IF NOT EXISTS job_results (
+            job_id TEXT PRIMARY KEY,
+            result TEXT NOT NULL,
+            completed_at REAL NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS chunk_checkpoints (
+            scope TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            result TEXT NOT NULL,
+            saved_at REAL NOT NULL,
+            PRIMARY KEY (scope, content_hash)
+        );
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._migrate()
+        self._results_view = _SQLiteResultsView(self)
+
+        logger.info(f"Async job store opened at {self.path}")
+
+    def _migrate(self) -> None:
+        """Add lease columns to databases created before they existed"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        with self._conn:
+            for name, sql_type in (("owner", "TEXT"), ("heartbeat_at", "REAL")):
+                if name not in columns:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {sql_type}")
+
+    def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _write_job(self, record: Dict[str, Any]) -> None:
+        row = dict(record, pr_data=json.dumps(record["pr_data"], default=str))
+        columns = ", ".join(JOB_FIELDS)
+        placeholders = ", ".join(f":{name}" for name in JOB_FIELDS)
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO jobs ({columns}) VALUES ({placeholders})", row
+        )
+        self._conn.execute(
+            "INSERT INTO job_transitions "
+            "(job_id, status, progress, worker_id, error_message, recorded_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                record["job_id"],
+                record["status"],
+                record["progress"],
+                record["worker_id"],
+                record["error_message"],
+                time.time(),
+            ),
+        )
+
+    def record_job(self, job: Any) -> None:
+        record = job_to_record(job)
+        with self._lock, self._conn:
+            self._write_job(record)
+
+    def save_result(self, job: Any, result: Dict[str, Any]) -> None:
+        record = job_to_record(job)
+        with self._lock, self._conn:
+            self._write_job(record)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_results (job_id, result, completed_at) "
+                "VALUES (?, ?, ?)",
+                (
+                    job.job_id,
+                    json.dumps(result, default=str),
+                    record["completed_at"] or time.time(),
+                ),
+            )
+
+    @staticmethod
+    def _to_record(row: sqlite3.Row) -> Dict[str, Any]:
+        record = dict(row)
+        record["pr_data"] = json.loads(record["pr_data"])
+        return record
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+        return self._to_record(rows[0]) if rows else None
+
+    def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT result FROM job_results WHERE job_id = ?", (job_id,))
+        return json.loads(rows[0]["result"]) if rows else None
+
+    def get_transitions(self, job_id: str) -> List[Dict[str, Any]]:
+        """Full state history of a job, oldest first"""
+        rows = self._query(
+            "SELECT status, progress, worker_id, error_message, recorded_at "
+            "FROM job_transitions WHERE job_id = ? ORDER BY seq",
+            (job_id,),
+        )
+        return [dict(row) for row in rows]
+
+    def load_unfinished(self) -> List[Dict[str, Any]]:
+        rows = self._query(
+            "SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY queued_at",
+            UNFINISHED_STATUSES,
+        )
+        return [self._to_record(row) for row in rows]
+
+    def claim_unfinished(
+        self, owner: str, lease_seconds: float
+    ) -> List[Dict[str, Any]]:
+        claimed = []
+        with self._lock:
+            # IMMEDIATE takes the write lock up front, so no other process can
+            # claim between the read and the conditional updates below
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                rows = self._conn.execute(
+                    "SELECT * FROM jobs WHERE status IN (?, ?) ORDER BY queued_at",
+                    UNFINISHED_STATUSES,
+                ).fetchall()
+                for row in rows:
+                    record = self._to_record(row)
+                    if not is_claimable(record, now, lease_seconds):
+                        continue
+                    updated = self._conn.execute(
+                        "UPDATE jobs SET owner = ?, heartbeat_at = ? "
+                        "WHERE job_id = ? AND status IN (?, ?) "
+                        "AND owner IS ? AND heartbeat_at IS ?",
+                        (
+                            owner,
+                            now,
+                            record["job_id"],
+                            *UNFINISHED_STATUSES,
+                            record["owner"],
+                            record["heartbeat_at"],
+                        ),
+                    ).rowcount
+                    if updated:
+                        claimed.append(dict(record, owner=owner, heartbeat_at=now))
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return claimed
+
+    def heartbeat(self, owner: str) -> int:
+        return self._set_lease(owner, owner, time.time())
+
+    def release(self, owner: str) -> int:
+        return self._set_lease(owner, None, None)
+
+    def _set_lease(
+        self, owner: str, new_owner: Optional[str], heartbeat_at: Optional[float]
+    ) -> int:
+        with self._lock, self._conn:
+            return self._conn.execute(
+                "UPDATE jobs SET owner = ?, heartbeat_at = ? "
+                "WHERE owner = ? AND status IN (?, ?)",
+                (new_owner, heartbeat_at, owner, *UNFINISHED_STATUSES),
+            ).rowcount
+
+    def cleanup(self, result_cutoff: float, status_cutoff: float) -> int:
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM job_results WHERE completed_at < ?", (result_cutoff,)
+            ).rowcount
+            expired = "SELECT job_id FROM jobs WHERE completed_at < ?"
+            self._conn.execute(
+                f"DELETE FROM job_transitions WHERE job_id IN ({expired})",
+                (status_cutoff,),
+            )
+            self._conn.execute(
+                f"DELETE FROM job_results WHERE job_id IN ({expired})",
+                (status_cutoff,),
+            )
+            self._conn.execute(
+                "DELETE FROM jobs WHERE completed_at < ?", (status_cutoff,)
+            )
+            self._conn.execute(
+                "DELETE FROM chunk_checkpoints WHERE saved_at < ?", (status_cutoff,)
+            )
+        return removed
+
+    def save_chunk_checkpoint(
+        self, scope: str, content_hash: str, result: Dict[str, Any]
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO chunk_checkpoints "
+                "(scope, content_hash, result, saved_at) VALUES (?, ?, ?, ?)",
+                (scope, content_hash, json.dumps(result, default=str), time.time()),
+            )
+
+    def load_chunk_checkpoints(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._query(
+            "SELECT content_hash, result FROM chunk_checkpoints WHERE scope = ?",
+            (scope,),
+        )
+        return {row["content_hash"]: json.loads(row["result"]) for row in rows}
+
+    def clear_chunk_checkpoints(self, scope: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM chunk_checkpoints WHERE scope = ?", (scope,)
+            )
+
+    @property
+    def results(self) -> Mapping[str, Dict[str, Any]]:
+        return self._results_view
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def resolve_job_store_path(configured: Optional[str] = None) -> str:
+    """
+    Resolve where async jobs are stored.
+
+    Order: explicit configuration, the VIBE_CHECK_JOB_STORE environment
+    variable, then ~/.vibe-check/async_jobs.db. Set the variable to
+    ":memory:" to keep jobs in process memory only.
+    """
+    if configured:
+        return configured
+    from_env = os.environ.get(JOB_STORE_ENV_VAR)
+    if from_env:
+        return from_env
+    return str(DEFAULT_JOB_STORE_PATH)
+
+
+def create_job_store(path: Optional[str] = None) -> JobStore:
+    """Create the job store for path, falling back to memory if it can't be opened"""
+    resolved = resolve_job_store_path(path)
+    if resolved == MEMORY_STORE:
+        return InMemoryJobStore()
+
+    try:
+        return SQLiteJobStore(resolved)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(
+            f"Could not open async job store at {resolved} ({e}); "
+            "jobs will not survive a restart"
+        )
+        return InMemoryJobStore()
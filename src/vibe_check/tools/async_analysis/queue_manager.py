@@ -3,18 +3,29 @@ Async Analysis Queue Manager
 
 Manages background processing queue for massive PRs, providing job tracking,
 status monitoring, and result storage with configurable retention.
+
+Only queued and running jobs are held in memory. Finished jobs and their
+results are kept in a pluggable job store (SQLite by default), so jobs survive
+restarts and memory use does not grow with history. Each queue owns the
+unfinished jobs it writes and renews a lease on them, so server processes
+sharing a job store only resume jobs whose owner is gone. Store calls run in
+worker threads, so waiting on another process's write never stalls the loop.
 """
 
 import asyncio
 import logging
 import time
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import Any, Callable, Dict, List, Mapping, Optional, TypeVar
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
 from .config import AsyncAnalysisConfig, DEFAULT_ASYNC_CONFIG, ASYNC_METRICS
+from .job_store import JobStore, create_job_store, make_owner_id
+from .scheduler import PriorityJobQueue
+
+T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +73,13 @@ class AnalysisJob:
     # Metadata
     created_by: str = "async_analysis_system"
     priority: int = 1  # Lower numbers = higher priority
+    owner: Optional[str] = None  # Queue instance holding the job's lease
+    heartbeat_at: Optional[float] = None
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "AnalysisJob":
+        """Rebuild a job from a job store record."""
+        return cls(**dict(record, status=JobStatus(record["status"])))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert job to dictionary for JSON serialization."""
@@ -96,17 +114,23 @@ class AsyncAnalysisQueue:
     processing of massive PRs that exceed chunked analysis thresholds.
     """
 
-    def __init__(self, config: AsyncAnalysisConfig = None):
+    def __init__(
+        self, config: AsyncAnalysisConfig = None, job_store: Optional[JobStore] = None
+    ):
         self.config = config or DEFAULT_ASYNC_CONFIG
 
         # Core queue and storage
-        self.job_queue = asyncio.Queue(maxsize=self.config.max_queue_size)
-        self.active_jobs: Dict[str, AnalysisJob] = {}  # job_id -> job
-        self.job_results: Dict[str, Dict[str, Any]] = {}  # job_id -> result
-        self.job_history: List[AnalysisJob] = []  # For metrics and debugging
+        self.job_queue = PriorityJobQueue(
+            maxsize=self.config.max_queue_size,
+            aging_seconds=self.config.priority_aging_seconds,
+        )
+        self.active_jobs: Dict[str, AnalysisJob] = {}  # queued/running job_id -> job
+        self.job_store = job_store or create_job_store(self.config.job_store_path)
+        self.owner = make_owner_id()
 
-        # Cleanup task
+        # Cleanup and lease renewal tasks
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
         self._shutdown_requested = False
 
         logger.info(
@@ -118,24 +142,91 @@ class AsyncAnalysisQueue:
             },
         )
 
+    @property
+    def job_results(self) -> Mapping[str, Dict[str, Any]]:
+        """Read-only view of stored results (job_id -> result)."""
+        return self.job_store.results
+
     async def start(self):
-        """Start the queue manager and background cleanup."""
+        """Start the queue manager, resume stored jobs and start background cleanup."""
         if self._cleanup_task is None:
+            resumed = await self._resume_unfinished_jobs()
             self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-            logger.info("Async analysis queue started")
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            logger.info("Async analysis queue started", extra={"resumed_jobs": resumed})
+
+    async def _record(self, job: AnalysisJob) -> None:
+        """Persist a job state change, renewing this queue's claim on it."""
+        job.owner = self.owner
+        job.heartbeat_at = time.time()
+        await self._store_call(self.job_store.record_job, job)
+
+    async def _store_call(self, method: Callable[..., T], *args: Any) -> T:
+        """
+        Run a job store call in a worker thread.
+
+        A store shared between server processes can wait on another
+        process's write transaction, so store I/O stays off the event loop.
+        """
+        return await asyncio.to_thread(method, *args)
+
+    async def _resume_unfinished_jobs(self) -> int:
+        """
+        Re-queue unfinished jobs left behind by a stopped or crashed server.
+
+        Jobs whose owner is still alive and renewing its lease are left alone.
+        """
+        from .resource_monitor import get_global_resource_monitor
+
+        resumed = 0
+        claimed = await self._store_call(
+            self.job_store.claim_unfinished, self.owner, self.config.job_lease_seconds
+        )
+        for record in claimed:
+            if record["job_id"] in self.active_jobs:
+                continue
+
+            job = AnalysisJob.from_record(record)
+            job.status = JobStatus.QUEUED
+            job.progress = self.config.progress_checkpoints["queued"]
+            job.worker_id = None
+            job.started_at = None
+
+            try:
+                self.job_queue.put_nowait(job)
+            except (asyncio.QueueFull, ValueError) as e:
+                job.status = JobStatus.FAILED
+                job.completed_at = time.time()
+                job.error_message = f"Could not resume job after restart: {e!r}"
+                await self._record(job)
+                continue
+
+            self.active_jobs[job.job_id] = job
+            await self._record(job)
+            get_global_resource_monitor().register_job(job.job_id)
+            resumed += 1
+
+        if resumed:
+            logger.info(f"Resumed {resumed} async analysis jobs from the job store")
+        return resumed
 
     async def stop(self):
         """Stop the queue manager and cleanup background tasks."""
         self._shutdown_requested = True
 
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-            self._cleanup_task = None
-
+        for task in (self._cleanup_task, self._heartbeat_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._cleanup_task = None
+        self._heartbeat_task = None
+
+        # Let the next server resume our unfinished jobs without waiting out the lease
+        await self._store_call(self.job_store.release, self.owner)
+        self.job_store.close()
         logger.info("Async analysis queue stopped")
 
     async def queue_analysis(
@@ -155,22 +246,14 @@ class AsyncAnalysisQueue:
             priority: Job priority (lower = higher priority)
 
         Returns:
-            job_id for tracking the analysis
+            job_id for tracking the analysis. If a job for the same PR and head
+            commit is still queued, its job_id is returned instead (and its
+            priority raised if this request is more urgent).
 
         Raises:
             asyncio.QueueFull: If queue is at capacity
             ResourceError: If resource limits prevent job execution
         """
-        # Check resource limits before queuing
-        from .resource_monitor import get_global_resource_monitor
-
-        resource_monitor = get_global_resource_monitor()
-        can_accept, reason = resource_monitor.should_accept_new_job()
-
-        if not can_accept:
-            logger.warning(f"Rejecting job due to resource limits: {reason}")
-            raise ResourceError(f"Cannot accept new job: {reason}")
-
         # Generate unique job ID
         job_id = f"{repository}#{pr_number}#{uuid.uuid4().hex[:8]}"
 
@@ -185,10 +268,33 @@ class AsyncAnalysisQueue:
             estimated_completion=time.time() + estimated_duration,
         )
 
+        # Reuse an identical job that is still waiting in the queue
+        existing = self.job_queue.find_duplicate(job)
+        if existing is not None:
+            if priority < existing.priority:
+                self.job_queue.reprioritize(existing, priority)
+            ASYNC_METRICS.record_job_deduplicated()
+            logger.info(
+                f"Analysis for {repository}#{pr_number} already queued",
+                extra={"job_id": existing.job_id, "priority": existing.priority},
+            )
+            return existing.job_id
+
+        # Check resource limits before queuing
+        from .resource_monitor import get_global_resource_monitor
+
+        resource_monitor = get_global_resource_monitor()
+        can_accept, reason = resource_monitor.should_accept_new_job()
+
+        if not can_accept:
+            logger.warning(f"Rejecting job due to resource limits: {reason}")
+            raise ResourceError(f"Cannot accept new job: {reason}")
+
         # Add to queue
         try:
             await self.job_queue.put(job)
             self.active_jobs[job_id] = job
+            await self._record(job)
             ASYNC_METRICS.record_job_queued()
 
             # Register job for resource monitoring
@@ -231,6 +337,7 @@ class AsyncAnalysisQueue:
             job.status = JobStatus.PROCESSING
             job.started_at = time.time()
             job.progress = self.config.progress_checkpoints["started"]
+            await self._record(job)
 
             logger.debug(f"Dispatched job {job.job_id} for processing")
             return job
@@ -238,17 +345,20 @@ class AsyncAnalysisQueue:
         except asyncio.TimeoutError:
             return None
 
-    def update_job_progress(self, job_id: str, progress: int, worker_id: str = None):
+    async def update_job_progress(
+        self, job_id: str, progress: int, worker_id: str = None
+    ):
         """Update job progress."""
         if job_id in self.active_jobs:
             job = self.active_jobs[job_id]
             job.progress = min(progress, 100)
             if worker_id:
                 job.worker_id = worker_id
+            await self._record(job)
 
             logger.debug(f"Job {job_id} progress: {progress}%")
 
-    def complete_job(self, job_id: str, result: Dict[str, Any]):
+    async def complete_job(self, job_id: str, result: Dict[str, Any]):
         """Mark job as completed with result."""
         if job_id in self.active_jobs:
             job = self.active_jobs[job_id]
@@ -257,11 +367,10 @@ class AsyncAnalysisQueue:
             job.progress = 100
             job.result = result
 
-            # Store result
-            self.job_results[job_id] = result
-
-            # Move to history
-            self.job_history.append(job)
+            # Persist result and drop the job from memory
+            job.owner = self.owner
+            await self._store_call(self.job_store.save_result, job, result)
+            del self.active_jobs[job_id]
 
             # Calculate duration and record metrics
             duration = job.completed_at - (job.started_at or job.queued_at)
@@ -272,7 +381,7 @@ class AsyncAnalysisQueue:
                 extra={"duration": duration, "pr": f"{job.repository}#{job.pr_number}"},
             )
 
-    def fail_job(self, job_id: str, error_message: str):
+    async def fail_job(self, job_id: str, error_message: str):
         """Mark job as failed with error message."""
         if job_id in self.active_jobs:
             job = self.active_jobs[job_id]
@@ -280,8 +389,9 @@ class AsyncAnalysisQueue:
             job.completed_at = time.time()
             job.error_message = error_message
 
-            # Move to history
-            self.job_history.append(job)
+            # Persist failure and drop the job from memory
+            await self._record(job)
+            del self.active_jobs[job_id]
             ASYNC_METRICS.record_job_failed()
 
             logger.error(
@@ -295,26 +405,21 @@ class AsyncAnalysisQueue:
         if job_id in self.active_jobs:
             return self.active_jobs[job_id].to_dict()
 
-        # Check completed results
-        if job_id in self.job_results:
-            # Find in history
-            for job in self.job_history:
-                if job.job_id == job_id:
-                    status = job.to_dict()
-                    if job.status == JobStatus.COMPLETED:
-                        status["result"] = self.job_results[job_id]
-                    return status
-
-        # Check history for failed/expired jobs
-        for job in self.job_history:
-            if job.job_id == job_id:
-                return job.to_dict()
+        # Fall back to the job store for finished jobs
+        record = self.job_store.get_job(job_id)
+        if record is None:
+            return None
 
-        return None
+        status = AnalysisJob.from_record(record).to_dict()
+        if record["status"] == JobStatus.COMPLETED.value:
+            result = self.job_store.get_result(job_id)
+            if result is not None:
+                status["result"] = result
+        return status
 
     def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get result of completed analysis."""
-        return self.job_results.get(job_id)
+        return self.job_store.get_result(job_id)
 
     def list_active_jobs(self) -> List[Dict[str, Any]]:
         """List all active jobs."""
@@ -324,6 +429,9 @@ class AsyncAnalysisQueue:
         """Get overall queue status."""
         return {
             "queue_size": self.job_queue.qsize(),
+            "queue_depth_by_priority": self.job_queue.depth_by_priority(),
+            "queue_depth_by_repository": self.job_queue.depth_by_repository(),
+            "wait_time": self.job_queue.wait_time_stats(),
             "active_jobs": len(self.active_jobs),
             "max_queue_size": self.config.max_queue_size,
             "max_concurrent_workers": self.config.max_concurrent_workers,
@@ -332,6 +440,7 @@ class AsyncAnalysisQueue:
                 "result_retention_hours": self.config.result_retention_hours,
                 "async_threshold_lines": self.config.async_threshold_lines,
                 "async_threshold_files": self.config.async_threshold_files,
+                "priority_aging_seconds": self.config.priority_aging_seconds,
             },
         }
 
@@ -346,37 +455,29 @@ class AsyncAnalysisQueue:
             except Exception as e:
                 logger.error(f"Error in cleanup loop: {e}")
 
+    async def _heartbeat_loop(self):
+        """Renew the lease on this queue's unfinished jobs."""
+        interval = max(self.config.job_lease_seconds / 3, 0.01)
+        while not self._shutdown_requested:
+            try:
+                await asyncio.sleep(interval)
+                await self._store_call(self.job_store.heartbeat, self.owner)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error renewing async job leases: {e}")
+
     async def _cleanup_expired_results(self):
-        """Remove expired results and update metrics."""
+        """Remove expired results and job history from the job store."""
         now = time.time()
-        retention_seconds = self.config.result_retention_hours * 3600
-
-        # Clean up results
-        expired_results = []
-        for job_id, _ in list(self.job_results.items()):
-            # Find corresponding job in history
-            job = next((j for j in self.job_history if j.job_id == job_id), None)
-            if (
-                job
-                and job.completed_at
-                and (now - job.completed_at) > retention_seconds
-            ):
-                expired_results.append(job_id)
-
-        for job_id in expired_results:
-            del self.job_results[job_id]
-
-        # Clean up old history entries
-        status_retention_seconds = self.config.status_retention_hours * 3600
-        self.job_history = [
-            job
-            for job in self.job_history
-            if not job.completed_at
-            or (now - job.completed_at) <= status_retention_seconds
-        ]
+        expired_results = await self._store_call(
+            self.job_store.cleanup,
+            now - self.config.result_retention_hours * 3600,
+            now - self.config.status_retention_hours * 3600,
+        )
 
         if expired_results:
-            logger.info(f"Cleaned up {len(expired_results)} expired analysis results")
+            logger.info(f"Cleaned up {expired_results} expired analysis results")
 
 
 # Global queue instance
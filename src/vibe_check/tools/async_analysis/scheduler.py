@@ -0,0 +1,199 @@
+"""
+Priority Job Scheduler for Async Analysis
+
+Replaces the FIFO ``asyncio.Queue`` behind ``AsyncAnalysisQueue`` with a
+priority scheduler that keeps the same queue interface (``put``/``get``,
+``qsize``, ``maxsize``) and adds:
+
+- Priority ordering: lower ``AnalysisJob.priority`` values are served first.
+- Aging: a queued job gains one priority level for every ``aging_seconds`` it
+  waits, so low-priority jobs cannot starve behind a steady stream of urgent ones.
+- Per-repository fairness: every repository has its own heap, and repositories
+  whose next job is in the same (aged) priority band are served round-robin, so
+  one repository flooding the queue cannot block everyone else.
+- Deduplication: a job for a (repository, pr_number, head SHA) that is already
+  queued is reported instead of being queued twice.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+DEFAULT_AGING_SECONDS = 120.0
+WAIT_TIME_SAMPLE_SIZE = 1000
+
+DedupKey = Tuple[str, int, Optional[str]]
+
+
+def job_dedup_key(job: Any) -> DedupKey:
+    """Identify a job by repository, PR number and head commit (when known)"""
+    pr_data = job.pr_data or {}
+    head = pr_data.get("head")
+    head_sha = pr_data.get("head_sha") or (
+        head.get("sha") if isinstance(head, dict) else None
+    )
+    return (job.repository, job.pr_number, head_sha)
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    index = max(0, math.ceil(len(ordered) * percent / 100) - 1)
+    return ordered[index]
+
+
+class PriorityJobQueue:
+    """
+    Heap-based async job queue with aging, per-repository fairness and dedup.
+
+    Jobs must provide ``priority``, ``queued_at``, ``repository``, ``pr_number``
+    and ``pr_data`` attributes (see ``AnalysisJob``).
+    """
+
+    def __init__(self, maxsize: int = 0, aging_seconds: float = DEFAULT_AGING_SECONDS):
+        self.maxsize = maxsize
+        self.aging_seconds = aging_seconds
+
+        # repository -> heap of [aged_key, sequence, job]; ordered for round-robin
+        self._heaps: "OrderedDict[str, List[List[Any]]]" = OrderedDict()
+        self._entries: Dict[DedupKey, List[Any]] = {}
+        self._sequence = itertools.count()
+        self._getters: Deque[asyncio.Future] = deque()
+        self._wait_times: Deque[float] = deque(maxlen=WAIT_TIME_SAMPLE_SIZE)
+
+    def qsize(self) -> int:
+        """Number of queued jobs"""
+        return len(self._entries)
+
+    def empty(self) -> bool:
+        return not self._entries
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= self.qsize()
+
+    def find_duplicate(self, job: Any) -> Optional[Any]:
+        """Return the queued job equivalent to job, if any"""
+        entry = self._entries.get(job_dedup_key(job))
+        return entry[2] if entry is not None else None
+
+    def _aged_key(self, job: Any) -> float:
+        # priority - waited/aging_seconds, shifted by "now" which is the same for
+        # every job at comparison time, so the heap order never needs updating
+        return job.priority + job.queued_at / self.aging_seconds
+
+    def put_nowait(self, job: Any) -> None:
+        """
+        Queue a job.
+
+        Raises:
+            asyncio.QueueFull: If the queue is at capacity
+            ValueError: If an equivalent job is already queued
+        """
+        dedup_key = job_dedup_key(job)
+        if dedup_key in self._entries:
+            raise ValueError(f"Job for {dedup_key} is already queued")
+        if self.full():
+            raise asyncio.QueueFull
+
+        entry = [self._aged_key(job), next(self._sequence), job]
+        heapq.heappush(self._heaps.setdefault(job.repository, []), entry)
+        self._entries[dedup_key] = entry
+        self._wakeup_next()
+
+    async def put(self, job: Any) -> None:
+        """Queue a job without waiting for capacity (raises asyncio.QueueFull)"""
+        self.put_nowait(job)
+
+    def reprioritize(self, job: Any, priority: int) -> None:
+        """Change the priority of a queued job in place"""
+        entry = self._entries.get(job_dedup_key(job))
+        if entry is None or entry[2] is not job:
+            return
+        job.priority = priority
+        entry[0] = self._aged_key(job)
+        heapq.heapify(self._heaps[job.repository])
+
+    def get_nowait(self) -> Any:
+        """
+        Remove and return the next job to run.
+
+        Raises:
+            asyncio.QueueEmpty: If no job is queued
+        """
+        if not self._entries:
+            raise asyncio.QueueEmpty
+
+        # Serve the least recently served repository among those whose next
+        # job is in the best aged priority band
+        now = time.time()
+        best_band = None
+        chosen = None
+        for repository, heap in self._heaps.items():
+            job = heap[0][2]
+            band = math.ceil(job.priority - (now - job.queued_at) / self.aging_seconds)
+            if best_band is None or band < best_band:
+                best_band, chosen = band, repository
+
+        heap = self._heaps.pop(chosen)
+        _, _, job = heapq.heappop(heap)
+        if heap:
+            self._heaps[chosen] = heap  # re-insert at the back of the rotation
+        del self._entries[job_dedup_key(job)]
+
+        self._wait_times.append(max(0.0, now - job.queued_at))
+        return job
+
+    async def get(self) -> Any:
+        """Remove and return the next job, waiting until one is available"""
+        while self.empty():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if not self.empty() and not getter.cancelled():
+                    self._wakeup_next()
+                raise
+        return self.get_nowait()
+
+    def _wakeup_next(self) -> None:
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                break
+
+    def depth_by_priority(self) -> Dict[str, int]:
+        """Number of queued jobs per nominal priority band"""
+        counts = Counter(entry[2].priority for entry in self._entries.values())
+        return {str(priority): counts[priority] for priority in sorted(counts)}
+
+    def depth_by_repository(self) -> Dict[str, int]:
+        """Number of queued jobs per repository"""
+        return {repository: len(heap) for repository, heap in self._heaps.items()}
+
+    def wait_time_stats(self) -> Dict[str, float]:
+        """Queue wait-time percentiles of recently dispatched jobs (seconds)"""
+        ordered = sorted(self._wait_times)
+        now = time.time()
+        oldest = max(
+            (now - entry[2].queued_at for entry in self._entries.values()),
+            default=0.0,
+        )
+        return {
+            "samples": len(ordered),
+            "p50_seconds": _percentile(ordered, 50),
+            "p90_seconds": _percentile(ordered, 90),
+            "p99_seconds": _percentile(ordered, 99),
+            "max_seconds": ordered[-1] if ordered else 0.0,
+            "oldest_queued_seconds": max(0.0, oldest),
+        }
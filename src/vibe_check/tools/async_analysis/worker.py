@@ -6,10 +6,12 @@ analysis with longer timeouts and larger chunks optimized for background process
 """
 
 import asyncio
+import functools
 import logging
 import time
 import uuid
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, List, TypeVar
 from dataclasses import dataclass
 
 from .config import AsyncAnalysisConfig, DEFAULT_ASYNC_CONFIG
@@ -19,11 +21,36 @@ from vibe_check.tools.shared.claude_integration import (
 )
 from vibe_check.tools.pr_review.chunked_analyzer import (
     analyze_pr_with_chunking,
+    ChunkAnalysisResult,
     ChunkedAnalyzer,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Bounded pool for blocking GitHub I/O, shared by all workers so they overlap
+# on network waits without ever blocking the event loop
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_io_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Get or create the thread pool used for blocking worker I/O."""
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="async-analysis-io"
+        )
+    return _io_executor
+
+
+def shutdown_io_executor():
+    """Shut down the worker I/O thread pool."""
+    global _io_executor
+    if _io_executor is not None:
+        _io_executor.shutdown(wait=False, cancel_futures=True)
+        _io_executor = None
+
 
 @dataclass
 class WorkerResult:
@@ -92,9 +119,9 @@ class AsyncAnalysisWorker:
 
                 # Update queue with result
                 if result.success:
-                    self.queue.complete_job(result.job_id, result.result)
+                    await self.queue.complete_job(result.job_id, result.result)
                 else:
-                    self.queue.fail_job(result.job_id, result.error)
+                    await self.queue.fail_job(result.job_id, result.error)
 
             except asyncio.CancelledError:
                 logger.info(f"Worker {self.worker_id} cancelled")
@@ -108,7 +135,7 @@ class AsyncAnalysisWorker:
 
                 # If we have a current job, mark it as failed
                 if self.current_job:
-                    self.queue.fail_job(
+                    await self.queue.fail_job(
                         self.current_job.job_id, f"Worker error: {str(e)}"
                     )
                     self.current_job = None
@@ -120,6 +147,12 @@ class AsyncAnalysisWorker:
         self.running = False
         logger.info(f"Worker {self.worker_id} stop requested")
 
+    async def _run_blocking(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call in the shared I/O pool instead of on the event loop."""
+        loop = asyncio.get_running_loop()
+        executor = get_io_executor(self.config.github_io_threads)
+        return await loop.run_in_executor(executor, functools.partial(func, *args))
+
     async def _process_job(self, job: AnalysisJob) -> WorkerResult:
         """
         Process a single analysis job.
@@ -158,7 +191,7 @@ class AsyncAnalysisWorker:
 
         try:
             # Update progress - started
-            self.queue.update_job_progress(
+            await self.queue.update_job_progress(
                 job.job_id, self.config.progress_checkpoints["started"], self.worker_id
             )
 
@@ -167,9 +200,9 @@ class AsyncAnalysisWorker:
 
             github_ops = get_default_github_operations()
 
-            # Get PR files with diff content
-            files_result = github_ops.get_pull_request_files(
-                job.repository, job.pr_number
+            # Get PR files with diff content (blocking API calls, run off-loop)
+            files_result = await self._run_blocking(
+                github_ops.get_pull_request_files, job.repository, job.pr_number
             )
             if not files_result.success:
                 raise Exception(f"Failed to fetch PR files: {files_result.error}")
@@ -177,13 +210,13 @@ class AsyncAnalysisWorker:
             pr_files = files_result.data
 
             # Update progress - files fetched
-            self.queue.update_job_progress(job.job_id, 25)
+            await self.queue.update_job_progress(job.job_id, 25)
 
             # Perform extended chunked analysis
             analysis_result = await self._analyze_large_pr(job, pr_files)
 
             # Update progress - analysis complete
-            self.queue.update_job_progress(job.job_id, 95)
+            await self.queue.update_job_progress(job.job_id, 95)
 
             # Prepare final result
             final_result = self._prepare_final_result(job, analysis_result)
@@ -234,23 +267,49 @@ class AsyncAnalysisWorker:
         Returns:
             Comprehensive analysis result
         """
+        # Chunks completed by an earlier attempt at this PR are not re-analyzed
+        job_store = self.queue.job_store
+        checkpoint_scope = f"{job.repository}#{job.pr_number}"
+        stored = await self._run_blocking(
+            job_store.load_chunk_checkpoints, checkpoint_scope
+        )
+        checkpoints = {
+            content_hash: ChunkAnalysisResult.from_dict(data)
+            for content_hash, data in stored.items()
+        }
+
+        # Progress range from analysis_in_progress (30) to merging_results (90)
+        base_progress = self.config.progress_checkpoints["analysis_in_progress"]
+        total_progress_range = (
+            self.config.progress_checkpoints["merging_results"] - base_progress
+        )
+
+        async def on_chunk_complete(
+            content_hash: str, result: ChunkAnalysisResult, completed: int, total: int
+        ):
+            if result.success:
+                await self._run_blocking(
+                    job_store.save_chunk_checkpoint,
+                    checkpoint_scope,
+                    content_hash,
+                    result.to_dict(),
+                )
+            chunk_progress = int((completed / total) * total_progress_range)
+            await self.queue.update_job_progress(
+                job.job_id, base_progress + chunk_progress
+            )
+
         # Perform chunked analysis with background-optimized settings
         chunked_result = await self.chunked_analyzer.analyze_pr_chunked(
-            pr_data=job.pr_data, pr_files=pr_files
+            pr_data=job.pr_data,
+            pr_files=pr_files,
+            checkpoints=checkpoints,
+            on_chunk_complete=on_chunk_complete,
         )
 
-        # Update progress based on chunked analysis completion
-        if chunked_result.total_chunks > 0:
-            # Progress range from analysis_in_progress (30) to merging_results (90)
-            base_progress = self.config.progress_checkpoints["analysis_in_progress"]
-            total_progress_range = (
-                self.config.progress_checkpoints["merging_results"] - base_progress
-            )
-            chunk_progress = int(
-                (chunked_result.successful_chunks / chunked_result.total_chunks)
-                * total_progress_range
-            )
-            self.queue.update_job_progress(job.job_id, base_progress + chunk_progress)
+        # Keep checkpoints of a partial run so a retry only re-runs failed chunks
+        if chunked_result.total_chunks > 0 and chunked_result.failed_chunks == 0:
+            job_store.clear_chunk_checkpoints(checkpoint_scope)
 
         return {
             "analysis_mode": "async_detailed_analysis",
@@ -300,6 +359,9 @@ class AsyncAnalysisWorker:
                     chunked_result.successful_chunks if chunked_result else 0
                 ),
                 "failed_chunks": chunked_result.failed_chunks if chunked_result else 0,
+                "resumed_chunks": (
+                    chunked_result.resumed_chunks if chunked_result else 0
+                ),
                 "total_duration": (
                     chunked_result.total_duration if chunked_result else 0
                 ),
@@ -416,3 +478,4 @@ async def shutdown_global_workers():
     if _global_worker_manager:
         await _global_worker_manager.stop_workers()
         _global_worker_manager = None
+    shutdown_io_executor()
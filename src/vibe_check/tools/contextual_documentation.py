@@ -5,6 +5,7 @@ Implements Context 7 integration and library detection for project-aware analysi
 Provides MCP tools for detecting project libraries and loading contextual documentation.
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -55,6 +56,15 @@ class AnalysisContext:
 
         return generic_pattern
 
+    def fingerprint(self) -> str:
+        """Stable hash of the parts of the context that shape analysis output"""
+        payload = json.dumps(
+            [self.library_docs, self.pattern_exceptions, self.conflict_resolution],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 class LibraryDetectionEngine:
     """Detects project libraries with performance optimization"""
@@ -11,7 +11,7 @@ the bash script's Claude-powered analysis engine while transforming technical
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import subprocess
@@ -30,12 +30,16 @@ from ...core.vibe_coaching import (
     LearningLevel,
     CoachingTone,
 )
+from ..shared.result_cache import get_result_cache
 
 # Import Claude CLI debug/verbose config
 from ...utils import CLAUDE_CLI_DEBUG, CLAUDE_CLI_VERBOSE
 
 logger = logging.getLogger(__name__)
 
+# Issue fields that influence the vibe check result
+_ISSUE_CACHE_FIELDS = ("title", "body", "author", "repository", "labels")
+
 
 class VibeCheckMode(Enum):
     """Vibe check analysis modes"""
@@ -115,29 +119,25 @@ class VibeCheckFramework:
             # Fetch issue data
             issue_data = self._fetch_issue_data(issue_number, repository)
 
-            # Phase 1: Basic pattern detection (validated engine)
-            basic_patterns = self._detect_basic_patterns(issue_data, detail_level)
-
-            # Phase 2: Claude-powered reasoning (if available and comprehensive mode)
-            claude_analysis = None
-            if mode == VibeCheckMode.COMPREHENSIVE and self.claude_available:
-                claude_analysis = self._run_claude_analysis(issue_data, basic_patterns)
-
-            # Phase 3: Clear-Thought systematic analysis (for complex issues)
-            clear_thought_analysis = None
-            if self._needs_systematic_analysis(issue_data, basic_patterns):
-                clear_thought_analysis = self._run_clear_thought_analysis(
-                    issue_data, basic_patterns
-                )
-
-            # Phase 4: Generate friendly vibe check result
-            vibe_result = self._generate_vibe_check_result(
-                issue_data=issue_data,
-                basic_patterns=basic_patterns,
-                claude_analysis=claude_analysis,
-                clear_thought_analysis=clear_thought_analysis,
-                detail_level=detail_level,
+            # Identical issue content is analyzed once per cache lifetime
+            cache = get_result_cache()
+            cache_key = cache.make_key(
+                "issue_vibes",
+                {key: issue_data.get(key) for key in _ISSUE_CACHE_FIELDS},
+                mode.value,
+                detail_level.value,
+                self.claude_available,
+                cache.pattern_version(),
             )
+            vibe_result = cache.get(cache_key)
+            if vibe_result is None:
+                vibe_result, cacheable = self._analyze_issue_data(
+                    issue_data, mode, detail_level
+                )
+                if cacheable:
+                    cache.put(cache_key, vibe_result)
+            else:
+                logger.debug(f"Serving vibe check for issue #{issue_number} from cache")
 
             # Phase 5: Post GitHub comment if requested
             if post_comment and mode == VibeCheckMode.COMPREHENSIVE and repository:
@@ -155,6 +155,46 @@ class VibeCheckFramework:
                 technical_analysis={"error": str(e)},
             )
 
+    def _analyze_issue_data(
+        self,
+        issue_data: Dict[str, Any],
+        mode: VibeCheckMode,
+        detail_level: DetailLevel,
+    ) -> Tuple[VibeCheckResult, bool]:
+        """
+        Run analysis phases 1-4 on fetched issue data.
+
+        Returns the vibe check result and whether it may be cached: a
+        comprehensive run whose Claude analysis failed is not cached, so the
+        next call retries it.
+        """
+        # Phase 1: Basic pattern detection (validated engine)
+        basic_patterns = self._detect_basic_patterns(issue_data, detail_level)
+
+        # Phase 2: Claude-powered reasoning (if available and comprehensive mode)
+        claude_analysis = None
+        claude_requested = mode == VibeCheckMode.COMPREHENSIVE and self.claude_available
+        if claude_requested:
+            claude_analysis = self._run_claude_analysis(issue_data, basic_patterns)
+
+        # Phase 3: Clear-Thought systematic analysis (for complex issues)
+        clear_thought_analysis = None
+        if self._needs_systematic_analysis(issue_data, basic_patterns):
+            clear_thought_analysis = self._run_clear_thought_analysis(
+                issue_data, basic_patterns
+            )
+
+        # Phase 4: Generate friendly vibe check result
+        vibe_result = self._generate_vibe_check_result(
+            issue_data=issue_data,
+            basic_patterns=basic_patterns,
+            claude_analysis=claude_analysis,
+            clear_thought_analysis=clear_thought_analysis,
+            detail_level=detail_level,
+        )
+
+        return vibe_result, not (claude_requested and claude_analysis is None)
+
     def _fetch_issue_data(
         self, issue_number: int, repository: Optional[str]
     ) -> Dict[str, Any]:
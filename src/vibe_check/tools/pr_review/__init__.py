@@ -11,6 +11,8 @@ Architecture:
 - context_analyzer.py: Review context and re-review detection
 - prompt_generator.py: Claude prompt creation and formatting
 - claude_integration.py: External Claude CLI integration
+- chunked_analyzer.py: Chunked analysis of medium and large PRs
+- chunk_cache.py: Persistent cache of per-chunk Claude analysis results
 - fallback_analyzer.py: Non-Claude analysis methods
 - github_integration.py: GitHub API operations and posting
 - output_formatter.py: Result formatting and comment generation
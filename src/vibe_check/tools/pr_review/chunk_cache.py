@@ -0,0 +1,181 @@
+"""
+Persistent Chunk Result Cache
+
+Caches parsed per-chunk Claude analysis results across runs, keyed by the hash
+of the chunk prompt together with the model, task type and prompt template
+version. When a PR gets a new push, chunks whose files did not change hit the
+cache and only the changed chunks are sent to the Claude CLI again.
+
+Entries live in a small SQLite database (``~/.vibe-check/chunk_cache.db`` by
+default), expire after a TTL and are evicted least-recently-used beyond
+``max_entries``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+MEMORY_CACHE = ":memory:"
+CHUNK_CACHE_ENV_VAR = "VIBE_CHECK_CHUNK_CACHE"
+DEFAULT_CHUNK_CACHE_PATH = Path.home() / ".vibe-check" / "chunk_cache.db"
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+def resolve_chunk_cache_path(configured: Optional[str] = None) -> str:
+    """
+    Resolve where chunk results are cached.
+
+    Order: explicit configuration, the VIBE_CHECK_CHUNK_CACHE environment
+    variable, then ~/.vibe-check/chunk_cache.db. Set the variable to
+    ":memory:" to keep results in process memory only.
+    """
+    if configured:
+        return configured
+    from_env = os.environ.get(CHUNK_CACHE_ENV_VAR)
+    if from_env:
+        return from_env
+    return str(DEFAULT_CHUNK_CACHE_PATH)
+
+
+class ChunkResultCache:
+    """SQLite-backed cache of serialized ChunkAnalysisResult dictionaries"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS chunk_results (
+            cache_key TEXT PRIMARY KEY,
+            result TEXT NOT NULL,
+            stored_at REAL NOT NULL,
+            last_used REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_chunk_results_last_used
+            ON chunk_results (last_used);
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.path = resolve_chunk_cache_path(path)
+        self._lock = threading.Lock()
+        self._conn = self._connect(self.path)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        if path != MEMORY_CACHE:
+            Path(path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            path = str(Path(path).expanduser())
+        conn = sqlite3.connect(path, check_same_thread=False)
+        if path != MEMORY_CACHE:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(ChunkResultCache.SCHEMA)
+        return conn
+
+    def _connect(self, path: str) -> sqlite3.Connection:
+        try:
+            return self._open(path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                f"Could not open chunk cache at {path} ({e}); "
+                "chunk results will not survive a restart"
+            )
+            self.path = MEMORY_CACHE
+            return self._open(MEMORY_CACHE)
+
+    @staticmethod
+    def make_key(
+        prompt_hash: str, model: str, task_type: str, template_version: str
+    ) -> str:
+        """Combine everything that determines a chunk's analysis into one key"""
+        payload = json.dumps([prompt_hash, model, task_type, template_version])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None on miss or expiry"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT result, stored_at FROM chunk_results WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    self._conn.execute(
+                        "DELETE FROM chunk_results WHERE cache_key = ?", (key,)
+                    )
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE chunk_results SET last_used = ? WHERE cache_key = ?",
+                (now, key),
+            )
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result, evicting least recently used entries beyond max_entries"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO chunk_results "
+                "(cache_key, result, stored_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(result, default=str), now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM chunk_results WHERE cache_key IN ("
+                "SELECT cache_key FROM chunk_results "
+                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Drop all cached chunk results and reset statistics"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM chunk_results")
+            self.hits = self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM chunk_results").fetchone()[
+                0
+            ]
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+            return {
+                "path": self.path,
+                "size": size,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": f"{hit_rate:.1f}%",
+            }
+
+
+# Global chunk cache instance
+_chunk_cache: Optional[ChunkResultCache] = None
+
+
+def get_chunk_result_cache() -> ChunkResultCache:
+    """Get or create the process-wide chunk result cache"""
+    global _chunk_cache
+    if _chunk_cache is None:
+        _chunk_cache = ChunkResultCache()
+    return _chunk_cache
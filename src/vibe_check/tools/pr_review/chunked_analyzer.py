@@ -5,14 +5,23 @@ Implements intelligent chunked analysis for medium-sized PRs that are too large
 for single-pass analysis but still manageable with chunking.
 
 Part of Phase 3 implementation for Issue #103.
+
+Chunk results can be checkpointed as they complete: every chunk is identified
+by a hash of its analysis prompt, results from a previous (interrupted or
+partially failed) run are passed back in as ``checkpoints`` and only the
+missing or failed chunks are sent to Claude again. Successful results are also
+kept in the persistent chunk result cache, so chunks that did not change since
+an earlier review are not sent to Claude at all.
 """
 
 import asyncio
+import hashlib
+import inspect
 import logging
 import sys
 import time
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
 
 from vibe_check.tools.shared.pr_classifier import (
@@ -21,6 +30,14 @@ from vibe_check.tools.shared.pr_classifier import (
     classify_pr_size,
 )
 from vibe_check.tools.shared import claude_integration as _claude_integration
+from vibe_check.tools.shared.adaptive_concurrency import (
+    AdaptiveConcurrencyLimiter,
+    get_claude_concurrency_limiter,
+)
+from vibe_check.tools.pr_review.chunk_cache import (
+    ChunkResultCache,
+    get_chunk_result_cache,
+)
 
 sys.modules.setdefault(
     "src.vibe_check.tools.shared.claude_integration", _claude_integration
@@ -31,9 +48,15 @@ from vibe_check.tools.shared.circuit_breaker import (
     ClaudeCliError,
     CircuitBreakerOpenError,
 )
+from vibe_check.tools.shared.pr_file_stream import PRFileRecord
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever _build_chunk_analysis_prompt or _parse_chunk_analysis changes
+# so cached chunk results from the old prompt are not reused
+CHUNK_PROMPT_TEMPLATE_VERSION = "2"
+CHUNK_TASK_TYPE = "pr_review"
+
 
 @dataclass
 class FileChunk:
@@ -76,6 +99,25 @@ class ChunkAnalysisResult:
     files_analyzed: List[str] = field(default_factory=list)
     lines_analyzed: int = 0
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    from_checkpoint: bool = False
+    from_cache: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary for checkpointing."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChunkAnalysisResult":
+        """Rebuild a result from to_dict() output, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+
+# Called as on_chunk_complete(content_hash, result, completed_chunks, total_chunks);
+# a coroutine function is awaited
+ChunkCompleteCallback = Callable[
+    [str, ChunkAnalysisResult, int, int], Optional[Awaitable[None]]
+]
 
 
 @dataclass
@@ -88,6 +130,8 @@ class ChunkedAnalysisResult:
     total_chunks: int = 0
     successful_chunks: int = 0
     failed_chunks: int = 0
+    resumed_chunks: int = 0
+    cached_chunks: int = 0
     total_duration: float = 0
 
     # Aggregated results
@@ -121,22 +165,24 @@ class FileChunker:
             f"FileChunker initialized with max {max_lines_per_chunk} lines per chunk"
         )
 
-    def create_chunks(self, pr_files: List[Dict[str, Any]]) -> List[FileChunk]:
+    def create_chunks(self, pr_files: Iterable[Any]) -> List[FileChunk]:
         """
         Create intelligent file chunks for analysis.
 
         Args:
-            pr_files: List of file data from PR
+            pr_files: File data from PR, as dicts or a PRFileStream
 
         Returns:
             List of file chunks optimized for analysis
         """
-        if not pr_files:
+        # Enhance file data with analysis metadata in a single pass
+        enhanced_files = [
+            self._enhance_file_data(f.to_dict() if isinstance(f, PRFileRecord) else f)
+            for f in pr_files
+        ]
+        if not enhanced_files:
             return []
 
-        # Enhance file data with analysis metadata
-        enhanced_files = [self._enhance_file_data(f) for f in pr_files]
-
         # Sort files by priority for optimal chunking when allowed
         if self.preserve_file_order:
             sorted_files = enhanced_files
@@ -147,11 +193,11 @@ class FileChunker:
         chunks = self._group_files_into_chunks(sorted_files)
 
         logger.info(
-            f"Created {len(chunks)} chunks from {len(pr_files)} files",
+            f"Created {len(chunks)} chunks from {len(enhanced_files)} files",
             extra={
-                "total_files": len(pr_files),
+                "total_files": len(enhanced_files),
                 "chunk_count": len(chunks),
-                "avg_files_per_chunk": len(pr_files) / max(len(chunks), 1),
+                "avg_files_per_chunk": len(enhanced_files) / max(len(chunks), 1),
             },
         )
 
@@ -326,10 +372,19 @@ class ChunkedAnalyzer:
         chunk_timeout: int = 60,
         max_concurrent_chunks: int = 3,
         max_lines_per_chunk: int = 500,
+        model: str = "sonnet",
+        result_cache: Optional[ChunkResultCache] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ):
         self.chunk_timeout = chunk_timeout
         self.max_concurrent_chunks = max_concurrent_chunks
         self.chunker = FileChunker(max_lines_per_chunk)
+        self.model = model
+        self.result_cache = result_cache or get_chunk_result_cache()
+        # Shared across analyzers: all of them compete for the same Claude CLI
+        self.concurrency_limiter = (
+            concurrency_limiter or get_claude_concurrency_limiter()
+        )
 
         logger.info(
             f"ChunkedAnalyzer initialized",
@@ -341,7 +396,11 @@ class ChunkedAnalyzer:
         )
 
     async def analyze_pr_chunked(
-        self, pr_data: Dict[str, Any], pr_files: List[Dict[str, Any]]
+        self,
+        pr_data: Dict[str, Any],
+        pr_files: List[Dict[str, Any]],
+        checkpoints: Optional[Dict[str, ChunkAnalysisResult]] = None,
+        on_chunk_complete: Optional[ChunkCompleteCallback] = None,
     ) -> ChunkedAnalysisResult:
         """
         Perform chunked analysis of a PR.
@@ -349,6 +408,10 @@ class ChunkedAnalyzer:
         Args:
             pr_data: PR metadata from GitHub API
             pr_files: List of changed files with content
+            checkpoints: Results of a previous run keyed by chunk content hash;
+                successful ones are reused instead of re-analyzing the chunk
+            on_chunk_complete: Called as each analyzed chunk finishes, to
+                checkpoint its result and report progress
 
         Returns:
             Comprehensive chunked analysis result
@@ -378,7 +441,9 @@ class ChunkedAnalyzer:
             )
 
         # Analyze chunks with concurrency control
-        chunk_results = await self._analyze_chunks_concurrently(chunks, pr_data)
+        chunk_results = await self._analyze_chunks_concurrently(
+            chunks, pr_data, checkpoints, on_chunk_complete
+        )
 
         # Merge results
         merged_result = await self._merge_chunk_results(
@@ -390,44 +455,137 @@ class ChunkedAnalyzer:
             extra={
                 "total_chunks": len(chunks),
                 "successful_chunks": merged_result.successful_chunks,
+                "resumed_chunks": merged_result.resumed_chunks,
+                "cached_chunks": merged_result.cached_chunks,
                 "total_duration": merged_result.total_duration,
             },
         )
 
         return merged_result
 
+    def chunk_content_hash(self, chunk: FileChunk) -> str:
+        """
+        Identify a chunk by the files it analyzes.
+
+        Only the per-file summaries, the model and the prompt template version
+        are hashed. The chunk ID, PR title and description and the chunk's
+        line totals are left out, so an unchanged group of files keeps its
+        hash when another file in the PR changes or the chunks renumber.
+        """
+        digest = hashlib.sha256()
+        for part in (self.model, CHUNK_PROMPT_TEMPLATE_VERSION):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        for file_data in chunk.files:
+            digest.update(self._build_file_summary(file_data).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _chunk_cache_key(self, content_hash: str) -> str:
+        return self.result_cache.make_key(
+            content_hash, self.model, CHUNK_TASK_TYPE, CHUNK_PROMPT_TEMPLATE_VERSION
+        )
+
+    def _get_cached_chunk_result(
+        self, content_hash: str
+    ) -> Optional[ChunkAnalysisResult]:
+        try:
+            cached = self.result_cache.get(self._chunk_cache_key(content_hash))
+        except Exception as e:
+            logger.warning(f"Chunk result cache lookup failed: {e}")
+            return None
+        if cached is None:
+            return None
+        result = ChunkAnalysisResult.from_dict(cached)
+        result.from_cache = True
+        return result
+
+    def _cache_chunk_result(
+        self, content_hash: str, result: ChunkAnalysisResult
+    ) -> None:
+        try:
+            self.result_cache.put(self._chunk_cache_key(content_hash), result.to_dict())
+        except Exception as e:
+            logger.warning(f"Failed to cache chunk {result.chunk_id} result: {e}")
+
     async def _analyze_chunks_concurrently(
-        self, chunks: List[FileChunk], pr_data: Dict[str, Any]
+        self,
+        chunks: List[FileChunk],
+        pr_data: Dict[str, Any],
+        checkpoints: Optional[Dict[str, ChunkAnalysisResult]] = None,
+        on_chunk_complete: Optional[ChunkCompleteCallback] = None,
     ) -> List[ChunkAnalysisResult]:
         """Analyze chunks with controlled concurrency."""
 
-        # Create semaphore for concurrency control
+        # Per-run cap; the shared adaptive limiter governs total CLI concurrency
         semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
 
-        # Create analysis tasks
-        tasks = [
-            self._analyze_single_chunk(chunk, pr_data, semaphore) for chunk in chunks
-        ]
+        checkpoints = checkpoints or {}
+        content_hashes = [self.chunk_content_hash(chunk) for chunk in chunks]
+        chunk_results: List[Optional[ChunkAnalysisResult]] = [None] * len(chunks)
+
+        # Reuse successful checkpointed results; failed chunks are re-run
+        for i, content_hash in enumerate(content_hashes):
+            checkpoint = checkpoints.get(content_hash)
+            if checkpoint is not None and checkpoint.success:
+                # The same files may have been numbered differently last run
+                checkpoint.chunk_id = chunks[i].chunk_id
+                checkpoint.from_checkpoint = True
+                checkpoint.from_cache = False
+                chunk_results[i] = checkpoint
+
+        completed = sum(1 for result in chunk_results if result is not None)
+        if completed:
+            logger.info(
+                f"Resuming chunked analysis from {completed} checkpointed chunks",
+                extra={"resumed_chunks": completed, "total_chunks": len(chunks)},
+            )
 
-        # Execute with controlled concurrency
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Convert exceptions to error results
-        chunk_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                chunk_results.append(
-                    ChunkAnalysisResult(
-                        chunk_id=chunks[i].chunk_id,
-                        success=False,
-                        duration=0.0,
-                        error_type=type(result).__name__,
-                        error_message=str(result),
-                        files_analyzed=chunks[i].filenames,
-                    )
+        async def analyze_and_checkpoint(i: int) -> None:
+            nonlocal completed
+            chunk = chunks[i]
+            try:
+                # Only chunks whose content changed since it was cached hit Claude
+                result = self._get_cached_chunk_result(content_hashes[i])
+                if result is not None:
+                    result.chunk_id = chunk.chunk_id
+                else:
+                    result = await self._analyze_single_chunk(chunk, pr_data, semaphore)
+                    if result.success:
+                        self._cache_chunk_result(content_hashes[i], result)
+            except Exception as e:
+                # Convert exceptions to error results
+                result = ChunkAnalysisResult(
+                    chunk_id=chunk.chunk_id,
+                    success=False,
+                    duration=0.0,
+                    error_type=type(e).__name__,
+                    error_message=str(e),
+                    files_analyzed=chunk.filenames,
                 )
-            else:
-                chunk_results.append(result)
+            chunk_results[i] = result
+            completed += 1
+
+            if on_chunk_complete:
+                try:
+                    outcome = on_chunk_complete(
+                        content_hashes[i], result, completed, len(chunks)
+                    )
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception as e:
+                    logger.warning(
+                        f"Chunk {chunk.chunk_id} completion callback failed: {e}"
+                    )
+
+        # Execute with controlled concurrency
+        await asyncio.gather(
+            *(
+                analyze_and_checkpoint(i)
+                for i, result in enumerate(chunk_results)
+                if result is None
+            )
+        )
 
         return chunk_results
 
@@ -436,97 +594,115 @@ class ChunkedAnalyzer:
     ) -> ChunkAnalysisResult:
         """Analyze a single chunk of files."""
 
-        async with semaphore:
-            start_time = time.time()
+        async with semaphore, self.concurrency_limiter.slot():
+            result = await self._run_chunk_analysis(chunk, pr_data)
 
-            logger.debug(
-                f"Analyzing chunk {chunk.chunk_id}",
-                extra={
-                    "chunk_id": chunk.chunk_id,
-                    "files": chunk.file_count,
-                    "lines": chunk.total_lines,
-                },
-            )
+        # Feed the outcome back into the adaptive concurrency limit
+        if result.success:
+            self.concurrency_limiter.record_success(result.duration)
+        elif result.error_type in ("TimeoutError", "CircuitBreakerOpenError"):
+            self.concurrency_limiter.record_overload(result.error_type)
+        elif "timed out" in (result.error_message or "").lower():
+            self.concurrency_limiter.record_overload("TimeoutError")
 
-            try:
-                # Build analysis prompt for this chunk
-                analysis_prompt = self._build_chunk_analysis_prompt(chunk, pr_data)
-
-                # Perform Claude CLI analysis with circuit breaker
-                claude_result = await asyncio.wait_for(
-                    claude_integration.analyze_content_async_with_circuit_breaker(
-                        content=analysis_prompt,
-                        task_type="pr_review",
-                        timeout_seconds=self.chunk_timeout,
-                        max_retries=2,
-                    ),
-                    timeout=self.chunk_timeout,
-                )
+        return result
 
-                if claude_result.success:
-                    # Parse analysis results
-                    return self._parse_chunk_analysis(
-                        chunk, claude_result.output, time.time() - start_time
-                    )
-                else:
-                    # Handle analysis failure
-                    return ChunkAnalysisResult(
-                        chunk_id=chunk.chunk_id,
-                        success=False,
-                        duration=time.time() - start_time,
-                        error_type="ClaudeCliError",
-                        error_message=claude_result.error or "Analysis failed",
-                        files_analyzed=chunk.filenames,
-                        lines_analyzed=chunk.total_lines,
-                    )
+    async def _run_chunk_analysis(
+        self, chunk: FileChunk, pr_data: Dict[str, Any]
+    ) -> ChunkAnalysisResult:
+        """Run the Claude CLI analysis of a single chunk."""
 
-            except asyncio.TimeoutError as e:
-                logger.warning(
-                    f"Chunk {chunk.chunk_id} analysis timed out",
-                    extra={"chunk_id": chunk.chunk_id, "error": str(e)},
-                )
+        start_time = time.time()
 
-                return ChunkAnalysisResult(
-                    chunk_id=chunk.chunk_id,
-                    success=False,
-                    duration=time.time() - start_time,
-                    error_type="TimeoutError",
-                    error_message="Analysis timed out",
-                    files_analyzed=chunk.filenames,
-                    lines_analyzed=chunk.total_lines,
-                )
+        logger.debug(
+            f"Analyzing chunk {chunk.chunk_id}",
+            extra={
+                "chunk_id": chunk.chunk_id,
+                "files": chunk.file_count,
+                "lines": chunk.total_lines,
+            },
+        )
 
-            except (ClaudeCliError, CircuitBreakerOpenError) as e:
-                logger.warning(
-                    f"Chunk {chunk.chunk_id} analysis failed: {e}",
-                    extra={"chunk_id": chunk.chunk_id, "error": str(e)},
-                )
+        try:
+            # Build analysis prompt for this chunk
+            analysis_prompt = self._build_chunk_analysis_prompt(chunk, pr_data)
+
+            # Perform Claude CLI analysis with circuit breaker
+            claude_result = await asyncio.wait_for(
+                claude_integration.analyze_content_async_with_circuit_breaker(
+                    content=analysis_prompt,
+                    task_type=CHUNK_TASK_TYPE,
+                    timeout_seconds=self.chunk_timeout,
+                    max_retries=2,
+                    model=self.model,
+                ),
+                timeout=self.chunk_timeout,
+            )
 
+            if claude_result.success:
+                # Parse analysis results
+                return self._parse_chunk_analysis(
+                    chunk, claude_result.output, time.time() - start_time
+                )
+            else:
+                # Handle analysis failure
                 return ChunkAnalysisResult(
                     chunk_id=chunk.chunk_id,
                     success=False,
                     duration=time.time() - start_time,
-                    error_type=type(e).__name__,
-                    error_message=str(e),
+                    error_type="ClaudeCliError",
+                    error_message=claude_result.error or "Analysis failed",
                     files_analyzed=chunk.filenames,
                     lines_analyzed=chunk.total_lines,
                 )
 
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error analyzing chunk {chunk.chunk_id}: {e}",
-                    extra={"chunk_id": chunk.chunk_id, "error": str(e)},
-                )
+        except asyncio.TimeoutError as e:
+            logger.warning(
+                f"Chunk {chunk.chunk_id} analysis timed out",
+                extra={"chunk_id": chunk.chunk_id, "error": str(e)},
+            )
 
-                return ChunkAnalysisResult(
-                    chunk_id=chunk.chunk_id,
-                    success=False,
-                    duration=time.time() - start_time,
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                    files_analyzed=chunk.filenames,
-                    lines_analyzed=chunk.total_lines,
-                )
+            return ChunkAnalysisResult(
+                chunk_id=chunk.chunk_id,
+                success=False,
+                duration=time.time() - start_time,
+                error_type="TimeoutError",
+                error_message="Analysis timed out",
+                files_analyzed=chunk.filenames,
+                lines_analyzed=chunk.total_lines,
+            )
+
+        except (ClaudeCliError, CircuitBreakerOpenError) as e:
+            logger.warning(
+                f"Chunk {chunk.chunk_id} analysis failed: {e}",
+                extra={"chunk_id": chunk.chunk_id, "error": str(e)},
+            )
+
+            return ChunkAnalysisResult(
+                chunk_id=chunk.chunk_id,
+                success=False,
+                duration=time.time() - start_time,
+                error_type=type(e).__name__,
+                error_message=str(e),
+                files_analyzed=chunk.filenames,
+                lines_analyzed=chunk.total_lines,
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error analyzing chunk {chunk.chunk_id}: {e}",
+                extra={"chunk_id": chunk.chunk_id, "error": str(e)},
+            )
+
+            return ChunkAnalysisResult(
+                chunk_id=chunk.chunk_id,
+                success=False,
+                duration=time.time() - start_time,
+                error_type=type(e).__name__,
+                error_message=str(e),
+                files_analyzed=chunk.filenames,
+                lines_analyzed=chunk.total_lines,
+            )
 
     def _build_chunk_analysis_prompt(
         self, chunk: FileChunk, pr_data: Dict[str, Any]
@@ -537,24 +713,9 @@ class ChunkedAnalyzer:
         pr_description = pr_data.get("body", "No description provided")
 
         # Build file summaries
-        file_summaries = []
-        for file_data in chunk.files:
-            filename = file_data.get("filename", "unknown")
-            changes = file_data.get("total_changes", 0)
-            file_type = file_data.get("file_type", "unknown")
-
-            # Get patch/diff if available
-            patch = file_data.get("patch", "")
-            if patch:
-                # Truncate very long patches
-                if len(patch) > 2000:
-                    patch = patch[:2000] + "\n... (truncated)"
-
-            file_summary = f"""
-**File**: {filename} ({file_type}, {changes} lines changed)
-{patch if patch else "No diff available"}
-"""
-            file_summaries.append(file_summary)
+        file_summaries = [
+            self._build_file_summary(file_data) for file_data in chunk.files
+        ]
 
         prompt = f"""
 Please analyze this chunk of files from a Pull Request as part of a larger chunked analysis.
@@ -589,6 +750,24 @@ Please provide focused, actionable analysis for this chunk.
 
         return prompt
 
+    def _build_file_summary(self, file_data: Dict[str, Any]) -> str:
+        """Build the prompt section describing one file of a chunk."""
+        filename = file_data.get("filename", "unknown")
+        changes = file_data.get("total_changes", 0)
+        file_type = file_data.get("file_type", "unknown")
+
+        # Get patch/diff if available
+        patch = file_data.get("patch", "")
+        if patch:
+            # Truncate very long patches
+            if len(patch) > 2000:
+                patch = patch[:2000] + "\n... (truncated)"
+
+        return f"""
+**File**: {filename} ({file_type}, {changes} lines changed)
+{patch if patch else "No diff available"}
+"""
+
     def _parse_chunk_analysis(
         self, chunk: FileChunk, analysis_output: str, duration: float
     ) -> ChunkAnalysisResult:
@@ -662,6 +841,8 @@ Please provide focused, actionable analysis for this chunk.
 
         successful_results = [r for r in chunk_results if r.success]
         failed_results = [r for r in chunk_results if not r.success]
+        resumed_results = [r for r in chunk_results if r.from_checkpoint]
+        cached_results = [r for r in chunk_results if r.from_cache]
 
         # Aggregate patterns and recommendations
         all_patterns = []
@@ -680,6 +861,8 @@ Please provide focused, actionable analysis for this chunk.
                         "patterns_found": len(result.patterns_detected),
                         "recommendations_made": len(result.recommendations),
                         "duration": result.duration,
+                        "from_checkpoint": result.from_checkpoint,
+                        "from_cache": result.from_cache,
                         "key_findings": (
                             result.summary[:200] + "..."
                             if len(result.summary) > 200
@@ -725,6 +908,8 @@ Please provide focused, actionable analysis for this chunk.
             total_chunks=len(chunk_results),
             successful_chunks=len(successful_results),
             failed_chunks=len(failed_results),
+            resumed_chunks=len(resumed_results),
+            cached_chunks=len(cached_results),
             total_duration=total_duration,
             patterns_detected=unique_patterns,
             recommendations=prioritized_recommendations,
@@ -879,7 +1064,10 @@ def get_chunked_analyzer() -> ChunkedAnalyzer:
     global _chunked_analyzer_instance
 
     if _chunked_analyzer_instance is None:
-        _chunked_analyzer_instance = ChunkedAnalyzer()
+        # Let the adaptive limiter, not a fixed per-run cap, decide concurrency
+        _chunked_analyzer_instance = ChunkedAnalyzer(
+            max_concurrent_chunks=get_claude_concurrency_limiter().max_limit
+        )
 
     return _chunked_analyzer_instance
 
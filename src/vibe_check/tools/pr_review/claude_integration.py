@@ -136,13 +136,13 @@ class ClaudeIntegration:
         self.logger.info(f"🔍 Running Claude analysis with model: {model}")
         start_time = time.time()
 
-        # Build command arguments securely - no shell execution needed
+        # Build command arguments securely - no shell execution needed. The
+        # prompt is streamed through stdin so PR-sized prompts never hit ARG_MAX
         command_args = [
             self.external_claude.claude_cli_path,
             "--model",
             model,
             "-p",
-            prompt,
         ]
 
         try:
@@ -151,12 +151,14 @@ class ClaudeIntegration:
                 *command_args,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                stdin=asyncio.subprocess.PIPE,
                 cwd=os.path.expanduser("~"),
             )
 
             try:
                 stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=self.external_claude.timeout_seconds
+                    process.communicate(input=prompt.encode("utf-8")),
+                    timeout=self.external_claude.timeout_seconds,
                 )
             except asyncio.TimeoutError:
                 process.kill()
@@ -3,16 +3,33 @@ PR Data Collector
 
 Handles GitHub API interactions and PR data collection.
 This module extracts data collection functionality from the monolithic PRReviewTool.
+
+The collection stage is async: `gh pr view`, `gh pr diff` and one
+`gh issue view` per linked issue run as concurrent subprocesses with bounded
+parallelism and per-call timeouts. Linked issues are fetched as soon as the PR
+body is known, while the diff is still downloading. The sync wrappers run
+the collection on a private event loop, in a helper thread when they are
+called from inside a running loop.
 """
 
+import asyncio
 import json
 import logging
 import re
 import subprocess
-from typing import Dict, Any, List
+from typing import Any, Dict, List, Optional, Tuple
+
+from vibe_check.tools.shared.async_github import run_sync
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_PARALLEL = 4
+PR_VIEW_TIMEOUT = 30
+PR_DIFF_TIMEOUT = 15
+ISSUE_VIEW_TIMEOUT = 10
+
+PR_VIEW_FIELDS = "title,body,files,additions,deletions,author,createdAt,baseRefName,headRefName,comments"
+
 
 class PRDataCollector:
     """
@@ -25,14 +42,40 @@ class PRDataCollector:
     - Format data for downstream analysis
     """
 
-    def __init__(self):
-        """Initialize the PR data collector."""
+    def __init__(self, max_parallel: int = DEFAULT_MAX_PARALLEL):
+        """
+        Initialize the PR data collector.
+
+        Args:
+            max_parallel: Maximum number of concurrent gh subprocesses
+        """
         self.logger = logger
+        self.max_parallel = max(1, max_parallel)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def collect_pr_data(self, pr_number: int, repository: str) -> Dict[str, Any]:
         """
         Collect comprehensive PR data using GitHub CLI.
 
+        Sync wrapper around collect_pr_data_async(); async callers should
+        await that directly instead of blocking their loop on this one.
+
+        Args:
+            pr_number: PR number to collect data for
+            repository: Repository in format "owner/repo"
+
+        Returns:
+            Comprehensive PR data structure or error dict
+        """
+        return run_sync(self.collect_pr_data_async(pr_number, repository))
+
+    async def collect_pr_data_async(
+        self, pr_number: int, repository: str
+    ) -> Dict[str, Any]:
+        """
+        Collect comprehensive PR data using concurrent GitHub CLI calls.
+
         Args:
             pr_number: PR number to collect data for
             repository: Repository in format "owner/repo"
@@ -40,39 +83,33 @@ class PRDataCollector:
         Returns:
             Comprehensive PR data structure or error dict
         """
+        diff_task = asyncio.create_task(self._fetch_diff(pr_number, repository))
+
         try:
             # Get comprehensive PR information
-            pr_result = subprocess.run(
+            returncode, stdout, stderr = await self._run_gh(
                 [
-                    "gh",
                     "pr",
                     "view",
                     str(pr_number),
                     "--repo",
                     repository,
                     "--json",
-                    "title,body,files,additions,deletions,author,createdAt,baseRefName,headRefName,comments",
+                    PR_VIEW_FIELDS,
                 ],
-                capture_output=True,
-                text=True,
-                check=True,
+                timeout=PR_VIEW_TIMEOUT,
             )
+            if returncode != 0:
+                diff_task.cancel()
+                self.logger.error(f"Failed to fetch PR #{pr_number}: {stderr}")
+                return {"error": f"Failed to fetch PR #{pr_number}: {stderr}"}
 
-            pr_info = json.loads(pr_result.stdout)
+            pr_info = json.loads(stdout)
 
-            # Get PR diff
-            diff_result = subprocess.run(
-                ["gh", "pr", "diff", str(pr_number), "--repo", repository],
-                capture_output=True,
-                text=True,
-                timeout=15,
-            )
-
-            pr_diff = diff_result.stdout if diff_result.returncode == 0 else ""
-
-            # Extract linked issues from PR body
-            linked_issues = self.extract_linked_issues(
-                pr_info.get("body", ""), repository
+            # Extract linked issues from PR body while the diff downloads
+            linked_issues, pr_diff = await asyncio.gather(
+                self.extract_linked_issues_async(pr_info.get("body", ""), repository),
+                diff_task,
             )
 
             # Build comprehensive data structure
@@ -106,19 +143,41 @@ class PRDataCollector:
 
             return pr_data
 
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to fetch PR #{pr_number}: {e}")
-            return {"error": f"Failed to fetch PR #{pr_number}: {e.stderr}"}
+        except asyncio.TimeoutError:
+            diff_task.cancel()
+            self.logger.error(f"Timed out fetching PR #{pr_number}")
+            return {
+                "error": f"Failed to fetch PR #{pr_number}: timed out after {PR_VIEW_TIMEOUT}s"
+            }
         except Exception as e:
+            diff_task.cancel()
             self.logger.error(f"PR data collection failed: {e}")
             return {"error": f"Failed to collect PR data: {str(e)}"}
 
+    async def _fetch_diff(self, pr_number: int, repository: str) -> str:
+        """Get the PR diff, or an empty string if it cannot be fetched"""
+        try:
+            returncode, stdout, _ = await self._run_gh(
+                ["pr", "diff", str(pr_number), "--repo", repository],
+                timeout=PR_DIFF_TIMEOUT,
+            )
+            return stdout if returncode == 0 else ""
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Timed out fetching diff for PR #{pr_number}")
+            return ""
+        except OSError as e:
+            self.logger.warning(f"Could not fetch diff for PR #{pr_number}: {e}")
+            return ""
+
     def extract_linked_issues(
         self, pr_body: str, repository: str
     ) -> List[Dict[str, Any]]:
         """
         Extract and analyze linked issues from PR body.
 
+        Sync wrapper around extract_linked_issues_async(); async callers
+        should await that directly instead of blocking their loop on this one.
+
         Args:
             pr_body: PR description/body text
             repository: Repository in format "owner/repo"
@@ -126,57 +185,118 @@ class PRDataCollector:
         Returns:
             List of linked issue data with metadata
         """
+        return run_sync(self.extract_linked_issues_async(pr_body, repository))
+
+    async def extract_linked_issues_async(
+        self, pr_body: str, repository: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract linked issues from PR body and fetch them concurrently.
+
+        An issue that cannot be fetched is returned with an "error" entry
+        instead of failing the whole collection.
+
+        Args:
+            pr_body: PR description/body text
+            repository: Repository in format "owner/repo"
+
+        Returns:
+            List of linked issue data with metadata, in PR body order
+        """
         try:
             # Extract issue numbers from PR body using standard GitHub patterns
             issue_pattern = r"(Fixes|Closes|Resolves)\s+#(\d+)"
-            matches = re.findall(issue_pattern, pr_body, re.IGNORECASE)
-
-            linked_issues = []
-            for action, issue_num in matches:
-                try:
-                    # Get issue details
-                    issue_result = subprocess.run(
-                        [
-                            "gh",
-                            "issue",
-                            "view",
-                            issue_num,
-                            "--repo",
-                            repository,
-                            "--json",
-                            "title,body,labels,state",
-                        ],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-
-                    issue_data = json.loads(issue_result.stdout)
-                    linked_issues.append(
-                        {
-                            "number": int(issue_num),
-                            "action": action,
-                            "title": issue_data["title"],
-                            "body": issue_data.get("body", ""),
-                            "labels": [
-                                label["name"] for label in issue_data.get("labels", [])
-                            ],
-                            "state": issue_data["state"],
-                        }
-                    )
+            matches = re.findall(issue_pattern, pr_body or "", re.IGNORECASE)
 
-                except subprocess.CalledProcessError:
-                    self.logger.warning(f"Could not fetch issue #{issue_num}")
-                    linked_issues.append(
-                        {
-                            "number": int(issue_num),
-                            "action": action,
-                            "error": "Issue not found or inaccessible",
-                        }
+            return list(
+                await asyncio.gather(
+                    *(
+                        self._fetch_linked_issue(action, issue_num, repository)
+                        for action, issue_num in matches
                     )
-
-            return linked_issues
+                )
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to extract linked issues: {e}")
             return []
+
+    async def _fetch_linked_issue(
+        self, action: str, issue_num: str, repository: str
+    ) -> Dict[str, Any]:
+        try:
+            # Get issue details
+            returncode, stdout, _ = await self._run_gh(
+                [
+                    "issue",
+                    "view",
+                    issue_num,
+                    "--repo",
+                    repository,
+                    "--json",
+                    "title,body,labels,state",
+                ],
+                timeout=ISSUE_VIEW_TIMEOUT,
+            )
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, "gh issue view")
+
+            issue_data = json.loads(stdout)
+            return {
+                "number": int(issue_num),
+                "action": action,
+                "title": issue_data["title"],
+                "body": issue_data.get("body", ""),
+                "labels": [label["name"] for label in issue_data.get("labels", [])],
+                "state": issue_data["state"],
+            }
+
+        except (subprocess.CalledProcessError, asyncio.TimeoutError):
+            self.logger.warning(f"Could not fetch issue #{issue_num}")
+            return {
+                "number": int(issue_num),
+                "action": action,
+                "error": "Issue not found or inaccessible",
+            }
+        except Exception as e:
+            # Missing gh, malformed output or missing fields: keep the other issues
+            self.logger.warning(f"Could not read issue #{issue_num}: {e}")
+            return {
+                "number": int(issue_num),
+                "action": action,
+                "error": f"Could not read issue: {e}",
+            }
+
+    async def _run_gh(self, args: List[str], timeout: float) -> Tuple[int, str, str]:
+        """
+        Run a gh CLI command without blocking the event loop.
+
+        Raises:
+            asyncio.TimeoutError: If the command does not finish within timeout
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_parallel)
+            self._semaphore_loop = loop
+
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                "gh",
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
+
+        return (
+            process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace"),
+        )
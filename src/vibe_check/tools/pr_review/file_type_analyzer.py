@@ -5,10 +5,12 @@ Provides file type-specific analysis guidelines and prompts based on the
 Claude GitHub action patterns. Each file type has specific review criteria.
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Tuple, Optional, Any
 from pathlib import Path
 import logging
 
+from vibe_check.tools.shared.pr_file_stream import PRFileRecord
+
 logger = logging.getLogger(__name__)
 
 
@@ -155,12 +157,15 @@ class FileTypeAnalyzer:
         },
     }
 
-    def analyze_files(self, files: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_files(self, files: Iterable[Any]) -> Dict[str, Any]:
         """
         Analyze files and group by type with specific guidelines.
 
+        Files are consumed in a single pass, so a PRFileStream can be passed
+        directly and grouping starts before its last page arrives.
+
         Args:
-            files: List of file dictionaries from PR data
+            files: File dictionaries from PR data, or PRFileRecord objects
 
         Returns:
             Analysis results with file type breakdown and guidelines
@@ -230,13 +235,13 @@ class FileTypeAnalyzer:
 
         return analysis
 
-    def _group_files_by_type(
-        self, files: List[Dict[str, Any]]
-    ) -> Dict[str, List[Dict]]:
+    def _group_files_by_type(self, files: Iterable[Any]) -> Dict[str, List[Dict]]:
         """Group files by their detected type."""
         file_groups: Dict[str, List[Dict]] = {}
 
         for file_data in files:
+            if isinstance(file_data, PRFileRecord):
+                file_data = file_data.to_dict()
             filename = file_data.get("filename", "")
             primary_type = self._detect_file_type(filename)
             detected_types = {primary_type} | set(
@@ -59,7 +59,7 @@ async def review_pull_request(
 
         # Phase 1: Data Collection
         logger.info("📊 Phase 1: Collecting PR data...")
-        pr_data = data_collector.collect_pr_data(pr_number, repository)
+        pr_data = await data_collector.collect_pr_data_async(pr_number, repository)
         if "error" in pr_data:
             pr_data.setdefault("pr_number", pr_number)
             pr_data.setdefault("repository", repository)
@@ -10,6 +10,9 @@ Features:
 - Pre-defined intent templates for common query types
 - Semantic matching to find contextually appropriate responses
 - Lightweight and fast (no transformer models needed)
+
+scikit-learn is imported when a classifier or matcher is first built, not at
+module import, so loading the server does not pay for it.
 """
 
 import json
@@ -18,10 +21,6 @@ from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from pathlib import Path
 
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
 from ..data import RESPONSE_BANK_PATH
 
 logger = logging.getLogger(__name__)
@@ -63,6 +62,8 @@ class QueryIntentClassifier:
     """Classifies query intent using semantic analysis"""
 
     def __init__(self):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         self.vectorizer = TfidfVectorizer(
             max_features=100, ngram_range=(1, 3), stop_words="english", lowercase=True
         )
@@ -252,13 +253,15 @@ class QueryIntentClassifier:
         # If we have pre-computed vectors, use cosine similarity
         if self.template_vectors is not None and len(self.template_texts) > 0:
             try:
+                from sklearn.metrics.pairwise import cosine_similarity
+
                 query_vector = self.vectorizer.transform([full_text])
                 similarities = cosine_similarity(
                     query_vector, self.template_vectors
                 ).flatten()
 
                 # Get top matching template
-                best_idx = np.argmax(similarities)
+                best_idx = int(similarities.argmax())
                 if similarities[best_idx] > 0.3:  # Threshold for semantic match
                     best_intent = self.template_labels[best_idx]
                     best_score = max(best_score, similarities[best_idx])
@@ -374,6 +377,9 @@ class SemanticResponseMatcher:
             response_bank_path or self._get_default_response_path()
         )
         self.responses = self._load_response_bank()
+
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
         self.vectorizer = TfidfVectorizer(
             max_features=100, ngram_range=(1, 2), stop_words="english"
         )
@@ -515,6 +521,8 @@ class SemanticResponseMatcher:
         # Use semantic similarity to find best match
         if self.response_vectors is not None:
             try:
+                from sklearn.metrics.pairwise import cosine_similarity
+
                 # Include intent context in query vector
                 enhanced_query = (
                     f"{query} {intent.intent_type} {' '.join(intent.key_entities)}"
@@ -537,7 +545,7 @@ class SemanticResponseMatcher:
                             similarities[idx] *= 1.5
 
                 # Get best match
-                best_idx = np.argmax(similarities)
+                best_idx = int(similarities.argmax())
                 if similarities[best_idx] >= min_similarity:
                     _, response_data = self.response_mappings[best_idx]
                     return response_data["response"], float(similarities[best_idx])
@@ -0,0 +1,259 @@
+"""
+Adaptive Concurrency Limiter for Claude CLI Calls
+
+AIMD (additive increase, multiplicative decrease) limiter that decides how many
+Claude CLI analyses may run at once:
+
+- Additive increase: every successful call that finished within the latency
+  target grows the window by 1/limit, i.e. about one slot per full window of
+  healthy calls.
+- Multiplicative decrease: a timeout, an open circuit breaker, an unhealthy
+  ClaudeCliHealthMonitor status or CPU/memory pressure reported by the
+  ResourceMonitor halves the window (at most once per cooldown period, so a
+  burst of simultaneous timeouts counts as one congestion event).
+
+The current limit and the recent adjustments with their reasons are exposed via
+``get_stats()`` for telemetry.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HOLD = "hold"
+DECREASE = "decrease"
+
+DEFAULT_INITIAL_LIMIT = 3
+DEFAULT_MIN_LIMIT = 1
+DEFAULT_MAX_LIMIT = 6
+DEFAULT_LATENCY_TARGET_SECONDS = 30.0
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_DECREASE_COOLDOWN_SECONDS = 5.0
+DEFAULT_SIGNAL_INTERVAL_SECONDS = 5.0
+MEMORY_HOLD_PERCENT = 80.0
+MEMORY_DECREASE_PERCENT = 90.0
+ADJUSTMENT_HISTORY_SIZE = 20
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limiter driven by latency, health and resource signals"""
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = DEFAULT_MIN_LIMIT,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        latency_target_seconds: float = DEFAULT_LATENCY_TARGET_SECONDS,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        decrease_cooldown_seconds: float = DEFAULT_DECREASE_COOLDOWN_SECONDS,
+        signal_interval_seconds: float = DEFAULT_SIGNAL_INTERVAL_SECONDS,
+        health_monitor: Optional[Any] = None,
+        resource_monitor: Optional[Any] = None,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.latency_target_seconds = latency_target_seconds
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+        self.signal_interval_seconds = signal_interval_seconds
+        self._health_monitor = health_monitor
+        self._resource_monitor = resource_monitor
+
+        self._window = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+        self._signal: Tuple[Optional[str], Optional[str]] = (None, None)
+        self._signal_checked_at = 0.0
+        self._adjustments: Deque[Dict[str, Any]] = deque(maxlen=ADJUSTMENT_HISTORY_SIZE)
+
+        self.successes = 0
+        self.slow_calls = 0
+        self.overloads = 0
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Number of calls currently allowed to run concurrently"""
+        return max(self.min_limit, min(self.max_limit, math.floor(self._window)))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of the block"""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+                self._wake_waiters()
+                raise
+        self._in_flight += 1
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def record_success(self, latency: float) -> None:
+        """Feed back a successful call and its latency"""
+        self.successes += 1
+        action, reason = self._check_signals()
+        if action == DECREASE:
+            self._decrease(reason)
+            return
+        if action == HOLD:
+            return
+        if latency > self.latency_target_seconds:
+            self.slow_calls += 1
+            return
+        self._increase("healthy_latency")
+
+    def record_overload(self, reason: str) -> None:
+        """Feed back a timeout, open circuit breaker or other overload signal"""
+        self.overloads += 1
+        self._decrease(reason)
+
+    def _increase(self, reason: str) -> None:
+        previous = self.limit
+        self._window = min(float(self.max_limit), self._window + 1.0 / previous)
+        if self.limit != previous:
+            self.increases += 1
+            self._record_adjustment(previous, reason)
+            self._wake_waiters()
+
+    def _decrease(self, reason: Optional[str]) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown_seconds:
+            return
+        self._last_decrease = now
+
+        previous = self.limit
+        self._window = max(float(self.min_limit), self._window * self.decrease_factor)
+        if self.limit != previous:
+            self.decreases += 1
+            self._record_adjustment(previous, reason or "overload")
+
+    def _record_adjustment(self, previous: int, reason: str) -> None:
+        self._adjustments.append(
+            {"at": time.time(), "from": previous, "to": self.limit, "reason": reason}
+        )
+        logger.info(
+            f"Claude CLI concurrency limit {previous} -> {self.limit} ({reason})"
+        )
+
+    def _check_signals(self) -> Tuple[Optional[str], Optional[str]]:
+        """Sample health and resource signals, at most once per signal interval"""
+        now = time.monotonic()
+        if now - self._signal_checked_at < self.signal_interval_seconds:
+            return self._signal
+        self._signal_checked_at = now
+        self._signal = self._read_health_signal()
+        if self._signal[0] != DECREASE:
+            resource_signal = self._read_resource_signal()
+            if resource_signal[0] is not None:
+                self._signal = resource_signal
+        return self._signal
+
+    def _read_health_signal(self) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            if self._health_monitor is None:
+                from .claude_integration import get_global_health_monitor
+
+                self._health_monitor = get_global_health_monitor()
+            status = self._health_monitor.get_health_status()
+        except Exception as e:
+            logger.debug(f"Health signal unavailable: {e}")
+            return (None, None)
+
+        if status.level in ("UNHEALTHY", "CRITICAL"):
+            return (DECREASE, f"claude_cli_{status.level.lower()}")
+        if status.level == "DEGRADED":
+            return (HOLD, "claude_cli_degraded")
+        return (None, None)
+
+    def _read_resource_signal(self) -> Tuple[Optional[str], Optional[str]]:
+        try:
+            if self._resource_monitor is None:
+                from vibe_check.tools.async_analysis.resource_monitor import (
+                    get_global_resource_monitor,
+                )
+
+                self._resource_monitor = get_global_resource_monitor()
+            usage = self._resource_monitor.get_system_usage()
+            max_cpu = self._resource_monitor.limits.max_total_cpu_percent
+        except Exception as e:
+            logger.debug(f"Resource signal unavailable: {e}")
+            return (None, None)
+
+        if usage.memory_percent > MEMORY_DECREASE_PERCENT:
+            return (DECREASE, "memory_pressure")
+        if usage.cpu_percent > max_cpu:
+            return (DECREASE, "cpu_pressure")
+        if usage.memory_percent > MEMORY_HOLD_PERCENT or usage.cpu_percent > (
+            max_cpu * 0.8
+        ):
+            return (HOLD, "resource_pressure")
+        return (None, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current limit, counters and recent adjustments for telemetry"""
+        action, reason = self._signal
+        return {
+            "limit": self.limit,
+            "window": round(self._window, 2),
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "waiting": sum(1 for waiter in self._waiters if not waiter.done()),
+            "latency_target_seconds": self.latency_target_seconds,
+            "successes": self.successes,
+            "slow_calls": self.slow_calls,
+            "overloads": self.overloads,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "last_signal": {"action": action, "reason": reason},
+            "recent_adjustments": list(self._adjustments),
+        }
+
+
+# Global limiter shared by all Claude CLI chunk analyses in this process
+_claude_concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+
+
+def get_claude_concurrency_limiter() -> AdaptiveConcurrencyLimiter:
+    """Get or create the process-wide Claude CLI concurrency limiter"""
+    global _claude_concurrency_limiter
+    if _claude_concurrency_limiter is None:
+        _claude_concurrency_limiter = AdaptiveConcurrencyLimiter()
+    return _claude_concurrency_limiter
@@ -0,0 +1,668 @@
+"""
+Async GitHub Operations
+
+Async counterpart of the GitHubOperations interface in github_abstraction.py.
+The native implementation talks to the GitHub REST API over aiohttp, so PR
+metadata, diff, files and linked issues can be fetched concurrently instead of
+one blocking PyGithub call after another on the event loop.
+
+All requests from one AsyncGitHubOperations instance share a rate-limit-aware
+semaphore: concurrency is capped, and when GitHub reports that the remaining
+quota is nearly exhausted, new requests wait for the reset instead of failing.
+
+Sync callers keep using GitHubOperations; SyncGitHubOperationsAdapter exposes
+an async implementation through that interface.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from .github_abstraction import (
+    GitHubIssue,
+    GitHubOperationResult,
+    GitHubOperations,
+    GitHubPullRequest,
+    create_github_operations,
+)
+from .pr_file_stream import PRFileRecord
+
+logger = logging.getLogger(__name__)
+
+GITHUB_API_URL = "https://api.github.com"
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_RATE_LIMIT_RESERVE = 10
+DEFAULT_MAX_RATE_LIMIT_WAIT = 60.0
+DEFAULT_REQUEST_TIMEOUT = 30.0
+FILES_PER_PAGE = 100
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """Run a coroutine to completion from sync code, inside a running loop or not"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    outcome: Dict[str, Any] = {}
+
+    def run_in_thread():
+        try:
+            outcome["result"] = asyncio.run(coro)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run_in_thread, daemon=True)
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+class GitHubRateLimiter:
+    """
+    Concurrency cap plus backoff driven by GitHub's rate-limit headers.
+
+    Use as ``async with limiter:`` around each request and feed every
+    response's headers to ``update()``.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        reserve: int = DEFAULT_RATE_LIMIT_RESERVE,
+        max_wait_seconds: float = DEFAULT_MAX_RATE_LIMIT_WAIT,
+    ):
+        self.max_concurrency = max(1, max_concurrency)
+        self.reserve = reserve
+        self.max_wait_seconds = max_wait_seconds
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.waits = 0
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_semaphore: Optional[asyncio.Semaphore] = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Semaphores are bound to the event loop they are first used on
+        loop = asyncio.get_running_loop()
+        if self._loop_semaphore is None or self._semaphore_loop is not loop:
+            self._loop_semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._loop_semaphore
+
+    def wait_seconds(self) -> float:
+        """Seconds to hold new requests so the remaining quota is not exhausted"""
+        if self.remaining is None or self.reset_at is None:
+            return 0.0
+        if self.remaining > self.reserve:
+            return 0.0
+        return min(max(0.0, self.reset_at - time.time()), self.max_wait_seconds)
+
+    def update(self, headers: Any) -> None:
+        """Record X-RateLimit-Remaining / X-RateLimit-Reset from a response"""
+        try:
+            remaining = headers.get("X-RateLimit-Remaining")
+            reset = headers.get("X-RateLimit-Reset")
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset is not None:
+                self.reset_at = float(reset)
+        except (TypeError, ValueError):
+            pass
+
+    async def __aenter__(self) -> "GitHubRateLimiter":
+        semaphore = self._semaphore()
+        await semaphore.acquire()
+        try:
+            delay = self.wait_seconds()
+            if delay > 0:
+                self.waits += 1
+                logger.warning(
+                    f"GitHub rate limit nearly exhausted ({self.remaining} left), "
+                    f"waiting {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+        except BaseException:
+            # Cancelled while waiting for the reset: give the permit back
+            semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore().release()
+
+
+@dataclass
+class PullRequestBundle:
+    """Results of fetching everything a PR review needs in one fan-out"""
+
+    pull_request: GitHubOperationResult
+    diff: Optional[GitHubOperationResult] = None
+    files: Optional[GitHubOperationResult] = None
+    linked_issues: Dict[int, GitHubOperationResult] = field(default_factory=dict)
+    execution_time: float = 0.0
+
+
+class AsyncGitHubOperations(ABC):
+    """
+    Async interface for GitHub operations.
+
+    Mirrors GitHubOperations; every method returns a GitHubOperationResult
+    instead of raising.
+    """
+
+    @abstractmethod
+    async def get_issue(
+        self, repository: str, issue_number: int
+    ) -> GitHubOperationResult:
+        """Fetch a GitHub issue (data: GitHubIssue)."""
+        pass
+
+    @abstractmethod
+    async def get_pull_request(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        """Fetch a GitHub pull request (data: GitHubPullRequest)."""
+        pass
+
+    @abstractmethod
+    async def post_issue_comment(
+        self, repository: str, issue_number: int, comment_body: str
+    ) -> GitHubOperationResult:
+        """Post a comment to a GitHub issue."""
+        pass
+
+    @abstractmethod
+    async def get_pull_request_diff(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        """Get the diff content of a pull request (data: str)."""
+        pass
+
+    @abstractmethod
+    async def get_pull_request_files(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        """Get the files changed in a pull request (data: list of file dicts)."""
+        pass
+
+    @abstractmethod
+    async def check_authentication(self) -> GitHubOperationResult:
+        """Check GitHub authentication status."""
+        pass
+
+    async def _close_stale_session(self) -> None:
+        session, self._session = self._session, None
+        if session is None or session.closed:
+            return
+        try:
+            # The connector belongs to the session's loop, which may be gone
+            await session.close()
+        except Exception as e:
+            logger.debug(f"Could not close GitHub session from another loop: {e}")
+
+    async def close(self) -> None:
+        """Release network resources held by the implementation."""
+
+    async def fetch_pull_request_bundle(
+        self,
+        repository: str,
+        pr_number: int,
+        include_diff: bool = True,
+        include_files: bool = False,
+        linked_issues: Iterable[int] = (),
+    ) -> PullRequestBundle:
+        """
+        Fetch PR metadata, diff, files and linked issues concurrently.
+
+        Total latency approaches the slowest single request rather than the
+        sum. A failed part is reported in its own result; it does not fail the
+        other parts.
+        """
+        start_time = time.time()
+        issue_numbers = list(dict.fromkeys(linked_issues))
+
+        requests: List[Awaitable[GitHubOperationResult]] = [
+            self.get_pull_request(repository, pr_number)
+        ]
+        if include_diff:
+            requests.append(self.get_pull_request_diff(repository, pr_number))
+        if include_files:
+            requests.append(self.get_pull_request_files(repository, pr_number))
+        requests.extend(self.get_issue(repository, number) for number in issue_numbers)
+
+        results = list(await asyncio.gather(*requests))
+
+        bundle = PullRequestBundle(pull_request=results.pop(0))
+        if include_diff:
+            bundle.diff = results.pop(0)
+        if include_files:
+            bundle.files = results.pop(0)
+        bundle.linked_issues = dict(zip(issue_numbers, results))
+        bundle.execution_time = time.time() - start_time
+        return bundle
+
+
+class AiohttpGitHubImplementation(AsyncGitHubOperations):
+    """Native async implementation using the GitHub REST API over aiohttp."""
+
+    def __init__(
+        self,
+        rate_limiter: Optional[GitHubRateLimiter] = None,
+        api_url: str = GITHUB_API_URL,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ):
+        self.implementation_name = "aiohttp"
+        self.rate_limiter = rate_limiter or GitHubRateLimiter()
+        self.api_url = api_url.rstrip("/")
+        self.request_timeout = request_timeout
+        self._session = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self):
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            await self._close_stale_session()
+            # Keep-alive connections are reused across requests on this loop
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                headers={"User-Agent": "vibe-check-mcp"},
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def _get_token(self) -> Optional[str]:
+        # Share the cached token with the sync PyGithub client. Resolving it
+        # may fork ``gh auth token``, so keep that off the event loop.
+        from .github_client_manager import get_github_client_manager
+
+        return await asyncio.to_thread(get_github_client_manager().get_token)
+
+    def _invalidate_token(self) -> None:
+        from .github_client_manager import get_github_client_manager
+
+        get_github_client_manager().invalidate_token()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        accept: str = "application/vnd.github+json",
+        json_body: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[int, Any]:
+        """
+        Send one API request under the rate limiter.
+
+        A 401 re-resolves the token and retries once.
+
+        Returns:
+            Tuple of (HTTP status, parsed JSON or text body)
+        """
+        for attempt in range(2):
+            token = await self._get_token()
+            if not token:
+                return 401, "No GitHub token available"
+
+            status, body = await self._send(
+                method, path, token, accept, json_body, params
+            )
+            if status == 401 and attempt == 0:
+                logger.info("GitHub rejected the cached token, re-resolving")
+                self._invalidate_token()
+                continue
+            return status, body
+
+        return status, body
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        token: str,
+        accept: str,
+        json_body: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> Tuple[int, Any]:
+        headers = {"Authorization": f"token {token}", "Accept": accept}
+        session = await self._get_session()
+
+        async with self.rate_limiter:
+            async with session.request(
+                method,
+                f"{self.api_url}{path}",
+                headers=headers,
+                json=json_body,
+                params=params,
+            ) as response:
+                self.rate_limiter.update(response.headers)
+                if "json" in (response.content_type or ""):
+                    body = await response.json()
+                else:
+                    body = await response.text()
+                return response.status, body
+
+    def _error(
+        self, status: int, body: Any, what: str, start_time: float
+    ) -> GitHubOperationResult:
+        if status == 404:
+            error = f"{what} not found. Check the number and repository access."
+        elif status == 401:
+            error = "GitHub authentication failed. Check GITHUB_TOKEN permissions."
+        else:
+            message = body.get("message", "") if isinstance(body, dict) else str(body)
+            error = f"GitHub API error: HTTP {status} - {message[:200]}"
+        return GitHubOperationResult(
+            success=False,
+            error=error,
+            implementation=self.implementation_name,
+            execution_time=time.time() - start_time,
+        )
+
+    def _failure(self, error: Exception, start_time: float) -> GitHubOperationResult:
+        return GitHubOperationResult(
+            success=False,
+            error=str(error) or type(error).__name__,
+            implementation=self.implementation_name,
+            execution_time=time.time() - start_time,
+        )
+
+    def _success(self, data: Any, start_time: float) -> GitHubOperationResult:
+        return GitHubOperationResult(
+            success=True,
+            data=data,
+            implementation=self.implementation_name,
+            execution_time=time.time() - start_time,
+        )
+
+    async def get_issue(
+        self, repository: str, issue_number: int
+    ) -> GitHubOperationResult:
+        start_time = time.time()
+        try:
+            status, data = await self._request(
+                "GET", f"/repos/{repository}/issues/{issue_number}"
+            )
+            if status != 200:
+                return self._error(status, data, f"Issue #{issue_number}", start_time)
+
+            issue = GitHubIssue(
+                number=data["number"],
+                title=data["title"],
+                body=data.get("body"),
+                state=data["state"],
+                user_login=data["user"]["login"],
+                labels=[label["name"] for label in data.get("labels", [])],
+                repository=repository,
+                html_url=data["html_url"],
+                created_at=data["created_at"],
+                updated_at=data["updated_at"],
+            )
+            return self._success(issue, start_time)
+        except Exception as e:
+            return self._failure(e, start_time)
+
+    async def get_pull_request(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        start_time = time.time()
+        try:
+            status, data = await self._request(
+                "GET", f"/repos/{repository}/pulls/{pr_number}"
+            )
+            if status != 200:
+                return self._error(status, data, f"PR #{pr_number}", start_time)
+
+            pr = GitHubPullRequest(
+                number=data["number"],
+                title=data["title"],
+                body=data.get("body"),
+                state=data["state"],
+                user_login=data["user"]["login"],
+                labels=[label["name"] for label in data.get("labels", [])],
+                repository=repository,
+                html_url=data["html_url"],
+                head_ref=data["head"]["ref"],
+                base_ref=data["base"]["ref"],
+                diff_url=data["diff_url"],
+                created_at=data["created_at"],
+                updated_at=data["updated_at"],
+                additions=data.get("additions", 0),
+                deletions=data.get("deletions", 0),
+                changed_files=data.get("changed_files", 0),
+            )
+            return self._success(pr, start_time)
+        except Exception as e:
+            return self._failure(e, start_time)
+
+    async def post_issue_comment(
+        self, repository: str, issue_number: int, comment_body: str
+    ) -> GitHubOperationResult:
+        start_time = time.time()
+        try:
+            status, data = await self._request(
+                "POST",
+                f"/repos/{repository}/issues/{issue_number}/comments",
+                json_body={"body": comment_body},
+            )
+            if status != 201:
+                return self._error(status, data, f"Issue #{issue_number}", start_time)
+
+            comment_url = f"https://github.com/{repository}/issues/{issue_number}#issuecomment-{data['id']}"
+            return self._success(
+                {"comment_posted": True, "comment_url": comment_url}, start_time
+            )
+        except Exception as e:
+            return self._failure(e, start_time)
+
+    async def get_pull_request_diff(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        start_time = time.time()
+        try:
+            status, data = await self._request(
+                "GET",
+                f"/repos/{repository}/pulls/{pr_number}",
+                accept="application/vnd.github.v3.diff",
+            )
+            if status != 200:
+                return self._error(status, data, f"PR #{pr_number}", start_time)
+            return self._success(data, start_time)
+        except Exception as e:
+            return self._failure(e, start_time)
+
+    async def get_pull_request_files(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        start_time = time.time()
+        try:
+            files: List[Dict[str, Any]] = []
+            page = 1
+            while True:
+                status, data = await self._request(
+                    "GET",
+                    f"/repos/{repository}/pulls/{pr_number}/files",
+                    params={"per_page": FILES_PER_PAGE, "page": page},
+                )
+                if status != 200:
+                    return self._error(status, data, f"PR #{pr_number}", start_time)
+
+                files.extend(
+                    PRFileRecord.from_api(file, keep_patch=True).to_dict()
+                    for file in data
+                )
+                if len(data) < FILES_PER_PAGE:
+                    break
+                page += 1
+
+            return self._success(files, start_time)
+        except Exception as e:
+            return self._failure(e, start_time)
+
+    async def check_authentication(self) -> GitHubOperationResult:
+        start_time = time.time()
+        try:
+            status, data = await self._request("GET", "/user")
+            if status != 200:
+                result = self._error(status, data, "Authenticated user", start_time)
+                result.data = {"authenticated": False, "error": result.error}
+                return result
+            return self._success(
+                {"authenticated": True, "username": data.get("login")}, start_time
+            )
+        except Exception as e:
+            return self._failure(e, start_time)
+
+
+class ThreadedAsyncGitHubOperations(AsyncGitHubOperations):
+    """Async view of a sync GitHubOperations, running each call in a thread."""
+
+    def __init__(
+        self,
+        operations: GitHubOperations,
+        rate_limiter: Optional[GitHubRateLimiter] = None,
+    ):
+        self.operations = operations
+        self.implementation_name = getattr(operations, "implementation_name", "")
+        self.rate_limiter = rate_limiter or GitHubRateLimiter()
+
+    async def _call(self, method: str, *args) -> GitHubOperationResult:
+        async with self.rate_limiter:
+            return await asyncio.to_thread(getattr(self.operations, method), *args)
+
+    async def get_issue(
+        self, repository: str, issue_number: int
+    ) -> GitHubOperationResult:
+        return await self._call("get_issue", repository, issue_number)
+
+    async def get_pull_request(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        return await self._call("get_pull_request", repository, pr_number)
+
+    async def post_issue_comment(
+        self, repository: str, issue_number: int, comment_body: str
+    ) -> GitHubOperationResult:
+        return await self._call(
+            "post_issue_comment", repository, issue_number, comment_body
+        )
+
+    async def get_pull_request_diff(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        return await self._call("get_pull_request_diff", repository, pr_number)
+
+    async def get_pull_request_files(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        return await self._call("get_pull_request_files", repository, pr_number)
+
+    async def check_authentication(self) -> GitHubOperationResult:
+        return await self._call("check_authentication")
+
+
+class SyncGitHubOperationsAdapter(GitHubOperations):
+    """
+    Thin sync GitHubOperations facade over an AsyncGitHubOperations.
+
+    Each call runs to completion on a private event loop (in a helper thread
+    when the caller is already inside a running loop).
+    """
+
+    def __init__(self, operations: AsyncGitHubOperations):
+        self.operations = operations
+        self.implementation_name = getattr(operations, "implementation_name", "")
+
+    def _run(self, method: str, *args) -> GitHubOperationResult:
+        async def call():
+            try:
+                return await getattr(self.operations, method)(*args)
+            finally:
+                await self.operations.close()
+
+        return run_sync(call())
+
+    def get_issue(self, repository: str, issue_number: int) -> GitHubOperationResult:
+        return self._run("get_issue", repository, issue_number)
+
+    def get_pull_request(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        return self._run("get_pull_request", repository, pr_number)
+
+    def post_issue_comment(
+        self, repository: str, issue_number: int, comment_body: str
+    ) -> GitHubOperationResult:
+        return self._run("post_issue_comment", repository, issue_number, comment_body)
+
+    def get_pull_request_diff(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        return self._run("get_pull_request_diff", repository, pr_number)
+
+    def get_pull_request_files(
+        self, repository: str, pr_number: int
+    ) -> GitHubOperationResult:
+        return self._run("get_pull_request_files", repository, pr_number)
+
+    def check_authentication(self) -> GitHubOperationResult:
+        return self._run("check_authentication")
+
+
+def create_async_github_operations(
+    implementation: str = "pygithub",
+) -> AsyncGitHubOperations:
+    """
+    Factory function to create an async GitHub operations implementation.
+
+    Args:
+        implementation: "pygithub" or "aiohttp" for the native async client,
+            any other GitHubOperations implementation name to run that
+            implementation in threads
+
+    Returns:
+        AsyncGitHubOperations implementation instance
+    """
+    if implementation in ("pygithub", "aiohttp"):
+        return AiohttpGitHubImplementation()
+    return ThreadedAsyncGitHubOperations(create_github_operations(implementation))
+
+
+# Shared instances, so keep-alive connections and the rate limiter are process-wide
+_default_async_operations: Dict[str, AsyncGitHubOperations] = {}
+
+
+def get_default_async_github_operations() -> AsyncGitHubOperations:
+    """
+    Get the shared default async GitHub operations implementation.
+
+    Honors the same GITHUB_IMPLEMENTATION environment variable as
+    get_default_github_operations().
+    """
+    import os
+
+    implementation = os.environ.get("GITHUB_IMPLEMENTATION", "pygithub")
+    operations = _default_async_operations.get(implementation)
+    if operations is None:
+        operations = create_async_github_operations(implementation)
+        _default_async_operations[implementation] = operations
+    return operations
@@ -14,9 +14,17 @@ Security Features:
 - Input validation prevents command injection attacks
 - Model parameter validation with helpful error messages
 - Environment isolation to prevent recursion issues
+- Prompts are streamed through stdin, never placed in argv (no ARG_MAX limit,
+  not visible in process listings)
+
+Performance:
+- Executors are reused through a warm pool (see executor_pool.py)
+- CLAUDE.md and other static prompt material is cached and invalidated by mtime
 """
 
 import asyncio
+import copy
+import hashlib
 import json
 import logging
 import os
@@ -25,7 +33,7 @@ import subprocess
 import sys
 import tempfile
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +46,49 @@ VALID_MODEL_PATTERNS = [
 ]
 
 
+# Project root: shared -> tools -> vibe_check -> src -> project_root
+_PROJECT_ROOT = os.path.dirname(
+    os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+)
+
+# Static prompt material read from disk: path -> (file signature, content)
+_text_file_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_text_cached(path: str) -> Optional[str]:
+    """
+    Read a UTF-8 text file, reusing the previous read while its mtime and size
+    are unchanged.
+
+    Returns:
+        File content, or None if the file does not exist
+    """
+    signature = file_signature(path)
+    if signature is None:
+        _text_file_cache.pop(path, None)
+        return None
+
+    cached = _text_file_cache.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    _text_file_cache[path] = (signature, content)
+    return content
+
+
 def _validate_model(model: str) -> str:
     """
     Validate Claude model parameter to prevent command injection and provide helpful errors.
@@ -182,6 +233,7 @@ Promote good engineering practices through constructive analysis.""",
         """
         self.timeout_seconds = timeout_seconds
         self.claude_cli_path = self._find_claude_cli()
+        self._system_prompt_cache: Dict[str, Tuple[str, str]] = {}
 
     def _find_claude_cli(self) -> str:
         """
@@ -288,19 +340,10 @@ Promote good engineering practices through constructive analysis.""",
             CLAUDE.md content or empty string if not found
         """
         try:
-            # Find project root by walking up from current file location
-            current_file = os.path.abspath(__file__)
-            # Navigate up: shared -> tools -> vibe_check -> src -> project_root
-            project_root = os.path.dirname(
-                os.path.dirname(
-                    os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-                )
-            )
-            claude_md_path = os.path.join(project_root, "CLAUDE.md")
+            claude_md_path = os.path.join(_PROJECT_ROOT, "CLAUDE.md")
 
-            if os.path.exists(claude_md_path):
-                with open(claude_md_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+            content = read_text_cached(claude_md_path)
+            if content is not None:
                 logger.debug(f"Successfully read CLAUDE.md from {claude_md_path}")
                 return content
             else:
@@ -324,6 +367,19 @@ Promote good engineering practices through constructive analysis.""",
 
         # Add CLAUDE.md instructions for comprehensive guidance
         claude_md_content = self._get_claude_md_content()
+
+        # Reuse the assembled prompt while CLAUDE.md is unchanged
+        cached = self._system_prompt_cache.get(task_type)
+        if cached and cached[0] == claude_md_content:
+            return cached[1]
+
+        system_prompt = self._build_system_prompt(base_prompt, claude_md_content)
+        self._system_prompt_cache[task_type] = (claude_md_content, system_prompt)
+        return system_prompt
+
+    @staticmethod
+    def _build_system_prompt(base_prompt: str, claude_md_content: str) -> str:
+        """Combine a task system prompt with CLAUDE.md guidelines."""
         if claude_md_content:
             enhanced_prompt = f"""{base_prompt}
 
@@ -347,15 +403,7 @@ Please apply these guidelines throughout your analysis and recommendations."""
         Returns path to MCP config file.
         """
         # Use project's MCP config file in project root
-        # __file__ is: /path/to/src/vibe_check/tools/shared/claude_integration.py
-        # We need to go up 4 levels to reach project root
-        current_file = os.path.abspath(__file__)
-        project_root = os.path.dirname(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-            )
-        )
-        config_path = os.path.join(project_root, "mcp-config.json")
+        config_path = os.path.join(_PROJECT_ROOT, "mcp-config.json")
 
         if os.path.exists(config_path):
             logger.debug(f"Using MCP config at: {config_path}")
@@ -543,6 +591,24 @@ Please apply these guidelines throughout your analysis and recommendations."""
         logger.debug(f"[Debug] Claude CLI args: {args}")
         return args
 
+    def _get_claude_command(
+        self, prompt: str, task_type: str, model: str = "sonnet"
+    ) -> Tuple[List[str], str]:
+        """
+        Build the Claude CLI command and the prompt text to stream to it.
+
+        The final prompt (the last element of _get_claude_args) is sent
+        through the subprocess's stdin instead of argv: `claude -p` reads the
+        prompt from stdin when none is given on the command line. Large
+        prompts therefore never hit ARG_MAX or get copied through exec.
+
+        Returns:
+            Tuple of (command list without the prompt, prompt text for stdin)
+        """
+        claude_args = self._get_claude_args(prompt, task_type, model)
+        stdin_prompt = claude_args.pop()
+        return [self.claude_cli_path] + claude_args, stdin_prompt
+
     def _is_running_in_mcp_context(self) -> bool:
         """
         Detect if we're currently running within a Claude CLI MCP context that would cause recursion.
@@ -621,11 +687,13 @@ Please apply these guidelines throughout your analysis and recommendations."""
         logger.info(f"Executing Claude CLI directly for task: {task_type}")
 
         try:
-            # Build command
-            claude_args = self._get_claude_args(prompt, task_type, model)
+            # Build command; the prompt is streamed through stdin
+            command, stdin_prompt = self._get_claude_command(prompt, task_type, model)
+            claude_args = command[1:]
 
             logger.debug(
-                f'[Debug] Invoking Claude CLI: {self.claude_cli_path} {" ".join(claude_args)}'
+                f'[Debug] Invoking Claude CLI: {" ".join(command)} '
+                f"(prompt: {len(stdin_prompt)} chars via stdin)"
             )
 
             # Create clean environment for internal Claude CLI calls
@@ -648,10 +716,6 @@ Please apply these guidelines throughout your analysis and recommendations."""
             for var in mcp_vars_to_remove:
                 clean_env.pop(var, None)
 
-            # Use regular subprocess
-            command = [self.claude_cli_path] + claude_args
-            logger.debug(f'[Debug] Running command: {" ".join(command)}')
-
             # Use home directory to avoid loading project's MCP config that includes vibe-check
             # This prevents recursion by ensuring Claude CLI doesn't load the vibe-check MCP server
             isolation_dir = os.path.expanduser("~")
@@ -666,7 +730,7 @@ Please apply these guidelines throughout your analysis and recommendations."""
                 timeout=self.timeout_seconds,
                 cwd=isolation_dir,
                 env=clean_env,
-                stdin=subprocess.DEVNULL,
+                input=stdin_prompt,
             )
 
             execution_time = time.time() - start_time
@@ -879,11 +943,13 @@ Please apply these guidelines throughout your analysis and recommendations."""
         logger.info(f"Executing Claude CLI async for task: {task_type}")
 
         try:
-            # Build command
-            claude_args = self._get_claude_args(prompt, task_type, model)
-            command = [self.claude_cli_path] + claude_args
+            # Build command; the prompt is streamed through stdin
+            command, stdin_prompt = self._get_claude_command(prompt, task_type, model)
 
-            logger.debug(f"Executing Claude CLI directly: {' '.join(command)}")
+            logger.debug(
+                f"Executing Claude CLI directly: {' '.join(command)} "
+                f"(prompt: {len(stdin_prompt)} chars via stdin)"
+            )
 
             # Use home directory to avoid loading project's MCP config that includes vibe-check
             # This prevents recursion by ensuring Claude CLI doesn't load the vibe-check MCP server
@@ -897,12 +963,12 @@ Please apply these guidelines throughout your analysis and recommendations."""
                 *command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                stdin=asyncio.subprocess.DEVNULL,
+                stdin=asyncio.subprocess.PIPE,
                 cwd=isolation_dir,
             )
 
             stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+                process.communicate(input=stdin_prompt.encode("utf-8")),
                 timeout=self.timeout_seconds
                 + 10,  # Allow extra time for process overhead
             )
@@ -1098,6 +1164,7 @@ from .circuit_breaker import (
 )
 from .retry_logic import get_global_circuit_breaker, claude_cli_with_retry
 from .health_monitor import ClaudeCliHealthMonitor
+from .single_flight import get_single_flight
 
 # Global health monitor instance
 _global_health_monitor: Optional[ClaudeCliHealthMonitor] = None
@@ -1147,9 +1214,6 @@ async def analyze_content_async_with_circuit_breaker(
         ClaudeCliError: When analysis fails after all retries
         CircuitBreakerOpenError: When circuit breaker is open
     """
-    circuit_breaker = get_global_circuit_breaker()
-    health_monitor = get_global_health_monitor()
-
     # Build prompt with context and content
     prompt_parts = []
 
@@ -1160,12 +1224,42 @@ async def analyze_content_async_with_circuit_breaker(
 
     prompt = "\n\n".join(prompt_parts)
 
+    # Identical concurrent requests share one Claude CLI run
+    flight_key = (
+        "claude_analysis",
+        hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        task_type,
+        model,
+        timeout_seconds,
+        max_retries,
+    )
+    result = await get_single_flight().do(
+        flight_key,
+        lambda: _analyze_prompt_with_circuit_breaker(
+            prompt, task_type, timeout_seconds, max_retries, model
+        ),
+    )
+    # Each caller gets its own copy of the shared result
+    return copy.deepcopy(result)
+
+
+async def _analyze_prompt_with_circuit_breaker(
+    prompt: str,
+    task_type: str,
+    timeout_seconds: int,
+    max_retries: int,
+    model: str,
+) -> ClaudeCliResult:
+    """Run one prompt through the circuit breaker, retries and health monitor"""
+    circuit_breaker = get_global_circuit_breaker()
+    health_monitor = get_global_health_monitor()
+
     async def _execute_analysis():
         """Inner function to execute the analysis."""
-        # Use enhanced executor for automatic context injection
-        from .enhanced_claude_integration import EnhancedClaudeCliExecutor
+        # Reuse a warm enhanced executor (automatic context injection)
+        from .executor_pool import get_claude_executor_pool
 
-        executor = EnhancedClaudeCliExecutor(timeout_seconds=timeout_seconds)
+        executor = get_claude_executor_pool().get_executor(timeout_seconds, model)
         return await executor.execute_async(
             prompt=prompt, task_type=task_type, model=model
         )
@@ -1335,8 +1429,8 @@ def analyze_content_sync(
 
     prompt = "\n\n".join(prompt_parts)
 
-    # Use enhanced executor for automatic context injection
-    from .enhanced_claude_integration import EnhancedClaudeCliExecutor
+    # Reuse a warm enhanced executor (automatic context injection)
+    from .executor_pool import get_claude_executor_pool
 
-    executor = EnhancedClaudeCliExecutor(timeout_seconds=timeout_seconds)
+    executor = get_claude_executor_pool().get_executor(timeout_seconds, model)
     return executor.execute_sync(prompt=prompt, task_type=task_type, model=model)
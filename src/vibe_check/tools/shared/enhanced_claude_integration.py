@@ -9,7 +9,8 @@ Features:
 - Library-specific documentation injection via Context 7
 - Pattern exception handling for project-specific overrides
 - Graceful degradation when context loading fails
-- Caching for performance optimization
+- Caching for performance optimization (context files are re-read only when
+  their mtime changes)
 """
 
 import json
@@ -17,9 +18,13 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from .claude_integration import ClaudeCliExecutor
+from .claude_integration import (
+    ClaudeCliExecutor,
+    file_signature,
+    read_text_cached,
+)
 from vibe_check.config.vibe_check_config import VibeCheckConfigLoader, VibeCheckConfig
 from vibe_check.tools import contextual_documentation
 from vibe_check.tools.contextual_documentation import AnalysisContext
@@ -50,6 +55,9 @@ class EnhancedClaudeCliExecutor(ClaudeCliExecutor):
         self._context_cache: Optional[AnalysisContext] = None
         self._context_cache_time: float = 0
         self._context_cache_ttl: int = 300  # 5 minutes default
+        self._config_cache: Optional[
+            Tuple[Optional[Tuple[int, int]], Optional[VibeCheckConfig]]
+        ] = None
 
     def _load_vibe_check_config(self) -> Optional[VibeCheckConfig]:
         """
@@ -58,6 +66,16 @@ class EnhancedClaudeCliExecutor(ClaudeCliExecutor):
         Returns:
             VibeCheckConfig object or None if not available/enabled
         """
+        # Reuse the parsed config while .vibe-check/config.json is unchanged
+        signature = file_signature(str(self.config_loader.config_file))
+        if self._config_cache and self._config_cache[0] == signature:
+            return self._config_cache[1]
+
+        config = self._read_vibe_check_config()
+        self._config_cache = (signature, config)
+        return config
+
+    def _read_vibe_check_config(self) -> Optional[VibeCheckConfig]:
         try:
             config = self.config_loader.load_config()
             if config.context_loading and config.context_loading.enabled:
@@ -79,15 +97,14 @@ class EnhancedClaudeCliExecutor(ClaudeCliExecutor):
         """
         context_file_path = self.project_root / ".vibe-check" / "project-context.md"
 
-        if not context_file_path.exists():
-            logger.debug(f"Project context file not found: {context_file_path}")
-            return None
-
         try:
-            with open(context_file_path, "r", encoding="utf-8") as f:
-                content = f.read().strip()
-                logger.debug(f"Loaded project context from {context_file_path}")
-                return content
+            content = read_text_cached(str(context_file_path))
+            if content is None:
+                logger.debug(f"Project context file not found: {context_file_path}")
+                return None
+
+            logger.debug(f"Loaded project context from {context_file_path}")
+            return content.strip()
         except Exception as e:
             logger.warning(f"Error reading project context file: {e}")
             return None
@@ -115,10 +132,15 @@ class EnhancedClaudeCliExecutor(ClaudeCliExecutor):
         pattern_exceptions_path = (
             self.project_root / ".vibe-check" / "pattern-exceptions.json"
         )
-        if pattern_exceptions_path.exists():
+        try:
+            exceptions_text = read_text_cached(str(pattern_exceptions_path))
+        except Exception as e:
+            logger.warning(f"Error loading pattern exceptions: {e}")
+            exceptions_text = None
+
+        if exceptions_text is not None:
             try:
-                with open(pattern_exceptions_path, "r", encoding="utf-8") as f:
-                    exceptions = json.load(f)
+                exceptions = json.loads(exceptions_text)
 
                 if exceptions.get("approved_patterns") or exceptions.get(
                     "temporary_exceptions"
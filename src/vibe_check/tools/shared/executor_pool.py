@@ -0,0 +1,151 @@
+"""
+Warm Claude CLI Executor Pool
+
+Long-lived EnhancedClaudeCliExecutor instances shared by all Claude CLI
+analyses, so per-call setup happens once instead of on every attempt:
+
+- Claude CLI path discovery (~/.claude/local/claude probing, PATH lookup) runs
+  when an executor is created and again only if CLAUDE_CLI_NAME or PATH change
+  or the resolved executable disappears.
+- CLAUDE.md, project context files and the assembled system prompts are cached
+  by the executors themselves and invalidated by file mtime.
+
+Executors are keyed by (timeout, model, project root). `claude -p` is a
+one-shot process with no session to keep alive, so warming means resolving the
+CLI and preloading prompt material via ``warm()`` rather than pre-spawning.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .claude_integration import ClaudeCliExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_EXECUTORS = 16
+
+PoolKey = Tuple[int, str, str]
+CliEnvironment = Tuple[Optional[str], Optional[str]]
+PoolEntry = Tuple[ClaudeCliExecutor, CliEnvironment]
+
+
+def _cli_environment() -> CliEnvironment:
+    """Environment that determines which Claude CLI executable is found"""
+    return (os.environ.get("CLAUDE_CLI_NAME"), os.environ.get("PATH"))
+
+
+def _default_executor_factory(timeout_seconds: int) -> ClaudeCliExecutor:
+    from .enhanced_claude_integration import EnhancedClaudeCliExecutor
+
+    return EnhancedClaudeCliExecutor(timeout_seconds=timeout_seconds)
+
+
+class ClaudeExecutorPool:
+    """Pool of reusable Claude CLI executors keyed by (timeout, model)"""
+
+    def __init__(
+        self,
+        executor_factory: Optional[Callable[[int], ClaudeCliExecutor]] = None,
+        max_executors: int = DEFAULT_MAX_EXECUTORS,
+    ):
+        self._executor_factory = executor_factory or _default_executor_factory
+        self.max_executors = max(1, max_executors)
+        self._executors: "OrderedDict[PoolKey, PoolEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.cli_refreshes = 0
+        self.evictions = 0
+
+    def get_executor(
+        self, timeout_seconds: int = 60, model: str = "sonnet"
+    ) -> ClaudeCliExecutor:
+        """Get a warm executor for the timeout and model, creating it if needed"""
+        key = (timeout_seconds, model, os.getcwd())
+        cli_environment = _cli_environment()
+
+        with self._lock:
+            entry = self._executors.get(key)
+            if entry is not None:
+                executor, environment = entry
+                self._executors.move_to_end(key)
+                self.hits += 1
+                if not self._cli_path_is_current(executor, environment):
+                    self._refresh_cli_path(key, executor, cli_environment)
+                return executor
+
+            self.misses += 1
+            executor = self._executor_factory(timeout_seconds)
+            self._executors[key] = (executor, cli_environment)
+            while len(self._executors) > self.max_executors:
+                self._executors.popitem(last=False)
+                self.evictions += 1
+            logger.debug(
+                f"Created pooled Claude CLI executor (timeout={key[0]}s, model={key[1]})"
+            )
+            return executor
+
+    def warm(
+        self,
+        timeout_seconds: int = 60,
+        model: str = "sonnet",
+        task_types: Iterable[str] = (),
+    ) -> ClaudeCliExecutor:
+        """Create the executor ahead of time and preload system prompts"""
+        executor = self.get_executor(timeout_seconds, model)
+        for task_type in task_types:
+            executor._get_system_prompt(task_type)
+        return executor
+
+    @staticmethod
+    def _cli_path_is_current(
+        executor: ClaudeCliExecutor, environment: CliEnvironment
+    ) -> bool:
+        if environment != _cli_environment():
+            return False
+        path = executor.claude_cli_path
+        return not os.path.isabs(path) or os.path.exists(path)
+
+    def _refresh_cli_path(
+        self, key: PoolKey, executor: ClaudeCliExecutor, environment: CliEnvironment
+    ) -> None:
+        self.cli_refreshes += 1
+        previous = executor.claude_cli_path
+        executor.claude_cli_path = executor._find_claude_cli()
+        self._executors[key] = (executor, environment)
+        logger.info(
+            f"Re-resolved Claude CLI path: {previous} -> {executor.claude_cli_path}"
+        )
+
+    def clear(self) -> None:
+        """Drop all pooled executors"""
+        with self._lock:
+            self._executors.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size and reuse counters for telemetry"""
+        with self._lock:
+            return {
+                "executors": len(self._executors),
+                "max_executors": self.max_executors,
+                "hits": self.hits,
+                "misses": self.misses,
+                "cli_refreshes": self.cli_refreshes,
+                "evictions": self.evictions,
+            }
+
+
+# Global pool shared by all Claude CLI analyses in this process
+_claude_executor_pool: Optional[ClaudeExecutorPool] = None
+
+
+def get_claude_executor_pool() -> ClaudeExecutorPool:
+    """Get or create the process-wide Claude CLI executor pool"""
+    global _claude_executor_pool
+    if _claude_executor_pool is None:
+        _claude_executor_pool = ClaudeExecutorPool()
+    return _claude_executor_pool
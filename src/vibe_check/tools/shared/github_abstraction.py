@@ -12,6 +12,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 
+from .pr_file_stream import PRFileStream
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +50,9 @@ class GitHubPullRequest:
     diff_url: str
     created_at: str
     updated_at: str
+    additions: int = 0
+    deletions: int = 0
+    changed_files: int = 0
 
 
 @dataclass
@@ -145,7 +150,8 @@ class GitHubOperations(ABC):
             pr_number: PR number to get files for
 
         Returns:
-            GitHubOperationResult with list of file names or error
+            GitHubOperationResult with a list of file dicts (filename, status,
+            additions, deletions, changes, patch) or error
         """
         pass
 
@@ -167,9 +173,10 @@ class PyGitHubImplementation(GitHubOperations):
         self.implementation_name = "pygithub"
         # Import here to avoid requiring PyGithub if not used
         try:
-            from .github_helpers import get_github_client, GITHUB_AVAILABLE
+            from .github_helpers import GITHUB_AVAILABLE
+            from .github_client_manager import get_github_client_manager
 
-            self.get_client = get_github_client
+            self.get_client_manager = get_github_client_manager
             self.available = GITHUB_AVAILABLE
         except ImportError:
             self.available = False
@@ -189,16 +196,16 @@ class PyGitHubImplementation(GitHubOperations):
         start_time = time.time()
 
         try:
-            client = self.get_client()
-            if not client:
+            manager = self.get_client_manager()
+            if not manager.get_client():
                 return GitHubOperationResult(
                     success=False,
                     error="GitHub authentication failed",
                     implementation=self.implementation_name,
                 )
 
-            repo = client.get_repo(repository)
-            issue = repo.get_issue(issue_number)
+            # Cached repo object; repeat fetches are conditional (304 if unchanged)
+            issue = manager.get_issue(repository, issue_number)
 
             github_issue = GitHubIssue(
                 number=issue.number,
@@ -244,16 +251,16 @@ class PyGitHubImplementation(GitHubOperations):
         start_time = time.time()
 
         try:
-            client = self.get_client()
-            if not client:
+            manager = self.get_client_manager()
+            if not manager.get_client():
                 return GitHubOperationResult(
                     success=False,
                     error="GitHub authentication failed",
                     implementation=self.implementation_name,
                 )
 
-            repo = client.get_repo(repository)
-            pr = repo.get_pull(pr_number)
+            # Cached repo object; repeat fetches are conditional (304 if unchanged)
+            pr = manager.get_pull(repository, pr_number)
 
             github_pr = GitHubPullRequest(
                 number=pr.number,
@@ -269,6 +276,9 @@ class PyGitHubImplementation(GitHubOperations):
                 diff_url=pr.diff_url,
                 created_at=pr.created_at.isoformat(),
                 updated_at=pr.updated_at.isoformat(),
+                additions=pr.additions,
+                deletions=pr.deletions,
+                changed_files=pr.changed_files,
             )
 
             return GitHubOperationResult(
@@ -343,10 +353,8 @@ class PyGitHubImplementation(GitHubOperations):
         start_time = time.time()
 
         try:
-            from .github_helpers import get_github_token
-
-            token = get_github_token()
-            if not token:
+            manager = self.get_client_manager()
+            if not manager.get_token():
                 return GitHubOperationResult(
                     success=False,
                     error="No GitHub token available for diff fetching",
@@ -355,19 +363,14 @@ class PyGitHubImplementation(GitHubOperations):
                 )
 
             # Use GitHub API v3 with proper diff Accept header (works for private repos)
-            import requests
-
+            # over the shared keep-alive session, revalidated by ETag
             api_url = f"https://api.github.com/repos/{repository}/pulls/{pr_number}"
-            headers = {
-                "Authorization": f"token {token}",
-                "Accept": "application/vnd.github.v3.diff",
-                "User-Agent": "vibe-check-mcp",
-            }
-
-            diff_response = requests.get(api_url, headers=headers, timeout=30)
+            status_code, response_text = manager.fetch_text(
+                api_url, accept="application/vnd.github.v3.diff", timeout=30
+            )
 
-            if diff_response.status_code == 200:
-                diff_content = diff_response.text
+            if status_code == 200:
+                diff_content = response_text
 
                 return GitHubOperationResult(
                     success=True,
@@ -375,14 +378,14 @@ class PyGitHubImplementation(GitHubOperations):
                     implementation=self.implementation_name,
                     execution_time=time.time() - start_time,
                 )
-            elif diff_response.status_code == 404:
+            elif status_code == 404:
                 return GitHubOperationResult(
                     success=False,
                     error=f"PR #{pr_number} not found in {repository}. Check PR number and repository access.",
                     implementation=self.implementation_name,
                     execution_time=time.time() - start_time,
                 )
-            elif diff_response.status_code == 401:
+            elif status_code == 401:
                 return GitHubOperationResult(
                     success=False,
                     error="GitHub authentication failed. Check GITHUB_TOKEN permissions.",
@@ -392,7 +395,7 @@ class PyGitHubImplementation(GitHubOperations):
             else:
                 return GitHubOperationResult(
                     success=False,
-                    error=f"GitHub API error: HTTP {diff_response.status_code} - {diff_response.text[:200]}",
+                    error=f"GitHub API error: HTTP {status_code} - {response_text[:200]}",
                     implementation=self.implementation_name,
                     execution_time=time.time() - start_time,
                 )
@@ -408,12 +411,49 @@ class PyGitHubImplementation(GitHubOperations):
     def get_pull_request_files(
         self, repository: str, pr_number: int
     ) -> GitHubOperationResult:
-        """Get PR files using PyGithub."""
-        return GitHubOperationResult(
-            success=False,
-            error="Not implemented yet",
-            implementation=self.implementation_name,
-        )
+        """Get PR files with their patches using PyGithub."""
+        if not self.available:
+            return GitHubOperationResult(
+                success=False,
+                error="PyGithub not available",
+                implementation=self.implementation_name,
+            )
+
+        import time
+
+        start_time = time.time()
+
+        try:
+            manager = self.get_client_manager()
+            if not manager.get_client():
+                return GitHubOperationResult(
+                    success=False,
+                    error="GitHub authentication failed",
+                    implementation=self.implementation_name,
+                )
+
+            # Cached repo object; repeat fetches are conditional (304 if unchanged)
+            pr = manager.get_pull(repository, pr_number)
+
+            # Fetch each page of the paginated file list exactly once
+            files = list(
+                PRFileStream.from_pull_request(pr, keep_patches=True).iter_dicts()
+            )
+
+            return GitHubOperationResult(
+                success=True,
+                data=files,
+                implementation=self.implementation_name,
+                execution_time=time.time() - start_time,
+            )
+
+        except Exception as e:
+            return GitHubOperationResult(
+                success=False,
+                error=f"Error fetching PR files: {str(e)}",
+                implementation=self.implementation_name,
+                execution_time=time.time() - start_time,
+            )
 
     def check_authentication(self) -> GitHubOperationResult:
         """Check auth using PyGithub."""
@@ -505,7 +545,8 @@ def create_github_operations(implementation: str = "pygithub") -> GitHubOperatio
     Factory function to create GitHub operations implementation.
 
     Args:
-        implementation: Either "pygithub" or "mcp"
+        implementation: "pygithub", "mcp" or "aiohttp" (native async client
+            behind a sync adapter)
 
     Returns:
         GitHubOperations implementation instance
@@ -514,6 +555,13 @@ def create_github_operations(implementation: str = "pygithub") -> GitHubOperatio
         return PyGitHubImplementation()
     elif implementation == "mcp":
         return GitHubMCPImplementation()
+    elif implementation == "aiohttp":
+        from .async_github import (
+            AiohttpGitHubImplementation,
+            SyncGitHubOperationsAdapter,
+        )
+
+        return SyncGitHubOperationsAdapter(AiohttpGitHubImplementation())
     else:
         raise ValueError(f"Unknown implementation: {implementation}")
 
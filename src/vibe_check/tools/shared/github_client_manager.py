@@ -0,0 +1,322 @@
+"""
+Pooled GitHub Client Manager
+
+One authenticated PyGithub client per process instead of one per request:
+
+- The token is resolved once (environment variables, then ``gh auth token``)
+  and only re-resolved when the token environment variables change or GitHub
+  answers 401, so the ``gh`` CLI is not forked on every call.
+- The client keeps a keep-alive HTTP connection pool, and a separate
+  ``requests`` session serves raw API calls such as PR diffs.
+- Repository objects are kept for a short TTL, so ``get_repo`` is not
+  re-fetched before every issue or PR lookup.
+- Issues, pull requests and raw responses are revalidated with conditional
+  requests (ETag / If-None-Match). An unchanged resource costs a 304, which
+  GitHub does not count against the rate limit.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from .github_helpers import GITHUB_AVAILABLE, get_github_token
+
+if TYPE_CHECKING:
+    from github import Github
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_REPO_TTL_SECONDS = 300
+DEFAULT_MAX_CACHED_OBJECTS = 256
+
+T = TypeVar("T")
+TokenEnvironment = Tuple[Optional[str], Optional[str]]
+
+
+def _token_environment() -> TokenEnvironment:
+    """Environment variables that determine which token is used"""
+    return (
+        os.environ.get("GITHUB_PERSONAL_ACCESS_TOKEN"),
+        os.environ.get("GITHUB_TOKEN"),
+    )
+
+
+def _default_client_factory(token: str, pool_size: int) -> "Github":
+    from github import Auth, Github
+
+    return Github(auth=Auth.Token(token), pool_size=pool_size)
+
+
+def is_auth_error(error: Exception) -> bool:
+    """True if a GitHub API error means the token was rejected"""
+    return getattr(error, "status", None) == 401
+
+
+class GitHubClientManager:
+    """Process-wide authenticated GitHub client with repo and ETag caching"""
+
+    def __init__(
+        self,
+        client_factory: Optional[Callable[[str, int], Any]] = None,
+        token_provider: Optional[Callable[[], Optional[str]]] = None,
+        session_factory: Optional[Callable[[], Any]] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        repo_ttl_seconds: float = DEFAULT_REPO_TTL_SECONDS,
+        max_cached_objects: int = DEFAULT_MAX_CACHED_OBJECTS,
+    ):
+        self._client_factory = client_factory or _default_client_factory
+        self._token_provider = token_provider or get_github_token
+        self._session_factory = session_factory
+        self.pool_size = pool_size
+        self.repo_ttl_seconds = repo_ttl_seconds
+        self.max_cached_objects = max(1, max_cached_objects)
+
+        self._lock = threading.RLock()
+        self._token: Optional[str] = None
+        self._token_environment: Optional[TokenEnvironment] = None
+        self._client: Optional[Any] = None
+        self._session: Optional[Any] = None
+        # repository -> (repo object, fetched at)
+        self._repos: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        # (kind, repository, number) -> PyGithub object holding its ETag
+        self._objects: "OrderedDict[Tuple[str, str, int], Any]" = OrderedDict()
+        # (url, accept) -> (ETag, body)
+        self._responses: "OrderedDict[Tuple[str, str], Tuple[str, str]]" = OrderedDict()
+
+        self.token_resolutions = 0
+        self.token_refreshes = 0
+        self.repo_hits = 0
+        self.repo_misses = 0
+        self.not_modified = 0
+        self.full_fetches = 0
+
+    def get_token(self) -> Optional[str]:
+        """Get the cached GitHub token, resolving it on first use"""
+        with self._lock:
+            environment = _token_environment()
+            if self._token is None or self._token_environment != environment:
+                self._set_token(self._token_provider(), environment)
+            return self._token
+
+    def invalidate_token(self) -> None:
+        """Forget the token and everything fetched with it (e.g. after a 401)"""
+        with self._lock:
+            self.token_refreshes += 1
+            self._set_token(None, None)
+
+    def _set_token(
+        self, token: Optional[str], environment: Optional[TokenEnvironment]
+    ) -> None:
+        if token is not None:
+            self.token_resolutions += 1
+        if token != self._token:
+            self._client = None
+            self._repos.clear()
+            self._objects.clear()
+            self._responses.clear()
+        self._token = token
+        self._token_environment = environment
+
+    def get_client(self) -> Optional[Any]:
+        """Get the shared authenticated client, or None without a token"""
+        if not GITHUB_AVAILABLE and self._client_factory is _default_client_factory:
+            logger.error("GitHub library not available")
+            return None
+
+        with self._lock:
+            token = self.get_token()
+            if not token:
+                logger.error("No GitHub token available")
+                return None
+            if self._client is None:
+                self._client = self._client_factory(token, self.pool_size)
+                logger.debug(
+                    f"Created pooled GitHub client (pool_size={self.pool_size})"
+                )
+            return self._client
+
+    def call_with_auth_retry(self, operation: Callable[[Any], T]) -> T:
+        """
+        Run operation(client), re-resolving the token once if GitHub returns 401.
+
+        Raises:
+            RuntimeError: If no authenticated client is available
+        """
+        client = self.get_client()
+        if client is None:
+            raise RuntimeError("GitHub authentication failed")
+        try:
+            return operation(client)
+        except Exception as e:
+            if not is_auth_error(e):
+                raise
+            logger.info("GitHub rejected the cached token, re-resolving")
+            self.invalidate_token()
+            client = self.get_client()
+            if client is None:
+                raise
+            return operation(client)
+
+    def get_repo(self, repository: str) -> Any:
+        """Get a repository object, reusing it for the repo TTL"""
+        with self._lock:
+            cached = self._repos.get(repository)
+            if cached and time.monotonic() - cached[1] < self.repo_ttl_seconds:
+                self.repo_hits += 1
+                self._repos.move_to_end(repository)
+                return cached[0]
+
+        repo = self.call_with_auth_retry(lambda client: client.get_repo(repository))
+        with self._lock:
+            self.repo_misses += 1
+            self._repos[repository] = (repo, time.monotonic())
+            self._repos.move_to_end(repository)
+            while len(self._repos) > self.max_cached_objects:
+                self._repos.popitem(last=False)
+        return repo
+
+    def get_issue(self, repository: str, issue_number: int) -> Any:
+        """Get an issue, revalidating a previous fetch with a conditional request"""
+        return self._get_object(
+            ("issue", repository, issue_number),
+            lambda: self.get_repo(repository).get_issue(issue_number),
+        )
+
+    def get_pull(self, repository: str, pr_number: int) -> Any:
+        """Get a pull request, revalidating a previous fetch with a conditional request"""
+        return self._get_object(
+            ("pull", repository, pr_number),
+            lambda: self.get_repo(repository).get_pull(pr_number),
+        )
+
+    def _get_object(self, key: Tuple[str, str, int], fetch: Callable[[], T]) -> T:
+        with self._lock:
+            cached = self._objects.get(key)
+            if cached is not None:
+                self._objects.move_to_end(key)
+
+        if cached is not None:
+            # PyGithub sends If-None-Match/If-Modified-Since; False means 304
+            changed = self.call_with_auth_retry(lambda client: cached.update())
+            with self._lock:
+                if changed:
+                    self.full_fetches += 1
+                else:
+                    self.not_modified += 1
+            return cached
+
+        obj = fetch()
+        with self._lock:
+            self.full_fetches += 1
+            self._objects[key] = obj
+            while len(self._objects) > self.max_cached_objects:
+                self._objects.popitem(last=False)
+        return obj
+
+    def _get_session(self) -> Any:
+        with self._lock:
+            if self._session is None:
+                if self._session_factory is not None:
+                    self._session = self._session_factory()
+                else:
+                    import requests
+
+                    self._session = requests.Session()
+            return self._session
+
+    def fetch_text(self, url: str, accept: str, timeout: float = 30) -> Tuple[int, str]:
+        """
+        GET a raw API resource over the shared session with ETag revalidation.
+
+        A 304 answer is returned as (200, cached body). A 401 re-resolves the
+        token and retries once.
+
+        Returns:
+            Tuple of (HTTP status code, response body)
+        """
+        for attempt in range(2):
+            token = self.get_token()
+            if not token:
+                return 401, "No GitHub token available"
+
+            cache_key = (url, accept)
+            with self._lock:
+                cached = self._responses.get(cache_key)
+
+            headers = {
+                "Authorization": f"token {token}",
+                "Accept": accept,
+                "User-Agent": "vibe-check-mcp",
+            }
+            if cached:
+                headers["If-None-Match"] = cached[0]
+
+            response = self._get_session().get(url, headers=headers, timeout=timeout)
+
+            if response.status_code == 304 and cached:
+                with self._lock:
+                    self.not_modified += 1
+                    self._responses.move_to_end(cache_key)
+                return 200, cached[1]
+
+            if response.status_code == 401 and attempt == 0:
+                logger.info("GitHub rejected the cached token, re-resolving")
+                self.invalidate_token()
+                continue
+
+            if response.status_code == 200:
+                with self._lock:
+                    self.full_fetches += 1
+                    etag = response.headers.get("ETag")
+                    if etag:
+                        self._responses[cache_key] = (etag, response.text)
+                        while len(self._responses) > self.max_cached_objects:
+                            self._responses.popitem(last=False)
+
+            return response.status_code, response.text
+
+        return response.status_code, response.text
+
+    def clear(self) -> None:
+        """Drop the token, client, session and all cached objects"""
+        with self._lock:
+            self._set_token(None, None)
+            self._client = None
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self.token_resolutions = self.token_refreshes = 0
+            self.repo_hits = self.repo_misses = 0
+            self.not_modified = self.full_fetches = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Client reuse and conditional request counters for telemetry"""
+        with self._lock:
+            return {
+                "authenticated": self._token is not None,
+                "pool_size": self.pool_size,
+                "cached_repos": len(self._repos),
+                "cached_objects": len(self._objects) + len(self._responses),
+                "token_resolutions": self.token_resolutions,
+                "token_refreshes": self.token_refreshes,
+                "repo_hits": self.repo_hits,
+                "repo_misses": self.repo_misses,
+                "not_modified": self.not_modified,
+                "full_fetches": self.full_fetches,
+            }
+
+
+# Global manager shared by all GitHub operations in this process
+_github_client_manager: Optional[GitHubClientManager] = None
+
+
+def get_github_client_manager() -> GitHubClientManager:
+    """Get or create the process-wide GitHub client manager"""
+    global _github_client_manager
+    if _github_client_manager is None:
+        _github_client_manager = GitHubClientManager()
+    return _github_client_manager
@@ -5,20 +5,20 @@ Consolidated GitHub integration utilities shared across vibe check tools.
 Provides authentication, API access, and comment posting functionality.
 """
 
+import importlib.util
 import logging
 import os
 import subprocess
-from typing import Optional, Any
+from typing import TYPE_CHECKING, Optional, Any
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from github import Github
 
-# GitHub integration
-try:
-    from github import Github, GithubException
+logger = logging.getLogger(__name__)
 
-    GITHUB_AVAILABLE = True
-except ImportError:
-    GITHUB_AVAILABLE = False
+# GitHub integration. PyGithub is only looked up here; it is imported when
+# a client is first built so that server startup does not pay for it.
+GITHUB_AVAILABLE = importlib.util.find_spec("github") is not None
 
 
 def get_github_token() -> Optional[str]:
@@ -71,14 +71,15 @@ def post_github_comment(
         logger.error("GitHub library not available for posting comments")
         return False, None
 
-    token = get_github_token()
-    if not token:
+    from .github_client_manager import get_github_client_manager
+
+    manager = get_github_client_manager()
+    if not manager.get_token():
         logger.error("No GitHub token available for posting comments")
         return False, None
 
     try:
-        github_client = Github(token)
-        repo = github_client.get_repo(repository)
+        repo = manager.get_repo(repository)
         issue = repo.get_issue(issue_number)
         comment = issue.create_comment(comment_body)
 
@@ -94,9 +95,12 @@ def post_github_comment(
         return False, None
 
 
-def get_github_client() -> Optional[Github]:
+def get_github_client() -> Optional["Github"]:
     """
-    Get authenticated GitHub client.
+    Get the shared authenticated GitHub client.
+
+    The client, its connection pool and the token are reused across calls
+    (see github_client_manager.py).
 
     Returns:
         Authenticated Github client if available, None otherwise
@@ -105,13 +109,10 @@ def get_github_client() -> Optional[Github]:
         logger.error("GitHub library not available")
         return None
 
-    token = get_github_token()
-    if not token:
-        logger.error("No GitHub token available")
-        return None
-
     try:
-        return Github(token)
+        from .github_client_manager import get_github_client_manager
+
+        return get_github_client_manager().get_client()
     except Exception as e:
         logger.error(f"Failed to create GitHub client: {e}")
         return None
@@ -131,8 +132,10 @@ def check_github_authentication() -> dict:
             "solution": "Install PyGithub: pip install PyGithub",
         }
 
-    token = get_github_token()
-    if not token:
+    from .github_client_manager import get_github_client_manager
+
+    manager = get_github_client_manager()
+    if not manager.get_token():
         return {
             "authenticated": False,
             "error": "No GitHub token available",
@@ -140,11 +143,10 @@ def check_github_authentication() -> dict:
         }
 
     try:
-        client = Github(token)
-        user = client.get_user()
+        user = manager.call_with_auth_retry(lambda client: client.get_user().login)
         return {
             "authenticated": True,
-            "username": user.login,
+            "username": user,
             "token_source": (
                 "GITHUB_PERSONAL_ACCESS_TOKEN"
                 if os.environ.get("GITHUB_PERSONAL_ACCESS_TOKEN")
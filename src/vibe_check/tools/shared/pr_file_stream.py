@@ -0,0 +1,143 @@
+"""
+PR File Stream
+
+Single-pass view over the files of a pull request. Each page of the PyGithub
+``PaginatedList`` returned by ``pr.get_files()`` is requested exactly once and
+converted into a lightweight PRFileRecord as it arrives, so consumers can start
+work before the last page is fetched. Later passes (counting, a second
+analyzer) replay the cached records instead of walking the PaginatedList again.
+
+Used by analyze_pr_nollm, the PyGithub and aiohttp GitHub operations (and so
+the async analysis worker), FileTypeAnalyzer and FileChunker.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+@dataclass
+class PRFileRecord:
+    """Changed file of a pull request without the full API object"""
+
+    filename: str
+    status: str
+    additions: int
+    deletions: int
+    changes: int
+    patch_size: int
+    patch: Optional[str] = None
+
+    @classmethod
+    def from_github_file(cls, file: Any, keep_patch: bool = False) -> "PRFileRecord":
+        """Build a record from a PyGithub File object"""
+        patch = file.patch or ""
+        return cls(
+            filename=file.filename,
+            status=file.status,
+            additions=file.additions,
+            deletions=file.deletions,
+            changes=file.changes,
+            patch_size=len(patch),
+            patch=patch if keep_patch else None,
+        )
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any], keep_patch: bool = False) -> "PRFileRecord":
+        """Build a record from a REST API file payload"""
+        patch = data.get("patch") or ""
+        return cls(
+            filename=data["filename"],
+            status=data["status"],
+            additions=data["additions"],
+            deletions=data["deletions"],
+            changes=data["changes"],
+            patch_size=len(patch),
+            patch=patch if keep_patch else None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        File dict as used by FileTypeAnalyzer, FileChunker and the worker.
+
+        Carries "patch" when the patch text was kept, "patch_size" otherwise.
+        """
+        data: Dict[str, Any] = {
+            "filename": self.filename,
+            "status": self.status,
+            "additions": self.additions,
+            "deletions": self.deletions,
+            "changes": self.changes,
+        }
+        if self.patch is not None:
+            data["patch"] = self.patch
+        else:
+            data["patch_size"] = self.patch_size
+        return data
+
+
+class PRFileStream:
+    """
+    Iterate PR files, fetching every page of the underlying list only once.
+
+    Iteration is lazy: records are yielded as pages arrive. Iterating again,
+    or calling ``len()``/``to_list()``, reuses what was already fetched.
+    """
+
+    def __init__(self, files: Iterable[Any], keep_patches: bool = False):
+        """
+        Args:
+            files: PyGithub PaginatedList of File objects (or any iterable)
+            keep_patches: Keep patch text on the records, not only its size
+        """
+        self._source: Optional[Iterator[Any]] = iter(files)
+        self.keep_patches = keep_patches
+        self._records: List[PRFileRecord] = []
+
+    @classmethod
+    def from_pull_request(cls, pr: Any, keep_patches: bool = False) -> "PRFileStream":
+        """Stream the files of a PyGithub PullRequest"""
+        return cls(pr.get_files(), keep_patches=keep_patches)
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the last page has been fetched"""
+        return self._source is None
+
+    def __iter__(self) -> Iterator[PRFileRecord]:
+        index = 0
+        while True:
+            if index < len(self._records):
+                yield self._records[index]
+                index += 1
+                continue
+            record = self._fetch_next()
+            if record is None:
+                return
+            index += 1
+            yield record
+
+    def _fetch_next(self) -> Optional[PRFileRecord]:
+        if self._source is None:
+            return None
+        try:
+            file = next(self._source)
+        except StopIteration:
+            self._source = None
+            return None
+        record = PRFileRecord.from_github_file(file, keep_patch=self.keep_patches)
+        self._records.append(record)
+        return record
+
+    def __len__(self) -> int:
+        return len(self.to_list())
+
+    def to_list(self) -> List[PRFileRecord]:
+        """All records, fetching any remaining pages"""
+        for _ in self:
+            pass
+        return list(self._records)
+
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Iterate records as file dicts"""
+        for record in self:
+            yield record.to_dict()
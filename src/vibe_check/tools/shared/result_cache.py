@@ -0,0 +1,167 @@
+"""
+Content-Addressed Analysis Result Cache
+
+Caches complete analysis results (text and issue vibe checks) keyed by a hash
+of everything that determines the output: the analyzed content, the detail
+level, the anti-pattern data version and the project context. Agents re-run
+the same checks constantly (retries, the same issue body each session), and a
+hit skips detection, educational content generation and context handling.
+
+Entries are evicted least-recently-used when either the entry count or the
+approximate byte budget is exceeded, and expire after a TTL. The whole cache
+is dropped as soon as ``anti_patterns.json`` changes on disk.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from vibe_check.core.compiled_patterns import get_compiled_pattern_set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 3600
+
+
+def _estimate_size(value: Any) -> int:
+    return len(json.dumps(value, default=str))
+
+
+class AnalysisResultCache:
+    """Thread-safe LRU cache with TTL and a byte budget"""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, Tuple[Any, float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._pattern_fingerprint: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash the given key components into a stable cache key"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def pattern_version(self) -> str:
+        """
+        Version string of the current pattern data, for use in cache keys.
+
+        Drops every cached result when the pattern file has changed since the
+        last call, so stale results never outlive a data update.
+        """
+        pattern_set = get_compiled_pattern_set()
+        with self._lock:
+            if self._pattern_fingerprint != pattern_set.fingerprint:
+                if self._pattern_fingerprint is not None and self._entries:
+                    logger.info("Pattern data changed, clearing analysis result cache")
+                    self.invalidations += 1
+                self._clear_locked()
+                self._pattern_fingerprint = pattern_set.fingerprint
+        return f"{pattern_set.data_version}:{pattern_set.fingerprint}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on miss or expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, stored_at, size = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a copy of value, evicting least recently used entries as needed"""
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            logger.debug(f"Result of {size} bytes exceeds cache budget, not cached")
+            return
+
+        value = copy.deepcopy(value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+
+            self._entries[key] = (value, time.monotonic(), size)
+            self._bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached results and reset statistics"""
+        with self._lock:
+            self._clear_locked()
+            self._pattern_fingerprint = None
+            self.hits = self.misses = 0
+            self.evictions = self.expirations = self.invalidations = 0
+
+    def _clear_locked(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+            return {
+                "size": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "hit_rate": f"{hit_rate:.1f}%",
+            }
+
+
+# Global result cache instance
+_result_cache: Optional[AnalysisResultCache] = None
+
+
+def get_result_cache() -> AnalysisResultCache:
+    """Get or create the process-wide analysis result cache"""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = AnalysisResultCache()
+    return _result_cache
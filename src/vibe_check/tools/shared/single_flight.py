@@ -0,0 +1,107 @@
+"""
+Single-Flight Request Coalescing
+
+When several callers ask for the same expensive result at the same time
+(parallel tool calls, several agents asking the mentor the same question),
+only the first caller runs the work; the others await the same in-flight
+task and receive its result or exception. Once the task finishes its key is
+released, so later calls run again (or hit whatever cache the caller keeps).
+
+Used for mentor MCP sampling, Context7 documentation fetches and Claude CLI
+analysis.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent identical async calls onto one in-flight task"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func() once per key among concurrent callers.
+
+        The work runs in its own task, so a caller that is cancelled does not
+        cancel it for the callers still waiting.
+
+        Args:
+            key: Identity of the request; callers with equal keys share a call
+            func: Zero-argument coroutine function doing the work
+
+        Returns:
+            The result of the shared call
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._calls.get(key)
+            # Tasks cannot be awaited from another event loop
+            if task is None or task.done() or task.get_loop() is not loop:
+                task = loop.create_task(self._run(key, func))
+                task.add_done_callback(_consume_exception)
+                self._calls[key] = task
+                self.executions += 1
+            else:
+                self.coalesced += 1
+                logger.debug(f"Joining in-flight call for {key!r}")
+        return await asyncio.shield(task)
+
+    async def _run(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await func()
+        finally:
+            with self._lock:
+                if self._calls.get(key) is asyncio.current_task():
+                    del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        with self._lock:
+            return sum(1 for task in self._calls.values() if not task.done())
+
+    def clear(self) -> None:
+        """Forget in-flight calls and reset statistics"""
+        with self._lock:
+            self._calls.clear()
+            self.executions = self.coalesced = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics"""
+        total = self.executions + self.coalesced
+        coalesced_rate = (self.coalesced / total * 100) if total > 0 else 0
+        return {
+            "in_flight": self.in_flight(),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesced_rate": f"{coalesced_rate:.1f}%",
+        }
+
+
+def _consume_exception(task: "asyncio.Task[Any]") -> None:
+    # Callers that gave up must not leave "exception was never retrieved" noise
+    if not task.cancelled():
+        task.exception()
+
+
+# Global single-flight instance
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get or create the process-wide single-flight group"""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
@@ -5,6 +5,7 @@ Provides specific, technical advice based on query analysis instead of generic r
 Extracts technologies, frameworks, and specific problems to give targeted guidance.
 """
 
+import asyncio
 import re
 import functools
 import logging
@@ -29,6 +30,7 @@ from vibe_check.strategies.response_strategies import (
 )
 from ..mentor.response_relevance import ResponseRelevanceValidator, RelevanceResult
 from .semantic_engine import SemanticEngine, QueryIntent
+from .shared.single_flight import get_single_flight
 
 # Import MCP sampling components
 try:
@@ -40,6 +42,7 @@ try:
         ResponseCache,
     )
     from ..mentor.hybrid_router import HybridRouter, RouteDecision, RouteOptimizer
+    from ..mentor.response_store import get_mentor_response_store
 
     MCP_SAMPLING_AVAILABLE = True
 except ImportError:
@@ -990,7 +993,10 @@ class EnhancedVibeMentorEngine:
             self.hybrid_router = HybridRouter(
                 confidence_threshold=0.7, enable_caching=True, prefer_speed=False
             )
-            self.dynamic_cache = ResponseCache(max_size=100)
+            # Persisted so sampled responses survive stdio server restarts
+            self.dynamic_cache = ResponseCache(
+                max_size=100, store=get_mentor_response_store()
+            )
             self.route_optimizer = RouteOptimizer()
             logger.info("MCP sampling enabled for dynamic response generation")
         else:
@@ -1226,25 +1232,6 @@ class EnhancedVibeMentorEngine:
     ) -> Optional[Tuple[str, str, float]]:
         """Try to generate dynamic response via MCP sampling with security measures."""
 
-        # Check rate limiting
-        import time
-
-        current_time = time.time()
-
-        # Clean old calls (older than rate window)
-        self._last_mcp_calls = [
-            t for t in self._last_mcp_calls if current_time - t < self._rate_window
-        ]
-
-        # Check rate limit
-        if len(self._last_mcp_calls) >= self._rate_limit:
-            logger.warning(
-                f"Rate limit exceeded for MCP sampling ({self._rate_limit}/{self._rate_window}s)"
-            )
-            return None
-
-        self._last_mcp_calls.append(current_time)
-
         try:
             # Prepare context for routing decision
             context_dict = {
@@ -1286,95 +1273,145 @@ class EnhancedVibeMentorEngine:
                 if route_metrics.decision != RouteDecision.DYNAMIC:
                     return None
 
-            # Check cache first
+            # Check cache first; the persistent store may wait on other
+            # processes' writes, so keep it off the event loop
             if self.dynamic_cache:
-                cached = self.dynamic_cache.get(intent, topic, context_dict)
+                cached = await asyncio.to_thread(
+                    self.dynamic_cache.get, intent, topic, context_dict
+                )
                 if cached:
                     logger.debug("Using cached dynamic response")
                     return cached["content"], "insight", cached["confidence"]
 
-            # Build persona-specific prompt
-            system_prompt = self._build_persona_prompt(persona, intent, tech_context)
-            user_message = f"Query: {topic}"
+            # Concurrent identical requests await one in-flight sample, which
+            # also consumes the rate limit budget only once. The persona is part
+            # of the key because the system prompt is persona-specific, and the
+            # client session is because the sample runs through the leader's
+            # ctx: a follower must not fail when another client disconnects.
+            request_key = (
+                self.dynamic_cache.get_cache_key(intent, topic, context_dict)
+                if self.dynamic_cache
+                else f"{intent}|{topic}"
+            )
+            session_id = id(getattr(ctx, "session", ctx))
+            content = await get_single_flight().do(
+                ("mentor_sample", session_id, persona.id, request_key),
+                lambda: self._sample_dynamic_response(
+                    persona, topic, intent, tech_context, context_dict, ctx
+                ),
+            )
+            if content:
+                return content, "insight", 0.85
 
-            if tech_context.file_references:
-                user_message += (
-                    f"\n\nRelevant files: {', '.join(tech_context.file_references[:3])}"
+        except Exception as e:
+            logger.error(f"Dynamic generation failed: {e}")
+            if self.route_optimizer:
+                self.route_optimizer.record_outcome(
+                    query=topic,
+                    decision=RouteDecision.DYNAMIC,
+                    latency_ms=1000,
+                    success=False,
                 )
 
-            # Request completion via MCP with security measures
-            # Scan and redact secrets before sending to LLM
-            from ..mentor.mcp_sampling import SecretsScanner
+        return None
+
+    async def _sample_dynamic_response(
+        self,
+        persona: PersonaData,
+        topic: str,
+        intent: str,
+        tech_context: TechnicalContext,
+        context_dict: Dict[str, Any],
+        ctx: Any,
+    ) -> Optional[str]:
+        """Request one MCP sample, rate limited, and cache the response text."""
 
-            scanner = SecretsScanner()
-            safe_message, secrets_found_msg = scanner.scan_and_redact(user_message)
-            safe_system_prompt, secrets_found_sys = scanner.scan_and_redact(
-                system_prompt
+        # Check rate limiting
+        import time
+
+        current_time = time.time()
+
+        # Clean old calls (older than rate window)
+        self._last_mcp_calls = [
+            t for t in self._last_mcp_calls if current_time - t < self._rate_window
+        ]
+
+        # Check rate limit
+        if len(self._last_mcp_calls) >= self._rate_limit:
+            logger.warning(
+                f"Rate limit exceeded for MCP sampling ({self._rate_limit}/{self._rate_window}s)"
             )
+            return None
 
-            if secrets_found_msg or secrets_found_sys:
-                logger.warning(
-                    f"Redacted {len(secrets_found_msg) + len(secrets_found_sys)} potential secrets"
-                )
+        self._last_mcp_calls.append(current_time)
 
-            # Enforce maximum prompt length
-            MAX_PROMPT_LENGTH = 8000
-            if len(safe_message) + len(safe_system_prompt) > MAX_PROMPT_LENGTH:
-                logger.warning("Prompt too long, truncating")
-                safe_message = safe_message[
-                    : MAX_PROMPT_LENGTH - len(safe_system_prompt)
-                ]
+        # Build persona-specific prompt
+        system_prompt = self._build_persona_prompt(persona, intent, tech_context)
+        user_message = f"Query: {topic}"
 
-            # Request with timeout for safety
-            import asyncio
+        if tech_context.file_references:
+            user_message += (
+                f"\n\nRelevant files: {', '.join(tech_context.file_references[:3])}"
+            )
 
-            try:
-                response = await asyncio.wait_for(
-                    ctx.sample(
-                        messages=safe_message,
-                        system_prompt=safe_system_prompt,
-                        temperature=0.7,
-                        max_tokens=1000,
-                    ),
-                    timeout=30,  # 30 second timeout
-                )
-            except asyncio.TimeoutError:
-                logger.error("MCP sampling timed out after 30 seconds")
-                return None
-
-            if hasattr(response, "text") and response.text:
-                content = response.text
-
-                # Cache the response
-                if self.dynamic_cache:
-                    self.dynamic_cache.put(
-                        intent,
-                        topic,
-                        context_dict,
-                        {"content": content, "confidence": 0.85},
-                    )
+        # Request completion via MCP with security measures
+        # Scan and redact secrets before sending to LLM
+        from ..mentor.mcp_sampling import SecretsScanner
 
-                # Record success
-                if self.route_optimizer:
-                    self.route_optimizer.record_outcome(
-                        query=topic,
-                        decision=RouteDecision.DYNAMIC,
-                        latency_ms=1000,  # Placeholder
-                        success=True,
-                    )
+        scanner = SecretsScanner()
+        safe_message, secrets_found_msg = scanner.scan_and_redact(user_message)
+        safe_system_prompt, secrets_found_sys = scanner.scan_and_redact(system_prompt)
 
-                return content, "insight", 0.85
+        if secrets_found_msg or secrets_found_sys:
+            logger.warning(
+                f"Redacted {len(secrets_found_msg) + len(secrets_found_sys)} potential secrets"
+            )
 
-        except Exception as e:
-            logger.error(f"Dynamic generation failed: {e}")
+        # Enforce maximum prompt length
+        MAX_PROMPT_LENGTH = 8000
+        if len(safe_message) + len(safe_system_prompt) > MAX_PROMPT_LENGTH:
+            logger.warning("Prompt too long, truncating")
+            safe_message = safe_message[: MAX_PROMPT_LENGTH - len(safe_system_prompt)]
+
+        # Request with timeout for safety
+        try:
+            response = await asyncio.wait_for(
+                ctx.sample(
+                    messages=safe_message,
+                    system_prompt=safe_system_prompt,
+                    temperature=0.7,
+                    max_tokens=1000,
+                ),
+                timeout=30,  # 30 second timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error("MCP sampling timed out after 30 seconds")
+            return None
+
+        if hasattr(response, "text") and response.text:
+            content = response.text
+
+            # Cache the response
+            if self.dynamic_cache:
+                await asyncio.to_thread(
+                    self.dynamic_cache.put,
+                    intent,
+                    topic,
+                    context_dict,
+                    {"content": content, "confidence": 0.85},
+                )
+
+            # Record success
             if self.route_optimizer:
                 self.route_optimizer.record_outcome(
                     query=topic,
                     decision=RouteDecision.DYNAMIC,
-                    latency_ms=1000,
-                    success=False,
+                    latency_ms=1000,  # Placeholder
+                    success=True,
                 )
 
+            return content
+
         return None
 
     def _generate_context_aware_fallback(
@@ -38,6 +38,14 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 os.environ.setdefault("VIBE_CHECK_TEST_MODE", "1")
+# Keep the persistent stores in memory so tests never touch ~/.vibe-check
+for _store_env_var in (
+    "VIBE_CHECK_JOB_STORE",
+    "VIBE_CHECK_CHUNK_CACHE",
+    "VIBE_CHECK_MENTOR_CACHE",
+    "VIBE_CHECK_PROJECT_INDEX",
+):
+    os.environ.setdefault(_store_env_var, ":memory:")
 os.environ.setdefault("GITHUB_TOKEN", "test_token_placeholder")
 os.environ.setdefault("CLAUDE_API_KEY", "test_api_key_placeholder")
 
@@ -464,6 +472,36 @@ def setup_test_logging():
     logging.getLogger("anthropic").setLevel(logging.WARNING)
 
 
+# Process-wide singletons reset around every test, as (module, getter)
+SINGLETON_GETTERS = [
+    ("vibe_check.tools.shared.result_cache", "get_result_cache"),
+    ("vibe_check.tools.pr_review.chunk_cache", "get_chunk_result_cache"),
+    ("vibe_check.mentor.response_store", "get_mentor_response_store"),
+    ("vibe_check.mentor.parsed_file_cache", "get_parsed_file_cache"),
+    ("vibe_check.mentor.project_index", "get_project_file_index"),
+    ("vibe_check.tools.shared.single_flight", "get_single_flight"),
+    ("vibe_check.tools.shared.executor_pool", "get_claude_executor_pool"),
+    ("vibe_check.tools.shared.github_client_manager", "get_github_client_manager"),
+]
+
+
+def _clear_singletons() -> None:
+    # A module that was never imported has no singleton to reset, so only
+    # touch the ones already loaded instead of importing all of them per test
+    for module_name, getter in SINGLETON_GETTERS:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            getattr(module, getter)().clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_singletons():
+    """Start every test with empty caches, pools and in-flight state"""
+    _clear_singletons()
+    yield
+    _clear_singletons()
+
+
 @pytest.fixture(autouse=True)
 def cleanup_async_globals():
     """
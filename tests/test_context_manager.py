@@ -11,12 +11,15 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+from vibe_check.mentor.project_index import DEFAULT_PROJECT_INDEX_PATH
 from vibe_check.mentor.context_manager import (
     SecurityValidator,
     FileReader,
     CodeParser,
     ContextCache,
     FileContext,
+    ParsedFileCache,
+    ProjectFileIndex,
     SessionContext,
     get_context_cache,
     reset_context_cache,
@@ -171,6 +174,28 @@ class TestFileReader:
         assert "..." in result  # Long line should be truncated
         assert error is None
 
+    def test_decode_uses_bom_and_coding_declaration(self, tmp_path):
+        """Test BOM and PEP 263 charset sniffing"""
+        utf16_file = tmp_path / "utf16.py"
+        utf16_file.write_bytes("x = 'ü'\r\n".encode("utf-16"))
+        cp1252_file = tmp_path / "cp1252.py"
+        cp1252_file.write_bytes(b"# -*- coding: cp1252 -*-\nx = '\x93quoted\x94'\n")
+
+        assert FileReader.read_file(str(utf16_file)) == "x = 'ü'\n"
+        assert "\u201cquoted\u201d" in FileReader.read_file(str(cp1252_file))
+
+    def test_file_bytes_read_once(self, tmp_path):
+        """Test that a file is read and decoded in a single pass"""
+        test_file = tmp_path / "test.py"
+        test_file.write_text("x = 1")
+
+        with patch.object(
+            Path, "read_bytes", autospec=True, return_value=b"x = 1"
+        ) as read:
+            assert FileReader.read_file(str(test_file)) == "x = 1"
+
+        assert read.call_count == 1
+
     def test_handle_invalid_path(self):
         """Test handling of invalid file paths"""
         result, error = FileReader.read_file(
@@ -343,7 +368,7 @@ class TestContextCache:
         assert contexts[1].classes == ["MyClass"]
 
     def test_file_caching(self, tmp_path):
-        """Test that files are cached and not re-read"""
+        """Test that unchanged files are cached and edited files refreshed"""
         cache = ContextCache()
 
         # Create test file
@@ -355,16 +380,123 @@ class TestContextCache:
             "test-session", [str(test_file)], working_directory=str(tmp_path)
         )
 
-        # Modify file on disk
-        test_file.write_text("modified content")
-
         # Add same file again - should return cached version
         contexts2, _ = cache.add_files_to_session(
             "test-session", [str(test_file)], working_directory=str(tmp_path)
         )
+        assert contexts2[0] is contexts1[0]
+
+        # Modify file on disk (same size, newer mtime)
+        test_file.write_text("modified content")
+        os.utime(test_file, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+        # Add same file again - should pick up the edit
+        contexts3, _ = cache.add_files_to_session(
+            "test-session", [str(test_file)], working_directory=str(tmp_path)
+        )
 
-        assert contexts1[0].content == contexts2[0].content
         assert contexts1[0].content == "original content"
+        assert contexts3[0].content == "modified content"
+        assert cache.get_session_context("test-session").total_size == len(
+            "modified content"
+        )
+
+    def test_files_ingested_concurrently(self, tmp_path):
+        """Test that uncached files are read in parallel"""
+        cache = ContextCache()
+        files = []
+        for i in range(4):
+            test_file = tmp_path / f"file{i}.py"
+            test_file.write_text(f"def f{i}(): pass")
+            files.append(str(test_file))
+        read_file = FileReader.read_file
+
+        def slow_read(*args, **kwargs):
+            time.sleep(0.2)
+            return read_file(*args, **kwargs)
+
+        with patch.object(cache._file_reader, "read_file", side_effect=slow_read):
+            start = time.perf_counter()
+            contexts, errors = cache.add_files_to_session(
+                "test-session", files, working_directory=str(tmp_path)
+            )
+            elapsed = time.perf_counter() - start
+
+        assert errors == []
+        assert [c.functions for c in contexts] == [[f"f{i}"] for i in range(4)]
+        assert elapsed < 0.6
+
+    def test_largest_files_scheduled_first(self, tmp_path):
+        """Test size-aware scheduling of file reads"""
+        cache = ContextCache()
+        files = []
+        for name, size in [("small", 10), ("large", 1000), ("medium", 100)]:
+            test_file = tmp_path / f"{name}.py"
+            test_file.write_text("#" * size)
+            files.append(str(test_file))
+        read_order = []
+        read_file = FileReader.read_file
+
+        def recording_read(path, *args, **kwargs):
+            read_order.append(Path(path).stem)
+            return read_file(path, *args, **kwargs)
+
+        with patch("vibe_check.mentor.cache.INGEST_MAX_WORKERS", 1), patch.object(
+            cache._file_reader, "read_file", side_effect=recording_read
+        ):
+            contexts, _ = cache.add_files_to_session(
+                "test-session", files, working_directory=str(tmp_path)
+            )
+
+        assert read_order == ["large", "medium", "small"]
+        assert [Path(c.path).stem for c in contexts] == ["small", "large", "medium"]
+
+    def test_sessions_share_parsed_files(self, tmp_path):
+        """Test that a second session reuses the first session's parse"""
+        cache = ContextCache()
+        test_file = tmp_path / "shared.py"
+        test_file.write_text('def helper():\n    """Help."""\n')
+
+        with patch.object(
+            cache._code_parser,
+            "parse_python_file",
+            wraps=cache._code_parser.parse_python_file,
+        ) as parse:
+            contexts1, _ = cache.add_files_to_session(
+                "session1", [str(test_file)], working_directory=str(tmp_path)
+            )
+            contexts2, _ = cache.add_files_to_session(
+                "session2", [str(test_file)], working_directory=str(tmp_path)
+            )
+
+        assert parse.call_count == 1
+        assert contexts1[0] is contexts2[0]
+        assert contexts1[0].docstrings == {"func:helper": "Help."}
+        shared = cache.get_stats()["shared_file_cache"]
+        assert (shared["hits"], shared["misses"]) == (1, 1)
+        assert shared["bytes"] == contexts1[0].size
+
+    def test_query_views_share_content(self, tmp_path):
+        """Test that query-specific session entries reference the shared parse"""
+        cache = ContextCache()
+        test_file = tmp_path / "view.py"
+        test_file.write_text("def function1(): pass")
+
+        contexts1, _ = cache.add_files_to_session(
+            "session1", [str(test_file)], working_directory=str(tmp_path)
+        )
+        contexts2, _ = cache.add_files_to_session(
+            "session2",
+            [str(test_file)],
+            working_directory=str(tmp_path),
+            query="function1",
+        )
+
+        assert contexts2[0] is not contexts1[0]
+        assert contexts2[0].content is contexts1[0].content
+        assert contexts2[0].functions is contexts1[0].functions
+        assert contexts2[0].relevant_lines["direct_mentions"]
+        assert not contexts1[0].relevant_lines
 
     def test_session_expiry(self):
         """Test that expired sessions are cleaned up"""
@@ -470,6 +602,172 @@ class TestContextCache:
         assert cache.get_session_context("session2") is None
 
 
+class TestParsedFileCache:
+    """Test the process-wide parsed file cache"""
+
+    def _context(self, path, size):
+        return FileContext(
+            path=path,
+            content="x" * size,
+            language="python",
+            size=size,
+            last_modified=0.0,
+            hash=path,
+        )
+
+    def test_hit_requires_matching_stamp(self, tmp_path):
+        """Test that entries are revalidated against mtime and size"""
+        cache = ParsedFileCache()
+        test_file = tmp_path / "a.py"
+        test_file.write_text("a = 1")
+        path = str(test_file)
+
+        _, stamp = cache.lookup(path)
+        cache.put(path, stamp, self._context(path, 5))
+        assert cache.lookup(path)[0] is not None
+
+        test_file.write_text("a = 22")
+        assert cache.lookup(path) == (None, ParsedFileCache.stamp(path))
+        assert cache.get_stats()["stale"] == 1
+        assert cache.lookup(str(tmp_path / "missing.py")) == (None, None)
+
+    def test_evicts_least_recently_used_beyond_byte_budget(self, tmp_path):
+        """Test byte-bounded LRU eviction"""
+        cache = ParsedFileCache(max_bytes=100)
+        paths = []
+        for name in ["a", "b", "c"]:
+            test_file = tmp_path / f"{name}.py"
+            test_file.write_text(name)
+            paths.append(str(test_file))
+
+        cache.put(paths[0], ParsedFileCache.stamp(paths[0]), self._context("a", 40))
+        cache.put(paths[1], ParsedFileCache.stamp(paths[1]), self._context("b", 40))
+        cache.lookup(paths[0])
+        cache.put(paths[2], ParsedFileCache.stamp(paths[2]), self._context("c", 40))
+        cache.put("huge", (0, 0), self._context("huge", 101))
+
+        stats = cache.get_stats()
+        assert (stats["files"], stats["bytes"], stats["evictions"]) == (2, 80, 1)
+        assert cache.lookup(paths[1])[0] is None
+        assert cache.lookup(paths[0])[0] is not None
+
+
+class TestProjectFileIndex:
+    """Test indexed project discovery"""
+
+    def _make_tree(self, tmp_path):
+        (tmp_path / "proj" / "src").mkdir(parents=True)
+        (tmp_path / "proj" / "src" / "mapper.py").write_text("x = 1")
+        (tmp_path / "proj" / "node_modules").mkdir()
+        (tmp_path / "proj" / "node_modules" / "lib.js").write_text("")
+        deep = tmp_path / "a" / "b" / "c" / "d"
+        deep.mkdir(parents=True)
+        (deep / "deep.py").write_text("")
+        return str(tmp_path)
+
+    def test_finds_directory_without_walking_again(self, tmp_path):
+        """Test that lookups after the first are answered from the index"""
+        root = self._make_tree(tmp_path)
+        index = ProjectFileIndex()
+
+        found = index.find_project_containing_files(["src/mapper.py"], [root])
+        with patch("os.scandir", side_effect=AssertionError("walked")):
+            again = index.find_project_containing_files(["mapper.py"], [root])
+
+        assert found == again == str(tmp_path / "proj" / "src")
+        assert index.get_stats()["builds"] == 1
+
+    def test_respects_depth_limit_and_skipped_directories(self, tmp_path):
+        """Test that the index matches the original walk's scope"""
+        root = self._make_tree(tmp_path)
+        index = ProjectFileIndex()
+
+        assert index.find_project_containing_files(["lib.js"], [root]) is None
+        assert index.find_project_containing_files(["deep.py"], [root]) is None
+
+    def test_incremental_refresh_picks_up_changes(self, tmp_path):
+        """Test that only directories with a new mtime are listed again"""
+        root = self._make_tree(tmp_path)
+        index = ProjectFileIndex()
+        index.find_project_containing_files(["mapper.py"], [root])
+
+        (tmp_path / "proj" / "src" / "mapper.py").unlink()
+        (tmp_path / "other").mkdir()
+        (tmp_path / "other" / "mapper.py").write_text("")
+        # Make sure the changed directories get a new mtime_ns
+        for changed in [tmp_path, tmp_path / "proj" / "src"]:
+            os.utime(changed, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+        # The stale entry is verified on disk, never reported
+        assert index.find_project_containing_files(["mapper.py"], [root]) is None
+
+        index.refresh(root)
+        found = index.find_project_containing_files(["mapper.py"], [root])
+        assert found == str(tmp_path / "other")
+
+    def test_stale_index_refreshed_in_background(self, tmp_path):
+        """Test that a lookup on an old index schedules a refresh"""
+        root = self._make_tree(tmp_path)
+        index = ProjectFileIndex(refresh_interval=0)
+
+        with patch.object(index, "refresh_in_background") as refresh:
+            index.find_project_containing_files(["mapper.py"], [root])
+
+        refresh.assert_called_once_with(root)
+
+    def test_stale_miss_refreshed_before_answering(self, tmp_path):
+        """Test that files created after a snapshot are found on a stale miss"""
+        root = self._make_tree(tmp_path / "tree")
+        snapshot = str(tmp_path / "index.json")
+        ProjectFileIndex(path=snapshot).find_project_containing_files(
+            ["mapper.py"], [root]
+        )
+        (tmp_path / "tree" / "new").mkdir()
+        (tmp_path / "tree" / "new" / "fresh.py").write_text("")
+
+        reloaded = ProjectFileIndex(path=snapshot, refresh_interval=0)
+        with patch.object(reloaded, "refresh_in_background") as background:
+            found = reloaded.find_project_containing_files(["fresh.py"], [root])
+
+        assert found == str(tmp_path / "tree" / "new")
+        background.assert_not_called()
+        assert reloaded.get_stats()["refreshes"] == 1
+        assert reloaded.get_stats()["hits"] == 1
+
+    def test_snapshot_persists_across_instances(self, tmp_path):
+        """Test that a new process starts from the saved index"""
+        root = self._make_tree(tmp_path / "tree")
+        snapshot = str(tmp_path / "index.json")
+        ProjectFileIndex(path=snapshot).find_project_containing_files(
+            ["mapper.py"], [root]
+        )
+
+        reloaded = ProjectFileIndex(path=snapshot)
+        with patch("os.scandir", side_effect=AssertionError("walked")):
+            found = reloaded.find_project_containing_files(["mapper.py"], [root])
+
+        assert found.endswith(os.path.join("proj", "src"))
+        assert reloaded.get_stats()["builds"] == 0
+
+    def test_snapshot_path_resolution(self, monkeypatch):
+        """Test that ":memory:" keeps the index off disk"""
+        monkeypatch.setenv("VIBE_CHECK_PROJECT_INDEX", ":memory:")
+        assert ProjectFileIndex().path is None
+
+        monkeypatch.delenv("VIBE_CHECK_PROJECT_INDEX")
+        assert ProjectFileIndex().path == str(DEFAULT_PROJECT_INDEX_PATH)
+        assert ProjectFileIndex(path="/explicit.json").path == "/explicit.json"
+
+    def test_search_dirs_configurable(self, tmp_path, monkeypatch):
+        """Test that the environment variable replaces the default roots"""
+        root = self._make_tree(tmp_path)
+        monkeypatch.setenv("VIBE_CHECK_PROJECT_SEARCH_DIRS", root)
+
+        found = ContextCache().find_project_containing_files(["mapper.py"])
+
+        assert found == str(tmp_path / "proj" / "src")
+
+
 class TestGlobalCache:
     """Test global cache instance management"""
 
@@ -498,8 +796,7 @@ class TestIntegration:
         """Test the complete flow from file reading to context extraction"""
         # Create a test Python file with various elements
         test_file = tmp_path / "example.py"
-        test_file.write_text(
-            """
+        test_file.write_text("""
 import requests
 from typing import Optional
 
@@ -519,8 +816,7 @@ def process_api_response(data: dict) -> Optional[str]:
     if 'result' in data:
         return data['result']
     return None
-"""
-        )
+""")
 
         # Initialize cache and add file
         cache = get_context_cache()
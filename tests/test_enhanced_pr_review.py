@@ -56,11 +56,13 @@ class TestEnhancedPRReview:
 
             # Setup mocks
             mock_collector_instance = Mock()
-            mock_collector_instance.collect_pr_data.return_value = {
-                "metadata": {"author_association": "FIRST_TIME_CONTRIBUTOR"},
-                "files": [],
-                "statistics": {"files_count": 1, "additions": 10, "deletions": 5},
-            }
+            mock_collector_instance.collect_pr_data_async = AsyncMock(
+                return_value={
+                    "metadata": {"author_association": "FIRST_TIME_CONTRIBUTOR"},
+                    "files": [],
+                    "statistics": {"files_count": 1, "additions": 10, "deletions": 5},
+                }
+            )
             mock_collector.return_value = mock_collector_instance
 
             mock_claude_instance = Mock()
@@ -83,15 +85,17 @@ class TestEnhancedPRReview:
 
             # Setup mocks for first-time contributor
             mock_collector_instance = Mock()
-            mock_collector_instance.collect_pr_data.return_value = {
-                "metadata": {
-                    "author": "newcontributor",
-                    "author_association": "FIRST_TIME_CONTRIBUTOR",
-                    "title": "Fix typo in README",
-                },
-                "files": [{"filename": "README.md"}],
-                "statistics": {"files_count": 1, "additions": 1, "deletions": 1},
-            }
+            mock_collector_instance.collect_pr_data_async = AsyncMock(
+                return_value={
+                    "metadata": {
+                        "author": "newcontributor",
+                        "author_association": "FIRST_TIME_CONTRIBUTOR",
+                        "title": "Fix typo in README",
+                    },
+                    "files": [{"filename": "README.md"}],
+                    "statistics": {"files_count": 1, "additions": 1, "deletions": 1},
+                }
+            )
             mock_collector.return_value = mock_collector_instance
 
             mock_claude_instance = Mock()
@@ -0,0 +1,165 @@
+"""
+Tests for the Adaptive Concurrency Limiter
+
+Covers AIMD control of concurrent Claude CLI chunk analyses:
+- Additive increase on healthy latencies, multiplicative decrease on overload
+- Health monitor and resource monitor signals
+- Slot accounting and waiting
+- Feedback from ChunkedAnalyzer
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vibe_check.tools.pr_review.chunk_cache import ChunkResultCache
+from vibe_check.tools.pr_review.chunked_analyzer import ChunkedAnalyzer
+from vibe_check.tools.shared.adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+def _health(level="HEALTHY"):
+    monitor = Mock()
+    monitor.get_health_status.return_value = SimpleNamespace(level=level)
+    return monitor
+
+
+def _resources(cpu=10.0, memory=40.0):
+    monitor = Mock()
+    monitor.limits = SimpleNamespace(max_total_cpu_percent=70.0)
+    monitor.get_system_usage.return_value = SimpleNamespace(
+        cpu_percent=cpu, memory_percent=memory
+    )
+    return monitor
+
+
+def _limiter(health="HEALTHY", cpu=10.0, memory=40.0, **kwargs):
+    kwargs.setdefault("signal_interval_seconds", 0)
+    kwargs.setdefault("decrease_cooldown_seconds", 0)
+    return AdaptiveConcurrencyLimiter(
+        health_monitor=_health(health),
+        resource_monitor=_resources(cpu, memory),
+        **kwargs,
+    )
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD limit adjustments."""
+
+    def test_healthy_latencies_increase_additively(self):
+        limiter = _limiter(initial_limit=2, max_limit=4)
+
+        limiter.record_success(1.0)
+        assert limiter.limit == 2
+        limiter.record_success(1.0)
+        assert limiter.limit == 3
+
+        for _ in range(20):
+            limiter.record_success(1.0)
+        assert limiter.limit == 4
+
+        stats = limiter.get_stats()
+        assert stats["increases"] == 2
+        assert stats["recent_adjustments"][0]["reason"] == "healthy_latency"
+
+    def test_overload_decreases_multiplicatively(self):
+        limiter = _limiter(initial_limit=6, max_limit=8)
+
+        limiter.record_overload("TimeoutError")
+        assert limiter.limit == 3
+        limiter.record_overload("CircuitBreakerOpenError")
+        assert limiter.limit == 1
+        limiter.record_overload("TimeoutError")
+        assert limiter.limit == 1
+
+        reasons = [a["reason"] for a in limiter.get_stats()["recent_adjustments"]]
+        assert reasons == ["TimeoutError", "CircuitBreakerOpenError"]
+
+    def test_simultaneous_timeouts_count_once(self):
+        limiter = _limiter(initial_limit=6, decrease_cooldown_seconds=60)
+
+        for _ in range(3):
+            limiter.record_overload("TimeoutError")
+
+        assert limiter.limit == 3
+        assert limiter.get_stats()["overloads"] == 3
+
+    def test_slow_calls_hold_the_limit(self):
+        limiter = _limiter(initial_limit=2, latency_target_seconds=10)
+
+        for _ in range(5):
+            limiter.record_success(30.0)
+
+        assert limiter.limit == 2
+        assert limiter.get_stats()["slow_calls"] == 5
+
+    @pytest.mark.parametrize(
+        "signals, expected_limit, reason",
+        [
+            ({"health": "CRITICAL"}, 2, "claude_cli_critical"),
+            ({"health": "DEGRADED"}, 4, "claude_cli_degraded"),
+            ({"cpu": 95.0}, 2, "cpu_pressure"),
+            ({"memory": 95.0}, 2, "memory_pressure"),
+            ({"memory": 85.0}, 4, "resource_pressure"),
+        ],
+    )
+    def test_monitor_signals(self, signals, expected_limit, reason):
+        limiter = _limiter(initial_limit=4, **signals)
+
+        limiter.record_success(1.0)
+
+        assert limiter.limit == expected_limit
+        assert limiter.get_stats()["last_signal"]["reason"] == reason
+
+    @pytest.mark.asyncio
+    async def test_slots_wait_for_capacity(self):
+        limiter = _limiter(initial_limit=1)
+        order = []
+
+        async def work(name):
+            async with limiter.slot():
+                order.append(f"{name}-start")
+                await asyncio.sleep(0.01)
+                order.append(f"{name}-end")
+
+        await asyncio.gather(work("a"), work("b"))
+
+        assert order == ["a-start", "a-end", "b-start", "b-end"]
+        assert limiter.in_flight == 0
+
+
+class TestChunkedAnalyzerFeedback:
+    """Test that chunk outcomes drive the limiter."""
+
+    PR_DATA = {"title": "Test", "additions": 200, "deletions": 0, "changed_files": 2}
+    PR_FILES = [
+        {"filename": f"file{i}.py", "changes": 100, "patch": f"+ {i}"} for i in range(2)
+    ]
+
+    @pytest.mark.asyncio
+    async def test_timeouts_shrink_and_successes_grow_the_limit(self):
+        limiter = _limiter(initial_limit=4)
+        analyzer = ChunkedAnalyzer(
+            chunk_timeout=0.05,
+            max_lines_per_chunk=100,
+            result_cache=ChunkResultCache(":memory:"),
+            concurrency_limiter=limiter,
+        )
+
+        async def slow_claude(*args, **kwargs):
+            await asyncio.sleep(0.2)
+
+        with patch(
+            "src.vibe_check.tools.shared.claude_integration.analyze_content_async_with_circuit_breaker",
+            side_effect=slow_claude,
+        ):
+            await analyzer.analyze_pr_chunked(self.PR_DATA, self.PR_FILES)
+        assert limiter.limit == 1
+
+        with patch(
+            "src.vibe_check.tools.shared.claude_integration.analyze_content_async_with_circuit_breaker"
+        ) as mock_claude:
+            mock_claude.return_value = Mock(success=True, output="**Summary**: Fine")
+            await analyzer.analyze_pr_chunked(self.PR_DATA, self.PR_FILES)
+        assert limiter.limit == 2
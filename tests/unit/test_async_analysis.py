@@ -218,7 +218,8 @@ class TestAsyncAnalysisQueue:
         finally:
             await self.queue.stop()
 
-    def test_job_completion(self):
+    @pytest.mark.asyncio
+    async def test_job_completion(self):
         """Test completing a job."""
         # Create and track a job
         pr_data = {"title": "Test"}
@@ -227,7 +228,7 @@ class TestAsyncAnalysisQueue:
 
         # Complete the job
         result = {"analysis": "completed", "patterns": ["test"]}
-        self.queue.complete_job("job-1", result)
+        await self.queue.complete_job("job-1", result)
 
         # Check job is completed
         assert job.status == JobStatus.COMPLETED
@@ -235,14 +236,15 @@ class TestAsyncAnalysisQueue:
         assert job.progress == 100
         assert self.queue.job_results["job-1"] == result
 
-    def test_job_failure(self):
+    @pytest.mark.asyncio
+    async def test_job_failure(self):
         """Test failing a job."""
         pr_data = {"title": "Test"}
         job = AnalysisJob("job-1", 1, "repo", pr_data)
         self.queue.active_jobs["job-1"] = job
 
         # Fail the job
-        self.queue.fail_job("job-1", "Analysis error")
+        await self.queue.fail_job("job-1", "Analysis error")
 
         # Check job is failed
         assert job.status == JobStatus.FAILED
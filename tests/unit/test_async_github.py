@@ -0,0 +1,389 @@
+"""
+Tests for Async GitHub Operations
+
+Covers the native async GitHub layer:
+- Concurrent fan-out of PR metadata, diff, files and linked issues
+- Rate-limit-aware concurrency cap
+- REST payload mapping and the sync adapter
+- Token resolution off the event loop and one retry after a 401
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from vibe_check.tools.shared.async_github import (
+    AiohttpGitHubImplementation,
+    AsyncGitHubOperations,
+    GitHubRateLimiter,
+    SyncGitHubOperationsAdapter,
+)
+from vibe_check.tools.shared.github_abstraction import GitHubOperationResult
+from vibe_check.tools.shared.github_client_manager import GitHubClientManager
+
+MANAGER_PATH = "vibe_check.tools.shared.github_client_manager.get_github_client_manager"
+
+
+class SlowOperations(AsyncGitHubOperations):
+    """Every request takes `delay` seconds; tracks peak concurrency."""
+
+    def __init__(self, delay=0.1, limiter=None):
+        self.delay = delay
+        self.limiter = limiter or GitHubRateLimiter()
+        self.active = 0
+        self.peak = 0
+
+    async def _fetch(self, data, success=True):
+        async with self.limiter:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(self.delay)
+            self.active -= 1
+        return GitHubOperationResult(success=success, data=data)
+
+    async def get_issue(self, repository, issue_number):
+        return await self._fetch(f"issue {issue_number}", success=issue_number != 13)
+
+    async def get_pull_request(self, repository, pr_number):
+        return await self._fetch(f"pr {pr_number}")
+
+    async def post_issue_comment(self, repository, issue_number, comment_body):
+        return await self._fetch({"comment_posted": True})
+
+    async def get_pull_request_diff(self, repository, pr_number):
+        return await self._fetch("diff")
+
+    async def get_pull_request_files(self, repository, pr_number):
+        return await self._fetch([])
+
+    async def check_authentication(self):
+        return await self._fetch({"authenticated": True})
+
+
+class TestPullRequestBundle:
+    """Test concurrent PR fetch fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_latency_is_slowest_request_not_sum(self):
+        ops = SlowOperations(delay=0.1)
+
+        start = time.perf_counter()
+        bundle = await ops.fetch_pull_request_bundle(
+            "owner/repo", 7, include_files=True, linked_issues=[1, 2, 2]
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.3  # five requests of 0.1s each
+        assert bundle.pull_request.data == "pr 7"
+        assert bundle.diff.data == "diff"
+        assert bundle.files.data == []
+        assert list(bundle.linked_issues) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failed_linked_issue_keeps_other_results(self):
+        ops = SlowOperations(delay=0)
+
+        bundle = await ops.fetch_pull_request_bundle(
+            "owner/repo", 7, include_diff=False, linked_issues=[12, 13]
+        )
+
+        assert bundle.diff is None
+        assert bundle.pull_request.success
+        assert bundle.linked_issues[12].success
+        assert not bundle.linked_issues[13].success
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped_by_shared_limiter(self):
+        ops = SlowOperations(delay=0.02, limiter=GitHubRateLimiter(max_concurrency=2))
+
+        await ops.fetch_pull_request_bundle(
+            "owner/repo", 7, include_files=True, linked_issues=range(6)
+        )
+
+        assert ops.peak == 2
+
+
+class TestGitHubRateLimiter:
+    """Test rate-limit-aware waiting."""
+
+    def test_waits_only_when_quota_nearly_exhausted(self):
+        limiter = GitHubRateLimiter(reserve=5, max_wait_seconds=30)
+        assert limiter.wait_seconds() == 0
+
+        limiter.update(
+            {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": str(time.time() + 20)}
+        )
+        assert limiter.wait_seconds() == 0
+
+        limiter.update({"X-RateLimit-Remaining": "3"})
+        assert 15 < limiter.wait_seconds() <= 20
+
+        limiter.update({"X-RateLimit-Reset": str(time.time() + 3600)})
+        assert limiter.wait_seconds() == 30
+
+    @pytest.mark.asyncio
+    async def test_requests_held_until_reset(self):
+        limiter = GitHubRateLimiter(reserve=5)
+        limiter.update(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 0.1)}
+        )
+
+        start = time.perf_counter()
+        async with limiter:
+            pass
+
+        assert time.perf_counter() - start >= 0.05
+        assert limiter.waits == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_wait_releases_permit(self):
+        limiter = GitHubRateLimiter(max_concurrency=1, reserve=5)
+        limiter.update(
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 30)}
+        )
+
+        async def request():
+            async with limiter:
+                pass
+
+        waiting = asyncio.create_task(request())
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+        limiter.update({"X-RateLimit-Remaining": "100"})
+        await asyncio.wait_for(request(), timeout=1)
+
+
+PR_PAYLOAD = {
+    "number": 7,
+    "title": "Add feature",
+    "body": None,
+    "state": "open",
+    "user": {"login": "octocat"},
+    "labels": [{"name": "enhancement"}],
+    "html_url": "https://github.com/owner/repo/pull/7",
+    "head": {"ref": "feature"},
+    "base": {"ref": "main"},
+    "diff_url": "https://github.com/owner/repo/pull/7.diff",
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-02T00:00:00Z",
+    "additions": 10,
+    "deletions": 2,
+    "changed_files": 3,
+}
+
+
+class TestAiohttpGitHubImplementation:
+    """Test REST payload handling of the native implementation."""
+
+    @pytest.mark.asyncio
+    async def test_pull_request_mapped_with_size_data(self):
+        ops = AiohttpGitHubImplementation()
+        ops._request = AsyncMock(return_value=(200, PR_PAYLOAD))
+
+        result = await ops.get_pull_request("owner/repo", 7)
+
+        assert result.success
+        assert result.implementation == "aiohttp"
+        assert result.data.user_login == "octocat"
+        assert result.data.labels == ["enhancement"]
+        assert (result.data.additions, result.data.changed_files) == (10, 3)
+
+    @pytest.mark.asyncio
+    async def test_files_fetched_page_by_page(self):
+        file = {
+            "filename": "a.py",
+            "status": "modified",
+            "additions": 1,
+            "deletions": 0,
+            "changes": 1,
+        }
+        ops = AiohttpGitHubImplementation()
+        ops._request = AsyncMock(side_effect=[(200, [file] * 100), (200, [file])])
+
+        result = await ops.get_pull_request_files("owner/repo", 7)
+
+        assert len(result.data) == 101
+        assert result.data[0]["patch"] == ""
+        pages = [call.kwargs["params"]["page"] for call in ops._request.call_args_list]
+        assert pages == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_session_from_another_loop_is_closed(self):
+        ops = AiohttpGitHubImplementation()
+        stale = Mock(closed=False, close=AsyncMock())
+        ops._session, ops._session_loop = stale, object()
+
+        session = await ops._get_session()
+
+        stale.close.assert_awaited_once()
+        assert session is not stale
+        await ops.close()
+
+    @pytest.mark.asyncio
+    async def test_http_errors_reported(self):
+        ops = AiohttpGitHubImplementation()
+        ops._request = AsyncMock(return_value=(404, {"message": "Not Found"}))
+
+        result = await ops.get_pull_request_diff("owner/repo", 7)
+
+        assert not result.success
+        assert "not found" in result.error
+
+
+class TestAiohttpAuthentication:
+    """Test token resolution and 401 handling of the native implementation."""
+
+    @pytest.mark.asyncio
+    async def test_token_resolved_off_event_loop(self):
+        resolving_threads = []
+
+        def token_provider():
+            resolving_threads.append(threading.current_thread())
+            return "token-1"
+
+        manager = GitHubClientManager(token_provider=token_provider)
+        ops = AiohttpGitHubImplementation()
+        ops._send = AsyncMock(return_value=(200, {}))
+
+        with patch(MANAGER_PATH, return_value=manager):
+            assert await ops._request("GET", "/repos/owner/repo") == (200, {})
+
+        assert resolving_threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_401_re_resolves_token_and_retries_once(self):
+        manager = GitHubClientManager(
+            token_provider=Mock(side_effect=["stale", "fresh"])
+        )
+        ops = AiohttpGitHubImplementation()
+        ops._send = AsyncMock(side_effect=[(401, "Bad credentials"), (200, {})])
+
+        with patch(MANAGER_PATH, return_value=manager):
+            assert await ops._request("GET", "/repos/owner/repo") == (200, {})
+
+        tokens = [call.args[2] for call in ops._send.call_args_list]
+        assert tokens == ["stale", "fresh"]
+        assert manager.token_refreshes == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_401_returned_after_one_retry(self):
+        manager = GitHubClientManager(token_provider=Mock(return_value="bad"))
+        ops = AiohttpGitHubImplementation()
+        ops._send = AsyncMock(return_value=(401, "Bad credentials"))
+
+        with patch(MANAGER_PATH, return_value=manager):
+            status, _ = await ops._request("GET", "/repos/owner/repo")
+
+        assert status == 401
+        assert ops._send.await_count == 2
+
+
+class TestSyncGitHubOperationsAdapter:
+    """Test the sync facade over async operations."""
+
+    def test_sync_call_outside_event_loop(self):
+        adapter = SyncGitHubOperationsAdapter(SlowOperations(delay=0))
+
+        assert adapter.get_pull_request("owner/repo", 7).data == "pr 7"
+
+    @pytest.mark.asyncio
+    async def test_sync_call_inside_running_loop(self):
+        adapter = SyncGitHubOperationsAdapter(SlowOperations(delay=0))
+
+        assert adapter.get_issue("owner/repo", 3).data == "issue 3"
+
+
+class TestAnalyzeGitHubPrFetching:
+    """Test that the PR vibe check fetches the diff only on the LLM route."""
+
+    @pytest.mark.asyncio
+    async def test_diff_not_refetched_by_llm_analysis(self):
+        from vibe_check.tools.analyze_llm import specialized_analyzers
+
+        ops = SlowOperations(delay=0)
+        ops.get_pull_request = AsyncMock(
+            return_value=GitHubOperationResult(success=True, data=_pr())
+        )
+        ops.get_pull_request_diff = AsyncMock(
+            return_value=GitHubOperationResult(success=False, error="boom")
+        )
+
+        async def fallback(pr_data, llm_analyzer_func, fast_analyzer_func):
+            with pytest.raises(Exception, match="boom"):
+                await llm_analyzer_func()
+            return {"status": "fast"}
+
+        with patch.object(
+            specialized_analyzers,
+            "get_default_async_github_operations",
+            return_value=ops,
+        ), patch("vibe_check.core.pr_filtering.analyze_with_fallback", fallback):
+            result = await specialized_analyzers.analyze_github_pr_llm(
+                7, repository="owner/repo", post_comment=False
+            )
+
+        assert result["status"] == "fast"
+        ops.get_pull_request_diff.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_massive_pr_routed_without_fetching_diff(self):
+        from vibe_check.tools.analyze_llm import specialized_analyzers
+
+        calls = []
+        pr = _pr()
+        pr.additions, pr.deletions, pr.changed_files = 50000, 0, 400
+
+        async def check_authentication():
+            calls.append("auth")
+            return GitHubOperationResult(success=True, data={})
+
+        async def get_pull_request(repository, pr_number):
+            calls.append("pr")
+            return GitHubOperationResult(success=True, data=pr)
+
+        ops = SlowOperations(delay=0)
+        ops.check_authentication = check_authentication
+        ops.get_pull_request = get_pull_request
+        ops.get_pull_request_diff = AsyncMock()
+
+        with patch.object(
+            specialized_analyzers,
+            "get_default_async_github_operations",
+            return_value=ops,
+        ), patch(
+            "vibe_check.tools.async_analysis.integration.start_async_analysis",
+            new=AsyncMock(return_value={"status": "queued"}),
+        ):
+            result = await specialized_analyzers.analyze_github_pr_llm(
+                7, repository="owner/repo", post_comment=False
+            )
+
+        assert result["status"] == "queued"
+        assert calls == ["auth", "pr"]
+        ops.get_pull_request_diff.assert_not_awaited()
+
+
+def _pr():
+    from vibe_check.tools.shared.github_abstraction import GitHubPullRequest
+
+    return GitHubPullRequest(
+        number=7,
+        title="Add feature",
+        body=None,
+        state="open",
+        user_login="octocat",
+        labels=[],
+        repository="owner/repo",
+        html_url="https://github.com/owner/repo/pull/7",
+        head_ref="feature",
+        base_ref="main",
+        diff_url="https://github.com/owner/repo/pull/7.diff",
+        created_at="2024-01-01T00:00:00Z",
+        updated_at="2024-01-02T00:00:00Z",
+    )
@@ -0,0 +1,317 @@
+"""
+Tests for the Async Analysis Job Store
+
+Covers durable storage of async analysis jobs:
+- SQLite persistence of job state, transitions and results
+- Resuming queued and in-flight jobs after a restart
+- Job ownership leases between server processes sharing a store
+- Serving finished jobs from the store instead of memory
+- Retention cleanup
+- Store writes waiting on a busy database off the event loop
+"""
+
+import asyncio
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.usefixtures("mock_async_analysis_environment")
+
+from vibe_check.tools.async_analysis.config import AsyncAnalysisConfig
+from vibe_check.tools.async_analysis.job_store import (
+    DEFAULT_JOB_STORE_PATH,
+    InMemoryJobStore,
+    SQLiteJobStore,
+    create_job_store,
+    resolve_job_store_path,
+)
+from vibe_check.tools.async_analysis.queue_manager import (
+    AnalysisJob,
+    AsyncAnalysisQueue,
+    JobStatus,
+)
+
+
+@pytest.fixture
+def accept_all_jobs():
+    with patch(
+        "vibe_check.tools.async_analysis.resource_monitor.get_global_resource_monitor"
+    ) as mock_monitor:
+        mock_monitor.return_value.should_accept_new_job.return_value = (True, "")
+        yield mock_monitor
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "jobs.db")
+
+
+LEASE_SECONDS = 120
+
+
+def _queue(store_path):
+    return AsyncAnalysisQueue(
+        AsyncAnalysisConfig(max_queue_size=5, job_lease_seconds=LEASE_SECONDS),
+        job_store=SQLiteJobStore(store_path),
+    )
+
+
+def _dead_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+class TestSQLiteJobStore:
+    """Test the SQLite job store backend."""
+
+    def test_job_state_and_transitions_are_persisted(self, store_path):
+        store = SQLiteJobStore(store_path)
+        job = AnalysisJob("job-1", 1, "owner/repo", {"title": "PR", "additions": 9})
+        store.record_job(job)
+        job.status = JobStatus.PROCESSING
+        job.progress = 10
+        store.record_job(job)
+        store.close()
+
+        reopened = SQLiteJobStore(store_path)
+        record = reopened.get_job("job-1")
+
+        assert record["status"] == "processing"
+        assert record["pr_data"] == {"title": "PR", "additions": 9}
+        assert [t["status"] for t in reopened.get_transitions("job-1")] == [
+            "queued",
+            "processing",
+        ]
+        assert [r["job_id"] for r in reopened.load_unfinished()] == ["job-1"]
+
+    def test_results_are_served_from_disk(self, store_path):
+        store = SQLiteJobStore(store_path)
+        job = AnalysisJob("job-1", 1, "owner/repo", {"title": "PR"})
+        job.status = JobStatus.COMPLETED
+        job.completed_at = time.time()
+        store.save_result(job, {"patterns": ["a"]})
+
+        assert store.get_result("job-1") == {"patterns": ["a"]}
+        assert store.results["job-1"] == {"patterns": ["a"]}
+        assert list(store.results) == ["job-1"]
+        assert store.load_unfinished() == []
+
+    @pytest.mark.parametrize("store_factory", [InMemoryJobStore, "sqlite"])
+    def test_cleanup_respects_retention(self, store_factory, store_path):
+        store = (
+            SQLiteJobStore(store_path) if store_factory == "sqlite" else store_factory()
+        )
+        now = time.time()
+        for job_id, age in (("old", 100), ("recent", 10)):
+            job = AnalysisJob(job_id, 1, "owner/repo", {"title": job_id})
+            job.status = JobStatus.COMPLETED
+            job.completed_at = now - age
+            store.save_result(job, {"job": job_id})
+
+        assert store.cleanup(result_cutoff=now - 50, status_cutoff=now - 200) == 1
+        assert store.get_result("old") is None
+        assert store.get_job("old") is not None
+        assert store.get_result("recent") == {"job": "recent"}
+
+        store.cleanup(result_cutoff=now, status_cutoff=now)
+        assert store.get_job("old") is None
+        assert store.get_job("recent") is None
+
+    @pytest.mark.parametrize("store_factory", [InMemoryJobStore, "sqlite"])
+    def test_chunk_checkpoints(self, store_factory, store_path):
+        store = (
+            SQLiteJobStore(store_path) if store_factory == "sqlite" else store_factory()
+        )
+        store.save_chunk_checkpoint("owner/repo#1", "hash-a", {"chunk_id": 1})
+        store.save_chunk_checkpoint("owner/repo#2", "hash-b", {"chunk_id": 1})
+
+        assert store.load_chunk_checkpoints("owner/repo#1") == {
+            "hash-a": {"chunk_id": 1}
+        }
+
+        store.clear_chunk_checkpoints("owner/repo#1")
+        assert store.load_chunk_checkpoints("owner/repo#1") == {}
+
+        store.cleanup(result_cutoff=time.time() + 1, status_cutoff=time.time() + 1)
+        assert store.load_chunk_checkpoints("owner/repo#2") == {}
+
+    def test_store_path_resolution(self, monkeypatch, store_path):
+        monkeypatch.delenv("VIBE_CHECK_JOB_STORE", raising=False)
+        assert resolve_job_store_path() == str(DEFAULT_JOB_STORE_PATH)
+
+        monkeypatch.setenv("VIBE_CHECK_JOB_STORE", ":memory:")
+        assert isinstance(create_job_store(), InMemoryJobStore)
+
+        monkeypatch.setenv("VIBE_CHECK_JOB_STORE", store_path)
+        assert isinstance(create_job_store(), SQLiteJobStore)
+        assert resolve_job_store_path(":memory:") == ":memory:"
+
+
+class TestDurableQueue:
+    """Test AsyncAnalysisQueue on top of a persistent store."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_resume_after_restart(self, store_path, accept_all_jobs):
+        first = _queue(store_path)
+        running_id = await first.queue_analysis(1, "owner/repo", {"title": "Running"})
+        queued_id = await first.queue_analysis(2, "owner/repo", {"title": "Queued"})
+        running = await first.get_next_job(timeout=1)
+        assert running.job_id == running_id
+        # Simulated crash: the first queue is never stopped and its lease lapses
+
+        second = _queue(store_path)
+        with patch("time.time", return_value=time.time() + LEASE_SECONDS + 1):
+            await second.start()
+        try:
+            assert set(second.active_jobs) == {queued_id, running_id}
+            assert second.job_queue.qsize() == 2
+            assert second.get_job_status(running_id)["status"] == "queued"
+            assert second.get_job_status(running_id)["progress"] == 0
+        finally:
+            await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_leave_memory(self, store_path, accept_all_jobs):
+        queue = _queue(store_path)
+        done_id = await queue.queue_analysis(1, "owner/repo", {"title": "Done"})
+        failed_id = await queue.queue_analysis(2, "owner/repo", {"title": "Failed"})
+        await queue.get_next_job(timeout=1)
+        await queue.get_next_job(timeout=1)
+
+        await queue.complete_job(done_id, {"summary": "ok"})
+        await queue.fail_job(failed_id, "boom")
+
+        assert queue.active_jobs == {}
+
+        restarted = _queue(store_path)
+        status = restarted.get_job_status(done_id)
+        assert status["status"] == "completed"
+        assert status["result"] == {"summary": "ok"}
+        assert restarted.get_result(done_id) == {"summary": "ok"}
+        assert restarted.get_job_status(failed_id)["error_message"] == "boom"
+        assert restarted.active_jobs == {}
+
+    @pytest.mark.asyncio
+    async def test_busy_store_does_not_block_event_loop(
+        self, store_path, accept_all_jobs
+    ):
+        queue = _queue(store_path)
+        other_process = sqlite3.connect(store_path)
+        other_process.execute("BEGIN IMMEDIATE")
+
+        queued = asyncio.create_task(
+            queue.queue_analysis(1, "owner/repo", {"title": "Busy"})
+        )
+        ticks = 0
+        while ticks < 5:
+            await asyncio.sleep(0.02)
+            ticks += 1
+        assert not queued.done()
+
+        other_process.commit()
+        job_id = await asyncio.wait_for(queued, timeout=5)
+        other_process.close()
+
+        assert queue.job_store.get_job(job_id)["status"] == "queued"
+
+
+class TestJobLeases:
+    """Test that server processes sharing a store only resume abandoned jobs."""
+
+    @pytest.mark.asyncio
+    async def test_live_owner_keeps_its_jobs(self, store_path, accept_all_jobs):
+        first = _queue(store_path)
+        await first.start()
+        job_id = await first.queue_analysis(1, "owner/repo", {"title": "Live"})
+
+        second = _queue(store_path)
+        await second.start()
+        try:
+            assert second.active_jobs == {}
+            assert SQLiteJobStore(store_path).get_job(job_id)["owner"] == first.owner
+        finally:
+            await second.stop()
+            await first.stop()
+
+    @pytest.mark.asyncio
+    async def test_stopped_queue_releases_jobs(self, store_path, accept_all_jobs):
+        first = _queue(store_path)
+        await first.start()
+        job_id = await first.queue_analysis(1, "owner/repo", {"title": "Handoff"})
+        await first.stop()
+
+        second = _queue(store_path)
+        await second.start()
+        try:
+            assert set(second.active_jobs) == {job_id}
+            assert SQLiteJobStore(store_path).get_job(job_id)["owner"] == second.owner
+        finally:
+            await second.stop()
+
+    @pytest.mark.parametrize("store_factory", [InMemoryJobStore, "sqlite"])
+    def test_claims_only_dead_or_expired_owners(self, store_factory, store_path):
+        store = (
+            SQLiteJobStore(store_path) if store_factory == "sqlite" else store_factory()
+        )
+        now = time.time()
+        host = socket.gethostname()
+        owners = {
+            "live": (f"{host}:{os.getpid()}:live", now),
+            "dead": (f"{host}:{_dead_pid()}:dead", now),
+            "expired": (f"{host}:{os.getpid()}:old", now - LEASE_SECONDS - 1),
+            "remote": ("other-host:1:remote", now),
+            "unowned": (None, None),
+        }
+        for job_id, (owner, heartbeat_at) in owners.items():
+            job = AnalysisJob(job_id, 1, "owner/repo", {"title": job_id})
+            job.owner, job.heartbeat_at = owner, heartbeat_at
+            store.record_job(job)
+
+        claimed = store.claim_unfinished("me:1:new", LEASE_SECONDS)
+
+        assert {r["job_id"] for r in claimed} == {"dead", "expired", "unowned"}
+        assert all(r["owner"] == "me:1:new" for r in claimed)
+        assert store.claim_unfinished("me:2:other", LEASE_SECONDS) == []
+        assert store.get_job("live")["owner"] == owners["live"][0]
+
+    def test_heartbeat_and_release(self, store_path):
+        store = SQLiteJobStore(store_path)
+        job = AnalysisJob("job-1", 1, "owner/repo", {"title": "PR"})
+        job.owner, job.heartbeat_at = "me:1:a", time.time() - LEASE_SECONDS - 1
+        store.record_job(job)
+
+        assert store.heartbeat("me:1:a") == 1
+        assert store.claim_unfinished("other:2:b", LEASE_SECONDS) == []
+
+        assert store.release("me:1:a") == 1
+        assert [r["job_id"] for r in store.claim_unfinished("other:2:b", 1)] == [
+            "job-1"
+        ]
+
+    def test_store_created_before_leases_is_migrated(self, store_path):
+        conn = sqlite3.connect(store_path)
+        conn.execute(
+            "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, pr_number INTEGER NOT NULL, "
+            "repository TEXT NOT NULL, pr_data TEXT NOT NULL, status TEXT NOT NULL, "
+            "progress INTEGER NOT NULL, worker_id TEXT, queued_at REAL NOT NULL, "
+            "started_at REAL, completed_at REAL, estimated_completion REAL, "
+            "error_message TEXT, created_by TEXT, priority INTEGER NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO jobs (job_id, pr_number, repository, pr_data, status, "
+            "progress, queued_at, priority) VALUES ('old', 1, 'o/r', '{}', "
+            "'queued', 0, 0, 1)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = SQLiteJobStore(store_path)
+
+        assert [r["job_id"] for r in store.claim_unfinished("me:1:a", 60)] == ["old"]
@@ -0,0 +1,182 @@
+"""
+Tests for the Async Analysis Priority Scheduler
+
+Covers the heap-based job queue behind AsyncAnalysisQueue:
+- Priority ordering and aging
+- Per-repository round-robin fairness
+- Deduplication of queued jobs for the same PR head
+- Queue depth and wait-time reporting
+"""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+pytestmark = pytest.mark.usefixtures("mock_async_analysis_environment")
+
+from vibe_check.tools.async_analysis.config import AsyncAnalysisConfig
+from vibe_check.tools.async_analysis.queue_manager import (
+    AnalysisJob,
+    AsyncAnalysisQueue,
+)
+from vibe_check.tools.async_analysis.scheduler import PriorityJobQueue
+
+
+def _job(job_id, repository="owner/repo", pr_number=None, priority=1, age=0.0):
+    return AnalysisJob(
+        job_id=job_id,
+        pr_number=pr_number if pr_number is not None else hash(job_id) % 10_000,
+        repository=repository,
+        pr_data={"title": job_id},
+        priority=priority,
+        queued_at=time.time() - age,
+    )
+
+
+def _drain(queue):
+    return [queue.get_nowait().job_id for _ in range(queue.qsize())]
+
+
+class TestPriorityJobQueue:
+    """Test scheduling order of the priority queue."""
+
+    def test_lower_priority_value_served_first(self):
+        queue = PriorityJobQueue()
+        queue.put_nowait(_job("low", priority=3))
+        queue.put_nowait(_job("high", priority=0))
+        queue.put_nowait(_job("normal", priority=1))
+
+        assert _drain(queue) == ["high", "normal", "low"]
+
+    def test_fifo_within_same_priority(self):
+        queue = PriorityJobQueue()
+        for index in range(3):
+            queue.put_nowait(_job(f"job-{index}", age=10 - index))
+
+        assert _drain(queue) == ["job-0", "job-1", "job-2"]
+
+    def test_aging_prevents_starvation(self):
+        queue = PriorityJobQueue(aging_seconds=60)
+        queue.put_nowait(_job("old-low", priority=3, age=300))
+        queue.put_nowait(_job("fresh-high", priority=0))
+
+        assert _drain(queue) == ["old-low", "fresh-high"]
+
+    def test_repositories_served_round_robin(self):
+        queue = PriorityJobQueue()
+        for index in range(4):
+            queue.put_nowait(_job(f"mono-{index}", "org/monorepo", age=20 - index))
+        queue.put_nowait(_job("small-0", "org/small"))
+        queue.put_nowait(_job("small-1", "org/small"))
+
+        assert _drain(queue) == [
+            "mono-0",
+            "small-0",
+            "mono-1",
+            "small-1",
+            "mono-2",
+            "mono-3",
+        ]
+
+    def test_priority_beats_fairness(self):
+        queue = PriorityJobQueue()
+        queue.put_nowait(_job("mono-urgent", "org/monorepo", priority=0))
+        queue.put_nowait(_job("mono-urgent-2", "org/monorepo", priority=0))
+        queue.put_nowait(_job("small", "org/small", priority=2))
+
+        assert _drain(queue) == ["mono-urgent", "mono-urgent-2", "small"]
+
+    def test_duplicate_and_capacity_rejected(self):
+        queue = PriorityJobQueue(maxsize=2)
+        queue.put_nowait(_job("first", pr_number=1))
+
+        with pytest.raises(ValueError):
+            queue.put_nowait(_job("again", pr_number=1))
+
+        queue.put_nowait(_job("second", pr_number=2))
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(_job("third", pr_number=3))
+
+    def test_different_head_sha_is_not_a_duplicate(self):
+        queue = PriorityJobQueue()
+        first = _job("first", pr_number=1)
+        first.pr_data["head_sha"] = "abc"
+        second = _job("second", pr_number=1)
+        second.pr_data["head"] = {"sha": "def"}
+
+        queue.put_nowait(first)
+        assert queue.find_duplicate(second) is None
+        queue.put_nowait(second)
+        assert queue.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_put(self):
+        queue = PriorityJobQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+
+        queue.put_nowait(_job("late"))
+
+        job = await asyncio.wait_for(getter, timeout=1)
+        assert job.job_id == "late"
+
+    def test_depth_and_wait_time_reporting(self):
+        queue = PriorityJobQueue()
+        queue.put_nowait(_job("a", priority=0, age=4))
+        queue.put_nowait(_job("b", priority=2, age=2))
+        queue.put_nowait(_job("c", "other/repo", priority=2, age=1))
+
+        assert queue.depth_by_priority() == {"0": 1, "2": 2}
+        assert queue.depth_by_repository() == {"owner/repo": 2, "other/repo": 1}
+
+        queue.get_nowait()
+        stats = queue.wait_time_stats()
+        assert stats["samples"] == 1
+        assert stats["p50_seconds"] == pytest.approx(4, abs=0.5)
+        assert stats["oldest_queued_seconds"] == pytest.approx(2, abs=0.5)
+
+
+class TestAsyncAnalysisQueueScheduling:
+    """Test scheduling features through AsyncAnalysisQueue."""
+
+    @pytest.fixture
+    def queue(self):
+        with patch(
+            "vibe_check.tools.async_analysis.resource_monitor.get_global_resource_monitor"
+        ) as mock_monitor:
+            mock_monitor.return_value.should_accept_new_job.return_value = (True, "")
+            yield AsyncAnalysisQueue(AsyncAnalysisConfig(max_queue_size=5))
+
+    @pytest.mark.asyncio
+    async def test_duplicate_request_returns_queued_job(self, queue):
+        pr_data = {"title": "Big PR", "head_sha": "abc123"}
+        first = await queue.queue_analysis(7, "owner/repo", pr_data, priority=2)
+        second = await queue.queue_analysis(7, "owner/repo", pr_data, priority=0)
+
+        assert second == first
+        assert queue.job_queue.qsize() == 1
+        assert queue.active_jobs[first].priority == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_raises_instead_of_blocking(self, queue):
+        for pr_number in range(5):
+            await queue.queue_analysis(pr_number, "owner/repo", {"title": "PR"})
+
+        with pytest.raises(asyncio.QueueFull):
+            await asyncio.wait_for(
+                queue.queue_analysis(99, "owner/repo", {"title": "PR"}), timeout=1
+            )
+
+    @pytest.mark.asyncio
+    async def test_queue_status_reports_bands_and_wait_times(self, queue):
+        await queue.queue_analysis(1, "owner/repo", {"title": "PR"}, priority=0)
+        await queue.queue_analysis(2, "owner/repo", {"title": "PR"}, priority=1)
+        await queue.get_next_job(timeout=1)
+
+        status = queue.get_queue_status()
+
+        assert status["queue_depth_by_priority"] == {"1": 1}
+        assert status["wait_time"]["samples"] == 1
+        assert "p90_seconds" in status["wait_time"]
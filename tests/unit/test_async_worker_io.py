@@ -0,0 +1,161 @@
+"""
+Tests for Non-Blocking Async Worker I/O
+
+Covers the async analysis worker pipeline:
+- PR file fetching via PyGithub (single pass over the paginated file list)
+- Blocking GitHub calls running in the shared I/O pool, off the event loop
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+pytestmark = pytest.mark.usefixtures("mock_async_analysis_environment")
+
+from vibe_check.tools.async_analysis.config import AsyncAnalysisConfig
+from vibe_check.tools.async_analysis.queue_manager import (
+    AnalysisJob,
+    AsyncAnalysisQueue,
+)
+from vibe_check.tools.async_analysis.worker import (
+    AsyncAnalysisWorker,
+    shutdown_io_executor,
+)
+from vibe_check.tools.pr_review.chunked_analyzer import ChunkedAnalysisResult
+from vibe_check.tools.shared.github_abstraction import PyGitHubImplementation
+from vibe_check.tools.shared.github_client_manager import GitHubClientManager
+
+
+@pytest.fixture(autouse=True)
+def fresh_io_executor():
+    shutdown_io_executor()
+    yield
+    shutdown_io_executor()
+
+
+def _pygithub_ops(client):
+    manager = GitHubClientManager(
+        client_factory=lambda token, pool_size: client,
+        token_provider=lambda: "token",
+    )
+    ops = PyGitHubImplementation()
+    ops.available = True
+    ops.get_client_manager = lambda: manager
+    return ops
+
+
+class TestPyGitHubPullRequestFiles:
+    """Test fetching PR files with PyGithub."""
+
+    def test_files_include_patches(self):
+        github_file = SimpleNamespace(
+            filename="src/app.py",
+            status="modified",
+            additions=3,
+            deletions=1,
+            changes=4,
+            patch="@@ -1 +1 @@",
+        )
+        binary_file = SimpleNamespace(
+            filename="logo.png",
+            status="added",
+            additions=0,
+            deletions=0,
+            changes=0,
+            patch=None,
+        )
+        client = Mock()
+        pr = client.get_repo.return_value.get_pull.return_value
+        pr.get_files.return_value = iter([github_file, binary_file])
+
+        ops = _pygithub_ops(client)
+
+        result = ops.get_pull_request_files("owner/repo", 7)
+
+        assert result.success
+        assert result.data == [
+            {
+                "filename": "src/app.py",
+                "status": "modified",
+                "additions": 3,
+                "deletions": 1,
+                "changes": 4,
+                "patch": "@@ -1 +1 @@",
+            },
+            {
+                "filename": "logo.png",
+                "status": "added",
+                "additions": 0,
+                "deletions": 0,
+                "changes": 0,
+                "patch": "",
+            },
+        ]
+        client.get_repo.assert_called_once_with("owner/repo")
+        client.get_repo.return_value.get_pull.assert_called_once_with(7)
+        pr.get_files.assert_called_once()
+        assert ops.get_client_manager().get_stats()["repo_misses"] == 1
+
+    def test_api_errors_are_reported(self):
+        client = Mock()
+        client.get_repo.side_effect = RuntimeError("rate limited")
+
+        ops = _pygithub_ops(client)
+
+        result = ops.get_pull_request_files("owner/repo", 7)
+
+        assert not result.success
+        assert "rate limited" in result.error
+
+
+class TestWorkerBlockingIO:
+    """Test that workers overlap on blocking GitHub I/O."""
+
+    @pytest.mark.asyncio
+    async def test_file_fetches_overlap_and_keep_loop_responsive(self):
+        config = AsyncAnalysisConfig(github_io_threads=2)
+        queue = AsyncAnalysisQueue(config)
+        workers = [AsyncAnalysisWorker(queue, f"w{i}", config) for i in range(2)]
+
+        def slow_fetch(repository, pr_number):
+            time.sleep(0.3)  # blocking HTTP request
+            return Mock(success=True, data=[{"filename": "a.py", "patch": "+ x"}])
+
+        github_ops = Mock()
+        github_ops.get_pull_request_files.side_effect = slow_fetch
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        with patch(
+            "vibe_check.tools.shared.github_abstraction.get_default_github_operations",
+            return_value=github_ops,
+        ):
+            for worker in workers:
+                worker._analyze_large_pr = AsyncMock(
+                    return_value={"chunked_result": ChunkedAnalysisResult(status="ok")}
+                )
+
+            beat = asyncio.create_task(heartbeat())
+            start = time.monotonic()
+            results = await asyncio.gather(
+                *(
+                    worker._process_job(
+                        AnalysisJob(f"job-{i}", i, "owner/repo", {"title": "PR"})
+                    )
+                    for i, worker in enumerate(workers)
+                )
+            )
+            elapsed = time.monotonic() - start
+            beat.cancel()
+
+        assert all(result.success for result in results)
+        assert elapsed < 0.55  # both fetches ran concurrently, not 0.6s+
+        assert ticks >= 10  # the event loop kept running during the fetches
@@ -0,0 +1,154 @@
+"""
+Tests for the Persistent Chunk Result Cache
+
+Covers caching of per-chunk Claude analysis results:
+- Storage, expiry and LRU eviction
+- Persistence across cache instances
+- Re-reviews only sending changed chunks to Claude
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from vibe_check.tools.pr_review.chunk_cache import (
+    DEFAULT_CHUNK_CACHE_PATH,
+    ChunkResultCache,
+    resolve_chunk_cache_path,
+)
+from vibe_check.tools.pr_review.chunked_analyzer import ChunkedAnalyzer
+
+CLAUDE_PATCH_TARGET = (
+    "src.vibe_check.tools.shared.claude_integration."
+    "analyze_content_async_with_circuit_breaker"
+)
+
+
+class TestChunkResultCache:
+    """Test the cache backend."""
+
+    def test_key_covers_model_task_and_template_version(self):
+        base = ChunkResultCache.make_key("hash", "sonnet", "pr_review", "1")
+
+        assert base == ChunkResultCache.make_key("hash", "sonnet", "pr_review", "1")
+        assert base != ChunkResultCache.make_key("hash", "opus", "pr_review", "1")
+        assert base != ChunkResultCache.make_key("hash", "sonnet", "general", "1")
+        assert base != ChunkResultCache.make_key("hash", "sonnet", "pr_review", "2")
+
+    def test_results_persist_across_instances(self, tmp_path):
+        path = str(tmp_path / "chunks.db")
+        ChunkResultCache(path).put("key", {"chunk_id": 1, "summary": "ok"})
+
+        reopened = ChunkResultCache(path)
+        assert reopened.get("key") == {"chunk_id": 1, "summary": "ok"}
+        assert reopened.get("missing") is None
+        assert reopened.get_stats()["hits"] == 1
+        assert reopened.get_stats()["misses"] == 1
+
+    def test_expired_entries_are_dropped(self):
+        cache = ChunkResultCache(":memory:", ttl_seconds=60)
+        cache.put("key", {"chunk_id": 1})
+
+        with patch("time.time", return_value=time.time() + 120):
+            assert cache.get("key") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_least_recently_used_evicted(self):
+        cache = ChunkResultCache(":memory:", max_entries=2)
+        now = time.time()
+        with patch("time.time", side_effect=[now - 3, now - 2, now - 1, now]):
+            cache.put("a", {"chunk_id": 1})
+            cache.put("b", {"chunk_id": 2})
+            cache.get("a")
+            cache.put("c", {"chunk_id": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"chunk_id": 1}
+        assert cache.get("c") == {"chunk_id": 3}
+
+    def test_path_resolution(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("VIBE_CHECK_CHUNK_CACHE", raising=False)
+        assert resolve_chunk_cache_path() == str(DEFAULT_CHUNK_CACHE_PATH)
+
+        monkeypatch.setenv("VIBE_CHECK_CHUNK_CACHE", str(tmp_path / "env.db"))
+        assert resolve_chunk_cache_path() == str(tmp_path / "env.db")
+        assert resolve_chunk_cache_path("explicit.db") == "explicit.db"
+
+
+class TestChunkedAnalyzerCaching:
+    """Test that re-reviews only analyze changed chunks."""
+
+    PR_DATA = {"title": "Test", "additions": 300, "deletions": 0, "changed_files": 3}
+
+    @staticmethod
+    def _files(*patches):
+        return [
+            {"filename": f"file{i}.py", "changes": 100, "patch": patch}
+            for i, patch in enumerate(patches)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_chunks_skip_claude(self):
+        analyzer = ChunkedAnalyzer(
+            max_lines_per_chunk=100, result_cache=ChunkResultCache(":memory:")
+        )
+
+        with patch(CLAUDE_PATCH_TARGET) as mock_claude:
+            mock_claude.return_value = Mock(success=True, output="**Summary**: Fine")
+            first = await analyzer.analyze_pr_chunked(
+                self.PR_DATA, self._files("+ a", "+ b", "+ c")
+            )
+            assert mock_claude.call_count == 3
+
+            second = await analyzer.analyze_pr_chunked(
+                self.PR_DATA, self._files("+ a", "+ changed", "+ c")
+            )
+
+        assert mock_claude.call_count == 4
+        assert "+ changed" in mock_claude.call_args.kwargs["content"]
+        assert mock_claude.call_args.kwargs["model"] == "sonnet"
+        assert first.cached_chunks == 0
+        assert second.cached_chunks == 2
+        assert second.status == "chunked_analysis_complete"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_hit_when_earlier_chunks_shift(self):
+        analyzer = ChunkedAnalyzer(
+            max_lines_per_chunk=100, result_cache=ChunkResultCache(":memory:")
+        )
+        files = self._files("+ a", "+ b", "+ c")
+        added = {"filename": "added.py", "changes": 100, "patch": "+ new"}
+
+        with patch(CLAUDE_PATCH_TARGET) as mock_claude:
+            mock_claude.return_value = Mock(success=True, output="**Summary**: Fine")
+            await analyzer.analyze_pr_chunked(self.PR_DATA, files)
+            second = await analyzer.analyze_pr_chunked(
+                {**self.PR_DATA, "title": "Edited title"}, [added] + files
+            )
+
+        assert mock_claude.call_count == 4
+        assert "+ new" in mock_claude.call_args.kwargs["content"]
+        assert second.cached_chunks == 3
+        assert [r.chunk_id for r in second.chunk_results] == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_and_other_models_are_not_reused(self):
+        cache = ChunkResultCache(":memory:")
+        files = self._files("+ a")
+
+        with patch(CLAUDE_PATCH_TARGET) as mock_claude:
+            mock_claude.return_value = Mock(success=False, error="Analysis failed")
+            await ChunkedAnalyzer(result_cache=cache).analyze_pr_chunked(
+                self.PR_DATA, files
+            )
+            mock_claude.return_value = Mock(success=True, output="**Summary**: Fine")
+            await ChunkedAnalyzer(result_cache=cache).analyze_pr_chunked(
+                self.PR_DATA, files
+            )
+            result = await ChunkedAnalyzer(
+                model="opus", result_cache=cache
+            ).analyze_pr_chunked(self.PR_DATA, files)
+
+        assert mock_claude.call_count == 3
+        assert result.cached_chunks == 0
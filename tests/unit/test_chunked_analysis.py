@@ -623,5 +623,83 @@ class TestIntegration:
             ]
 
 
+class TestChunkCheckpointing:
+    """Test per-chunk checkpointing and resumption."""
+
+    PR_DATA = {"title": "Test", "additions": 300, "deletions": 0, "changed_files": 3}
+    PR_FILES = [
+        {"filename": f"file{i}.py", "changes": 100, "patch": f"+ change {i}"}
+        for i in range(3)
+    ]
+
+    def setup_method(self):
+        self.analyzer = ChunkedAnalyzer(
+            max_concurrent_chunks=2, max_lines_per_chunk=100
+        )
+
+    @pytest.mark.asyncio
+    async def test_each_chunk_reported_as_it_completes(self):
+        completions = []
+
+        def on_chunk_complete(content_hash, result, completed, total):
+            completions.append((content_hash, result.chunk_id, completed, total))
+
+        with patch(
+            "src.vibe_check.tools.shared.claude_integration.analyze_content_async_with_circuit_breaker"
+        ) as mock_claude:
+            mock_claude.return_value = Mock(success=True, output="**Summary**: Fine")
+            result = await self.analyzer.analyze_pr_chunked(
+                self.PR_DATA, self.PR_FILES, on_chunk_complete=on_chunk_complete
+            )
+
+        assert result.total_chunks == 3
+        assert [c[2] for c in completions] == [1, 2, 3]
+        assert {c[3] for c in completions} == {3}
+        assert len({c[0] for c in completions}) == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_reruns_only_missing_and_failed_chunks(self):
+        checkpoints = {}
+
+        def on_chunk_complete(content_hash, result, completed, total):
+            checkpoints[content_hash] = ChunkAnalysisResult.from_dict(result.to_dict())
+
+        async def fail_second_chunk(content, **kwargs):
+            if "Chunk ID: 2" in content:
+                return Mock(success=False, error="Analysis failed")
+            return Mock(success=True, output="**Summary**: Fine")
+
+        with patch(
+            "src.vibe_check.tools.shared.claude_integration.analyze_content_async_with_circuit_breaker",
+            side_effect=fail_second_chunk,
+        ):
+            first = await self.analyzer.analyze_pr_chunked(
+                self.PR_DATA, self.PR_FILES, on_chunk_complete=on_chunk_complete
+            )
+        assert first.status == "chunked_analysis_partial"
+
+        with patch(
+            "src.vibe_check.tools.shared.claude_integration.analyze_content_async_with_circuit_breaker"
+        ) as mock_claude:
+            mock_claude.return_value = Mock(success=True, output="**Summary**: Fine")
+            retry = await self.analyzer.analyze_pr_chunked(
+                self.PR_DATA, self.PR_FILES, checkpoints=checkpoints
+            )
+
+        assert mock_claude.call_count == 1
+        assert "Chunk ID: 2" in mock_claude.call_args.kwargs["content"]
+        assert retry.status == "chunked_analysis_complete"
+        assert retry.resumed_chunks == 2
+        assert [r.chunk_id for r in retry.chunk_results] == [1, 2, 3]
+
+    def test_content_hash_tracks_chunk_content(self):
+        chunk = FileChunk(1, [{"filename": "a.py", "patch": "+ x"}], 1, 1.0)
+        changed = FileChunk(1, [{"filename": "a.py", "patch": "+ y"}], 1, 1.0)
+
+        content_hash = self.analyzer.chunk_content_hash
+        assert content_hash(chunk) == content_hash(chunk)
+        assert content_hash(chunk) != content_hash(changed)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+Tests for Stdin-Streamed Claude CLI Prompts
+
+Covers passing prompts to the Claude CLI through stdin rather than argv:
+- Prompts far beyond ARG_MAX reach the CLI intact (sync and async)
+- The command line ends with -p and carries no prompt text
+"""
+
+import json
+import sys
+
+import pytest
+
+from vibe_check.tools.shared.claude_integration import ClaudeCliExecutor
+
+FAKE_CLI = """#!{python}
+import json, sys
+prompt = sys.stdin.read()
+print(json.dumps({{"argv": sys.argv[1:], "prompt_length": len(prompt),
+                  "prompt_tail": prompt[-20:]}}))
+"""
+
+# Far beyond the ~128KB single-argument limit on Linux
+LARGE_PROMPT = "x" * 2_000_000 + "END OF PROMPT"
+
+
+@pytest.fixture
+def executor(tmp_path):
+    cli = tmp_path / "claude"
+    cli.write_text(FAKE_CLI.format(python=sys.executable))
+    cli.chmod(0o755)
+
+    executor = ClaudeCliExecutor(timeout_seconds=30)
+    executor.claude_cli_path = str(cli)
+    return executor
+
+
+def _received(result):
+    assert result.success, result.error
+    return json.loads(result.output)
+
+
+class TestStdinPrompts:
+    """Test that prompts reach the CLI via stdin."""
+
+    def test_sync_streams_large_prompt(self, executor):
+        received = _received(executor.execute_sync(LARGE_PROMPT, "general"))
+
+        assert received["prompt_length"] == len(LARGE_PROMPT)
+        assert received["prompt_tail"].endswith("END OF PROMPT")
+        assert received["argv"][-1] == "-p"
+        assert all(len(arg) < 10_000 for arg in received["argv"])
+
+    @pytest.mark.asyncio
+    async def test_async_streams_large_prompt(self, executor):
+        received = _received(await executor.execute_async(LARGE_PROMPT, "general"))
+
+        assert received["prompt_length"] == len(LARGE_PROMPT)
+        assert received["argv"][-1] == "-p"
+
+    def test_system_prompt_travels_with_the_prompt(self, executor):
+        command, stdin_prompt = executor._get_claude_command(
+            "Review this", "code_analysis", "opus"
+        )
+
+        assert command[0] == executor.claude_cli_path
+        assert command[-1] == "-p"
+        assert "--model" in command and "opus" in command
+        assert stdin_prompt.startswith("System: ")
+        assert stdin_prompt.endswith("User: Review this")
@@ -0,0 +1,157 @@
+"""
+Tests for the Warm Claude CLI Executor Pool
+
+Covers reuse of Claude CLI executors across analyses:
+- Pooling by (timeout, model) and re-resolving a stale CLI path
+- Static prompt material cached and invalidated by file mtime
+- analyze_content_async_with_circuit_breaker reusing one executor across calls
+"""
+
+import os
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from vibe_check.tools.shared import claude_integration
+from vibe_check.tools.shared.claude_integration import (
+    ClaudeCliExecutor,
+    ClaudeCliResult,
+    analyze_content_async_with_circuit_breaker,
+    read_text_cached,
+)
+from vibe_check.tools.shared.executor_pool import ClaudeExecutorPool
+
+
+def _executor(timeout_seconds, cli_path="/usr/local/bin/claude"):
+    executor = Mock(timeout_seconds=timeout_seconds, claude_cli_path=cli_path)
+    executor._find_claude_cli.return_value = "/opt/claude/bin/claude"
+    return executor
+
+
+class TestClaudeExecutorPool:
+    """Test executor pooling."""
+
+    def test_executors_reused_per_timeout_and_model(self):
+        factory = Mock(side_effect=_executor)
+        pool = ClaudeExecutorPool(executor_factory=factory)
+
+        first = pool.get_executor(60, "sonnet")
+        assert pool.get_executor(60, "sonnet") is first
+        assert pool.get_executor(60, "opus") is not first
+        assert pool.get_executor(120, "sonnet") is not first
+
+        assert factory.call_count == 3
+        stats = pool.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+
+    def test_least_recently_used_executor_evicted(self):
+        pool = ClaudeExecutorPool(executor_factory=_executor, max_executors=2)
+
+        first = pool.get_executor(60)
+        pool.get_executor(90)
+        pool.get_executor(60)
+        pool.get_executor(120)
+
+        assert pool.get_executor(60) is first
+        assert pool.get_stats()["evictions"] == 1
+        assert pool.get_stats()["executors"] == 2
+
+    def test_cli_path_re_resolved_when_environment_changes(self, monkeypatch):
+        pool = ClaudeExecutorPool(executor_factory=_executor)
+        with patch("os.path.exists", return_value=True):
+            executor = pool.get_executor(60)
+            pool.get_executor(60)
+        executor._find_claude_cli.assert_not_called()
+
+        monkeypatch.setenv("CLAUDE_CLI_NAME", "claude-beta")
+        with patch("os.path.exists", return_value=True):
+            assert pool.get_executor(60) is executor
+            pool.get_executor(60)
+
+        executor._find_claude_cli.assert_called_once()
+        assert executor.claude_cli_path == "/opt/claude/bin/claude"
+        assert pool.get_stats()["cli_refreshes"] == 1
+
+    def test_cli_path_re_resolved_when_executable_disappears(self):
+        pool = ClaudeExecutorPool(executor_factory=_executor)
+        executor = pool.get_executor(60)
+
+        with patch("os.path.exists", return_value=False):
+            pool.get_executor(60)
+
+        assert executor.claude_cli_path == "/opt/claude/bin/claude"
+
+    def test_warm_preloads_system_prompts(self):
+        pool = ClaudeExecutorPool(executor_factory=_executor)
+
+        executor = pool.warm(60, "sonnet", task_types=["pr_review", "general"])
+
+        assert pool.get_executor(60, "sonnet") is executor
+        assert executor._get_system_prompt.call_count == 2
+
+
+class TestStaticPromptMaterial:
+    """Test mtime-invalidated caching of prompt material."""
+
+    def test_file_reread_only_when_changed(self, tmp_path):
+        path = tmp_path / "CLAUDE.md"
+        path.write_text("v1")
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert read_text_cached(str(path)) == "v1"
+            assert read_text_cached(str(path)) == "v1"
+        assert mock_open.call_count == 1
+
+        path.write_text("version 2")
+        assert read_text_cached(str(path)) == "version 2"
+
+        path.unlink()
+        assert read_text_cached(str(path)) is None
+
+    def test_system_prompt_rebuilt_when_claude_md_changes(self, tmp_path):
+        claude_md = tmp_path / "CLAUDE.md"
+        claude_md.write_text("Use tabs")
+        executor = ClaudeCliExecutor()
+
+        with patch.object(claude_integration, "_PROJECT_ROOT", str(tmp_path)):
+            with patch.object(
+                executor, "_build_system_prompt", wraps=executor._build_system_prompt
+            ) as mock_build:
+                first = executor._get_system_prompt("pr_review")
+                assert executor._get_system_prompt("pr_review") is first
+                assert mock_build.call_count == 1
+
+                os.utime(claude_md, ns=(0, 0))
+                claude_md.write_text("Use spaces")
+                updated = executor._get_system_prompt("pr_review")
+
+        assert "Use tabs" in first
+        assert "Use spaces" in updated
+        assert mock_build.call_count == 2
+
+
+class TestCircuitBreakerAnalysisReuse:
+    """Test that analyses reuse pooled executors."""
+
+    @pytest.mark.asyncio
+    async def test_one_executor_across_calls(self):
+        executor = Mock(claude_cli_path="claude")
+        executor.execute_async = AsyncMock(
+            return_value=ClaudeCliResult(success=True, output="ok")
+        )
+        factory = Mock(return_value=executor)
+        pool = ClaudeExecutorPool(executor_factory=factory)
+
+        with patch(
+            "vibe_check.tools.shared.executor_pool.get_claude_executor_pool",
+            return_value=pool,
+        ):
+            for _ in range(3):
+                await analyze_content_async_with_circuit_breaker(
+                    "diff", task_type="pr_review", timeout_seconds=45, model="opus"
+                )
+
+        factory.assert_called_once_with(45)
+        assert executor.execute_async.call_count == 3
+        assert executor.execute_async.call_args.kwargs["model"] == "opus"
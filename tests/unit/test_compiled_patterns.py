@@ -0,0 +1,105 @@
+"""
+Unit Tests for the shared Compiled Pattern Set
+
+Tests that pattern data is loaded and compiled once per process:
+- Detector instances share one compiled set
+- Compiled scoring matches the raw-regex algorithm
+- Edits to the pattern file invalidate the cached set
+"""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from vibe_check.core.compiled_patterns import (
+    clear_compiled_pattern_cache,
+    get_compiled_pattern_set,
+)
+from vibe_check.core.educational_content import EducationalContentGenerator
+from vibe_check.core.pattern_detector import PatternDetector
+
+
+def _raw_confidence(text, pattern_config):
+    """Reference implementation of the Phase 0 scoring loop"""
+    text_lower = text.lower()
+    confidence = 0.0
+    for indicator in pattern_config["indicators"]:
+        if re.search(indicator["regex"], text_lower, re.IGNORECASE):
+            confidence += indicator["weight"]
+    for indicator in pattern_config.get("negative_indicators", []):
+        if re.search(indicator["regex"], text_lower, re.IGNORECASE):
+            confidence += indicator["weight"]
+    return max(0.0, min(1.0, confidence))
+
+
+class TestCompiledPatternSet:
+    """Test process-wide compiled pattern sharing"""
+
+    def test_detectors_share_compiled_set(self):
+        first = PatternDetector()
+        second = PatternDetector()
+
+        assert first.compiled_patterns is second.compiled_patterns
+        assert first.compiled_patterns is get_compiled_pattern_set()
+
+    def test_educational_generator_uses_shared_data(self):
+        generator = EducationalContentGenerator()
+
+        assert generator.patterns is get_compiled_pattern_set().raw_data
+
+    def test_compiled_set_is_immutable(self):
+        pattern_set = get_compiled_pattern_set()
+
+        with pytest.raises(TypeError):
+            pattern_set.patterns["new_pattern"] = None  # type: ignore[index]
+
+    def test_compiled_scores_match_raw_algorithm(self):
+        detector = PatternDetector()
+        text = (
+            "We're planning to build a custom HTTP client because the SDK might be "
+            "limiting. Let's add a quick workaround for now and fix it later."
+        )
+
+        for pattern_id, pattern_config in detector.patterns.items():
+            result = detector._detect_single_pattern(text, pattern_config)
+            assert result.confidence == pytest.approx(
+                _raw_confidence(text, pattern_config)
+            ), pattern_id
+
+    def test_pattern_file_change_invalidates_cache(self, tmp_path):
+        pattern_data = {
+            "data_version": "1.0.0",
+            "test_pattern": {
+                "id": "test_pattern",
+                "detection_threshold": 0.5,
+                "indicators": [
+                    {"regex": "alpha", "description": "alpha", "weight": 0.6}
+                ],
+            },
+        }
+        pattern_file = tmp_path / "patterns.json"
+        case_file = tmp_path / "case_studies.json"
+        pattern_file.write_text(json.dumps(pattern_data))
+        case_file.write_text("{}")
+
+        try:
+            first = get_compiled_pattern_set(str(pattern_file), str(case_file))
+            assert get_compiled_pattern_set(str(pattern_file), str(case_file)) is first
+
+            pattern_data["data_version"] = "2.0.0"
+            pattern_file.write_text(json.dumps(pattern_data))
+            stat = pattern_file.stat()
+            os.utime(pattern_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+            second = get_compiled_pattern_set(str(pattern_file), str(case_file))
+            assert second is not first
+            assert second.data_version == "2.0.0"
+        finally:
+            clear_compiled_pattern_cache()
@@ -399,9 +399,10 @@ class TestContextInjectionIntegration(unittest.TestCase):
         mock_subprocess.assert_called_once()
         call_args = mock_subprocess.call_args
         command_args = call_args[0][0]  # First positional arg is the command list
+        self.assertEqual(command_args[-1], "-p")
 
-        # The prompt should be the last argument and contain context
-        enhanced_prompt = command_args[-1]
+        # The prompt is streamed through stdin and should contain context
+        enhanced_prompt = call_args.kwargs["input"]
         self.assertIn("Test Project", enhanced_prompt)
         self.assertIn("React hooks", enhanced_prompt)
         self.assertIn("## Library Context", enhanced_prompt)
@@ -301,7 +301,7 @@ class TestClaudeCliExecutor:
         assert args[0] == "/usr/local/bin/claude"
         assert "--model" in args
         assert "sonnet" in args
-        assert "-p" in args
-        prompt_arg = next((arg for arg in args if "test prompt" in arg), None)
-        assert prompt_arg is not None
-        assert "test prompt" in prompt_arg
+        assert args[-1] == "-p"
+        assert not any("test prompt" in arg for arg in args)
+        stdin_prompt = mock_process.communicate.call_args.kwargs["input"]
+        assert b"test prompt" in stdin_prompt
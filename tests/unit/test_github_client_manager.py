@@ -0,0 +1,177 @@
+"""
+Tests for the Pooled GitHub Client Manager
+
+Covers reuse of one authenticated GitHub client per process:
+- Token resolved once and refreshed on 401 or environment change
+- Repository objects cached for a TTL
+- Conditional (ETag) revalidation of issues, PRs and raw diffs
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from vibe_check.tools.shared.github_client_manager import GitHubClientManager
+
+
+class _AuthError(Exception):
+    status = 401
+
+
+def _response(status_code, text="", etag=None):
+    return SimpleNamespace(
+        status_code=status_code,
+        text=text,
+        headers={"ETag": etag} if etag else {},
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_token_env(monkeypatch):
+    monkeypatch.delenv("GITHUB_PERSONAL_ACCESS_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+
+def _manager(**kwargs):
+    kwargs.setdefault("token_provider", Mock(return_value="token-1"))
+    kwargs.setdefault("client_factory", Mock(side_effect=lambda token, size: Mock()))
+    return GitHubClientManager(**kwargs)
+
+
+class TestTokenAndClient:
+    """Test token caching and client reuse."""
+
+    def test_token_and_client_resolved_once(self):
+        manager = _manager()
+
+        client = manager.get_client()
+        assert manager.get_client() is client
+        assert manager.get_token() == "token-1"
+
+        manager._token_provider.assert_called_once()
+        manager._client_factory.assert_called_once_with("token-1", manager.pool_size)
+
+    def test_token_re_resolved_when_environment_changes(self, monkeypatch):
+        manager = _manager()
+        manager.get_token()
+
+        monkeypatch.setenv("GITHUB_TOKEN", "token-2")
+        manager._token_provider.return_value = "token-2"
+
+        assert manager.get_token() == "token-2"
+        assert manager._token_provider.call_count == 2
+
+    def test_auth_error_refreshes_token_and_retries_once(self):
+        manager = _manager(token_provider=Mock(side_effect=["stale", "fresh"]))
+        operation = Mock(side_effect=[_AuthError(), "user"])
+
+        assert manager.call_with_auth_retry(operation) == "user"
+
+        assert manager.get_token() == "fresh"
+        assert manager._client_factory.call_count == 2
+        assert manager.get_stats()["token_refreshes"] == 1
+
+    def test_other_errors_are_not_retried(self):
+        manager = _manager()
+        operation = Mock(side_effect=RuntimeError("rate limited"))
+
+        with pytest.raises(RuntimeError):
+            manager.call_with_auth_retry(operation)
+        operation.assert_called_once()
+
+    def test_no_client_without_token(self):
+        manager = _manager(token_provider=Mock(return_value=None))
+
+        assert manager.get_client() is None
+        manager._client_factory.assert_not_called()
+
+
+class TestRepoAndObjectCaching:
+    """Test repository TTL caching and conditional revalidation."""
+
+    def test_repo_cached_within_ttl(self):
+        manager = _manager()
+        client = manager.get_client()
+
+        assert manager.get_repo("owner/repo") is manager.get_repo("owner/repo")
+        client.get_repo.assert_called_once_with("owner/repo")
+
+        manager.repo_ttl_seconds = 0
+        manager.get_repo("owner/repo")
+        assert client.get_repo.call_count == 2
+
+    def test_repo_cache_bounded_by_least_recent_use(self):
+        manager = _manager(max_cached_objects=2)
+        client = manager.get_client()
+
+        manager.get_repo("owner/a")
+        manager.get_repo("owner/b")
+        manager.get_repo("owner/a")
+        manager.get_repo("owner/c")
+
+        assert manager.get_stats()["cached_repos"] == 2
+        manager.get_repo("owner/a")
+        assert client.get_repo.call_count == 3
+        manager.get_repo("owner/b")
+        assert client.get_repo.call_count == 4
+
+    def test_repeat_issue_fetch_is_conditional(self):
+        manager = _manager()
+        repo = manager.get_client().get_repo.return_value
+        issue = repo.get_issue.return_value
+        issue.update.side_effect = [False, True]
+
+        assert manager.get_issue("owner/repo", 5) is issue
+        assert manager.get_issue("owner/repo", 5) is issue
+        assert manager.get_issue("owner/repo", 5) is issue
+
+        repo.get_issue.assert_called_once_with(5)
+        assert issue.update.call_count == 2
+        stats = manager.get_stats()
+        assert stats["not_modified"] == 1
+        assert stats["full_fetches"] == 2
+
+    def test_pulls_and_issues_cached_separately(self):
+        manager = _manager()
+        repo = manager.get_client().get_repo.return_value
+
+        manager.get_issue("owner/repo", 5)
+        manager.get_pull("owner/repo", 5)
+
+        repo.get_issue.assert_called_once_with(5)
+        repo.get_pull.assert_called_once_with(5)
+
+
+class TestConditionalRawFetch:
+    """Test ETag revalidation of raw API responses."""
+
+    def test_not_modified_returns_cached_body(self):
+        session = Mock()
+        session.get.side_effect = [
+            _response(200, "diff --git a b", etag='"abc"'),
+            _response(304),
+        ]
+        manager = _manager(session_factory=lambda: session)
+
+        first = manager.fetch_text("https://api/pulls/1", accept="diff")
+        second = manager.fetch_text("https://api/pulls/1", accept="diff")
+
+        assert first == second == (200, "diff --git a b")
+        assert session.get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert manager.get_stats()["not_modified"] == 1
+
+    def test_unauthorized_refreshes_token(self):
+        session = Mock()
+        session.get.side_effect = [
+            _response(401, "Bad credentials"),
+            _response(200, "ok"),
+        ]
+        manager = _manager(
+            token_provider=Mock(side_effect=["stale", "fresh"]),
+            session_factory=lambda: session,
+        )
+
+        assert manager.fetch_text("https://api/pulls/1", accept="diff") == (200, "ok")
+        headers = session.get.call_args.kwargs["headers"]
+        assert headers["Authorization"] == "token fresh"
@@ -9,6 +9,7 @@ import pytest
 from unittest.mock import patch, mock_open
 import json
 
+from vibe_check.core.compiled_patterns import clear_compiled_pattern_cache
 from vibe_check.core.integration_pattern_detector import (
     IntegrationPatternDetector,
     TechnologyDetection,
@@ -140,9 +141,13 @@ def mock_anti_patterns_file():
             return mock_open(read_data=json.dumps(case_study_data))(*args, **kwargs)
         raise FileNotFoundError(path_str)
 
+    # The compiled pattern set is shared per process; make sure the mocked
+    # files are actually read and don't leak into other tests
+    clear_compiled_pattern_cache()
     with patch("builtins.open", side_effect=mock_open_side_effect):
         with patch("pathlib.Path.exists", return_value=True):
             yield
+    clear_compiled_pattern_cache()
 
 
 class TestRealWorldScenarios:
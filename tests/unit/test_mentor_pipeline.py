@@ -0,0 +1,151 @@
+"""
+Tests for the Mentor Request Stage Pipeline
+
+Covers the concurrent mentor analysis path:
+- PR diff fetching and project context loading overlap
+- Blocking GitHub calls stay off the event loop
+- Per-stage timings reported in the mentor response
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from vibe_check.server.tools.mentor import analysis
+from vibe_check.server.tools.mentor.core import vibe_check_mentor
+from vibe_check.server.tools.mentor.pipeline import StageTimer
+
+QUERY = "Review PR #42: should we build our own HTTP client instead of using requests?"
+STAGE_DELAY = 0.2
+
+
+def _slow_github_ops():
+    def get_pull_request_diff(repository, pr_number):
+        time.sleep(STAGE_DELAY)
+        return SimpleNamespace(success=True, data="diff --git a/x.py b/x.py\n+ x")
+
+    return Mock(get_pull_request_diff=Mock(side_effect=get_pull_request_diff))
+
+
+def _slow_project_context():
+    time.sleep(STAGE_DELAY)
+    return None
+
+
+class TestStageTimer:
+    """Test stage timing helpers."""
+
+    @pytest.mark.asyncio
+    async def test_records_each_stage(self):
+        timer = StageTimer()
+
+        with timer.stage("sync"):
+            pass
+        assert await timer.run("thread", lambda x: x * 2, 21) == 42
+        assert await timer.timed("coroutine", asyncio.sleep(0, result="ok")) == "ok"
+
+        summary = timer.summary()
+        assert set(summary) == {"sync", "thread", "coroutine", "total"}
+        assert all(value >= 0 for value in summary.values())
+
+    @pytest.mark.asyncio
+    async def test_failed_stage_still_timed(self):
+        timer = StageTimer()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await timer.run("failing", fail)
+
+        assert "failing" in timer.timings
+
+
+class TestConcurrentAnalysis:
+    """Test that independent analysis stages overlap."""
+
+    @pytest.mark.asyncio
+    async def test_diff_and_project_context_run_concurrently(self):
+        timer = StageTimer()
+        with patch.object(
+            analysis, "get_default_github_operations", return_value=_slow_github_ops()
+        ), patch.object(
+            analysis, "_load_project_context", side_effect=_slow_project_context
+        ):
+            start = time.perf_counter()
+            result = await analysis.analyze_query_and_context(
+                QUERY, None, "planning", "standard", 0.7, timer=timer
+            )
+            elapsed = time.perf_counter() - start
+
+        assert "vibe_level" in result
+        assert timer.timings["pr_diff"] >= STAGE_DELAY * 1000
+        assert timer.timings["project_context"] >= STAGE_DELAY * 1000
+        # Run in sequence, the request would take at least the sum of its stages
+        assert elapsed * 1000 < sum(timer.timings.values()) - STAGE_DELAY * 500
+        assert {"business_context", "pattern_detection"} <= set(timer.timings)
+
+    @pytest.mark.asyncio
+    async def test_diff_fetch_does_not_block_event_loop(self):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        with patch.object(
+            analysis, "get_default_github_operations", return_value=_slow_github_ops()
+        ):
+            task = asyncio.create_task(ticker())
+            diff = await analysis.fetch_pr_diff(QUERY, None)
+            task.cancel()
+
+        assert "diff --git" in diff
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_large_diff_truncated_to_default_cap(self, monkeypatch):
+        monkeypatch.delenv("VIBE_CHECK_MAX_DIFF_SIZE", raising=False)
+        huge = "diff --git a/x.py b/x.py\n" + "+ x\n" * analysis.DEFAULT_MAX_DIFF_SIZE
+        github_ops = Mock(
+            get_pull_request_diff=Mock(
+                return_value=SimpleNamespace(success=True, data=huge)
+            )
+        )
+
+        with patch.object(
+            analysis, "get_default_github_operations", return_value=github_ops
+        ):
+            diff = await analysis.fetch_pr_diff(QUERY, None)
+
+        assert analysis.DEFAULT_MAX_DIFF_SIZE <= 50000
+        assert "[TRUNCATED: Diff too large" in diff
+        assert len(diff) < analysis.DEFAULT_MAX_DIFF_SIZE + 500
+
+
+class TestMentorStageTimings:
+    """Test that the mentor response reports its stage timings."""
+
+    @pytest.mark.asyncio
+    async def test_response_includes_stage_timings(self):
+        analysis_result = {
+            "vibe_level": "good",
+            "pattern_confidence": 0.0,
+            "detected_patterns": [],
+        }
+        with patch(
+            "vibe_check.server.tools.mentor.core.analyze_query_and_context",
+            new=AsyncMock(return_value=analysis_result),
+        ), patch(
+            "vibe_check.server.tools.mentor.core.generate_response",
+            new=AsyncMock(return_value={"status": "success"}),
+        ):
+            response = await vibe_check_mentor(query="Should I use Redis?")
+
+        timings = response["stage_timings"]
+        assert {"workspace_context", "response_generation", "total"} <= set(timings)
@@ -0,0 +1,216 @@
+"""
+Tests for the Persistent Mentor Response Store
+
+Covers the on-disk backend of the dynamic response cache:
+- Storage, expiry and per-namespace LRU eviction
+- Responses surviving a restart and shared between processes
+- ResponseCache warming its near-duplicate tier from the store
+- Loading only entries within the cache TTL, skipping unreadable ones
+- The mentor running cache lookups off the event loop
+"""
+
+import multiprocessing
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from vibe_check.mentor.mcp_sampling import ResponseCache
+from vibe_check.mentor.models.persona import PersonaData
+from vibe_check.mentor.response_store import (
+    DEFAULT_MENTOR_CACHE_PATH,
+    PersistentResponseStore,
+    resolve_mentor_cache_path,
+)
+from vibe_check.strategies.response_strategies import TechnicalContext
+from vibe_check.tools.vibe_mentor_enhanced import EnhancedVibeMentorEngine
+
+
+def _write_entries(path, worker, count):
+    store = PersistentResponseStore(path)
+    for i in range(count):
+        store.put("ns", f"{worker}-{i}", f'{{"worker": {worker}}}')
+
+
+class TestPersistentResponseStore:
+    """Test the store backend."""
+
+    def test_values_persist_across_instances(self, tmp_path):
+        path = str(tmp_path / "mentor.db")
+        PersistentResponseStore(path).put("ns", "key", '"value"')
+
+        reopened = PersistentResponseStore(path)
+        assert reopened.get("ns", "key")[0] == '"value"'
+        assert reopened.get("other", "key") is None
+        assert reopened.get_stats()["hits"] == 1
+
+    def test_expired_entries_are_dropped(self):
+        store = PersistentResponseStore(":memory:", ttl_seconds=60)
+        store.put("ns", "key", "1")
+
+        with patch("time.time", return_value=time.time() + 120):
+            assert store.get("ns", "key") is None
+            assert store.recent("ns", 10) == []
+        assert store.get_stats()["size"] == 0
+
+    def test_least_recently_used_evicted_per_namespace(self):
+        store = PersistentResponseStore(":memory:", max_entries=2)
+        now = time.time()
+        with patch("time.time", side_effect=[now - 4, now - 3, now - 2, now - 1, now]):
+            store.put("ns", "a", "1")
+            store.put("ns", "b", "2")
+            store.put("other", "c", "3")
+            store.get("ns", "a")
+            store.put("ns", "d", "4")
+
+        assert store.get("ns", "b") is None
+        assert store.get("ns", "a") is not None
+        assert store.get("other", "c") is not None
+
+    def test_concurrent_writers_from_separate_processes(self, tmp_path):
+        path = str(tmp_path / "mentor.db")
+        PersistentResponseStore(path)
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_write_entries, args=(path, worker, 25))
+            for worker in range(3)
+        ]
+        for process in workers:
+            process.start()
+        for process in workers:
+            process.join(timeout=60)
+
+        assert [process.exitcode for process in workers] == [0, 0, 0]
+        assert PersistentResponseStore(path).get_stats()["size"] == 75
+
+    def test_path_resolution(self, monkeypatch):
+        monkeypatch.setenv("VIBE_CHECK_MENTOR_CACHE", "/tmp/custom.db")
+        assert resolve_mentor_cache_path() == "/tmp/custom.db"
+        assert resolve_mentor_cache_path("/explicit.db") == "/explicit.db"
+
+        monkeypatch.delenv("VIBE_CHECK_MENTOR_CACHE")
+        assert resolve_mentor_cache_path() == str(DEFAULT_MENTOR_CACHE_PATH)
+
+
+class TestResponseCacheWithStore:
+    """Test ResponseCache backed by the persistent store."""
+
+    def test_response_survives_restart(self, tmp_path):
+        path = str(tmp_path / "mentor.db")
+        context = {"technologies": ["redis"]}
+        ResponseCache(store=PersistentResponseStore(path)).put(
+            "implementation", "How to cache?", context, {"content": "Use Redis"}
+        )
+
+        restarted = ResponseCache(store=PersistentResponseStore(path))
+
+        cached = restarted.get("implementation", "How to cache?", context)
+        assert cached == {"content": "Use Redis"}
+        assert restarted.get("debugging", "How to cache?", context) is None
+
+    def test_entry_written_by_parallel_server_is_found(self):
+        store = PersistentResponseStore(":memory:")
+        first, second = ResponseCache(store=store), ResponseCache(store=store)
+        second.get("intent", "warm up", {})
+
+        first.put("intent", "shared query", {}, {"content": "shared"})
+
+        assert second.get("intent", "shared query", {}) == {"content": "shared"}
+        assert second.store_hits == 1
+
+    def test_near_duplicate_tier_warmed_from_store(self):
+        store = PersistentResponseStore(":memory:")
+        query = "How should I implement caching for my Django API with Redis?"
+        ResponseCache(store=store).put("implementation", query, {}, {"content": "x"})
+
+        restarted = ResponseCache(store=store)
+
+        assert restarted.get("implementation", query.lower().rstrip("?"), {}) == {
+            "content": "x"
+        }
+        assert restarted.near_duplicate_hits == 1
+
+    def test_stored_ttl_still_applies(self):
+        store = PersistentResponseStore(":memory:")
+        ResponseCache(store=store).put("intent", "query", {}, {"content": "x"})
+
+        restarted = ResponseCache(ttl_seconds=60, store=store)
+        with patch("time.time", return_value=time.time() + 120):
+            assert restarted.get("intent", "query", {}) is None
+
+    def test_store_entries_older_than_cache_ttl_not_loaded(self):
+        store = PersistentResponseStore(":memory:")
+        with patch("time.time", return_value=time.time() - 120):
+            ResponseCache(store=store).put("intent", "query", {}, {"content": "x"})
+        key = ResponseCache().get_cache_key("intent", "query", {})
+
+        restarted = ResponseCache(ttl_seconds=60, store=store)
+
+        assert restarted.get("intent", "other query", {}) is None
+        assert len(restarted.cache) == 0
+        assert restarted.get("intent", "query", {}) is None
+        assert restarted.store_hits == 0
+        # Still valid for readers with the store's own, longer TTL
+        assert store.get(ResponseCache.STORE_NAMESPACE, key) is not None
+
+    def test_unreadable_stored_entry_is_a_miss(self):
+        store = PersistentResponseStore(":memory:")
+        cache = ResponseCache(store=store)
+        cache.get("intent", "warm up", {})
+        key = cache.get_cache_key("intent", "query", {})
+
+        store.put(ResponseCache.STORE_NAMESPACE, key, "not json")
+        assert cache.get("intent", "query", {}) is None
+
+        store.put(ResponseCache.STORE_NAMESPACE, key, '{"query": "query"}')
+        assert cache.get("intent", "query", {}) is None
+        assert cache.store_hits == 0
+
+
+class TestMentorStoreAccess:
+    """Test that the mentor keeps cache and store I/O off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_cache_lookup_runs_in_worker_thread(self):
+        engine = EnhancedVibeMentorEngine(MagicMock(), enable_mcp_sampling=True)
+        if not engine.enable_mcp_sampling:
+            pytest.skip("MCP sampling components unavailable")
+
+        lookup_threads = []
+
+        def get(*args):
+            lookup_threads.append(threading.current_thread())
+            return {"content": "Use a queue", "confidence": 0.9}
+
+        engine.dynamic_cache = MagicMock(get=MagicMock(side_effect=get))
+        persona = PersonaData(
+            id="senior_engineer",
+            name="Senior Engineer",
+            expertise=["Architecture"],
+            background="Background",
+            perspective="Pragmatic",
+            biases=[],
+            communication={"style": "Direct", "tone": "Blunt"},
+        )
+        tech_context = TechnicalContext(
+            technologies=["redis"],
+            frameworks=[],
+            patterns=[],
+            problem_type="architecture",
+            specific_features=[],
+            decision_points=[],
+        )
+
+        result = await engine._try_dynamic_generation(
+            persona,
+            "Should I add a job queue?",
+            tech_context,
+            [],
+            SimpleNamespace(sample=AsyncMock()),
+            force_decision=True,
+        )
+
+        assert result == ("Use a queue", "insight", 0.9)
+        assert lookup_threads and lookup_threads[0] is not threading.main_thread()
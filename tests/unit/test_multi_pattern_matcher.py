@@ -0,0 +1,97 @@
+"""
+Unit Tests for the Multi-Pattern Literal Prefilter
+
+Tests the single-pass indicator prefilter:
+- Required literal extraction from indicator regexes
+- Exact literal scanning (overlapping and prefix literals)
+- Detection results identical to running every indicator regex
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from vibe_check.core.multi_pattern_matcher import (
+    MultiPatternMatcher,
+    required_literals,
+)
+from vibe_check.core.pattern_detector import PatternDetector
+
+
+class TestRequiredLiterals:
+    """Test literal requirement extraction"""
+
+    def test_plain_literal(self):
+        assert required_literals(r"\bworkaround\b") == frozenset({"workaround"})
+
+    def test_alternation_requires_any(self):
+        assert required_literals(r"\b(?:custom|build)\s+client") == frozenset(
+            {"client"}
+        )
+        assert required_literals(r"\b(?:workaround|hack)\b") == frozenset(
+            {"workaround", "hack"}
+        )
+
+    def test_optional_parts_are_not_required(self):
+        assert required_literals(r"(?:quick)?\s*fix") == frozenset({"fix"})
+        assert required_literals(r"(?:foo)?\d+") is None
+
+    def test_literals_are_lowercased(self):
+        assert required_literals(r"\bI'LL\b") == frozenset({"i'll"})
+
+    def test_invalid_regex(self):
+        assert required_literals(r"(unclosed") is None
+
+
+class TestMultiPatternMatcher:
+    """Test the single-pass literal scanner"""
+
+    def test_scan_finds_overlapping_and_prefix_literals(self):
+        matcher = MultiPatternMatcher(
+            [frozenset({"custom", "cust"}), frozenset({"tom", "sdk"}), None]
+        )
+
+        assert matcher.scan("a custom sdk") == frozenset(
+            {"custom", "cust", "tom", "sdk"}
+        )
+        assert matcher.scan("nothing here") == frozenset()
+
+    def test_scan_folds_ignorecase_specials(self):
+        matcher = MultiPatternMatcher([frozenset({"sdk"})])
+
+        # re.IGNORECASE treats LATIN SMALL LETTER LONG S as "s"
+        assert matcher.scan("ſdk") == frozenset({"sdk"})
+
+
+class TestPrefilteredDetection:
+    """Test that the prefilter never changes detection results"""
+
+    @pytest.fixture
+    def detector(self):
+        return PatternDetector()
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "We're planning to build a custom HTTP client since the SDK might be limiting.",
+            "Let's add a quick workaround for now and fix it properly later.",
+            "I'll implement our own enterprise-grade multi-layered architecture.",
+            "We reviewed the official documentation and tested the SDK first.",
+            "Nothing suspicious in this plain sentence about lunch.",
+        ],
+    )
+    def test_results_match_full_regex_scan(self, detector, text):
+        text_lower = text.lower()
+
+        for pattern_id in detector.patterns:
+            compiled = detector.compiled_patterns.patterns[pattern_id]
+            present = detector.compiled_patterns.matcher.scan(text_lower)
+
+            prefiltered = detector._score_pattern(text_lower, compiled, present)
+            full = detector._score_pattern(text_lower, compiled)
+
+            assert prefiltered == full
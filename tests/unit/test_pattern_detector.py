@@ -290,3 +290,66 @@ class TestPatternDetector:
         assert isinstance(results, list)
         # Should complete within reasonable time (allow generous margin for CI)
         assert duration < 30.0, f"Analysis took too long: {duration} seconds"
+
+
+class TestStreamingDetection:
+    """Test chunked (streaming) pattern detection"""
+
+    TEXT = (
+        "We're planning to build a custom HTTP client since the SDK might be "
+        "limiting. I'll implement our own enterprise-grade multi-layered "
+        "architecture and add a quick workaround for now."
+    )
+
+    @pytest.fixture
+    def detector(self):
+        return PatternDetector()
+
+    @staticmethod
+    def _summary(results):
+        return {r.pattern_type: (r.confidence, r.evidence) for r in results}
+
+    def test_single_chunk_matches_whole_text(self, detector):
+        whole = detector.analyze_text_for_patterns(self.TEXT)
+        streamed = detector.analyze_stream_for_patterns([self.TEXT])
+
+        assert self._summary(streamed) == self._summary(whole)
+
+    def test_matches_across_chunk_boundaries(self, detector):
+        chunks = [self.TEXT[i : i + 7] for i in range(0, len(self.TEXT), 7)]
+
+        whole = detector.analyze_text_for_patterns(self.TEXT)
+        streamed = detector.analyze_stream_for_patterns(chunks)
+
+        assert self._summary(streamed) == self._summary(whole)
+
+    def test_running_confidence_accumulates(self, detector):
+        scan = detector.start_stream(
+            focus_patterns=["infrastructure_without_implementation"]
+        )
+
+        scan.feed("Plain introduction without any indicators. ")
+        assert scan.confidence("infrastructure_without_implementation") == 0.0
+
+        scan.feed("We will build our own client. ")
+        first = scan.confidence("infrastructure_without_implementation")
+        assert first > 0.0
+
+        scan.feed("The SDK might be limiting.")
+        assert scan.confidence("infrastructure_without_implementation") > first
+        assert scan.chunks_processed == 3
+
+    def test_overlap_window_is_bounded(self, detector):
+        scan = detector.start_stream(overlap_chars=16)
+
+        for _ in range(50):
+            scan.feed("x" * 1000)
+
+        assert len(scan._tail) == 16
+        assert scan.chars_processed == 50_000
+
+    def test_invalid_chunk_type(self, detector):
+        scan = detector.start_stream()
+
+        with pytest.raises(TypeError):
+            scan.feed(None)
@@ -0,0 +1,207 @@
+"""
+Tests for the Async PR Data Collector
+
+Covers concurrent `gh` based PR data collection:
+- PR view, diff and linked issues fetched concurrently
+- Bounded parallelism and per-call timeouts
+- Partial results when a linked-issue fetch fails
+- Sync wrappers usable from inside a running event loop
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from vibe_check.tools.pr_review import data_collector as data_collector_module
+from vibe_check.tools.pr_review.data_collector import PRDataCollector
+
+PR_VIEW = {
+    "title": "Add caching",
+    "body": "Fixes #1, closes #2 and resolves #3",
+    "files": [{"path": "a.py"}],
+    "additions": 10,
+    "deletions": 4,
+    "author": {"login": "octocat"},
+    "createdAt": "2024-01-01T00:00:00Z",
+    "baseRefName": "main",
+    "headRefName": "feature",
+    "comments": [],
+}
+
+
+class FakeProcess:
+    """Stand-in for an asyncio subprocess running one gh command."""
+
+    def __init__(self, gh, args):
+        self.gh = gh
+        self.args = args
+        self.returncode = None
+        self.killed = False
+
+    async def communicate(self):
+        gh, args = self.gh, self.args
+        gh.active += 1
+        gh.peak = max(gh.peak, gh.active)
+        try:
+            if args[:2] == ["issue", "view"] and args[2] in gh.hanging_issues:
+                await asyncio.sleep(3600)
+            await asyncio.sleep(gh.delay)
+        finally:
+            gh.active -= 1
+
+        if args[:2] == ["pr", "view"]:
+            self.returncode, out = 0, json.dumps(PR_VIEW)
+        elif args[:2] == ["pr", "diff"]:
+            self.returncode, out = 0, "diff --git a/a.py b/a.py"
+        elif args[2] in gh.failing_issues:
+            self.returncode, out = 1, ""
+        elif args[2] in gh.malformed_issues:
+            self.returncode, out = 0, "not json"
+        else:
+            self.returncode = 0
+            out = json.dumps(
+                {"title": f"Issue {args[2]}", "body": "", "labels": [], "state": "OPEN"}
+            )
+        return out.encode(), b"" if self.returncode == 0 else b"not found"
+
+    def kill(self):
+        self.killed = True
+
+    async def wait(self):
+        self.returncode = -9
+        return self.returncode
+
+
+class FakeGh:
+    """Replaces asyncio.create_subprocess_exec; tracks gh calls and concurrency."""
+
+    def __init__(
+        self,
+        delay=0.1,
+        failing_issues=(),
+        hanging_issues=(),
+        malformed_issues=(),
+        missing_commands=(),
+    ):
+        self.delay = delay
+        self.failing_issues = set(failing_issues)
+        self.hanging_issues = set(hanging_issues)
+        self.malformed_issues = set(malformed_issues)
+        self.missing_commands = set(missing_commands)
+        self.processes = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, program, *args, **kwargs):
+        assert program == "gh"
+        if tuple(args[:2]) in self.missing_commands:
+            raise FileNotFoundError(2, "No such file or directory", "gh")
+        process = FakeProcess(self, list(args))
+        self.processes.append(process)
+        return process
+
+
+@pytest.fixture
+def fake_gh(monkeypatch):
+    def install(**kwargs):
+        gh = FakeGh(**kwargs)
+        monkeypatch.setattr(data_collector_module.asyncio, "create_subprocess_exec", gh)
+        return gh
+
+    return install
+
+
+class TestCollectPrData:
+    """Test concurrent PR data collection."""
+
+    @pytest.mark.asyncio
+    async def test_diff_and_issues_overlap(self, fake_gh):
+        gh = fake_gh(delay=0.1)
+
+        start = time.perf_counter()
+        pr_data = await PRDataCollector().collect_pr_data_async(5, "owner/repo")
+        elapsed = time.perf_counter() - start
+
+        # Serial: view + diff + 3 issues = 0.5s; concurrent: view, then the rest
+        assert elapsed < 0.35
+        assert pr_data["diff"] == "diff --git a/a.py b/a.py"
+        assert pr_data["statistics"]["total_changes"] == 14
+        assert [issue["number"] for issue in pr_data["linked_issues"]] == [1, 2, 3]
+        assert len(gh.processes) == 5
+        assert gh.peak > 1
+
+    @pytest.mark.asyncio
+    async def test_parallelism_is_bounded(self, fake_gh):
+        gh = fake_gh(delay=0.02)
+
+        await PRDataCollector(max_parallel=2).collect_pr_data_async(5, "owner/repo")
+
+        assert gh.peak == 2
+        assert len(gh.processes) == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_and_timed_out_issues_return_partial_results(
+        self, fake_gh, monkeypatch
+    ):
+        monkeypatch.setattr(data_collector_module, "ISSUE_VIEW_TIMEOUT", 0.05)
+        gh = fake_gh(delay=0, failing_issues={"2"}, hanging_issues={"3"})
+
+        pr_data = await PRDataCollector().collect_pr_data_async(5, "owner/repo")
+
+        issues = {issue["number"]: issue for issue in pr_data["linked_issues"]}
+        assert issues[1]["title"] == "Issue 1"
+        assert "error" in issues[2]
+        assert "error" in issues[3]
+        assert pr_data["metadata"]["title"] == "Add caching"
+        assert [p.args[2] for p in gh.processes if p.killed] == ["3"]
+
+    @pytest.mark.asyncio
+    async def test_malformed_issue_output_keeps_other_issues(self, fake_gh):
+        fake_gh(delay=0, malformed_issues={"2"})
+
+        pr_data = await PRDataCollector().collect_pr_data_async(5, "owner/repo")
+
+        issues = {issue["number"]: issue for issue in pr_data["linked_issues"]}
+        assert issues[1]["title"] == "Issue 1"
+        assert issues[2]["action"] == "closes"
+        assert "error" in issues[2]
+        assert issues[3]["title"] == "Issue 3"
+
+    @pytest.mark.asyncio
+    async def test_missing_gh_for_issues_and_diff(self, fake_gh):
+        fake_gh(delay=0, missing_commands={("issue", "view"), ("pr", "diff")})
+
+        pr_data = await PRDataCollector().collect_pr_data_async(5, "owner/repo")
+
+        assert pr_data["diff"] == ""
+        assert [issue["number"] for issue in pr_data["linked_issues"]] == [1, 2, 3]
+        assert all("error" in issue for issue in pr_data["linked_issues"])
+
+    @pytest.mark.asyncio
+    async def test_pr_view_timeout_returns_error(self, fake_gh, monkeypatch):
+        monkeypatch.setattr(data_collector_module, "PR_VIEW_TIMEOUT", 0.05)
+        fake_gh(delay=1)
+
+        result = await PRDataCollector().collect_pr_data_async(99, "owner/repo")
+
+        assert "timed out" in result["error"]
+
+    def test_sync_wrapper(self, fake_gh):
+        fake_gh(delay=0)
+
+        pr_data = PRDataCollector().collect_pr_data(5, "owner/repo")
+
+        assert pr_data["metadata"]["author"] == "octocat"
+
+    @pytest.mark.asyncio
+    async def test_sync_wrappers_inside_running_loop(self, fake_gh):
+        fake_gh(delay=0)
+        collector = PRDataCollector()
+
+        pr_data = collector.collect_pr_data(5, "owner/repo")
+        issues = collector.extract_linked_issues("Fixes #7", "owner/repo")
+
+        assert pr_data["metadata"]["author"] == "octocat"
+        assert issues[0]["title"] == "Issue 7"
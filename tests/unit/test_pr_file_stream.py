@@ -0,0 +1,130 @@
+"""
+Tests for the PR File Stream
+
+Covers single-pass streaming of PR files:
+- Each page of the PaginatedList fetched exactly once
+- Lazy iteration and replay of cached records
+- Consumers (analyze_pr_nollm, FileTypeAnalyzer, FileChunker) accept streams
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from vibe_check.tools.analyze_pr_nollm import _analyze_file_changes
+from vibe_check.tools.pr_review.chunked_analyzer import FileChunker
+from vibe_check.tools.pr_review.file_type_analyzer import FileTypeAnalyzer
+from vibe_check.tools.shared.pr_file_stream import PRFileRecord, PRFileStream
+
+
+class FakePaginatedList:
+    """Iterable that counts page requests like a PyGithub PaginatedList."""
+
+    def __init__(self, files, per_page=2):
+        self.files = files
+        self.per_page = per_page
+        self.page_requests = 0
+
+    def __iter__(self):
+        for start in range(0, len(self.files), self.per_page):
+            self.page_requests += 1
+            yield from self.files[start : start + self.per_page]
+
+
+def _file(name, changes=10, patch="+ x"):
+    return SimpleNamespace(
+        filename=name,
+        status="modified",
+        additions=changes,
+        deletions=0,
+        changes=changes,
+        patch=patch,
+    )
+
+
+class TestPRFileStream:
+    """Test page-once streaming."""
+
+    def test_second_pass_does_not_refetch_pages(self):
+        pages = FakePaginatedList([_file(f"f{i}.py") for i in range(5)])
+        stream = PRFileStream(pages)
+
+        assert [r.filename for r in stream] == [f"f{i}.py" for i in range(5)]
+        assert len(stream) == 5
+        assert len(stream.to_list()) == 5
+        assert pages.page_requests == 3
+
+    def test_iteration_is_lazy(self):
+        pages = FakePaginatedList([_file(f"f{i}.py") for i in range(6)])
+        stream = PRFileStream(pages)
+
+        first = next(iter(stream))
+
+        assert first.filename == "f0.py"
+        assert pages.page_requests == 1
+        assert not stream.exhausted
+
+    def test_partial_pass_then_full_pass(self):
+        pages = FakePaginatedList([_file(f"f{i}.py") for i in range(4)])
+        stream = PRFileStream(pages)
+        iterator = iter(stream)
+        next(iterator)
+
+        assert len(stream) == 4
+        assert [r.filename for r in iterator] == ["f1.py", "f2.py", "f3.py"]
+        assert pages.page_requests == 2
+
+    def test_patch_kept_only_on_request(self):
+        files = [_file("a.py", patch="+ abc"), _file("b.py", patch=None)]
+
+        light = PRFileStream(files).to_list()
+        full = list(PRFileStream(files, keep_patches=True).iter_dicts())
+
+        assert (light[0].patch, light[0].patch_size) == (None, 5)
+        assert light[0].to_dict()["patch_size"] == 5
+        assert "patch" not in light[0].to_dict()
+        assert full[0]["patch"] == "+ abc"
+        assert full[1]["patch"] == ""
+
+    def test_from_api_payload(self):
+        record = PRFileRecord.from_api(
+            {
+                "filename": "a.py",
+                "status": "added",
+                "additions": 3,
+                "deletions": 0,
+                "changes": 3,
+            }
+        )
+
+        assert record.patch_size == 0
+        assert record.to_dict()["status"] == "added"
+
+
+class TestStreamConsumers:
+    """Test that PR file consumers walk the file list once."""
+
+    def test_analyze_file_changes_fetches_pages_once(self):
+        pages = FakePaginatedList(
+            [_file("config.py"), _file("big.py", changes=500), _file("README")]
+        )
+        pr = Mock()
+        pr.get_files.return_value = pages
+
+        result = _analyze_file_changes(pr)
+
+        assert result["total_files"] == 3
+        assert result["risk_files"] == ["config.py"]
+        assert result["large_files"][0]["filename"] == "big.py"
+        assert result["file_types"] == {"py": 2}
+        assert pages.page_requests == 2
+
+    def test_file_type_analyzer_and_chunker_share_one_stream(self):
+        pages = FakePaginatedList([_file("src/app.py"), _file("tests/test_app.py")])
+        stream = PRFileStream(pages, keep_patches=True)
+
+        analysis = FileTypeAnalyzer().analyze_files(stream)
+        chunks = FileChunker().create_chunks(stream)
+
+        assert "test" in analysis["file_types_found"]
+        assert sum(len(chunk.files) for chunk in chunks) == 2
+        assert pages.page_requests == 1
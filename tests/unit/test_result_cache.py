@@ -0,0 +1,162 @@
+"""
+Unit Tests for the Analysis Result Cache
+
+Tests the content-addressed cache behind analyze_text_nollm and issue vibe checks:
+- LRU eviction by entry count and byte budget
+- TTL expiry and hit/miss accounting
+- Invalidation when the pattern data changes
+- Cached analyze_text_demo responses
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to path for testing
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from vibe_check.core.compiled_patterns import get_compiled_pattern_set
+from vibe_check.tools.analyze_text_nollm import analyze_text_demo
+from vibe_check.tools.contextual_documentation import AnalysisContext
+from vibe_check.tools.shared.result_cache import (
+    AnalysisResultCache,
+    get_result_cache,
+)
+
+SAMPLE_TEXT = (
+    "We're planning to build a custom HTTP client since the SDK might be limiting."
+)
+
+
+def _context(exceptions):
+    return AnalysisContext(
+        library_docs={"fastapi": "docs"},
+        project_conventions={},
+        pattern_exceptions=exceptions,
+        conflict_resolution={},
+        context_metadata={},
+    )
+
+
+class TestAnalysisResultCache:
+    """Test cache eviction, expiry and statistics"""
+
+    def test_keys_are_content_addressed(self):
+        key = AnalysisResultCache.make_key("text", "standard", "1.0.0")
+
+        assert key == AnalysisResultCache.make_key("text", "standard", "1.0.0")
+        assert key != AnalysisResultCache.make_key("text", "brief", "1.0.0")
+
+    def test_get_returns_independent_copies(self):
+        cache = AnalysisResultCache()
+        cache.put("key", {"patterns": ["a"]})
+
+        first = cache.get("key")
+        first["patterns"].append("b")
+
+        assert cache.get("key") == {"patterns": ["a"]}
+        assert cache.get_stats()["hits"] == 2
+
+    def test_lru_eviction_by_entry_count(self):
+        cache = AnalysisResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_eviction_by_byte_budget(self):
+        cache = AnalysisResultCache(max_bytes=250)
+        cache.put("a", "x" * 100)
+        cache.put("b", "y" * 100)
+        cache.put("c", "z" * 100)
+
+        stats = cache.get_stats()
+        assert stats["size"] == 2
+        assert stats["bytes"] <= 250
+        assert cache.get("a") is None
+
+        cache.put("huge", "x" * 1000)
+        assert cache.get("huge") is None
+
+    def test_ttl_expiry(self):
+        cache = AnalysisResultCache(ttl_seconds=10)
+        with patch("vibe_check.tools.shared.result_cache.time.monotonic") as clock:
+            clock.return_value = 100.0
+            cache.put("key", "value")
+            clock.return_value = 111.0
+
+            assert cache.get("key") is None
+
+        stats = cache.get_stats()
+        assert stats["expirations"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 0
+
+    def test_pattern_change_clears_cache(self):
+        cache = AnalysisResultCache()
+        version = cache.pattern_version()
+        cache.put("key", "value")
+
+        assert cache.pattern_version() == version
+        assert cache.get("key") == "value"
+
+        cache._pattern_fingerprint = "outdated"
+        cache.pattern_version()
+
+        assert cache.get("key") is None
+        assert cache.get_stats()["invalidations"] == 1
+
+    def test_pattern_version_tracks_data(self):
+        pattern_set = get_compiled_pattern_set()
+
+        assert AnalysisResultCache().pattern_version() == (
+            f"{pattern_set.data_version}:{pattern_set.fingerprint}"
+        )
+
+
+class TestCachedTextAnalysis:
+    """Test analyze_text_demo result caching"""
+
+    def test_repeated_analysis_served_from_cache(self):
+        first = analyze_text_demo(SAMPLE_TEXT, use_project_context=False)
+
+        with patch("vibe_check.tools.analyze_text_nollm.PatternDetector") as detector:
+            second = analyze_text_demo(SAMPLE_TEXT, use_project_context=False)
+
+        detector.assert_not_called()
+        assert second == first
+        assert get_result_cache().get_stats()["hits"] == 1
+
+    def test_detail_level_and_context_are_part_of_key(self):
+        analyze_text_demo(SAMPLE_TEXT, detail_level="brief", use_project_context=False)
+        analyze_text_demo(
+            SAMPLE_TEXT, detail_level="standard", use_project_context=False
+        )
+        analyze_text_demo(SAMPLE_TEXT, context=_context([]))
+        analyze_text_demo(
+            SAMPLE_TEXT, context=_context(["infrastructure_without_implementation"])
+        )
+
+        stats = get_result_cache().get_stats()
+        assert stats["hits"] == 0
+        assert stats["size"] == 4
+
+    def test_streamed_analysis_is_not_cached(self):
+        analyze_text_demo(
+            SAMPLE_TEXT, use_project_context=False, stream_chunks=["more text"]
+        )
+
+        assert get_result_cache().get_stats()["size"] == 0
+
+    @pytest.mark.parametrize("text", [None, 42])
+    def test_invalid_input_is_not_cached(self, text):
+        analyze_text_demo(text, use_project_context=False)
+
+        assert get_result_cache().get_stats()["size"] == 0
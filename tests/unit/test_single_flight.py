@@ -0,0 +1,170 @@
+"""
+Tests for Single-Flight Request Coalescing
+
+Covers sharing one in-flight call between concurrent identical requests:
+- Identical concurrent calls execute once and share the result or exception
+- Keys are released once the call finishes
+- A cancelled caller does not cancel the call for the others
+- Concurrent identical mentor queries trigger a single ctx.sample per session
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from vibe_check.mentor.models.persona import PersonaData
+from vibe_check.strategies.response_strategies import TechnicalContext
+from vibe_check.tools.shared.single_flight import SingleFlight
+from vibe_check.tools.vibe_mentor_enhanced import EnhancedVibeMentorEngine
+
+
+def _counting_call(calls, result="done", delay=0.01):
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+
+    return call
+
+
+class TestSingleFlight:
+    """Test the coalescing group."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_execute_once(self):
+        group, calls = SingleFlight(), []
+
+        results = await asyncio.gather(
+            *(group.do("key", _counting_call(calls)) for _ in range(5))
+        )
+
+        assert results == ["done"] * 5
+        assert len(calls) == 1
+        stats = group.get_stats()
+        assert (stats["executions"], stats["coalesced"]) == (1, 4)
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_execute_separately(self):
+        group, calls = SingleFlight(), []
+
+        await asyncio.gather(
+            group.do("a", _counting_call(calls)), group.do("b", _counting_call(calls))
+        )
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_key_released_after_completion(self):
+        group, calls = SingleFlight(), []
+
+        await group.do("key", _counting_call(calls))
+        await group.do("key", _counting_call(calls))
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_every_caller(self):
+        group = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+
+        results = await asyncio.gather(
+            group.do("key", fail), group.do("key", fail), return_exceptions=True
+        )
+
+        assert [type(r) for r in results] == [ValueError, ValueError]
+        assert group.get_stats()["executions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        group, calls = SingleFlight(), []
+        leader = asyncio.ensure_future(group.do("key", _counting_call(calls)))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("key", _counting_call(calls)))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+
+        assert await follower == "done"
+        assert leader.cancelled()
+        assert len(calls) == 1
+
+
+class TestMentorCoalescing:
+    """Test that concurrent identical mentor queries share one sample."""
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_sample_once(self):
+        engine = EnhancedVibeMentorEngine(MagicMock(), enable_mcp_sampling=True)
+        if not engine.enable_mcp_sampling:
+            pytest.skip("MCP sampling components unavailable")
+
+        async def sample(**kwargs):
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(text="Use a queue")
+
+        ctx = SimpleNamespace(sample=AsyncMock(side_effect=sample))
+        results = await asyncio.gather(*(_generate(engine, ctx) for _ in range(3)))
+
+        assert results == [("Use a queue", "insight", 0.85)] * 3
+        assert ctx.sample.await_count == 1
+        assert len(engine._last_mcp_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_sessions_do_not_share_a_sample(self):
+        engine = EnhancedVibeMentorEngine(MagicMock(), enable_mcp_sampling=True)
+        if not engine.enable_mcp_sampling:
+            pytest.skip("MCP sampling components unavailable")
+
+        async def sample(**kwargs):
+            await asyncio.sleep(0.05)
+            return SimpleNamespace(text="Use a queue")
+
+        leaving = SimpleNamespace(
+            session=object(), sample=AsyncMock(side_effect=sample)
+        )
+        staying = SimpleNamespace(
+            session=object(), sample=AsyncMock(side_effect=sample)
+        )
+
+        leader = asyncio.create_task(_generate(engine, leaving))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(_generate(engine, staying))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        assert await follower == ("Use a queue", "insight", 0.85)
+        assert staying.sample.await_count == 1
+
+
+def _generate(engine, ctx):
+    persona = PersonaData(
+        id="senior_engineer",
+        name="Senior Engineer",
+        expertise=["Architecture"],
+        background="Background",
+        perspective="Pragmatic",
+        biases=[],
+        communication={"style": "Direct", "tone": "Blunt"},
+    )
+    tech_context = TechnicalContext(
+        technologies=["redis"],
+        frameworks=[],
+        patterns=[],
+        problem_type="architecture",
+        specific_features=[],
+        decision_points=[],
+    )
+    return engine._try_dynamic_generation(
+        persona,
+        "Should I add a job queue?",
+        tech_context,
+        [],
+        ctx,
+        force_decision=True,
+    )
@@ -0,0 +1,107 @@
+"""
+Tests for Server Startup Imports
+
+Guards the startup path against regressions:
+- Implementation dependencies (scikit-learn, numpy, PyGithub, the legacy
+  FastMCP tools) are not imported by ``import vibe_check.server``
+- Deferred tools still resolve their implementation on first call
+
+Wall-clock import budgets live in benchmarks/startup_import_benchmark.py.
+"""
+
+import os
+import re
+import subprocess
+import sys
+import warnings
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent.parent / "src"
+DEFERRED_PACKAGES = {"sklearn", "scipy", "numpy", "github", "fastmcp"}
+
+
+@pytest.fixture(scope="module")
+def import_times():
+    """Cumulative import time in ms per module for a cold server import"""
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), VIBE_CHECK_TEST_MODE="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import vibe_check.server"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1)) / 1000
+    return times
+
+
+class TestStartupImports:
+    """Test that server startup stays free of heavy implementation imports."""
+
+    def test_deferred_packages_not_imported(self, import_times):
+        imported = {name.split(".")[0] for name in import_times}
+        assert imported & DEFERRED_PACKAGES == set()
+
+    def test_tool_wrappers_loaded_without_implementations(self, import_times):
+        assert "vibe_check.server.tools.github_integration" in import_times
+        assert "vibe_check.tools.analyze_issue_nollm" not in import_times
+        assert "vibe_check.tools.legacy" not in import_times
+
+
+class TestFirstInvocation:
+    """Test that deferred implementations load when a tool is first called."""
+
+    def test_issue_tool_imports_implementation_on_call(self):
+        from vibe_check.server.tools import github_integration
+
+        with patch(
+            "vibe_check.tools.analyze_issue_nollm.analyze_issue",
+            return_value={"status": "ok"},
+        ) as analyze_issue:
+            result = github_integration.analyze_issue_nollm(
+                issue_number=1, repository="owner/repo"
+            )
+
+        assert result == {"status": "ok"}
+        analyze_issue.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_review_tool_unaffected_by_deprecated_submodule(self):
+        from vibe_check.server.tools import github_integration
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            from vibe_check.tools.pr_review.review_pull_request import (
+                review_pull_request as deprecated_review,
+            )
+        assert callable(deprecated_review)
+
+        with patch(
+            "vibe_check.tools.pr_review.main.review_pull_request",
+            new=AsyncMock(return_value={"status": "ok"}),
+        ) as review:
+            result = await github_integration.review_pr_comprehensive(
+                pr_number=1, repository="owner/repo"
+            )
+
+        assert result == {"status": "ok"}
+        review.assert_awaited_once()
+
+    def test_semantic_engine_builds_vectorizer_lazily(self):
+        from vibe_check.tools.semantic_engine import QueryIntentClassifier
+
+        intent = QueryIntentClassifier().classify_intent(
+            "Should I build a custom HTTP client instead of using the SDK?"
+        )
+
+        assert intent.intent_type
+        assert "sklearn" in sys.modules